@@ -22,13 +22,22 @@ Cache directly competes with Memory. See documentation for Pros and Cons.
 
 from __future__ import annotations
 
+import asyncio
+import concurrent.futures
 import hashlib
 import inspect
 import json
 import logging
+import os
+import struct
+import threading
+import time
 import uuid
 import warnings
-from abc import ABC
+import zlib
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import timedelta
 from enum import Enum
 from functools import lru_cache, wraps
@@ -40,15 +49,29 @@ from typing import (
     Dict,
     Generator,
     List,
+    Literal,
     Optional,
     Sequence,
+    Set,
     Tuple,
     Type,
     Union,
     cast,
 )
 
-from sqlalchemy import Column, Integer, String, create_engine, delete, select
+import numpy as np
+from sqlalchemy import (
+    Column,
+    Integer,
+    String,
+    create_engine,
+    delete,
+    event,
+    insert,
+    select,
+    tuple_,
+)
+from sqlalchemy import inspect as inspect_sqlalchemy
 from sqlalchemy.engine import Row
 from sqlalchemy.engine.base import Engine
 from sqlalchemy.orm import Session
@@ -58,6 +81,7 @@ from langchain_community.vectorstores.azure_cosmos_db import (
     CosmosDBSimilarityType,
     CosmosDBVectorSearchType,
 )
+from langchain_community.vectorstores.faiss import dependable_faiss_import
 from langchain_community.vectorstores.utils import DistanceStrategy
 
 try:
@@ -98,6 +122,7 @@ if TYPE_CHECKING:
     from astrapy.db import AstraDB, AsyncAstraDB
     from azure.cosmos.cosmos_client import CosmosClient
     from cassandra.cluster import Session as CassandraSession
+    from sqlalchemy.sql.expression import Select
 
 
 def _hash(_input: str) -> str:
@@ -201,24 +226,441 @@ def _loads_generations(generations_str: str) -> Union[RETURN_VAL_TYPE, None]:
         return None
 
 
+class GenerationCodec(ABC):
+    """Encodes cached generations to bytes and back.
+
+    Caches that store opaque blobs accept a codec so that the serialization
+    format can be swapped without touching the backend logic.
+    """
+
+    @abstractmethod
+    def encode(self, generations: RETURN_VAL_TYPE) -> bytes:
+        """Encode a list of generations."""
+
+    @abstractmethod
+    def decode(self, data: Union[str, bytes]) -> Optional[RETURN_VAL_TYPE]:
+        """Decode a blob, returning None if it cannot be decoded.
+
+        Backends that hand back text, such as clients decoding their
+        responses, pass the value as a `str`.
+        """
+
+
+class JSONGenerationCodec(GenerationCodec):
+    """The historical format: a JSON list of `dumps`-ed generations."""
+
+    def encode(self, generations: RETURN_VAL_TYPE) -> bytes:
+        return _dumps_generations(generations).encode("utf-8")
+
+    def decode(self, data: Union[str, bytes]) -> Optional[RETURN_VAL_TYPE]:
+        if isinstance(data, bytes):
+            data = data.decode("utf-8")
+        return _loads_generations(data)
+
+
+_BINARY_CODEC_MAGIC = b"\x00LCG\x01"
+_NO_COMPRESSION, _ZLIB_COMPRESSION, _ZSTD_COMPRESSION = 0, 1, 2
+_PLAIN_GENERATION, _SERIALIZED_GENERATION = 0, 1
+_UINT32 = struct.Struct("<I")
+
+
+def _is_json_value(value: Any) -> bool:
+    """Whether ``value`` is unchanged by a JSON round trip.
+
+    Tuples, non-string keys and non-JSON types such as datetimes are not.
+    """
+    if value is None or type(value) in (str, int, float, bool):
+        return True
+    if type(value) is list:
+        return all(_is_json_value(item) for item in value)
+    if type(value) is dict:
+        return all(
+            type(key) is str and _is_json_value(item) for key, item in value.items()
+        )
+    return False
+
+
+class BinaryGenerationCodec(GenerationCodec):
+    """Compact, length-prefixed binary encoding of generations.
+
+    Plain `Generation` objects, by far the most common payload, are packed as
+    raw UTF-8 text plus their JSON ``generation_info``, which avoids both the
+    nested JSON of `dumps` and the reviver-based reconstruction of `loads`.
+    Any other generation (e.g. `ChatGeneration`) falls back to `dumps`.
+
+    Payloads larger than ``compression_threshold`` bytes are compressed with
+    zstd when the `zstandard` package is installed, and zlib otherwise.
+
+    Blobs written in the JSON format (`JSONGenerationCodec`, `_dumps_generations`
+    or the legacy list of `Generation` dicts) are still decoded.
+    """
+
+    def __init__(
+        self,
+        *,
+        compression: Optional[Literal["zstd", "zlib"]] = "zstd",
+        compression_threshold: int = 1024,
+        compression_level: int = 3,
+    ):
+        """Initialize the codec.
+
+        Args:
+            compression: ``"zstd"``, ``"zlib"`` or None to disable compression.
+                ``"zstd"`` falls back to zlib if `zstandard` is not installed.
+            compression_threshold: Minimum payload size, in bytes, for which
+                compression is attempted.
+            compression_level: Compression level passed to the compressor.
+        """
+        self.compression = compression
+        self.compression_threshold = compression_threshold
+        self.compression_level = compression_level
+        self._zstd: Any = None
+        if compression == "zstd":
+            try:
+                import zstandard
+            except ImportError:
+                self.compression = "zlib"
+            else:
+                self._zstd = zstandard
+
+    def _compress(self, payload: bytes) -> Tuple[int, bytes]:
+        if self.compression is None or len(payload) < self.compression_threshold:
+            return _NO_COMPRESSION, payload
+        if self._zstd is not None:
+            compressor = self._zstd.ZstdCompressor(level=self.compression_level)
+            return _ZSTD_COMPRESSION, compressor.compress(payload)
+        return _ZLIB_COMPRESSION, zlib.compress(payload, self.compression_level)
+
+    @staticmethod
+    def _decompress(method: int, payload: bytes) -> bytes:
+        if method == _ZLIB_COMPRESSION:
+            return zlib.decompress(payload)
+        if method == _ZSTD_COMPRESSION:
+            try:
+                import zstandard
+            except ImportError:
+                raise ImportError(
+                    "Could not import zstandard python package, which is "
+                    "needed to read this cache entry. "
+                    "Please install it with `pip install zstandard`."
+                )
+            return zstandard.ZstdDecompressor().decompress(payload)
+        return payload
+
+    def encode(self, generations: RETURN_VAL_TYPE) -> bytes:
+        parts = [_UINT32.pack(len(generations))]
+        for generation in generations:
+            if type(generation) is Generation and (
+                generation.generation_info is None
+                or _is_json_value(generation.generation_info)
+            ):
+                text = generation.text.encode("utf-8")
+                info = (
+                    b""
+                    if generation.generation_info is None
+                    else json.dumps(generation.generation_info).encode("utf-8")
+                )
+                parts.extend(
+                    (
+                        bytes((_PLAIN_GENERATION,)),
+                        _UINT32.pack(len(text)),
+                        text,
+                        _UINT32.pack(len(info)),
+                        info,
+                    )
+                )
+            else:
+                serialized = dumps(generation).encode("utf-8")
+                parts.extend(
+                    (
+                        bytes((_SERIALIZED_GENERATION,)),
+                        _UINT32.pack(len(serialized)),
+                        serialized,
+                    )
+                )
+        method, payload = self._compress(b"".join(parts))
+        return _BINARY_CODEC_MAGIC + bytes((method,)) + payload
+
+    def decode(self, data: Union[str, bytes]) -> Optional[RETURN_VAL_TYPE]:
+        # Only bytes can carry the binary format, text is the legacy JSON one.
+        if isinstance(data, str):
+            return _loads_generations(data)
+        header = len(_BINARY_CODEC_MAGIC)
+        try:
+            if not data.startswith(_BINARY_CODEC_MAGIC):
+                return _loads_generations(data.decode("utf-8"))
+            payload = memoryview(self._decompress(data[header], data[header + 1 :]))
+            (count,) = _UINT32.unpack_from(payload, 0)
+            offset = _UINT32.size
+            generations: List[Generation] = []
+            for _ in range(count):
+                tag = payload[offset]
+                (length,) = _UINT32.unpack_from(payload, offset + 1)
+                start = offset + 1 + _UINT32.size
+                value = bytes(payload[start : start + length]).decode("utf-8")
+                offset = start + length
+                if tag == _PLAIN_GENERATION:
+                    (info_length,) = _UINT32.unpack_from(payload, offset)
+                    offset += _UINT32.size
+                    info = bytes(payload[offset : offset + info_length])
+                    offset += info_length
+                    generations.append(
+                        Generation(
+                            text=value,
+                            generation_info=json.loads(info) if info else None,
+                        )
+                    )
+                else:
+                    generations.append(loads(value))
+            return generations
+        except (
+            struct.error,
+            IndexError,
+            ValueError,
+            zlib.error,
+            # Values that ``dumps`` could only record as not serializable.
+            NotImplementedError,
+        ) as e:
+            logger.warning(f"Malformed/unparsable cached blob encountered: {e}")
+            return None
+
+
+def _estimate_size(prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> int:
+    """Cheap estimate, in bytes, of the memory held by a single cache entry.
+
+    Only the dominant string payloads are counted (prompt, llm string and the
+    generated texts), which keeps the estimate O(number of generations).
+    """
+    size = len(prompt) + len(llm_string)
+    for generation in return_val:
+        size += len(generation.text)
+    return size
+
+
+class _CountMinSketch:
+    """Approximate frequency counter backing the TinyLFU admission policy.
+
+    Counters are halved every ``sample_size`` increments so that the sketch
+    tracks recent popularity rather than all-time popularity.
+    """
+
+    _DEPTH = 4
+
+    def __init__(self, width: int) -> None:
+        self._width = max(16, width)
+        self._table = [[0] * self._width for _ in range(self._DEPTH)]
+        self._sample_size = 10 * self._width
+        self._additions = 0
+
+    def _indexes(self, key: Tuple[str, str]) -> List[int]:
+        return [hash((row, key)) % self._width for row in range(self._DEPTH)]
+
+    def increment(self, key: Tuple[str, str]) -> None:
+        for row, idx in zip(self._table, self._indexes(key)):
+            if row[idx] < 15:
+                row[idx] += 1
+        self._additions += 1
+        if self._additions >= self._sample_size:
+            self._reset()
+
+    def estimate(self, key: Tuple[str, str]) -> int:
+        return min(row[idx] for row, idx in zip(self._table, self._indexes(key)))
+
+    def _reset(self) -> None:
+        for row in self._table:
+            for idx in range(self._width):
+                row[idx] >>= 1
+        self._additions //= 2
+
+    def clear(self) -> None:
+        for row in self._table:
+            for idx in range(self._width):
+                row[idx] = 0
+        self._additions = 0
+
+
+@dataclass
+class InMemoryCacheStats:
+    """Counters describing the activity of an `InMemoryCache`."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    rejections: int = 0
+
+
 class InMemoryCache(BaseCache):
-    """Cache that stores things in memory."""
+    """Cache that stores things in memory.
+
+    By default the cache is unbounded. Passing ``maxsize`` and/or ``max_bytes``
+    turns it into a bounded cache that evicts the least recently used entries
+    once the budget is exceeded; ``ttl`` additionally expires entries a fixed
+    number of seconds after they were written.
+
+    With ``admission_policy="tinylfu"`` a new entry only displaces the LRU
+    victim if it has been requested more often recently, which protects hot
+    prompts from being flushed out by a burst of one-off prompts.
+
+    All operations are O(1) and guarded by a lock, so a single instance can be
+    shared between threads and the async ``alookup``/``aupdate`` paths.
+
+    Example:
+        .. code-block:: python
+
+            from langchain_community.cache import InMemoryCache
+            from langchain_core.globals import set_llm_cache
+
+            set_llm_cache(
+                InMemoryCache(maxsize=10_000, max_bytes=256 * 1024**2, ttl=3600)
+            )
+    """
+
+    def __init__(
+        self,
+        *,
+        maxsize: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        ttl: Optional[float] = None,
+        admission_policy: Literal["lru", "tinylfu"] = "lru",
+        size_fn: Optional[Callable[[str, str, RETURN_VAL_TYPE], int]] = None,
+    ) -> None:
+        """Initialize with empty cache.
 
-    def __init__(self) -> None:
-        """Initialize with empty cache."""
-        self._cache: Dict[Tuple[str, str], RETURN_VAL_TYPE] = {}
+        Args:
+            maxsize: Maximum number of entries to keep. None means unbounded.
+            max_bytes: Maximum estimated size of all entries, in bytes.
+                None means unbounded.
+            ttl: Time-to-live of an entry in seconds, counted from the moment
+                it was written. None means entries never expire.
+            admission_policy: Either ``"lru"`` (always admit new entries) or
+                ``"tinylfu"`` (admit a new entry only if it is estimated to be
+                more popular than the entry it would evict).
+            size_fn: Function returning the size of an entry in bytes, given
+                ``(prompt, llm_string, return_val)``. Defaults to an estimate
+                based on the length of the strings held by the entry.
+
+        Raises:
+            ValueError: If a budget or ttl is not positive, or the admission
+                policy is unknown.
+        """
+        if maxsize is not None and maxsize <= 0:
+            raise ValueError("maxsize must be greater than 0")
+        if max_bytes is not None and max_bytes <= 0:
+            raise ValueError("max_bytes must be greater than 0")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be greater than 0")
+        if admission_policy not in ("lru", "tinylfu"):
+            raise ValueError(
+                f"Unknown admission_policy {admission_policy!r}, "
+                "expected 'lru' or 'tinylfu'."
+            )
+        self._maxsize = maxsize
+        self._max_bytes = max_bytes
+        self._ttl = ttl
+        self._size_fn = size_fn or _estimate_size
+        self._lock = threading.RLock()
+        # Maps key -> (return_val, size, expires_at), ordered from least to
+        # most recently used.
+        self._cache: OrderedDict[
+            Tuple[str, str], Tuple[RETURN_VAL_TYPE, int, Optional[float]]
+        ] = OrderedDict()
+        self._current_bytes = 0
+        self._sketch: Optional[_CountMinSketch] = None
+        if admission_policy == "tinylfu":
+            self._sketch = _CountMinSketch(width=maxsize or 1024)
+        self.stats = InMemoryCacheStats()
+
+    @property
+    def currsize(self) -> int:
+        """Number of entries currently held."""
+        return len(self._cache)
+
+    @property
+    def current_bytes(self) -> int:
+        """Estimated size of all the entries currently held, in bytes."""
+        return self._current_bytes
+
+    def _pop(self, key: Tuple[str, str]) -> None:
+        _, size, _ = self._cache.pop(key)
+        self._current_bytes -= size
+
+    def _is_over_budget(self, extra_entries: int = 0, extra_bytes: int = 0) -> bool:
+        if (
+            self._maxsize is not None
+            and len(self._cache) + extra_entries > self._maxsize
+        ):
+            return True
+        if (
+            self._max_bytes is not None
+            and self._current_bytes + extra_bytes > self._max_bytes
+        ):
+            return True
+        return False
+
+    def _admit(self, key: Tuple[str, str], size: int, replacing: bool) -> bool:
+        """Make room for a new entry, returning False if it should be rejected."""
+        if self._max_bytes is not None and size > self._max_bytes:
+            return False
+        if self._sketch is not None and self._cache and not replacing:
+            if self._is_over_budget(extra_entries=1, extra_bytes=size):
+                victim = next(iter(self._cache))
+                if self._sketch.estimate(key) <= self._sketch.estimate(victim):
+                    return False
+        while self._cache and self._is_over_budget(extra_entries=1, extra_bytes=size):
+            self._pop(next(iter(self._cache)))
+            self.stats.evictions += 1
+        return True
 
     def lookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
         """Look up based on prompt and llm_string."""
-        return self._cache.get((prompt, llm_string), None)
+        key = (prompt, llm_string)
+        with self._lock:
+            if self._sketch is not None:
+                self._sketch.increment(key)
+            entry = self._cache.get(key)
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            return_val, _, expires_at = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                self._pop(key)
+                self.stats.expirations += 1
+                self.stats.misses += 1
+                return None
+            self._cache.move_to_end(key)
+            self.stats.hits += 1
+            return return_val
 
     def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
         """Update cache based on prompt and llm_string."""
-        self._cache[(prompt, llm_string)] = return_val
+        key = (prompt, llm_string)
+        size = self._size_fn(prompt, llm_string, return_val)
+        expires_at = time.monotonic() + self._ttl if self._ttl is not None else None
+        with self._lock:
+            replacing = key in self._cache
+            if replacing:
+                self._pop(key)
+            if not self._admit(key, size, replacing):
+                self.stats.rejections += 1
+                return
+            self._cache[key] = (return_val, size, expires_at)
+            self._current_bytes += size
+
+    def delete(self, prompt: str, llm_string: str) -> None:
+        """Evict the entry for prompt and llm_string, if any."""
+        with self._lock:
+            if (prompt, llm_string) in self._cache:
+                self._pop((prompt, llm_string))
 
     def clear(self, **kwargs: Any) -> None:
         """Clear cache."""
-        self._cache = {}
+        with self._lock:
+            self._cache = OrderedDict()
+            self._current_bytes = 0
+            if self._sketch is not None:
+                self._sketch.clear()
+            self.stats = InMemoryCacheStats()
 
     async def alookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
         """Look up based on prompt and llm_string."""
@@ -235,6 +677,266 @@ class InMemoryCache(BaseCache):
         self.clear()
 
 
+class TieredCache(BaseCache):
+    """Two-tier cache: a bounded in-process front tier over any slower cache.
+
+    Lookups are served from the front tier when possible and read through to
+    the backend otherwise, populating the front tier with the result.
+    Concurrent lookups of the same key are collapsed so that the backend is
+    queried only once. Misses can optionally be cached for ``negative_ttl``
+    seconds to spare the backend repeated lookups of prompts that are about
+    to be generated.
+
+    Updates are written to the front tier immediately. With ``write_behind``
+    (the default) the backend write happens in the background; call `flush`
+    (or `aflush`) to wait for pending writes.
+
+    Example:
+        .. code-block:: python
+
+            from langchain_community.cache import (
+                InMemoryCache,
+                RedisCache,
+                TieredCache,
+            )
+            from langchain_core.globals import set_llm_cache
+
+            set_llm_cache(
+                TieredCache(
+                    RedisCache(redis_=redis_client),
+                    front=InMemoryCache(maxsize=10_000, ttl=300),
+                    negative_ttl=5,
+                )
+            )
+    """
+
+    def __init__(
+        self,
+        backend: BaseCache,
+        *,
+        front: Optional[InMemoryCache] = None,
+        write_behind: bool = True,
+        negative_ttl: Optional[float] = None,
+        negative_maxsize: int = 10_000,
+    ):
+        """Initialize the tiered cache.
+
+        Args:
+            backend: The slow, persistent cache.
+            front: The in-process front tier. Defaults to an `InMemoryCache`
+                holding at most 1024 entries.
+            write_behind: Whether backend writes happen in the background.
+                If False, `update` writes through to the backend synchronously.
+            negative_ttl: If set, misses are remembered for this many seconds.
+            negative_maxsize: Maximum number of remembered misses.
+        """
+        self.backend = backend
+        self.front = front if front is not None else InMemoryCache(maxsize=1024)
+        self.write_behind = write_behind
+        self._negative: Optional[InMemoryCache] = None
+        if negative_ttl is not None:
+            self._negative = InMemoryCache(maxsize=negative_maxsize, ttl=negative_ttl)
+        self._lock = threading.Lock()
+        self._inflight: Dict[Tuple[str, str], concurrent.futures.Future] = {}
+        self._ainflight: Dict[Tuple[str, str], asyncio.Future] = {}
+        # In-flight keys updated since their backend read started.
+        self._superseded: set[Tuple[str, str]] = set()
+        self._executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._pending: set[concurrent.futures.Future] = set()
+        self._apending: set[asyncio.Task] = set()
+
+    def _lookup_local(
+        self, prompt: str, llm_string: str
+    ) -> Tuple[bool, Optional[RETURN_VAL_TYPE]]:
+        """Return ``(found, value)`` from the front tier or the negative cache."""
+        value = self.front.lookup(prompt, llm_string)
+        if value is not None:
+            return True, value
+        if (
+            self._negative is not None
+            and self._negative.lookup(prompt, llm_string) is not None
+        ):
+            return True, None
+        return False, None
+
+    def _store_read(
+        self, prompt: str, llm_string: str, value: Optional[RETURN_VAL_TYPE]
+    ) -> None:
+        """Store a backend read, unless the key was updated while it ran."""
+        with self._lock:
+            if (prompt, llm_string) in self._superseded:
+                self._superseded.discard((prompt, llm_string))
+                return
+            self._store_local(prompt, llm_string, value)
+
+    def _supersede_read(self, prompt: str, llm_string: str) -> None:
+        key = (prompt, llm_string)
+        with self._lock:
+            if key in self._inflight or key in self._ainflight:
+                self._superseded.add(key)
+
+    def _store_local(
+        self, prompt: str, llm_string: str, value: Optional[RETURN_VAL_TYPE]
+    ) -> None:
+        if value is not None:
+            self.front.update(prompt, llm_string, value)
+        elif self._negative is not None:
+            self._negative.update(prompt, llm_string, [])
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        """Look up based on prompt and llm_string."""
+        found, value = self._lookup_local(prompt, llm_string)
+        if found:
+            return value
+        key = (prompt, llm_string)
+        with self._lock:
+            future = self._inflight.get(key)
+            is_leader = future is None
+            if future is None:
+                # A read of this key may have finished since the check above.
+                found, value = self._lookup_local(prompt, llm_string)
+                if found:
+                    return value
+                future = concurrent.futures.Future()
+                self._inflight[key] = future
+        if not is_leader:
+            return future.result()
+        try:
+            value = self.backend.lookup(prompt, llm_string)
+            self._store_read(prompt, llm_string, value)
+            future.set_result(value)
+            return value
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                del self._inflight[key]
+                self._superseded.discard(key)
+
+    async def alookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        """Look up based on prompt and llm_string. Async version."""
+        found, value = self._lookup_local(prompt, llm_string)
+        if found:
+            return value
+        key = (prompt, llm_string)
+        future = self._ainflight.get(key)
+        if future is not None:
+            return await asyncio.shield(future)
+        future = asyncio.get_running_loop().create_future()
+        self._ainflight[key] = future
+        try:
+            value = await self.backend.alookup(prompt, llm_string)
+            self._store_read(prompt, llm_string, value)
+            future.set_result(value)
+            return value
+        except Exception as e:
+            future.set_exception(e)
+            # Avoid "exception was never retrieved" warnings without waiters.
+            future.exception()
+            raise
+        finally:
+            if not future.done():
+                future.cancel()
+            with self._lock:
+                del self._ainflight[key]
+                self._superseded.discard(key)
+
+    def _log_write_error(self, future: concurrent.futures.Future) -> None:
+        with self._lock:
+            self._pending.discard(future)
+        if not future.cancelled() and future.exception() is not None:
+            logger.error(f"TieredCache backend update failed: {future.exception()}")
+
+    def _submit_write(
+        self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE
+    ) -> None:
+        with self._lock:
+            if self._executor is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="TieredCache"
+                )
+            future = self._executor.submit(
+                self.backend.update, prompt, llm_string, return_val
+            )
+            self._pending.add(future)
+        future.add_done_callback(self._log_write_error)
+
+    def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        """Update cache based on prompt and llm_string."""
+        self._supersede_read(prompt, llm_string)
+        self.front.update(prompt, llm_string, return_val)
+        if self._negative is not None:
+            self._negative.delete(prompt, llm_string)
+        if self.write_behind:
+            self._submit_write(prompt, llm_string, return_val)
+        else:
+            self.backend.update(prompt, llm_string, return_val)
+
+    def _alog_write_error(self, task: asyncio.Task) -> None:
+        self._apending.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"TieredCache backend async update failed: {task.exception()}")
+
+    async def aupdate(
+        self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE
+    ) -> None:
+        """Update cache based on prompt and llm_string. Async version."""
+        self._supersede_read(prompt, llm_string)
+        self.front.update(prompt, llm_string, return_val)
+        if self._negative is not None:
+            self._negative.delete(prompt, llm_string)
+        if not self.write_behind:
+            await self.backend.aupdate(prompt, llm_string, return_val)
+        elif type(self.backend).aupdate is BaseCache.aupdate:
+            # The backend has no native async write: the default would run the
+            # sync update in a thread anyway, so use the background writer.
+            self._submit_write(prompt, llm_string, return_val)
+        else:
+            task = asyncio.create_task(
+                self.backend.aupdate(prompt, llm_string, return_val)
+            )
+            self._apending.add(task)
+            task.add_done_callback(self._alog_write_error)
+
+    def flush(self) -> None:
+        """Block until all pending background writes have reached the backend."""
+        with self._lock:
+            pending = list(self._pending)
+        concurrent.futures.wait(pending)
+
+    async def aflush(self) -> None:
+        """Wait until all pending background writes have reached the backend."""
+        if self._apending:
+            await asyncio.gather(*self._apending, return_exceptions=True)
+        if self._pending:
+            await asyncio.get_running_loop().run_in_executor(None, self.flush)
+
+    def close(self) -> None:
+        """Flush pending writes and release the background writer thread."""
+        self.flush()
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def clear(self, **kwargs: Any) -> None:
+        """Clear both tiers."""
+        self.flush()
+        self.front.clear()
+        if self._negative is not None:
+            self._negative.clear()
+        self.backend.clear(**kwargs)
+
+    async def aclear(self, **kwargs: Any) -> None:
+        """Clear both tiers. Async version."""
+        await self.aflush()
+        self.front.clear()
+        if self._negative is not None:
+            self._negative.clear()
+        await self.backend.aclear(**kwargs)
+
+
 Base = declarative_base()
 
 
@@ -299,15 +1001,264 @@ class SQLAlchemyCache(BaseCache):
             session.commit()
 
 
+SQLITE_PERFORMANCE_PRAGMAS: Dict[str, Any] = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "temp_store": "MEMORY",
+    "cache_size": -64_000,
+    "mmap_size": 268_435_456,
+}
+"""PRAGMAs that trade a little durability for much faster concurrent access.
+
+WAL journaling lets readers proceed while a writer commits, and
+``synchronous=NORMAL`` is safe against corruption in WAL mode.
+"""
+
+
+def _create_sqlite_engine(
+    database_path: str, pragmas: Optional[Dict[str, Any]] = None
+) -> Engine:
+    """Create a SQLite engine that applies ``pragmas`` on every new connection."""
+    engine = create_engine(f"sqlite:///{database_path}")
+    if pragmas:
+
+        @event.listens_for(engine, "connect")
+        def _set_sqlite_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+            cursor = dbapi_connection.cursor()
+            try:
+                for name, value in pragmas.items():
+                    cursor.execute(f"PRAGMA {name}={value}")
+            finally:
+                cursor.close()
+
+    return engine
+
+
 class SQLiteCache(SQLAlchemyCache):
     """Cache that uses SQLite as a backend."""
 
-    def __init__(self, database_path: str = ".langchain.db"):
-        """Initialize by creating the engine and all tables."""
-        engine = create_engine(f"sqlite:///{database_path}")
+    def __init__(
+        self,
+        database_path: str = ".langchain.db",
+        *,
+        pragmas: Optional[Dict[str, Any]] = None,
+    ):
+        """Initialize by creating the engine and all tables.
+
+        Args:
+            database_path: Path of the SQLite database file.
+            pragmas: Optional PRAGMAs applied to every connection, e.g.
+                `SQLITE_PERFORMANCE_PRAGMAS` to enable WAL mode.
+        """
+        engine = _create_sqlite_engine(database_path, pragmas)
         super().__init__(engine)
 
 
+class FullHashedLLMCache(Base):  # type: ignore[misc,valid-type]
+    """SQL table for full LLM Cache keyed by a digest of prompt and llm string."""
+
+    __tablename__ = "full_hashed_llm_cache"
+    key = Column(String(64), primary_key=True)
+    idx = Column(Integer, primary_key=True)
+    prompt = Column(String)
+    response = Column(String)
+
+
+class SQLAlchemyHashedCache(BaseCache):
+    """Cache that uses SQLAlchemy as a backend with fixed-width hashed keys.
+
+    Unlike `SQLAlchemyCache`, which uses the full prompt and llm string as the
+    primary key, rows are keyed by a SHA-256 digest of ``(prompt, llm_string)``.
+    The index therefore stays small and lookups compare 64-character keys only;
+    the prompt is kept alongside the response to verify hits.
+
+    Each ``update`` replaces all generations of a key with a single bulk insert.
+    Existing `SQLAlchemyCache` tables can be copied over with `migrate_from`.
+    """
+
+    def __init__(
+        self,
+        engine: Engine,
+        cache_schema: Type[FullHashedLLMCache] = FullHashedLLMCache,
+    ):
+        """Initialize by creating all tables."""
+        self.engine = engine
+        self.cache_schema = cache_schema
+        self.cache_schema.metadata.create_all(self.engine)
+
+    @staticmethod
+    def _key(prompt: str, llm_string: str) -> str:
+        """Compute the digest key; the length prefix keeps the split unambiguous."""
+        digest = hashlib.sha256(f"{len(prompt)}:".encode())
+        digest.update(prompt.encode())
+        digest.update(llm_string.encode())
+        return digest.hexdigest()
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        """Look up based on prompt and llm_string."""
+        stmt: Select = (
+            select(self.cache_schema.prompt, self.cache_schema.response)
+            .where(self.cache_schema.key == self._key(prompt, llm_string))
+            .order_by(self.cache_schema.idx)
+        )
+        with Session(self.engine) as session:
+            rows = session.execute(stmt).fetchall()
+        if not rows or any(row[0] != prompt for row in rows):
+            return None
+        try:
+            return [loads(row[1]) for row in rows]
+        except Exception:
+            logger.warning(
+                "Retrieving a cache value that could not be deserialized "
+                "properly. This is likely due to the cache being in an "
+                "older format. Please recreate your cache to avoid this "
+                "error."
+            )
+            return [Generation(text=row[1]) for row in rows]
+
+    def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        """Update based on prompt and llm_string."""
+        key = self._key(prompt, llm_string)
+        rows = [
+            {"key": key, "idx": i, "prompt": prompt, "response": dumps(gen)}
+            for i, gen in enumerate(return_val)
+        ]
+        with Session(self.engine) as session, session.begin():
+            session.execute(
+                delete(self.cache_schema).where(self.cache_schema.key == key)
+            )
+            if rows:
+                session.execute(insert(self.cache_schema), rows)
+
+    def clear(self, **kwargs: Any) -> None:
+        """Clear cache."""
+        with Session(self.engine) as session, session.begin():
+            session.execute(delete(self.cache_schema))
+
+    def migrate_from(
+        self,
+        legacy_schema: Type[FullLLMCache] = FullLLMCache,
+        *,
+        batch_size: int = 1000,
+        drop_legacy: bool = False,
+        overwrite: bool = True,
+    ) -> int:
+        """Copy entries from a `SQLAlchemyCache` table into this cache.
+
+        The legacy table is read in pages of ``batch_size`` rows with a keyset
+        cursor over its primary key, so neither the table nor the set of
+        migrated keys needs to fit in memory.
+
+        Args:
+            legacy_schema: The table used by the existing `SQLAlchemyCache`.
+            batch_size: Number of rows to read and write per page.
+            drop_legacy: Whether to drop the legacy table once copied.
+            overwrite: Whether legacy entries replace keys already present in
+                this cache. With False, keys written before the migration are
+                kept, so migrating again only copies the entries still missing.
+
+        Returns:
+            The number of rows migrated.
+        """
+        if not inspect_sqlalchemy(self.engine).has_table(legacy_schema.__tablename__):
+            return 0
+        columns = (legacy_schema.prompt, legacy_schema.llm, legacy_schema.idx)
+        stmt: Select = (
+            select(*columns, legacy_schema.response)
+            .order_by(*columns)
+            .limit(batch_size)
+        )
+        migrated = 0
+        cursor: Optional[Tuple[Any, ...]] = None
+        # Pages are ordered by prompt and llm, so the generations of a key are
+        # contiguous and only the key straddling a page boundary is carried.
+        last_key: Optional[str] = None
+        last_key_skipped = False
+        with Session(self.engine) as session, session.begin():
+            while True:
+                page_stmt = stmt
+                if cursor is not None:
+                    page_stmt = stmt.where(tuple_(*columns) > tuple_(*cursor))
+                page = session.execute(page_stmt).fetchall()
+                if not page:
+                    break
+                cursor = tuple(page[-1][:3])
+                rows: List[Dict[str, Any]] = []
+                for prompt, llm, idx, response in page:
+                    key = self._key(cast(str, prompt), cast(str, llm))
+                    rows.append(
+                        {"key": key, "idx": idx, "prompt": prompt, "response": response}
+                    )
+                new_keys = {row["key"] for row in rows} - {last_key}
+                skipped_keys: Set[Optional[str]] = set()
+                if new_keys and not overwrite:
+                    skipped_keys.update(
+                        session.execute(
+                            select(self.cache_schema.key).where(
+                                self.cache_schema.key.in_(new_keys)
+                            )
+                        ).scalars()
+                    )
+                elif new_keys:
+                    session.execute(
+                        delete(self.cache_schema).where(
+                            self.cache_schema.key.in_(new_keys)
+                        )
+                    )
+                if last_key_skipped:
+                    skipped_keys.add(last_key)
+                last_key = rows[-1]["key"]
+                last_key_skipped = last_key in skipped_keys
+                rows = [row for row in rows if row["key"] not in skipped_keys]
+                if rows:
+                    session.execute(insert(self.cache_schema), rows)
+                migrated += len(rows)
+                if len(page) < batch_size:
+                    break
+        if drop_legacy:
+            legacy_schema.__table__.drop(self.engine)
+        return migrated
+
+
+class SQLiteHashedCache(SQLAlchemyHashedCache):
+    """Cache that uses SQLite as a backend with fixed-width hashed keys.
+
+    Connections are tuned with `SQLITE_PERFORMANCE_PRAGMAS` (WAL mode) unless
+    other ``pragmas`` are given.
+    """
+
+    def __init__(
+        self,
+        database_path: str = ".langchain.db",
+        *,
+        pragmas: Optional[Dict[str, Any]] = None,
+        migrate_legacy: bool = False,
+    ):
+        """Initialize by creating the engine and all tables.
+
+        Args:
+            database_path: Path of the SQLite database file.
+            pragmas: PRAGMAs applied to every connection. Defaults to
+                `SQLITE_PERFORMANCE_PRAGMAS`; pass an empty dict to disable.
+            migrate_legacy: Whether to copy the entries of an existing
+                `SQLiteCache` table from the same database on startup. The
+                migration only runs while this cache is still empty, so
+                restarts neither rescan the legacy table nor overwrite
+                entries written since.
+        """
+        if pragmas is None:
+            pragmas = SQLITE_PERFORMANCE_PRAGMAS
+        engine = _create_sqlite_engine(database_path, pragmas)
+        super().__init__(engine)
+        if migrate_legacy and self._is_empty():
+            self.migrate_from(FullLLMCache, overwrite=False)
+
+    def _is_empty(self) -> bool:
+        stmt: Select = select(self.cache_schema.key).limit(1)
+        with Session(self.engine) as session:
+            return session.execute(stmt).first() is None
+
+
 class UpstashRedisCache(BaseCache):
     """Cache that uses Upstash Redis as a backend."""
 
@@ -395,11 +1346,44 @@ class UpstashRedisCache(BaseCache):
 
 
 class _RedisCacheBase(BaseCache, ABC):
+    redis: Any
+    ttl: Optional[int]
+    value_encoding: Literal["hash", "binary"]
+    codec: GenerationCodec
+
     @staticmethod
     def _key(prompt: str, llm_string: str) -> str:
         """Compute key from prompt and llm_string"""
         return _hash(prompt + llm_string)
 
+    @staticmethod
+    def _binary_key(prompt: str, llm_string: str) -> str:
+        """Compute key for the binary encoding, which stores a plain string value.
+
+        Uses its own namespace so that the two encodings can share a database
+        without running into WRONGTYPE errors.
+        """
+        return "lcb:" + _hash(prompt + llm_string)
+
+    @staticmethod
+    def _validate_value_encoding(value_encoding: str, redis_: Any) -> None:
+        if value_encoding not in ("hash", "binary"):
+            raise ValueError(
+                f"Unknown value_encoding {value_encoding!r}, "
+                "expected 'hash' or 'binary'."
+            )
+        # A client that decodes responses returns the binary blobs as `str`,
+        # which either fails to decode or never matches the codec's header.
+        if value_encoding == "binary" and redis_.get_encoder().decode_responses:
+            raise ValueError(
+                "value_encoding='binary' requires a Redis client created with "
+                "decode_responses=False."
+            )
+
+    def _keys(self, prompts: Sequence[str], llm_string: str) -> List[str]:
+        key_fn = self._binary_key if self.value_encoding == "binary" else self._key
+        return [key_fn(prompt, llm_string) for prompt in prompts]
+
     @staticmethod
     def _ensure_generation_type(return_val: RETURN_VAL_TYPE) -> None:
         for gen in return_val:
@@ -430,6 +1414,17 @@ class _RedisCacheBase(BaseCache, ABC):
                     generations.append(Generation(text=text))  # type: ignore[arg-type]
         return generations if generations else None
 
+    def _decode_binary(
+        self, value: Optional[Union[str, bytes]]
+    ) -> Optional[RETURN_VAL_TYPE]:
+        return self.codec.decode(value) if value else None
+
+    def _decode(self, result: Any) -> Optional[RETURN_VAL_TYPE]:
+        """Decode the reply of a HGETALL or GET, depending on the encoding."""
+        if self.value_encoding == "binary":
+            return self._decode_binary(result)
+        return self._get_generations(result)
+
     @staticmethod
     def _configure_pipeline_for_update(
         key: str, pipe: Any, return_val: RETURN_VAL_TYPE, ttl: Optional[int] = None
@@ -443,13 +1438,28 @@ class _RedisCacheBase(BaseCache, ABC):
         if ttl is not None:
             pipe.expire(key, ttl)
 
+    def _configure_pipeline_for_write(
+        self, key: str, pipe: Any, return_val: RETURN_VAL_TYPE
+    ) -> None:
+        if self.value_encoding == "binary":
+            pipe.set(key, self.codec.encode(return_val), ex=self.ttl)
+        else:
+            self._configure_pipeline_for_update(key, pipe, return_val, self.ttl)
+
 
 class RedisCache(_RedisCacheBase):
     """
     Cache that uses Redis as a backend. Allows to use a sync `redis.Redis` client.
     """
 
-    def __init__(self, redis_: Any, *, ttl: Optional[int] = None):
+    def __init__(
+        self,
+        redis_: Any,
+        *,
+        ttl: Optional[int] = None,
+        value_encoding: Literal["hash", "binary"] = "hash",
+        codec: Optional[GenerationCodec] = None,
+    ):
         """
         Initialize an instance of RedisCache.
 
@@ -467,6 +1477,13 @@ class RedisCache(_RedisCacheBase):
                 If provided, it sets the time duration for how long cached
                 items will remain valid. If not provided, cached items will not
                 have an automatic expiration.
+            value_encoding (str): ``"hash"`` (default) stores each generation
+                as a field of a Redis HASH. ``"binary"`` stores all generations
+                as one blob encoded by ``codec``, which is smaller and lets
+                `batch_lookup` use a single MGET. It needs a client created
+                with ``decode_responses=False``.
+            codec (GenerationCodec, optional): Codec of the ``"binary"``
+                encoding. Defaults to `BinaryGenerationCodec`.
         """
         try:
             from redis import Redis
@@ -477,26 +1494,120 @@ class RedisCache(_RedisCacheBase):
             )
         if not isinstance(redis_, Redis):
             raise ValueError("Please pass a valid `redis.Redis` client.")
+        self._validate_value_encoding(value_encoding, redis_)
         self.redis = redis_
         self.ttl = ttl
+        self.value_encoding = value_encoding
+        self.codec = codec or BinaryGenerationCodec()
+
+    @classmethod
+    def from_url(
+        cls,
+        redis_url: str,
+        *,
+        ttl: Optional[int] = None,
+        value_encoding: Literal["hash", "binary"] = "hash",
+        codec: Optional[GenerationCodec] = None,
+        max_connections: Optional[int] = None,
+        socket_timeout: Optional[float] = None,
+        socket_connect_timeout: Optional[float] = None,
+        health_check_interval: int = 0,
+        **connection_kwargs: Any,
+    ) -> RedisCache:
+        """Create a RedisCache with its own connection pool.
+
+        Args:
+            redis_url: URL of the Redis server.
+            ttl: Time-to-live for cached items in seconds.
+            value_encoding: See `RedisCache`.
+            codec: See `RedisCache`.
+            max_connections: Maximum number of connections in the pool.
+            socket_timeout: Timeout, in seconds, of socket reads and writes.
+            socket_connect_timeout: Timeout, in seconds, to connect.
+            health_check_interval: Seconds after which an idle connection is
+                checked before use. 0 disables the checks.
+            connection_kwargs: Further arguments for `redis.ConnectionPool`.
+        """
+        try:
+            from redis import ConnectionPool, Redis
+        except ImportError:
+            raise ImportError(
+                "Could not import `redis` python package. "
+                "Please install it with `pip install redis`."
+            )
+        pool = ConnectionPool.from_url(
+            redis_url,
+            max_connections=max_connections,
+            socket_timeout=socket_timeout,
+            socket_connect_timeout=socket_connect_timeout,
+            health_check_interval=health_check_interval,
+            **connection_kwargs,
+        )
+        return cls(
+            Redis(connection_pool=pool),
+            ttl=ttl,
+            value_encoding=value_encoding,
+            codec=codec,
+        )
 
     def lookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
         """Look up based on prompt and llm_string."""
-        # Read from a Redis HASH
         try:
+            if self.value_encoding == "binary":
+                return self._decode_binary(
+                    self.redis.get(self._binary_key(prompt, llm_string))
+                )
+            # Read from a Redis HASH
             results = self.redis.hgetall(self._key(prompt, llm_string))
             return self._get_generations(results)  # type: ignore[arg-type]
         except Exception as e:
             logger.error(f"Redis lookup failed: {e}")
             return None
 
+    def batch_lookup(
+        self, prompts: Sequence[str], llm_string: str
+    ) -> List[Optional[RETURN_VAL_TYPE]]:
+        """Look up several prompts for the same llm_string in one round-trip.
+
+        Returns:
+            One entry per prompt: the cached generations, or None on a miss.
+        """
+        if not prompts:
+            return []
+        keys = self._keys(prompts, llm_string)
+        try:
+            if self.value_encoding == "binary":
+                results = self.redis.mget(keys)
+            else:
+                with self.redis.pipeline(transaction=False) as pipe:
+                    for key in keys:
+                        pipe.hgetall(key)
+                    results = pipe.execute()
+            return [self._decode(result) for result in results]
+        except Exception as e:
+            logger.error(f"Redis batch lookup failed: {e}")
+            return [None] * len(prompts)
+
     def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
         """Update cache based on prompt and llm_string."""
-        self._ensure_generation_type(return_val)
-        key = self._key(prompt, llm_string)
+        self.batch_update([prompt], llm_string, [return_val])
+
+    def batch_update(
+        self,
+        prompts: Sequence[str],
+        llm_string: str,
+        return_vals: Sequence[RETURN_VAL_TYPE],
+    ) -> None:
+        """Update several prompts for the same llm_string in one round-trip."""
+        if len(prompts) != len(return_vals):
+            raise ValueError("prompts and return_vals must have the same length.")
+        for return_val in return_vals:
+            self._ensure_generation_type(return_val)
+        keys = self._keys(prompts, llm_string)
         try:
             with self.redis.pipeline() as pipe:
-                self._configure_pipeline_for_update(key, pipe, return_val, self.ttl)
+                for key, return_val in zip(keys, return_vals):
+                    self._configure_pipeline_for_write(key, pipe, return_val)
                 pipe.execute()
         except Exception as e:
             logger.error(f"Redis update failed: {e}")
@@ -516,7 +1627,14 @@ class AsyncRedisCache(_RedisCacheBase):
     async `redis.asyncio.Redis` client.
     """
 
-    def __init__(self, redis_: Any, *, ttl: Optional[int] = None):
+    def __init__(
+        self,
+        redis_: Any,
+        *,
+        ttl: Optional[int] = None,
+        value_encoding: Literal["hash", "binary"] = "hash",
+        codec: Optional[GenerationCodec] = None,
+    ):
         """
         Initialize an instance of AsyncRedisCache.
 
@@ -534,6 +1652,13 @@ class AsyncRedisCache(_RedisCacheBase):
                 If provided, it sets the time duration for how long cached
                 items will remain valid. If not provided, cached items will not
                 have an automatic expiration.
+            value_encoding (str): ``"hash"`` (default) stores each generation
+                as a field of a Redis HASH. ``"binary"`` stores all generations
+                as one blob encoded by ``codec``, which is smaller and lets
+                `abatch_lookup` use a single MGET. It needs a client created
+                with ``decode_responses=False``.
+            codec (GenerationCodec, optional): Codec of the ``"binary"``
+                encoding. Defaults to `BinaryGenerationCodec`.
         """
         try:
             from redis.asyncio import Redis
@@ -544,8 +1669,62 @@ class AsyncRedisCache(_RedisCacheBase):
             )
         if not isinstance(redis_, Redis):
             raise ValueError("Please pass a valid `redis.asyncio.Redis` client.")
+        self._validate_value_encoding(value_encoding, redis_)
         self.redis = redis_
         self.ttl = ttl
+        self.value_encoding = value_encoding
+        self.codec = codec or BinaryGenerationCodec()
+
+    @classmethod
+    def from_url(
+        cls,
+        redis_url: str,
+        *,
+        ttl: Optional[int] = None,
+        value_encoding: Literal["hash", "binary"] = "hash",
+        codec: Optional[GenerationCodec] = None,
+        max_connections: Optional[int] = None,
+        socket_timeout: Optional[float] = None,
+        socket_connect_timeout: Optional[float] = None,
+        health_check_interval: int = 0,
+        **connection_kwargs: Any,
+    ) -> AsyncRedisCache:
+        """Create an AsyncRedisCache with its own connection pool.
+
+        Args:
+            redis_url: URL of the Redis server.
+            ttl: Time-to-live for cached items in seconds.
+            value_encoding: See `AsyncRedisCache`.
+            codec: See `AsyncRedisCache`.
+            max_connections: Maximum number of connections in the pool.
+            socket_timeout: Timeout, in seconds, of socket reads and writes.
+            socket_connect_timeout: Timeout, in seconds, to connect.
+            health_check_interval: Seconds after which an idle connection is
+                checked before use. 0 disables the checks.
+            connection_kwargs: Further arguments for
+                `redis.asyncio.ConnectionPool`.
+        """
+        try:
+            from redis.asyncio import ConnectionPool, Redis
+        except ImportError:
+            raise ImportError(
+                "Could not import `redis.asyncio` python package. "
+                "Please install it with `pip install redis`."
+            )
+        pool = ConnectionPool.from_url(
+            redis_url,
+            max_connections=max_connections,
+            socket_timeout=socket_timeout,
+            socket_connect_timeout=socket_connect_timeout,
+            health_check_interval=health_check_interval,
+            **connection_kwargs,
+        )
+        return cls(
+            Redis(connection_pool=pool),
+            ttl=ttl,
+            value_encoding=value_encoding,
+            codec=codec,
+        )
 
     def lookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
         """Look up based on prompt and llm_string."""
@@ -557,12 +1736,40 @@ class AsyncRedisCache(_RedisCacheBase):
     async def alookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
         """Look up based on prompt and llm_string. Async version."""
         try:
+            if self.value_encoding == "binary":
+                return self._decode_binary(
+                    await self.redis.get(self._binary_key(prompt, llm_string))
+                )
             results = await self.redis.hgetall(self._key(prompt, llm_string))
             return self._get_generations(results)  # type: ignore[arg-type]
         except Exception as e:
             logger.error(f"Redis async lookup failed: {e}")
             return None
 
+    async def abatch_lookup(
+        self, prompts: Sequence[str], llm_string: str
+    ) -> List[Optional[RETURN_VAL_TYPE]]:
+        """Look up several prompts for the same llm_string in one round-trip.
+
+        Returns:
+            One entry per prompt: the cached generations, or None on a miss.
+        """
+        if not prompts:
+            return []
+        keys = self._keys(prompts, llm_string)
+        try:
+            if self.value_encoding == "binary":
+                results = await self.redis.mget(keys)
+            else:
+                async with self.redis.pipeline(transaction=False) as pipe:
+                    for key in keys:
+                        pipe.hgetall(key)
+                    results = await pipe.execute()
+            return [self._decode(result) for result in results]
+        except Exception as e:
+            logger.error(f"Redis async batch lookup failed: {e}")
+            return [None] * len(prompts)
+
     def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
         """Update cache based on prompt and llm_string."""
         raise NotImplementedError(
@@ -574,11 +1781,24 @@ class AsyncRedisCache(_RedisCacheBase):
         self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE
     ) -> None:
         """Update cache based on prompt and llm_string. Async version."""
-        self._ensure_generation_type(return_val)
-        key = self._key(prompt, llm_string)
+        await self.abatch_update([prompt], llm_string, [return_val])
+
+    async def abatch_update(
+        self,
+        prompts: Sequence[str],
+        llm_string: str,
+        return_vals: Sequence[RETURN_VAL_TYPE],
+    ) -> None:
+        """Update several prompts for the same llm_string in one round-trip."""
+        if len(prompts) != len(return_vals):
+            raise ValueError("prompts and return_vals must have the same length.")
+        for return_val in return_vals:
+            self._ensure_generation_type(return_val)
+        keys = self._keys(prompts, llm_string)
         try:
             async with self.redis.pipeline() as pipe:
-                self._configure_pipeline_for_update(key, pipe, return_val, self.ttl)
+                for key, return_val in zip(keys, return_vals):
+                    self._configure_pipeline_for_write(key, pipe, return_val)
                 await pipe.execute()
         except Exception as e:
             logger.error(f"Redis async update failed: {e}")
@@ -891,6 +2111,7 @@ class MomentoCache(BaseCache):
         *,
         ttl: Optional[timedelta] = None,
         ensure_cache_exists: bool = True,
+        codec: Optional[GenerationCodec] = None,
     ):
         """Instantiate a prompt cache using Momento as a backend.
 
@@ -904,6 +2125,9 @@ class MomentoCache(BaseCache):
                 Defaults to None, ie use the client default TTL.
             ensure_cache_exists (bool, optional): Create the cache if it doesn't
                 exist. Defaults to True.
+            codec (GenerationCodec, optional): Codec used to store generations,
+                e.g. `BinaryGenerationCodec`. Defaults to the legacy JSON format,
+                which `BinaryGenerationCodec` can still read.
 
         Raises:
             ImportError: Momento python package is not installed.
@@ -926,6 +2150,7 @@ class MomentoCache(BaseCache):
         self.cache_client = cache_client
         self.cache_name = cache_name
         self.ttl = ttl
+        self.codec = codec
 
     @classmethod
     def from_client_params(
@@ -991,8 +2216,10 @@ class MomentoCache(BaseCache):
             self.cache_name, self.__key(prompt, llm_string)
         )
         if isinstance(get_response, CacheGet.Hit):
-            value = get_response.value_string
-            generations = _load_generations_from_json(value)
+            if self.codec is not None:
+                generations = self.codec.decode(get_response.value_bytes) or []
+            else:
+                generations = _load_generations_from_json(get_response.value_string)
         elif isinstance(get_response, CacheGet.Miss):
             pass
         elif isinstance(get_response, CacheGet.Error):
@@ -1018,7 +2245,11 @@ class MomentoCache(BaseCache):
                     f"got {type(gen)}"
                 )
         key = self.__key(prompt, llm_string)
-        value = _dump_generations_to_json(return_val)
+        value: Union[str, bytes] = (
+            self.codec.encode(return_val)
+            if self.codec is not None
+            else _dump_generations_to_json(return_val)
+        )
         set_response = self.cache_client.set(self.cache_name, key, value, self.ttl)
         from momento.responses import CacheSet
 
@@ -2722,13 +3953,17 @@ class SingleStoreDBSemanticCache(BaseCache):
 class MemcachedCache(BaseCache):
     """Cache that uses Memcached backend through pymemcache client lib"""
 
-    def __init__(self, client_: Any):
+    def __init__(self, client_: Any, *, codec: Optional[GenerationCodec] = None):
         """
         Initialize an instance of MemcachedCache.
 
         Args:
             client_ (str): An instance of any of pymemcache's Clients
                 (Client, PooledClient, HashClient)
+            codec (GenerationCodec, optional): Codec used to store generations,
+                e.g. `BinaryGenerationCodec`. Defaults to the JSON format.
+                Entries written in the JSON format stay readable by
+                `BinaryGenerationCodec`.
         Example:
         .. code-block:: python
             ifrom langchain.globals import set_llm_cache
@@ -2769,6 +4004,7 @@ class MemcachedCache(BaseCache):
             raise ValueError("Please pass a valid pymemcached client")
 
         self.client = client_
+        self.codec = codec
 
     def lookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
         """Look up based on prompt and llm_string."""
@@ -2778,7 +4014,11 @@ class MemcachedCache(BaseCache):
         except pymemcache.MemcacheError:
             return None
 
-        return _loads_generations(result) if result is not None else None
+        if result is None:
+            return None
+        if self.codec is not None:
+            return self.codec.decode(result)
+        return _loads_generations(result)
 
     def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
         """Update cache based on prompt and llm_string."""
@@ -2792,8 +4032,12 @@ class MemcachedCache(BaseCache):
                     + f"got {type(gen)}"
                 )
 
-        # Deserialize return_val into string and update cache
-        value = _dumps_generations(return_val)
+        # Serialize return_val and update cache
+        value = (
+            self.codec.encode(return_val)
+            if self.codec is not None
+            else _dumps_generations(return_val)
+        )
         self.client.set(key, value)
 
     def clear(self, **kwargs: Any) -> None:
@@ -2810,3 +4054,343 @@ class MemcachedCache(BaseCache):
         noreply = kwargs.get("noreply", None)
 
         self.client.flush_all(delay, noreply)
+
+
+class _LocalSemanticPartition:
+    """Embeddings and generations cached for a single llm string.
+
+    Vectors are unit-normalized float32 rows of a growable matrix; slots freed
+    by eviction are reused. An optional HNSW index accelerates the search; it
+    is rebuilt from the matrix once too many of its entries went stale.
+    """
+
+    def __init__(self, dim: int, index_type: str) -> None:
+        self.dim = dim
+        self.index_type = index_type
+        self.vectors = np.zeros((16, dim), dtype=np.float32)
+        self.live = np.zeros(16, dtype=bool)
+        self.last_used = np.zeros(16, dtype=np.int64)
+        self.ann_ids = np.full(16, -1, dtype=np.int64)
+        self.prompts: List[Optional[str]] = [None] * 16
+        self.values: List[Optional[RETURN_VAL_TYPE]] = [None] * 16
+        self.slots: Dict[str, int] = {}  # prompt -> slot
+        self.size = 0  # high-water mark of used slots
+        self.free: List[int] = []
+        self._ann: Any = None
+        self._ann_slots: List[int] = []
+        self._stale = 0
+
+    @property
+    def count(self) -> int:
+        return self.size - len(self.free)
+
+    def _grow(self) -> None:
+        capacity = 2 * len(self.live)
+        vectors = np.zeros((capacity, self.dim), dtype=np.float32)
+        vectors[: self.size] = self.vectors[: self.size]
+        self.vectors = vectors
+        self.live = np.concatenate([self.live, np.zeros_like(self.live)])
+        self.last_used = np.concatenate([self.last_used, np.zeros_like(self.last_used)])
+        self.ann_ids = np.concatenate([self.ann_ids, np.full_like(self.ann_ids, -1)])
+        self.prompts.extend([None] * (capacity - len(self.prompts)))
+        self.values.extend([None] * (capacity - len(self.values)))
+
+    def _ann_add(self, slot: int) -> None:
+        if self.index_type != "hnsw":
+            return
+        if self._ann is None:
+            faiss = dependable_faiss_import()
+            self._ann = faiss.IndexHNSWFlat(self.dim, 32, faiss.METRIC_INNER_PRODUCT)
+        self._ann.add(self.vectors[slot : slot + 1])
+        self.ann_ids[slot] = len(self._ann_slots)
+        self._ann_slots.append(slot)
+
+    def _ann_rebuild(self) -> None:
+        self._ann = None
+        self._ann_slots = []
+        self._stale = 0
+        for slot in np.flatnonzero(self.live[: self.size]):
+            self._ann_add(int(slot))
+
+    def add(
+        self, prompt: str, vector: np.ndarray, value: RETURN_VAL_TYPE, tick: int
+    ) -> None:
+        if self.free:
+            slot = self.free.pop()
+        else:
+            if self.size == len(self.live):
+                self._grow()
+            slot = self.size
+            self.size += 1
+        self.vectors[slot] = vector
+        self.live[slot] = True
+        self.last_used[slot] = tick
+        self.prompts[slot] = prompt
+        self.values[slot] = value
+        self.slots[prompt] = slot
+        self._ann_add(slot)
+
+    def remove(self, slot: int) -> None:
+        self.live[slot] = False
+        self.slots.pop(cast(str, self.prompts[slot]), None)
+        self.prompts[slot] = None
+        self.values[slot] = None
+        self.free.append(slot)
+        if self._ann is not None:
+            self._stale += 1
+            if self._stale > max(16, self.count):
+                self._ann_rebuild()
+
+    def evict_lru(self) -> None:
+        last_used = np.where(
+            self.live[: self.size], self.last_used[: self.size], np.iinfo(np.int64).max
+        )
+        self.remove(int(np.argmin(last_used)))
+
+    def search(self, vector: np.ndarray) -> Tuple[int, float]:
+        """Return the slot most similar to ``vector`` and its cosine similarity."""
+        if self.count == 0:
+            return -1, -1.0
+        if self._ann is not None:
+            k = min(8 + self._stale, self._ann.ntotal)
+            scores, ids = self._ann.search(vector[None, :], k)
+            for score, ann_id in zip(scores[0], ids[0]):
+                if ann_id < 0:
+                    break
+                slot = self._ann_slots[ann_id]
+                # A reused slot is only valid for the id it was last added with.
+                if self.live[slot] and self.ann_ids[slot] == ann_id:
+                    return slot, float(score)
+            return -1, -1.0
+        scores = self.vectors[: self.size] @ vector
+        scores[~self.live[: self.size]] = -np.inf
+        slot = int(np.argmax(scores))
+        return slot, float(scores[slot])
+
+
+class LocalSemanticCache(BaseCache):
+    """Semantic cache backed by an in-process vector index.
+
+    Prompt embeddings are kept in a local index partitioned per llm string, so
+    a semantic lookup costs a matrix-vector product instead of a network hop
+    and a vector-database query. A cached answer is returned when the cosine
+    similarity between the prompt and a cached prompt is at least
+    ``similarity_threshold``.
+
+    The default ``"flat"`` index is an exact numpy scan, which is fast up to a
+    few hundred thousand entries per llm string; ``"hnsw"`` uses a FAISS HNSW
+    graph (requires `faiss`) for larger caches.
+
+    Embeddings of recently seen prompts are memoized, so the usual
+    lookup-then-update sequence embeds each prompt only once.
+
+    Example:
+        .. code-block:: python
+
+            from langchain_community.cache import LocalSemanticCache
+            from langchain_community.embeddings import HuggingFaceEmbeddings
+            from langchain_core.globals import set_llm_cache
+
+            set_llm_cache(
+                LocalSemanticCache(
+                    embedding=HuggingFaceEmbeddings(),
+                    similarity_threshold=0.95,
+                    max_entries=50_000,
+                    persist_path="./semantic_cache",
+                )
+            )
+    """
+
+    def __init__(
+        self,
+        embedding: Embeddings,
+        *,
+        similarity_threshold: float = 0.95,
+        index_type: Literal["flat", "hnsw"] = "flat",
+        max_entries: Optional[int] = None,
+        embedding_cache_size: int = 1024,
+        persist_path: Optional[str] = None,
+    ):
+        """Initialize the local semantic cache.
+
+        Args:
+            embedding: Embedding provider for semantic encoding and search.
+            similarity_threshold: Minimum cosine similarity for a cache hit.
+            index_type: ``"flat"`` for an exact numpy index or ``"hnsw"`` for
+                an approximate FAISS HNSW index.
+            max_entries: Maximum number of entries per llm string; the least
+                recently used entries are evicted beyond it. None means
+                unbounded.
+            embedding_cache_size: Number of prompt embeddings to memoize.
+            persist_path: Directory to load the cache from, if it exists, and
+                to write it to on `persist`.
+        """
+        if index_type not in ("flat", "hnsw"):
+            raise ValueError(
+                f"Unknown index_type {index_type!r}, expected 'flat' or 'hnsw'."
+            )
+        if max_entries is not None and max_entries <= 0:
+            raise ValueError("max_entries must be greater than 0")
+        if index_type == "hnsw":
+            dependable_faiss_import()
+        self.embedding = embedding
+        self.similarity_threshold = similarity_threshold
+        self.index_type = index_type
+        self.max_entries = max_entries
+        self.persist_path = persist_path
+        self._embedding_cache_size = embedding_cache_size
+        self._embeddings: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._partitions: Dict[str, _LocalSemanticPartition] = {}
+        self._lock = threading.RLock()
+        self._tick = 0
+        if persist_path is not None and os.path.exists(
+            os.path.join(persist_path, "index.json")
+        ):
+            self._load(persist_path)
+
+    @staticmethod
+    def _normalize(embedding: List[float]) -> np.ndarray:
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
+
+    def _memoized_embedding(self, prompt: str) -> Optional[np.ndarray]:
+        with self._lock:
+            vector = self._embeddings.get(prompt)
+            if vector is not None:
+                self._embeddings.move_to_end(prompt)
+            return vector
+
+    def _memoize_embedding(self, prompt: str, vector: np.ndarray) -> None:
+        if self._embedding_cache_size <= 0:
+            return
+        with self._lock:
+            self._embeddings[prompt] = vector
+            self._embeddings.move_to_end(prompt)
+            while len(self._embeddings) > self._embedding_cache_size:
+                self._embeddings.popitem(last=False)
+
+    def _embed(self, prompt: str) -> np.ndarray:
+        vector = self._memoized_embedding(prompt)
+        if vector is None:
+            vector = self._normalize(self.embedding.embed_query(prompt))
+            self._memoize_embedding(prompt, vector)
+        return vector
+
+    async def _aembed(self, prompt: str) -> np.ndarray:
+        vector = self._memoized_embedding(prompt)
+        if vector is None:
+            vector = self._normalize(await self.embedding.aembed_query(prompt))
+            self._memoize_embedding(prompt, vector)
+        return vector
+
+    def _search(self, vector: np.ndarray, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        with self._lock:
+            partition = self._partitions.get(llm_string)
+            if partition is None:
+                return None
+            slot, score = partition.search(vector)
+            if slot < 0 or score < self.similarity_threshold:
+                return None
+            self._tick += 1
+            partition.last_used[slot] = self._tick
+            return partition.values[slot]
+
+    def _add(
+        self,
+        prompt: str,
+        vector: np.ndarray,
+        llm_string: str,
+        return_val: RETURN_VAL_TYPE,
+    ) -> None:
+        with self._lock:
+            partition = self._partitions.get(llm_string)
+            if partition is None:
+                partition = _LocalSemanticPartition(len(vector), self.index_type)
+                self._partitions[llm_string] = partition
+            # Updating a cached prompt replaces its entry.
+            existing = partition.slots.get(prompt)
+            if existing is not None:
+                partition.remove(existing)
+            if self.max_entries is not None:
+                while partition.count >= self.max_entries:
+                    partition.evict_lru()
+            self._tick += 1
+            partition.add(prompt, vector, return_val, self._tick)
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        """Look up based on prompt and llm_string."""
+        if llm_string not in self._partitions:
+            return None
+        return self._search(self._embed(prompt), llm_string)
+
+    async def alookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        """Look up based on prompt and llm_string. Async version."""
+        if llm_string not in self._partitions:
+            return None
+        return self._search(await self._aembed(prompt), llm_string)
+
+    def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        """Update cache based on prompt and llm_string."""
+        self._add(prompt, self._embed(prompt), llm_string, return_val)
+
+    async def aupdate(
+        self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE
+    ) -> None:
+        """Update cache based on prompt and llm_string. Async version."""
+        self._add(prompt, await self._aembed(prompt), llm_string, return_val)
+
+    def clear(self, **kwargs: Any) -> None:
+        """Clear the cache for ``llm_string`` if given, otherwise entirely."""
+        with self._lock:
+            if "llm_string" in kwargs:
+                self._partitions.pop(kwargs["llm_string"], None)
+            else:
+                self._partitions = {}
+                self._embeddings = OrderedDict()
+
+    async def aclear(self, **kwargs: Any) -> None:
+        """Clear the cache for ``llm_string`` if given, otherwise entirely."""
+        self.clear(**kwargs)
+
+    def persist(self, path: Optional[str] = None) -> None:
+        """Write the cache to ``path`` (defaults to ``persist_path``).
+
+        Vectors are stored as ``.npy`` files and generations in JSON, so
+        loading does not rely on pickle.
+        """
+        path = path or self.persist_path
+        if path is None:
+            raise ValueError("No path given and no persist_path configured.")
+        os.makedirs(path, exist_ok=True)
+        manifest = []
+        with self._lock:
+            for i, (llm_string, partition) in enumerate(self._partitions.items()):
+                slots = np.flatnonzero(partition.live[: partition.size])
+                order = slots[np.argsort(partition.last_used[slots], kind="stable")]
+                vectors_file = f"partition_{i}.npy"
+                np.save(os.path.join(path, vectors_file), partition.vectors[order])
+                manifest.append(
+                    {
+                        "llm_string": llm_string,
+                        "vectors": vectors_file,
+                        "prompts": [partition.prompts[slot] for slot in order],
+                        "values": [
+                            _dumps_generations(partition.values[slot]) for slot in order
+                        ],
+                    }
+                )
+        with open(os.path.join(path, "index.json"), "w") as f:
+            json.dump({"partitions": manifest}, f)
+
+    def _load(self, path: str) -> None:
+        with open(os.path.join(path, "index.json")) as f:
+            manifest = json.load(f)
+        for entry in manifest["partitions"]:
+            vectors = np.load(os.path.join(path, entry["vectors"]))
+            for prompt, vector, value_str in zip(
+                entry["prompts"], vectors, entry["values"]
+            ):
+                value = _loads_generations(value_str)
+                if value is not None:
+                    self._add(prompt, vector, entry["llm_string"], value)
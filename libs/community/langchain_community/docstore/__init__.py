@@ -23,15 +23,21 @@ if TYPE_CHECKING:
         DocstoreFn,
     )
     from langchain_community.docstore.in_memory import (
+        ColumnarInMemoryDocstore,
         InMemoryDocstore,
     )
+    from langchain_community.docstore.jsonl import (
+        JSONLinesDocstore,
+    )
     from langchain_community.docstore.wikipedia import (
         Wikipedia,
     )
 
 _module_lookup = {
+    "ColumnarInMemoryDocstore": "langchain_community.docstore.in_memory",
     "DocstoreFn": "langchain_community.docstore.arbitrary_fn",
     "InMemoryDocstore": "langchain_community.docstore.in_memory",
+    "JSONLinesDocstore": "langchain_community.docstore.jsonl",
     "Wikipedia": "langchain_community.docstore.wikipedia",
 }
 
@@ -43,4 +49,10 @@ def __getattr__(name: str) -> Any:
     raise AttributeError(f"module {__name__} has no attribute {name}")
 
 
-__all__ = ["DocstoreFn", "InMemoryDocstore", "Wikipedia"]
+__all__ = [
+    "ColumnarInMemoryDocstore",
+    "DocstoreFn",
+    "InMemoryDocstore",
+    "JSONLinesDocstore",
+    "Wikipedia",
+]
@@ -1,7 +1,7 @@
 """Interface to access to place that stores documents."""
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Union
+from typing import Dict, List, Sequence, Union
 
 from langchain_core.documents import Document
 
@@ -17,6 +17,14 @@ class Docstore(ABC):
         If page does not exist, return similar entries.
         """
 
+    def mget(self, ids: Sequence[str]) -> List[Union[str, Document]]:
+        """Search for many documents by id at once.
+
+        Returns one ``search`` result per id, in order. Subclasses can override
+        this with a bulk lookup.
+        """
+        return [self.search(_id) for _id in ids]
+
     def delete(self, ids: List) -> None:
         """Deleting IDs from in memory dictionary."""
         raise NotImplementedError
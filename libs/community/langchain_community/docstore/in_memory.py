@@ -1,6 +1,8 @@
 """Simple in memory docstore in the form of a dict."""
 
-from typing import Dict, List, Optional, Union
+import json
+from array import array
+from typing import Dict, List, Optional, Sequence, Union
 
 from langchain_core.documents import Document
 
@@ -11,8 +13,8 @@ class InMemoryDocstore(Docstore, AddableMixin):
     """Simple in memory docstore in the form of a dict."""
 
     def __init__(self, _dict: Optional[Dict[str, Document]] = None):
-        """Initialize with dict."""
-        self._dict = _dict if _dict is not None else {}
+        """Initialize with a copy of dict, so adds do not mutate the caller's."""
+        self._dict = dict(_dict) if _dict is not None else {}
 
     def add(self, texts: Dict[str, Document]) -> None:
         """Add texts to in memory dictionary.
@@ -23,14 +25,14 @@ class InMemoryDocstore(Docstore, AddableMixin):
         Returns:
             None
         """
-        overlapping = set(texts).intersection(self._dict)
+        overlapping = {_id for _id in texts if _id in self._dict}
         if overlapping:
             raise ValueError(f"Tried to add ids that already exist: {overlapping}")
-        self._dict = {**self._dict, **texts}
+        self._dict.update(texts)
 
     def delete(self, ids: List) -> None:
         """Deleting IDs from in memory dictionary."""
-        overlapping = set(ids).intersection(self._dict)
+        overlapping = {_id for _id in ids if _id in self._dict}
         if not overlapping:
             raise ValueError(f"Tried to delete ids that does not  exist: {ids}")
         for _id in ids:
@@ -49,3 +51,144 @@ class InMemoryDocstore(Docstore, AddableMixin):
             return f"ID {search} not found."
         else:
             return self._dict[search]
+
+    def mget(self, ids: Sequence[str]) -> List[Union[str, Document]]:
+        """Look up many ids at once.
+
+        Args:
+            ids: ids of documents to search for.
+
+        Returns:
+            One Document per id if found, else error message.
+        """
+        return [
+            self._dict[_id] if _id in self._dict else f"ID {_id} not found."
+            for _id in ids
+        ]
+
+
+class ColumnarInMemoryDocstore(Docstore, AddableMixin):
+    """In memory docstore that keeps documents in columns instead of objects.
+
+    Texts are kept in a list and identical metadata dicts are stored once,
+    with each document holding an index into them, so a document costs a
+    string and a few machine words instead of a ``Document`` object.
+    ``Document`` objects are built on lookup, with a copy of the metadata.
+
+    Deleted rows are cleared in place and the columns are compacted once
+    more than half of the rows are deleted.
+    """
+
+    def __init__(self, _dict: Optional[Dict[str, Document]] = None):
+        """Initialize with an optional dict of id -> document."""
+        self._ids: List[Optional[str]] = []
+        self._texts: List[Optional[str]] = []
+        self._metadata_refs = array("q")
+        self._document_ids: Dict[int, str] = {}
+        self._metadatas: List[dict] = []
+        self._metadata_keys: Dict[str, int] = {}
+        self._rows: Dict[str, int] = {}
+        if _dict:
+            self.add(_dict)
+
+    def __contains__(self, _id: object) -> bool:
+        return _id in self._rows
+
+    def _intern_metadata(self, metadata: dict) -> int:
+        try:
+            key: Optional[str] = json.dumps(metadata, sort_keys=True)
+        except (TypeError, ValueError):
+            key = None
+        if key is not None and key in self._metadata_keys:
+            return self._metadata_keys[key]
+        ref = len(self._metadatas)
+        self._metadatas.append(metadata)
+        if key is not None:
+            self._metadata_keys[key] = ref
+        return ref
+
+    def add(self, texts: Dict[str, Document]) -> None:
+        """Add texts to the columns.
+
+        Args:
+            texts: dictionary of id -> document.
+
+        Returns:
+            None
+        """
+        overlapping = {_id for _id in texts if _id in self._rows}
+        if overlapping:
+            raise ValueError(f"Tried to add ids that already exist: {overlapping}")
+        for _id, doc in texts.items():
+            row = len(self._texts)
+            self._rows[_id] = row
+            self._ids.append(_id)
+            self._texts.append(doc.page_content)
+            self._metadata_refs.append(self._intern_metadata(doc.metadata))
+            if doc.id is not None:
+                self._document_ids[row] = doc.id
+
+    def delete(self, ids: List) -> None:
+        """Deleting IDs from the columns."""
+        overlapping = {_id for _id in ids if _id in self._rows}
+        if not overlapping:
+            raise ValueError(f"Tried to delete ids that does not  exist: {ids}")
+        for _id in overlapping:
+            row = self._rows.pop(_id)
+            self._ids[row] = None
+            self._texts[row] = None
+            self._document_ids.pop(row, None)
+        if len(self._rows) * 2 < len(self._texts):
+            self._compact()
+
+    def _compact(self) -> None:
+        """Drop deleted rows and metadata no longer referenced."""
+        ids: List[Optional[str]] = []
+        texts: List[Optional[str]] = []
+        refs = array("q")
+        document_ids: Dict[int, str] = {}
+        metadatas: List[dict] = []
+        remap: Dict[int, int] = {}
+        for row, _id in enumerate(self._ids):
+            if _id is None:
+                continue
+            new_row = len(ids)
+            ids.append(_id)
+            texts.append(self._texts[row])
+            old_ref = self._metadata_refs[row]
+            if old_ref not in remap:
+                remap[old_ref] = len(metadatas)
+                metadatas.append(self._metadatas[old_ref])
+            refs.append(remap[old_ref])
+            if row in self._document_ids:
+                document_ids[new_row] = self._document_ids[row]
+        self._ids = ids
+        self._texts = texts
+        self._metadata_refs = refs
+        self._document_ids = document_ids
+        self._metadatas = metadatas
+        self._metadata_keys = {
+            key: remap[ref] for key, ref in self._metadata_keys.items() if ref in remap
+        }
+        self._rows = {_id: row for row, _id in enumerate(ids) if _id is not None}
+
+    def _document(self, row: int) -> Document:
+        return Document(
+            page_content=self._texts[row],  # type: ignore[arg-type]
+            metadata=dict(self._metadatas[self._metadata_refs[row]]),
+            id=self._document_ids.get(row),
+        )
+
+    def search(self, search: str) -> Union[str, Document]:
+        """Search via direct lookup.
+
+        Args:
+            search: id of a document to search for.
+
+        Returns:
+            Document if found, else error message.
+        """
+        row = self._rows.get(search)
+        if row is None:
+            return f"ID {search} not found."
+        return self._document(row)
@@ -0,0 +1,176 @@
+"""Read-mostly docstore backed by a memory-mapped JSON Lines file."""
+
+from __future__ import annotations
+
+import json
+import mmap
+import os
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Set, Tuple, Union
+
+import numpy as np
+from langchain_core.documents import Document
+
+from langchain_community.docstore.base import AddableMixin, Docstore
+
+
+def _file(path: Path, suffix: str) -> Path:
+    return path.with_name(path.name + suffix)
+
+
+def _replace(tmp: Path, target: Path) -> None:
+    # Readers may still have the old file mapped. Renaming keeps their inode
+    # alive, where truncating it in place would pull the pages from under them.
+    os.replace(tmp, target)
+
+
+class JSONLinesDocstore(Docstore, AddableMixin):
+    """Docstore that reads documents lazily from a memory-mapped JSON Lines file.
+
+    A store at ``path`` is made of three files:
+
+    - ``<path>.jsonl``: one JSON object per document.
+    - ``<path>.offsets.npy``: byte offset of every line, plus the file size.
+    - ``<path>.ids.json``: the docstore id of every line.
+
+    Only the ids are read when the store is opened. A ``Document`` is parsed
+    from its line when it is looked up, and the pages of the file are shared by
+    every process that maps it.
+
+    Documents added after opening are kept in memory and deleted documents are
+    hidden, until the store is written out again with ``write``.
+
+    Example:
+        .. code-block:: python
+
+            from langchain_community.docstore.jsonl import JSONLinesDocstore
+
+            JSONLinesDocstore.write("store/docs", docstore_items)
+            docstore = JSONLinesDocstore("store/docs")
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """Open the store at ``path``, without the file suffixes."""
+        self.path = Path(path)
+        with open(_file(self.path, ".ids.json"), encoding="utf-8") as f:
+            ids: List[str] = json.load(f)
+        self._offsets = np.load(_file(self.path, ".offsets.npy"), mmap_mode="r")
+        with open(_file(self.path, ".jsonl"), "rb") as f:
+            if os.fstat(f.fileno()).st_size:
+                self._data: Union[mmap.mmap, bytes] = mmap.mmap(
+                    f.fileno(), 0, access=mmap.ACCESS_READ
+                )
+            else:
+                self._data = b""
+        self._rows: Dict[str, int] = {_id: row for row, _id in enumerate(ids)}
+        self._added: Dict[str, Document] = {}
+        self._deleted: Set[str] = set()
+
+    @classmethod
+    def write(
+        cls, path: Union[str, Path], documents: Iterable[Tuple[str, Document]]
+    ) -> JSONLinesDocstore:
+        """Write ``(id, document)`` pairs to a new store at ``path`` and open it.
+
+        Existing files are replaced atomically, so stores that still have them
+        open keep reading the old contents.
+
+        Raises:
+            ValueError: If the metadata of a document is not JSON serializable.
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        ids: List[str] = []
+        offsets = [0]
+        tmp_jsonl = _file(path, ".jsonl.tmp")
+        with open(tmp_jsonl, "wb") as f:
+            for _id, doc in documents:
+                row: dict = {"page_content": doc.page_content, "metadata": doc.metadata}
+                if doc.id is not None:
+                    row["id"] = doc.id
+                try:
+                    line = json.dumps(row, ensure_ascii=False).encode("utf-8")
+                except (TypeError, ValueError) as e:
+                    raise ValueError(
+                        f"Metadata of document {_id} is not JSON serializable."
+                    ) from e
+                f.write(line + b"\n")
+                ids.append(_id)
+                offsets.append(offsets[-1] + len(line) + 1)
+        tmp_offsets = _file(path, ".offsets.tmp.npy")
+        np.save(tmp_offsets, np.array(offsets, dtype=np.int64))
+        tmp_ids = _file(path, ".ids.json.tmp")
+        with open(tmp_ids, "w", encoding="utf-8") as f:
+            json.dump(ids, f, ensure_ascii=False)
+        _replace(tmp_jsonl, _file(path, ".jsonl"))
+        _replace(tmp_offsets, _file(path, ".offsets.npy"))
+        _replace(tmp_ids, _file(path, ".ids.json"))
+        return cls(path)
+
+    @staticmethod
+    def remove(path: Union[str, Path]) -> None:
+        """Delete the files of the store at ``path``, if there are any.
+
+        Stores that still have the files open keep reading them.
+        """
+        path = Path(path)
+        for suffix in (".jsonl", ".offsets.npy", ".ids.json"):
+            _file(path, suffix).unlink(missing_ok=True)
+
+    def __contains__(self, _id: object) -> bool:
+        return _id in self._added or (_id in self._rows and _id not in self._deleted)
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the ids of the documents in the store."""
+        for _id in self._rows:
+            if _id not in self._deleted and _id not in self._added:
+                yield _id
+        yield from self._added
+
+    def _read(self, row: int) -> Document:
+        start, end = int(self._offsets[row]), int(self._offsets[row + 1])
+        data = json.loads(self._data[start:end])
+        return Document(
+            page_content=data["page_content"],
+            metadata=data["metadata"],
+            id=data.get("id"),
+        )
+
+    def add(self, texts: Dict[str, Document]) -> None:
+        """Add texts in memory.
+
+        Args:
+            texts: dictionary of id -> document.
+
+        Returns:
+            None
+        """
+        overlapping = {_id for _id in texts if _id in self}
+        if overlapping:
+            raise ValueError(f"Tried to add ids that already exist: {overlapping}")
+        self._added.update(texts)
+
+    def delete(self, ids: List) -> None:
+        """Deleting IDs from the store."""
+        overlapping = {_id for _id in ids if _id in self}
+        if not overlapping:
+            raise ValueError(f"Tried to delete ids that does not  exist: {ids}")
+        for _id in overlapping:
+            if self._added.pop(_id, None) is None:
+                self._deleted.add(_id)
+
+    def search(self, search: str) -> Union[str, Document]:
+        """Search via direct lookup.
+
+        Args:
+            search: id of a document to search for.
+
+        Returns:
+            Document if found, else error message.
+        """
+        if search in self._added:
+            return self._added[search]
+        row = self._rows.get(search)
+        if row is None or search in self._deleted:
+            return f"ID {search} not found."
+        return self._read(row)
@@ -1,49 +1,353 @@
 from __future__ import annotations
 
 import concurrent.futures
+import itertools
+import logging
+import multiprocessing
+import multiprocessing.pool
+import os
+import queue
+import signal
+import time
 from pathlib import Path
-from typing import Iterator, Literal, Optional, Sequence, Union
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 
 from langchain_core.documents import Document
 
 from langchain_community.document_loaders.base import BaseBlobParser
 from langchain_community.document_loaders.blob_loaders import (
+    Blob,
     BlobLoader,
     FileSystemBlobLoader,
 )
 from langchain_community.document_loaders.generic import GenericLoader
 from langchain_community.document_loaders.parsers.registry import get_parser
 
+logger = logging.getLogger(__name__)
+
 _PathLike = Union[str, Path]
 
 DEFAULT = Literal["default"]
 
+# Parser of the current worker process, set once by the pool initializer so
+# that it is not pickled with every blob.
+_worker_parser: Optional[BaseBlobParser] = None
+# Queue on which the worker reports when and in which process it starts on a
+# blob, if timed.
+_worker_starts: Optional[Any] = None
+
+
+def _init_worker(parser: BaseBlobParser, starts: Optional[Any] = None) -> None:
+    global _worker_parser, _worker_starts
+    _worker_parser = parser
+    _worker_starts = starts
+
+
+def _parse_in_worker(index: int, blob: Blob) -> List[Document]:
+    assert _worker_parser is not None
+    if _worker_starts is not None:
+        # Wall-clock time, as the monotonic clock may differ between processes.
+        _worker_starts.put((index, time.time(), os.getpid()))
+    return list(_worker_parser.lazy_parse(blob))
+
+
+def _parse(
+    parser: BaseBlobParser,
+    index: int,
+    blob: Blob,
+    starts: Optional[Dict[int, float]] = None,
+) -> List[Document]:
+    if starts is not None:
+        starts[index] = time.time()
+    return list(parser.lazy_parse(blob))
+
 
 class ConcurrentLoader(GenericLoader):
-    """Load and pars Documents concurrently."""
+    """Load and pars Documents concurrently.
+
+    Blobs are parsed by a pool of threads or, for CPU-bound parsers, of
+    processes. At most ``max_in_flight`` blobs are submitted or waiting to be
+    yielded at any time, so memory stays bounded however many blobs the blob
+    loader yields, and the documents of each blob are yielded as soon as it
+    is parsed.
+
+    With ``executor="process"`` the parser is sent once to every worker
+    process and blobs are pickled to them. Blobs of a ``FileSystemBlobLoader``
+    only hold their path, so the workers read the files themselves.
+    """
 
     def __init__(
         self,
         blob_loader: BlobLoader,
         blob_parser: BaseBlobParser,
         num_workers: int = 4,
+        *,
+        executor: Literal["thread", "process"] = "thread",
+        max_in_flight: Optional[int] = None,
+        preserve_order: bool = False,
+        timeout: Optional[float] = None,
+        silent_errors: bool = False,
     ) -> None:
+        """Initialize the loader.
+
+        Args:
+            blob_loader: A blob loader which knows how to yield blobs
+            blob_parser: A blob parser which knows how to parse blobs into documents.
+                Must be picklable with ``executor="process"``.
+            num_workers: Max number of concurrent workers to use.
+            executor: Parse blobs in a pool of ``"thread"`` or ``"process"``.
+            max_in_flight: Max number of blobs submitted but not yet yielded.
+                Defaults to twice ``num_workers``.
+            preserve_order: Yield documents in the order the blob loader yields
+                blobs, instead of as soon as each blob is parsed.
+            timeout: Max seconds a blob may take to parse, counted from when a
+                worker starts on it. A blob past its timeout fails with a
+                ``TimeoutError``. With processes, the worker parsing it is
+                terminated and replaced, and the other workers carry on. Threads
+                cannot be interrupted and keep running until the parser
+                returns, so the blobs queued behind them are moved to a new
+                pool.
+            silent_errors: Log and skip blobs that fail to parse or time out,
+                instead of raising.
+        """
         super().__init__(blob_loader, blob_parser)
+        if executor not in ("thread", "process"):
+            raise ValueError(f"executor must be 'thread' or 'process', got {executor}")
         self.num_workers = num_workers
+        self.executor = executor
+        self.max_in_flight = max_in_flight or 2 * num_workers
+        self.preserve_order = preserve_order
+        self.timeout = timeout
+        self.silent_errors = silent_errors
 
     def lazy_load(
         self,
     ) -> Iterator[Document]:
         """Load documents lazily with concurrent parsing."""
-        with concurrent.futures.ThreadPoolExecutor(
-            max_workers=self.num_workers
-        ) as executor:
-            futures = {
-                executor.submit(self.blob_parser.lazy_parse, blob)
-                for blob in self.blob_loader.yield_blobs()
-            }
-            for future in concurrent.futures.as_completed(futures):
-                yield from future.result()
+        blobs = iter(self.blob_loader.yield_blobs())
+        # Submission number and blob of every future not yet yielded.
+        pending: Dict[concurrent.futures.Future, Tuple[int, Blob]] = {}
+        # Finished blobs waiting for their turn, by submission number.
+        ready: Dict[int, Tuple[Blob, concurrent.futures.Future, bool]] = {}
+        # When a worker started on each blob, by submission number.
+        started: Dict[int, float] = {}
+        # Blob each worker process last started on, by process id.
+        running: Dict[int, int] = {}
+        pool, starts = self._start_pool()
+        n_submitted = n_yielded = 0
+        try:
+            while True:
+                for blob in itertools.islice(
+                    blobs, self.max_in_flight - len(pending) - len(ready)
+                ):
+                    future = self._submit(pool, starts, started, n_submitted, blob)
+                    pending[future] = (n_submitted, blob)
+                    n_submitted += 1
+                if not pending and not ready:
+                    break
+                done, expired = self._wait(pending, started, running, starts)
+                if expired and self.executor == "process":
+                    self._kill_workers(
+                        {pending[future][0] for future in expired}, running
+                    )
+                for future in done | expired:
+                    index, blob = pending.pop(future)
+                    started.pop(index, None)
+                    ready[index] = (blob, future, future in expired)
+                if expired and self.executor == "thread":
+                    pool = self._replace_pool(pool, pending, started)
+                if self.preserve_order:
+                    while n_yielded in ready:
+                        yield from self._documents(*ready.pop(n_yielded))
+                        n_yielded += 1
+                else:
+                    for index in sorted(ready):
+                        yield from self._documents(*ready.pop(index))
+        finally:
+            self._stop_pool(pool, starts, abandon=bool(pending))
+
+    def _start_pool(self) -> Tuple[Any, Any]:
+        """Start a pool, and the queue its processes report starts on."""
+        if self.executor == "thread":
+            pool = concurrent.futures.ThreadPoolExecutor(max_workers=self.num_workers)
+            return pool, None
+        # Unlike a ProcessPoolExecutor, a multiprocessing pool survives the
+        # termination of one of its workers, and replaces it.
+        context = multiprocessing.get_context()
+        starts = context.Queue() if self.timeout is not None else None
+        return (
+            context.Pool(
+                self.num_workers,
+                initializer=_init_worker,
+                initargs=(self.blob_parser, starts),
+            ),
+            starts,
+        )
+
+    def _submit(
+        self,
+        pool: Any,
+        starts: Any,
+        started: Dict[int, float],
+        index: int,
+        blob: Blob,
+    ) -> concurrent.futures.Future:
+        if self.executor == "process":
+            future: concurrent.futures.Future = concurrent.futures.Future()
+            # Cannot be cancelled, the pool resolves it.
+            future.set_running_or_notify_cancel()
+            pool.apply_async(
+                _parse_in_worker,
+                (index, blob),
+                callback=future.set_result,
+                error_callback=future.set_exception,
+            )
+            return future
+        thread_starts = started if self.timeout is not None else None
+        return pool.submit(_parse, self.blob_parser, index, blob, thread_starts)
+
+    @staticmethod
+    def _kill_workers(indexes: Set[int], running: Dict[int, int]) -> None:
+        """Terminate the processes still parsing the blobs ``indexes``.
+
+        The pool starts new processes in their place, the blobs of the other
+        processes are not affected.
+        """
+        for pid, index in list(running.items()):
+            if index not in indexes:
+                continue
+            del running[pid]
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    def _replace_pool(
+        self,
+        pool: concurrent.futures.ThreadPoolExecutor,
+        pending: Dict[concurrent.futures.Future, Tuple[int, Blob]],
+        started: Dict[int, float],
+    ) -> concurrent.futures.ThreadPoolExecutor:
+        """Replace a thread pool with threads stuck on timed out blobs.
+
+        Threads cannot be stopped: blobs already running keep their future,
+        queued ones are moved to the new pool.
+        """
+        resubmit = [future for future in pending if future.cancel()]
+        self._stop_pool(pool, None, abandon=True)
+        pool = self._start_pool()[0]
+        for future in resubmit:
+            index, blob = pending.pop(future)
+            pending[self._submit(pool, None, started, index, blob)] = (index, blob)
+        return pool
+
+    def _stop_pool(self, pool: Any, starts: Any, abandon: bool) -> None:
+        """Shut a pool down, abandoning its unfinished blobs if ``abandon``.
+
+        Worker processes are terminated, as processes parsing abandoned blobs
+        would keep the interpreter from exiting. Threads cannot be stopped.
+        """
+        if isinstance(pool, multiprocessing.pool.Pool):
+            # Once every blob is yielded, only the tasks of terminated workers
+            # are left, which would never finish.
+            pool.terminate()
+            pool.join()
+        else:
+            pool.shutdown(wait=not abandon, cancel_futures=True)
+        if starts is not None:
+            # Terminated workers may have left the queue unusable.
+            starts.cancel_join_thread()
+            starts.close()
+
+    def _wait(
+        self,
+        pending: Dict[concurrent.futures.Future, Tuple[int, Blob]],
+        started: Dict[int, float],
+        running: Dict[int, int],
+        starts: Any,
+    ) -> Tuple[set, set]:
+        """Wait for a blob to finish or to time out.
+
+        The timeout of a blob counts from when its worker reports starting
+        on it, not from when it is handed to the pool.
+
+        Returns:
+            The futures that are done and the futures that timed out.
+        """
+        if self.timeout is None:
+            done, _ = concurrent.futures.wait(
+                pending, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            return done, set()
+        self._collect_starts(pending, started, running, starts)
+        now = time.time()
+        # Workers start on blobs while we wait, so poll for them.
+        deadlines = [
+            started[index] + self.timeout - now
+            for index, _ in pending.values()
+            if index in started
+        ]
+        done, _ = concurrent.futures.wait(
+            pending,
+            timeout=max(min([self.timeout / 10, 0.1] + deadlines), 0),
+            return_when=concurrent.futures.FIRST_COMPLETED,
+        )
+        self._collect_starts(pending, started, running, starts)
+        now = time.time()
+        expired = set()
+        for future, (index, _) in pending.items():
+            start = started.get(index)
+            if future not in done and start is not None and now - start > self.timeout:
+                expired.add(future)
+        return done, expired
+
+    @staticmethod
+    def _collect_starts(
+        pending: Dict[concurrent.futures.Future, Tuple[int, Blob]],
+        started: Dict[int, float],
+        running: Dict[int, int],
+        starts: Any,
+    ) -> None:
+        """Record the starts reported by worker processes."""
+        if starts is None:
+            return
+        indexes = {index for index, _ in pending.values()}
+        while True:
+            try:
+                index, start, pid = starts.get_nowait()
+            except queue.Empty:
+                return
+            running[pid] = index
+            # Blobs may be yielded before their start is collected.
+            if index in indexes:
+                started[index] = start
+
+    def _documents(
+        self, blob: Blob, future: concurrent.futures.Future, expired: bool
+    ) -> List[Document]:
+        try:
+            if expired:
+                future.cancel()
+                raise TimeoutError(
+                    f"Parsing {blob.source} took more than {self.timeout}s."
+                )
+            return future.result()
+        except Exception as e:
+            if not self.silent_errors:
+                raise
+            logger.warning(f"Error parsing blob {blob.source}: {e}")
+            return []
 
     @classmethod
     def from_filesystem(
@@ -57,6 +361,11 @@ class ConcurrentLoader(GenericLoader):
         parser: Union[DEFAULT, BaseBlobParser] = "default",
         num_workers: int = 4,
         parser_kwargs: Optional[dict] = None,
+        executor: Literal["thread", "process"] = "thread",
+        max_in_flight: Optional[int] = None,
+        preserve_order: bool = False,
+        timeout: Optional[float] = None,
+        silent_errors: bool = False,
     ) -> ConcurrentLoader:
         """Create a concurrent generic document loader using a filesystem blob loader.
 
@@ -71,6 +380,11 @@ class ConcurrentLoader(GenericLoader):
             parser: A blob parser which knows how to parse blobs into documents
             num_workers: Max number of concurrent workers to use.
             parser_kwargs: Keyword arguments to pass to the parser.
+            executor: Parse blobs in a pool of ``"thread"`` or ``"process"``.
+            max_in_flight: Max number of blobs submitted but not yet yielded.
+            preserve_order: Yield documents in the order files are found.
+            timeout: Max seconds a file may take to parse.
+            silent_errors: Log and skip files that fail to parse or time out.
         """
         blob_loader = FileSystemBlobLoader(
             path,
@@ -87,4 +401,13 @@ class ConcurrentLoader(GenericLoader):
                 blob_parser = get_parser(parser)
         else:
             blob_parser = parser
-        return cls(blob_loader, blob_parser, num_workers=num_workers)
+        return cls(
+            blob_loader,
+            blob_parser,
+            num_workers=num_workers,
+            executor=executor,
+            max_in_flight=max_in_flight,
+            preserve_order=preserve_order,
+            timeout=timeout,
+            silent_errors=silent_errors,
+        )
@@ -1,10 +1,28 @@
-import concurrent
+import concurrent.futures
+import fnmatch
+import hashlib
+import itertools
+import json
 import logging
+import os
 import random
+import time
 from pathlib import Path
-from typing import Any, Callable, Iterator, List, Optional, Sequence, Tuple, Type, Union
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
 
 from langchain_core.documents import Document
+from langchain_core.stores import ByteStore
 
 from langchain_community.document_loaders.base import BaseLoader
 from langchain_community.document_loaders.csv_loader import CSVLoader
@@ -26,6 +44,59 @@ def _is_visible(p: Path) -> bool:
     return True
 
 
+def _name_pattern(pattern: str) -> Optional[Tuple[bool, str]]:
+    """Split a glob pattern that only matches file names.
+
+    Returns:
+        Whether the pattern matches in subdirectories (a ``**/`` prefix) and the
+        file name pattern, or None for patterns that match on directory names.
+    """
+    *directories, name = pattern.split("/")
+    if name in ("", "**") or any(part != "**" for part in directories):
+        return None
+    return bool(directories), name
+
+
+def _walk(
+    root: Path, patterns: Sequence[Tuple[bool, str]], *, skip_hidden: bool = False
+) -> Iterator[Path]:
+    """Yield the files under root matching any ``(recursive, name)`` pattern.
+
+    Directories are scanned one at a time with ``os.scandir``, so files are
+    yielded as they are found. Like ``Path.glob``, symlinked directories are
+    not descended into and unreadable directories are skipped. With
+    ``skip_hidden``, directories starting with a dot are not descended into.
+    """
+    recursive = any(pattern_recursive for pattern_recursive, _ in patterns)
+    stack = [(str(root), True)]
+    while stack:
+        directory, top = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir() and not entry.is_symlink():
+                        if recursive and not (
+                            skip_hidden and entry.name.startswith(".")
+                        ):
+                            stack.append((entry.path, False))
+                    elif entry.is_file() and any(
+                        (top or pattern_recursive) and fnmatch.fnmatch(entry.name, name)
+                        for pattern_recursive, name in patterns
+                    ):
+                        yield Path(entry.path)
+        except OSError:
+            continue
+
+
+def _load_file(loader_cls: Any, loader_kwargs: dict, path: str) -> List[Document]:
+    """Load one file; module level so that worker processes can run it."""
+    loader = loader_cls(path, **loader_kwargs)
+    try:
+        return list(loader.lazy_load())
+    except NotImplementedError:
+        return list(loader.load())
+
+
 class DirectoryLoader(BaseLoader):
     """Load from a directory."""
 
@@ -46,6 +117,8 @@ class DirectoryLoader(BaseLoader):
         sample_size: int = 0,
         randomize_sample: bool = False,
         sample_seed: Union[int, None] = None,
+        use_multiprocessing: bool = False,
+        file_cache: Optional[ByteStore] = None,
     ):
         """Initialize with a path to directory and how to glob over it.
 
@@ -68,6 +141,21 @@ class DirectoryLoader(BaseLoader):
                 directory.
             randomize_sample: Shuffle the files to get a random sample.
             sample_seed: set the seed of the random shuffle for reproducibility.
+            use_multiprocessing: Whether to load files in a pool of
+                ``max_concurrency`` processes, for CPU-bound loaders.
+                ``loader_cls`` and ``loader_kwargs`` must be picklable.
+                Defaults to False.
+            file_cache: Store for the documents of each file, keyed on the file
+                path, modification time and size and on ``loader_cls`` and
+                ``loader_kwargs``. Files
+                found in it are not loaded again. Documents are stored as JSON,
+                files whose metadata is not JSON serializable are not cached.
+
+        Files are found with a streaming directory walk when every glob pattern
+        only matches file names (like ``"*.txt"`` or ``"**/*.txt"``), and are
+        loaded as they are found. With multithreading or multiprocessing, at
+        most twice ``max_concurrency`` files are being loaded at once. Files per
+        second and bytes per second are logged at INFO level when done.
 
         Examples:
 
@@ -111,6 +199,8 @@ class DirectoryLoader(BaseLoader):
         self.sample_size = sample_size
         self.randomize_sample = randomize_sample
         self.sample_seed = sample_seed
+        self.use_multiprocessing = use_multiprocessing
+        self.file_cache = file_cache
 
     def load(self) -> List[Document]:
         """Load documents."""
@@ -124,41 +214,28 @@ class DirectoryLoader(BaseLoader):
         if not p.is_dir():
             raise ValueError(f"Expected directory, got file: '{self.path}'")
 
-        # glob multiple patterns if a list is provided, e.g., multiple file extensions
-        if isinstance(self.glob, (list, tuple)):
-            paths = []
-            for pattern in self.glob:
-                paths.extend(
-                    list(p.rglob(pattern) if self.recursive else p.glob(pattern))
-                )
-        elif isinstance(self.glob, str):
-            paths = list(p.rglob(self.glob) if self.recursive else p.glob(self.glob))
-        else:
-            raise TypeError(
-                f"Expected glob to be str or sequence of str, but got {type(self.glob)}"
-            )
-
-        items = [
-            path
-            for path in paths
-            if not (self.exclude and any(path.match(glob) for glob in self.exclude))
-            and path.is_file()
-        ]
+        items: Iterable[Path] = (
+            item
+            for item in self._iter_paths(p)
+            if not (self.exclude and any(item.match(glob) for glob in self.exclude))
+            and (_is_visible(item.relative_to(p)) or self.load_hidden)
+        )
 
         if self.sample_size > 0:
             if self.randomize_sample:
+                items = list(items)
                 randomizer = random.Random(
                     self.sample_seed if self.sample_seed else None
                 )
                 randomizer.shuffle(items)
-            items = items[: min(len(items), self.sample_size)]
+            items = itertools.islice(items, self.sample_size)
 
         pbar = None
         if self.show_progress:
             try:
                 from tqdm import tqdm
 
-                pbar = tqdm(total=len(items))
+                pbar = tqdm(total=self.sample_size or None)
             except ImportError as e:
                 logger.warning(
                     "To log the progress of DirectoryLoader you need to install tqdm, "
@@ -173,35 +250,184 @@ class DirectoryLoader(BaseLoader):
                         "`pip install tqdm`"
                     )
 
-        if self.use_multithreading:
-            futures = []
-            with concurrent.futures.ThreadPoolExecutor(
-                max_workers=self.max_concurrency
-            ) as executor:
-                for i in items:
-                    futures.append(
-                        executor.submit(
-                            self._lazy_load_file_to_non_generator(self._lazy_load_file),
-                            i,
-                            p,
-                            pbar,
-                        )
-                    )
-                for future in concurrent.futures.as_completed(futures):
-                    for item in future.result():
-                        yield item
+        # Number of files and of bytes loaded.
+        totals = [0, 0]
+        start = time.perf_counter()
+        if self.use_multithreading or self.use_multiprocessing:
+            yield from self._load_concurrently(items, pbar, totals)
         else:
-            for i in items:
-                yield from self._lazy_load_file(i, p, pbar)
+            for item in items:
+                found = self._lookup(item)
+                if found is None:
+                    if pbar:
+                        pbar.update(1)
+                    continue
+                size, key, documents = found
+                totals[0] += 1
+                totals[1] += size
+                if documents is not None:
+                    yield from documents
+                    if pbar:
+                        pbar.update(1)
+                elif key is None:
+                    yield from self._lazy_load_file(item, p, pbar)
+                else:
+                    try:
+                        documents = _load_file(
+                            self.loader_cls, self.loader_kwargs, str(item)
+                        )
+                    except Exception as e:
+                        self._handle_error(item, e)
+                    else:
+                        self._store(key, documents)
+                        yield from documents
+                    finally:
+                        if pbar:
+                            pbar.update(1)
 
+        elapsed = time.perf_counter() - start
+        logger.info(
+            "Loaded %d files (%d bytes) in %.2fs (%.1f files/s, %.1f bytes/s)",
+            totals[0],
+            totals[1],
+            elapsed,
+            totals[0] / elapsed if elapsed else 0.0,
+            totals[1] / elapsed if elapsed else 0.0,
+        )
         if pbar:
             pbar.close()
 
-    def _lazy_load_file_to_non_generator(self, func: Callable) -> Callable:
-        def non_generator(item: Path, path: Path, pbar: Optional[Any]) -> List:
-            return [x for x in func(item, path, pbar)]
+    def _iter_paths(self, p: Path) -> Iterator[Path]:
+        """Yield the files matching the glob patterns, as they are found."""
+        if isinstance(self.glob, (list, tuple)):
+            globs = list(self.glob)
+        elif isinstance(self.glob, str):
+            globs = [self.glob]
+        else:
+            raise TypeError(
+                f"Expected glob to be str or sequence of str, but got {type(self.glob)}"
+            )
+        patterns = [
+            (self.recursive or pattern[0], pattern[1])
+            for pattern in map(_name_pattern, globs)
+            if pattern is not None
+        ]
+        if len(patterns) == len(globs):
+            yield from _walk(p, patterns, skip_hidden=not self.load_hidden)
+            return
+        # glob multiple patterns if a list is provided, e.g., multiple file extensions
+        for pattern in globs:
+            for path in p.rglob(pattern) if self.recursive else p.glob(pattern):
+                if path.is_file():
+                    yield path
+
+    def _lookup(
+        self, item: Path
+    ) -> Optional[Tuple[int, Optional[str], Optional[List[Document]]]]:
+        """Look a file up in the file cache.
+
+        Returns:
+            The size of the file, its cache key (None without a cache), and its
+            cached documents, if any. None if the file could not be read, e.g.
+            because it was deleted since it was found.
+        """
+        try:
+            stat = item.stat()
+        except OSError as e:
+            self._handle_error(item, e)
+            return None
+        if self.file_cache is None:
+            return stat.st_size, None, None
+        loader = f"{self.loader_cls.__module__}.{self.loader_cls.__qualname__}"
+        loader_kwargs = json.dumps(self.loader_kwargs, sort_keys=True, default=repr)
+        key = hashlib.sha256(
+            f"{loader}\0{loader_kwargs}\0{item.resolve()}\0{stat.st_mtime_ns}\0"
+            f"{stat.st_size}".encode()
+        ).hexdigest()
+        cached = self.file_cache.mget([key])[0]
+        if cached is None:
+            return stat.st_size, key, None
+        documents = [Document(**fields) for fields in json.loads(cached)]
+        return stat.st_size, key, documents
+
+    def _store(self, key: str, documents: List[Document]) -> None:
+        if self.file_cache is None:
+            return
+        rows = []
+        for doc in documents:
+            row: dict = {"page_content": doc.page_content, "metadata": doc.metadata}
+            if doc.id is not None:
+                row["id"] = doc.id
+            rows.append(row)
+        try:
+            value = json.dumps(rows)
+        except (TypeError, ValueError):
+            return
+        self.file_cache.mset([(key, value.encode())])
+
+    def _handle_error(self, item: Path, e: Exception) -> None:
+        if self.silent_errors:
+            logger.warning(f"Error loading file {str(item)}: {e}")
+        else:
+            logger.error(f"Error loading file {str(item)}")
+            raise e
+
+    def _load_concurrently(
+        self, items: Iterable[Path], pbar: Optional[Any], totals: List[int]
+    ) -> Iterator[Document]:
+        """Load files in a pool, with at most twice ``max_concurrency`` in flight."""
+        pool: concurrent.futures.Executor
+        if self.use_multiprocessing:
+            pool = concurrent.futures.ProcessPoolExecutor(self.max_concurrency)
+        else:
+            pool = concurrent.futures.ThreadPoolExecutor(self.max_concurrency)
+        pending: Dict[concurrent.futures.Future, Tuple[Path, Optional[str]]] = {}
 
-        return non_generator
+        def collect(block: bool) -> Iterator[Document]:
+            done, _ = concurrent.futures.wait(
+                pending,
+                timeout=None if block else 0,
+                return_when=concurrent.futures.FIRST_COMPLETED,
+            )
+            for future in done:
+                item, key = pending.pop(future)
+                if pbar:
+                    pbar.update(1)
+                try:
+                    documents = future.result()
+                except Exception as e:
+                    self._handle_error(item, e)
+                    continue
+                if key is not None:
+                    self._store(key, documents)
+                yield from documents
+
+        with pool:
+            try:
+                for item in items:
+                    found = self._lookup(item)
+                    if found is None:
+                        if pbar:
+                            pbar.update(1)
+                        continue
+                    size, key, documents = found
+                    totals[0] += 1
+                    totals[1] += size
+                    if documents is not None:
+                        yield from documents
+                        if pbar:
+                            pbar.update(1)
+                        continue
+                    future = pool.submit(
+                        _load_file, self.loader_cls, self.loader_kwargs, str(item)
+                    )
+                    pending[future] = (item, key)
+                    yield from collect(block=len(pending) >= 2 * self.max_concurrency)
+                while pending:
+                    yield from collect(block=True)
+            finally:
+                for future in pending:
+                    future.cancel()
 
     def _lazy_load_file(
         self, item: Path, path: Path, pbar: Optional[Any]
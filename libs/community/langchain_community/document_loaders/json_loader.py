@@ -1,12 +1,132 @@
 import json
+import re
 from os import PathLike
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterator, Optional, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from langchain_core.documents import Document
 
 from langchain_community.document_loaders.base import BaseLoader
 
+# Size hint, in characters, of the chunks of JSON Lines sent to jq at once.
+_JSON_LINES_CHUNK_SIZE = 1 << 20
+
+# One step of a jq path that streaming mode supports: `.key`, `["key"]` or `[]`.
+_JQ_PATH_STEP = re.compile(r'\.([A-Za-z_][A-Za-z0-9_]*)|\.?\["([^"\\.]*)"\]|\.?\[\]')
+
+
+def _jq_path_steps(jq_schema: str) -> Optional[List[Optional[str]]]:
+    """Split a jq path such as ``.data[].items[]`` into its steps.
+
+    Object keys are returned as strings and ``[]`` as None. Returns None if the
+    schema is not made only of object keys and ``[]``.
+    """
+    schema = jq_schema.strip()
+    if schema == ".":
+        return []
+    steps: List[Optional[str]] = []
+    pos = 0
+    while pos < len(schema):
+        match = _JQ_PATH_STEP.match(schema, pos)
+        if match is None:
+            return None
+        key, quoted_key = match.groups()
+        if key is not None:
+            steps.append(key)
+        elif quoted_key is not None:
+            steps.append(quoted_key)
+        else:
+            steps.append(None)
+        pos = match.end()
+    return steps or None
+
+
+def _iter_path(
+    events: Iterable[Tuple[str, str, Any]], steps: List[Optional[str]]
+) -> Iterator[Any]:
+    """Yield the values at a jq path from ijson ``parse`` events.
+
+    Follows jq: ``[]`` iterates over the elements of arrays and the values of
+    objects, a key step only matches object members and gives null on null,
+    and any other value on the path raises a ValueError.
+    """
+    import ijson
+
+    # One entry per open container: whether its current element or member is
+    # on the path.
+    on_path: List[bool] = []
+    # One entry per open container: for objects on the path whose step is a
+    # key, whether the key was found; None otherwise.
+    found: List[Optional[bool]] = []
+    builder: Optional[Any] = None
+    depth = 0
+    for _, event, value in events:
+        if builder is not None:
+            builder.event(event, value)
+            if event in ("start_map", "start_array"):
+                depth += 1
+            elif event in ("end_map", "end_array"):
+                depth -= 1
+            if depth == 0:
+                yield builder.value
+                builder = None
+            continue
+        if event == "map_key":
+            if len(on_path) == 1 or on_path[-2]:
+                step = steps[len(on_path) - 1]
+                on_path[-1] = step is None or step == value
+                if on_path[-1] and step is not None:
+                    found[-1] = True
+            continue
+        if event in ("end_map", "end_array"):
+            on_path.pop()
+            if found.pop() is False:
+                # A missing key gives null.
+                if None in steps[len(on_path) + 1 :]:
+                    raise ValueError("Cannot iterate over null")
+                yield None
+            continue
+        if on_path and not on_path[-1]:
+            if event in ("start_map", "start_array"):
+                on_path.append(False)
+                found.append(None)
+            continue
+        if len(on_path) == len(steps):
+            if event in ("start_map", "start_array"):
+                builder = ijson.ObjectBuilder()
+                builder.event(event, value)
+                depth = 1
+            else:
+                yield value
+            continue
+        step = steps[len(on_path)]
+        if event == "start_map":
+            # Decided by each key.
+            on_path.append(False)
+            found.append(None if step is None else False)
+        elif event == "start_array" and step is None:
+            on_path.append(True)
+            found.append(None)
+        elif value is None and None not in steps[len(on_path) :]:
+            yield None
+        else:
+            kind = "array" if event == "start_array" else event
+            raise ValueError(
+                f"Cannot iterate over {kind}"
+                if step is None
+                else f"Cannot index {kind} with {step!r}"
+            )
+
 
 class JSONLoader(BaseLoader):
     """
@@ -90,6 +210,7 @@ class JSONLoader(BaseLoader):
         metadata_func: Optional[Callable[[Dict, Dict], Dict]] = None,
         text_content: bool = True,
         json_lines: bool = False,
+        streaming: bool = False,
     ):
         """Initialize the JSONLoader.
 
@@ -113,7 +234,18 @@ class JSONLoader(BaseLoader):
             text_content (bool): Boolean flag to indicate whether the content is in
                 string format, default to True.
             json_lines (bool): Boolean flag to indicate whether the input is in
-                JSON Lines format.
+                JSON Lines format. JSON Lines files are read in chunks, so memory
+                does not grow with the size of the file.
+            streaming (bool): Boolean flag to parse a JSON file incrementally
+                with ``ijson`` instead of loading it whole. Documents are yielded
+                as soon as each value is parsed, in constant memory. Only
+                ``jq_schema`` paths made of object keys and ``[]``,
+                such as ``.[]`` or ``.data[].text``, are supported. Requires
+                ``pip install ijson``. Ignored for JSON Lines.
+
+        Raises:
+            ValueError: If ``streaming`` is set and ``jq_schema`` is not a simple
+                path.
         """
         try:
             import jq
@@ -131,18 +263,30 @@ class JSONLoader(BaseLoader):
         self._metadata_func = metadata_func
         self._text_content = text_content
         self._json_lines = json_lines
+        self._compiled_content_key = (
+            jq.compile(content_key)
+            if content_key is not None and is_content_key_jq_parsable
+            else None
+        )
+        self._stream_steps: Optional[List[Optional[str]]] = None
+        if streaming and not json_lines:
+            self._stream_steps = _jq_path_steps(jq_schema)
+            if self._stream_steps is None:
+                raise ValueError(
+                    f"Streaming mode only supports jq paths made of object keys "
+                    f"and `[]`, such as `.data[].text`, got `{jq_schema}`."
+                )
 
     def lazy_load(self) -> Iterator[Document]:
         """Load and return documents from the JSON file."""
         index = 0
         if self._json_lines:
-            with self.file_path.open(encoding="utf-8-sig") as f:
-                for line in f:
-                    line = line.strip()
-                    if line:
-                        for doc in self._parse(line, index):
-                            yield doc
-                            index += 1
+            for chunk in self._iter_json_lines_chunks():
+                for doc in self._parse(chunk, index):
+                    yield doc
+                    index += 1
+        elif self._stream_steps is not None:
+            yield from self._to_documents(self._stream(self._stream_steps), index)
         else:
             for doc in self._parse(
                 self.file_path.read_text(encoding="utf-8-sig"), index
@@ -150,9 +294,39 @@ class JSONLoader(BaseLoader):
                 yield doc
                 index += 1
 
+    def _iter_json_lines_chunks(self) -> Iterator[str]:
+        """Yield chunks of about ``_JSON_LINES_CHUNK_SIZE`` of non-empty lines."""
+        with self.file_path.open(encoding="utf-8-sig") as f:
+            while lines := f.readlines(_JSON_LINES_CHUNK_SIZE):
+                chunk = "\n".join(line for line in map(str.strip, lines) if line)
+                if chunk:
+                    yield chunk
+
+    def _stream(self, steps: List[Optional[str]]) -> Iterator[Any]:
+        """Parse the values at a jq path incrementally."""
+        try:
+            import ijson
+        except ImportError:
+            raise ImportError(
+                "ijson package not found, please install it with `pip install ijson`"
+            )
+
+        with self.file_path.open("rb") as f:
+            if f.read(3) != b"\xef\xbb\xbf":
+                f.seek(0)
+            events = ijson.parse(f, use_float=True)
+            for i, sample in enumerate(_iter_path(events, steps)):
+                if i == 0 and self._content_key is not None:
+                    self._validate_sample(sample)
+                yield sample
+
     def _parse(self, content: str, index: int) -> Iterator[Document]:
-        """Convert given content to documents."""
-        data = self._jq_schema.input(json.loads(content))
+        """Convert given content to documents.
+
+        The content may hold several whitespace-separated JSON values, that are
+        all parsed by jq in one call.
+        """
+        data = self._jq_schema.input_text(content)
 
         # Perform some validation
         # This is not a perfect validation, but it should catch most cases
@@ -160,7 +334,11 @@ class JSONLoader(BaseLoader):
         if self._content_key is not None:
             self._validate_content_key(data)
 
-        for i, sample in enumerate(data, index + 1):
+        yield from self._to_documents(data, index)
+
+    def _to_documents(self, samples: Iterable[Any], index: int) -> Iterator[Document]:
+        """Convert samples extracted by the jq schema to documents."""
+        for i, sample in enumerate(samples, index + 1):
             text = self._get_text(sample=sample)
             metadata = self._get_metadata(
                 sample=sample, source=str(self.file_path), seq_num=i
@@ -170,9 +348,8 @@ class JSONLoader(BaseLoader):
     def _get_text(self, sample: Any) -> str:
         """Convert sample to string format"""
         if self._content_key is not None:
-            if self._is_content_key_jq_parsable:
-                compiled_content_key = self.jq.compile(self._content_key)
-                content = compiled_content_key.input(sample).first()
+            if self._compiled_content_key is not None:
+                content = self._compiled_content_key.input(sample).first()
             else:
                 content = sample[self._content_key]
         else:
@@ -215,8 +392,10 @@ class JSONLoader(BaseLoader):
 
     def _validate_content_key(self, data: Any) -> None:
         """Check if a content key is valid"""
+        self._validate_sample(data.first())
 
-        sample = data.first()
+    def _validate_sample(self, sample: Any) -> None:
+        """Check that a sample has the content key"""
         if not isinstance(sample, dict):
             raise ValueError(
                 f"Expected the jq schema to result in a list of objects (dict), \
@@ -232,8 +411,8 @@ class JSONLoader(BaseLoader):
                     with the key `{self._content_key}`"
             )
         if (
-            self._is_content_key_jq_parsable
-            and self.jq.compile(self._content_key).input(sample).text() is None
+            self._compiled_content_key is not None
+            and self._compiled_content_key.input(sample).text() is None
         ):
             raise ValueError(
                 f"Expected the jq schema to result in a list of objects (dict) \
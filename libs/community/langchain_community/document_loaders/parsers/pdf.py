@@ -2,11 +2,17 @@
 
 from __future__ import annotations
 
+import concurrent.futures
+import functools
 import html
 import io
+import itertools
 import logging
+import multiprocessing
 import threading
 import warnings
+import weakref
+from collections import deque
 from datetime import datetime
 from pathlib import Path
 from tempfile import TemporaryDirectory
@@ -14,6 +20,7 @@ from typing import (
     TYPE_CHECKING,
     Any,
     BinaryIO,
+    Callable,
     Iterable,
     Iterator,
     Literal,
@@ -240,7 +247,126 @@ def _merge_text_and_extras(extras: list[str], text_from_page: str) -> str:
     return all_text
 
 
-class PyPDFParser(BaseBlobParser):
+# Text and page-level metadata of one parsed page.
+_Page = tuple[str, dict[str, Any]]
+
+
+def _use_workers(num_workers: int, pages_per_task: int, total_pages: int) -> bool:
+    """Whether a document is long enough to be split between worker processes."""
+    return num_workers > 1 and total_pages > pages_per_task
+
+
+def _spawn_page_pool(num_workers: int) -> concurrent.futures.ProcessPoolExecutor:
+    # The PDF libraries are not fork-safe.
+    return concurrent.futures.ProcessPoolExecutor(
+        max_workers=num_workers, mp_context=multiprocessing.get_context("spawn")
+    )
+
+
+def _parse_pages_in_workers(
+    parse_range: Callable[[Blob, int, int], list[_Page]],
+    blob: Blob,
+    total_pages: int,
+    num_workers: int,
+    pages_per_task: int,
+    executor: Optional[concurrent.futures.Executor] = None,
+) -> Iterator[_Page]:
+    """Parse a document in ranges of pages in worker processes.
+
+    ``parse_range(blob, start, stop)`` runs in the workers: it opens the
+    document itself and parses pages ``start`` to ``stop``. Only the path of
+    the file is sent to the workers; a blob held in memory is written to a
+    temporary file first.
+
+    At most ``2 * num_workers`` ranges are in flight at once. Pages are yielded
+    in document order, so ranges that finish early wait for the ones before them.
+    The ranges run in ``executor``, which is left running, or else in a pool
+    of ``num_workers`` spawned processes started for this document.
+    """
+    with TemporaryDirectory() as tempdir:
+        if blob.data is not None or blob.path is None:
+            path = Path(tempdir) / "document.pdf"
+            path.write_bytes(blob.as_bytes())
+            blob = Blob.from_path(path)
+        else:
+            blob = Blob.from_path(blob.path)
+        starts = iter(range(0, total_pages, pages_per_task))
+        pool = executor or _spawn_page_pool(num_workers)
+
+        def submit(start: int) -> concurrent.futures.Future:
+            stop = min(start + pages_per_task, total_pages)
+            return pool.submit(parse_range, blob, start, stop)
+
+        pending: deque[concurrent.futures.Future] = deque()
+        try:
+            pending.extend(
+                submit(start) for start in itertools.islice(starts, 2 * num_workers)
+            )
+            while pending:
+                pages = pending.popleft().result()
+                for start in itertools.islice(starts, 1):
+                    pending.append(submit(start))
+                yield from pages
+        finally:
+            if executor is None:
+                pool.shutdown(cancel_futures=True)
+            else:
+                for future in pending:
+                    future.cancel()
+                # The temporary file must outlive the ranges already running.
+                concurrent.futures.wait(pending)
+
+
+# Serializes starting the page pool of a parser shared between threads.
+_page_pool_lock = threading.Lock()
+
+
+class _PageWorkersMixin:
+    """Parse the pages of long documents in a pool of worker processes.
+
+    The pool is the ``executor`` passed by the caller, or one started on first
+    use and kept for the next documents of the parser.
+    """
+
+    num_workers: int
+    pages_per_task: int
+    executor: Optional[concurrent.futures.Executor]
+    _page_pool: Optional[concurrent.futures.ProcessPoolExecutor] = None
+
+    def _parse_pages_in_workers(
+        self,
+        parse_range: Callable[[Blob, int, int], list[_Page]],
+        blob: Blob,
+        total_pages: int,
+    ) -> Iterator[_Page]:
+        return _parse_pages_in_workers(
+            parse_range,
+            blob,
+            total_pages,
+            self.num_workers,
+            self.pages_per_task,
+            self.executor or self._get_page_pool(),
+        )
+
+    def _get_page_pool(self) -> concurrent.futures.ProcessPoolExecutor:
+        with _page_pool_lock:
+            if self._page_pool is None:
+                self._page_pool = _spawn_page_pool(self.num_workers)
+                # Stop the workers with the parser, or at exit.
+                weakref.finalize(
+                    self, self._page_pool.shutdown, wait=False, cancel_futures=True
+                )
+            return self._page_pool
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Pools cannot be pickled, and the workers parsing ranges need none.
+        state = self.__dict__.copy()
+        state["executor"] = None
+        state.pop("_page_pool", None)
+        return state
+
+
+class PyPDFParser(_PageWorkersMixin, BaseBlobParser):
     """Parse a blob from a PDF using `pypdf` library.
 
     This class provides methods to parse a blob from a PDF document, supporting various
@@ -300,6 +426,9 @@ class PyPDFParser(BaseBlobParser):
         images_inner_format: Literal["text", "markdown-img", "html-img"] = "text",
         extraction_mode: Literal["plain", "layout"] = "plain",
         extraction_kwargs: Optional[dict[str, Any]] = None,
+        num_workers: int = 1,
+        pages_per_task: int = 16,
+        executor: Optional[concurrent.futures.Executor] = None,
     ):
         """Initialize a parser based on PyPDF.
 
@@ -322,6 +451,15 @@ class PyPDFParser(BaseBlobParser):
                 the source pdf.
             extraction_kwargs: Optional additional parameters for the extraction
                 process.
+            num_workers: Number of worker processes that parse the pages of a
+                document. With more than one, documents longer than
+                `pages_per_task` are split into ranges of pages parsed in
+                parallel. Pages are still returned in order.
+            pages_per_task: Number of pages parsed by a worker at a time.
+            executor: Pool the pages are parsed in when `num_workers` is more
+                than one. It is left running for the caller to shut down. By default,
+                the parser starts a pool of `num_workers` processes on first use
+                and reuses it for the next documents.
 
         Raises:
             ValueError: If the `mode` is not "single" or "page".
@@ -339,6 +477,9 @@ class PyPDFParser(BaseBlobParser):
         self.pages_delimiter = pages_delimiter
         self.extraction_mode = extraction_mode
         self.extraction_kwargs = extraction_kwargs or {}
+        self.num_workers = num_workers
+        self.pages_per_task = pages_per_task
+        self.executor = executor
 
     def lazy_parse(self, blob: Blob) -> Iterator[Document]:
         """
@@ -362,52 +503,32 @@ class PyPDFParser(BaseBlobParser):
                 "`pypdf` package not found, please install it with `pip install pypdf`"
             )
 
-        def _extract_text_from_page(page: pypdf.PageObject) -> str:
-            """
-            Extract text from image given the version of pypdf.
-
-            Args:
-                page: The page object to extract text from.
-
-            Returns:
-                str: The extracted text.
-            """
-            if pypdf.__version__.startswith("3"):
-                return page.extract_text()
-            else:
-                return page.extract_text(
-                    extraction_mode=self.extraction_mode,
-                    **self.extraction_kwargs,
-                )
-
         with blob.as_bytes_io() as pdf_file_obj:
             pdf_reader = pypdf.PdfReader(pdf_file_obj, password=self.password)
 
+            total_pages = len(pdf_reader.pages)
             doc_metadata = _purge_metadata(
                 {"producer": "PyPDF", "creator": "PyPDF", "creationdate": ""}
                 | cast(dict, pdf_reader.metadata or {})
                 | {
                     "source": blob.source,
-                    "total_pages": len(pdf_reader.pages),
+                    "total_pages": total_pages,
                 }
             )
+            if _use_workers(self.num_workers, self.pages_per_task, total_pages):
+                pages = self._parse_pages_in_workers(
+                    self._parse_page_range,
+                    blob,
+                    total_pages,
+                )
+            else:
+                pages = self._parse_pages(pdf_reader, 0, total_pages)
             single_texts = []
-            for page_number, page in enumerate(pdf_reader.pages):
-                text_from_page = _extract_text_from_page(page=page)
-                images_from_page = self.extract_images_from_page(page)
-                all_text = _merge_text_and_extras(
-                    [images_from_page], text_from_page
-                ).strip()
+            for all_text, page_metadata in pages:
                 if self.mode == "page":
                     yield Document(
                         page_content=all_text,
-                        metadata=_validate_metadata(
-                            doc_metadata
-                            | {
-                                "page": page_number,
-                                "page_label": pdf_reader.page_labels[page_number],
-                            }
-                        ),
+                        metadata=_validate_metadata(doc_metadata | page_metadata),
                     )
                 else:
                     single_texts.append(all_text)
@@ -417,6 +538,55 @@ class PyPDFParser(BaseBlobParser):
                     metadata=_validate_metadata(doc_metadata),
                 )
 
+    def _parse_pages(
+        self, pdf_reader: pypdf.PdfReader, start: int, stop: int
+    ) -> Iterator[_Page]:
+        """Parse the pages from `start` to `stop` of an open document."""
+        import pypdf
+
+        def _extract_text_from_page(page: pypdf.PageObject) -> str:
+            """
+            Extract text from image given the version of pypdf.
+
+            Args:
+                page: The page object to extract text from.
+
+            Returns:
+                str: The extracted text.
+            """
+            if pypdf.__version__.startswith("3"):
+                return page.extract_text()
+            else:
+                return page.extract_text(
+                    extraction_mode=self.extraction_mode,
+                    **self.extraction_kwargs,
+                )
+
+        # Page labels are computed for the whole document on every access.
+        page_labels = pdf_reader.page_labels
+        for page_number in range(start, stop):
+            page = pdf_reader.pages[page_number]
+            text_from_page = _extract_text_from_page(page=page)
+            images_from_page = self.extract_images_from_page(page)
+            all_text = _merge_text_and_extras(
+                [images_from_page], text_from_page
+            ).strip()
+            yield (
+                all_text,
+                {
+                    "page": page_number,
+                    "page_label": page_labels[page_number],
+                },
+            )
+
+    def _parse_page_range(self, blob: Blob, start: int, stop: int) -> list[_Page]:
+        """Open the document and parse the pages from `start` to `stop`."""
+        import pypdf
+
+        with blob.as_bytes_io() as pdf_file_obj:
+            pdf_reader = pypdf.PdfReader(pdf_file_obj, password=self.password)
+            return list(self._parse_pages(pdf_reader, start, stop))
+
     def extract_images_from_page(self, page: pypdf._page.PageObject) -> str:
         """Extract images from a PDF page and get the text using images_to_text.
 
@@ -472,7 +642,7 @@ class PyPDFParser(BaseBlobParser):
         )
 
 
-class PDFMinerParser(BaseBlobParser):
+class PDFMinerParser(_PageWorkersMixin, BaseBlobParser):
     """Parse a blob from a PDF using `pdfminer.six` library.
 
     This class provides methods to parse a blob from a PDF document, supporting various
@@ -535,6 +705,9 @@ class PDFMinerParser(BaseBlobParser):
         images_parser: Optional[BaseImageBlobParser] = None,
         images_inner_format: Literal["text", "markdown-img", "html-img"] = "text",
         concatenate_pages: Optional[bool] = None,
+        num_workers: int = 1,
+        pages_per_task: int = 16,
+        executor: Optional[concurrent.futures.Executor] = None,
     ):
         """Initialize a parser based on PDFMiner.
 
@@ -553,6 +726,15 @@ class PDFMinerParser(BaseBlobParser):
                 (`<img alt="{body}" src="#"/>`)
             concatenate_pages: Deprecated. If True, concatenate all PDF pages
                 into one a single document. Otherwise, return one document per page.
+            num_workers: Number of worker processes that parse the pages of a
+                document. With more than one, documents longer than
+                `pages_per_task` are split into ranges of pages parsed in
+                parallel. Pages are still returned in order.
+            pages_per_task: Number of pages parsed by a worker at a time.
+            executor: Pool the pages are parsed in when `num_workers` is more
+                than one. It is left running for the caller to shut down. By default,
+                the parser starts a pool of `num_workers` processes on first use
+                and reuses it for the next documents.
 
         Returns:
             This method does not directly return data. Use the `parse` or `lazy_parse`
@@ -576,6 +758,9 @@ class PDFMinerParser(BaseBlobParser):
         self.password = password
         self.mode = mode
         self.pages_delimiter = pages_delimiter
+        self.num_workers = num_workers
+        self.pages_per_task = pages_per_task
+        self.executor = executor
         if concatenate_pages is not None:
             if not PDFMinerParser._warn_concatenate_pages:
                 PDFMinerParser._warn_concatenate_pages = True
@@ -698,18 +883,6 @@ class PDFMinerParser(BaseBlobParser):
         """
         try:
             import pdfminer
-            from pdfminer.converter import PDFLayoutAnalyzer
-            from pdfminer.layout import (
-                LAParams,
-                LTContainer,
-                LTImage,
-                LTItem,
-                LTPage,
-                LTText,
-                LTTextBox,
-            )
-            from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
-            from pdfminer.pdfpage import PDFPage
 
             if int(pdfminer.__version__) < 20201018:
                 raise ImportError(
@@ -724,77 +897,28 @@ class PDFMinerParser(BaseBlobParser):
             )
 
         with blob.as_bytes_io() as pdf_file_obj, TemporaryDirectory() as tempdir:
-            pages = PDFPage.get_pages(pdf_file_obj, password=self.password or "")
-            rsrcmgr = PDFResourceManager()
             doc_metadata = _purge_metadata(
                 {"producer": "PDFMiner", "creator": "PDFMiner", "creationdate": ""}
                 | self._get_metadata(pdf_file_obj, password=self.password or "")
             )
             doc_metadata["source"] = blob.source
-
-            class Visitor(PDFLayoutAnalyzer):
-                def __init__(
-                    self,
-                    rsrcmgr: PDFResourceManager,
-                    pageno: int = 1,
-                    laparams: Optional[LAParams] = None,
-                ) -> None:
-                    super().__init__(rsrcmgr, pageno=pageno, laparams=laparams)
-
-                def receive_layout(me, ltpage: LTPage) -> None:
-                    def render(item: LTItem) -> None:
-                        if isinstance(item, LTContainer):
-                            for child in item:
-                                render(child)
-                        elif isinstance(item, LTText):
-                            text_io.write(item.get_text())
-                        if isinstance(item, LTTextBox):
-                            text_io.write("\n")
-                        elif isinstance(item, LTImage):
-                            if self.images_parser:
-                                from pdfminer.image import ImageWriter
-
-                                image_writer = ImageWriter(tempdir)
-                                filename = image_writer.export_image(item)
-                                blob = Blob.from_path(Path(tempdir) / filename)
-                                blob.metadata["source"] = "#"
-                                image_text = next(
-                                    self.images_parser.lazy_parse(blob)
-                                ).page_content
-
-                                text_io.write(
-                                    _format_inner_image(
-                                        blob, image_text, self.images_inner_format
-                                    )
-                                )
-                        else:
-                            pass
-
-                    render(ltpage)
-
-            text_io = io.StringIO()
-            visitor_for_all = PDFPageInterpreter(
-                rsrcmgr, Visitor(rsrcmgr, laparams=LAParams())
-            )
+            total_pages = doc_metadata["total_pages"]
+            if _use_workers(self.num_workers, self.pages_per_task, total_pages):
+                pages = self._parse_pages_in_workers(
+                    self._parse_page_range,
+                    blob,
+                    total_pages,
+                )
+            else:
+                pages = self._parse_pages(pdf_file_obj, tempdir, 0, total_pages)
             all_content = []
-            for i, page in enumerate(pages):
-                text_io.truncate(0)
-                text_io.seek(0)
-                visitor_for_all.process_page(page)
-
-                all_text = text_io.getvalue()
-                # For legacy compatibility, net strip()
-                all_text = all_text.strip()
+            for all_text, page_metadata in pages:
                 if self.mode == "page":
-                    text_io.truncate(0)
-                    text_io.seek(0)
                     yield Document(
                         page_content=all_text,
-                        metadata=_validate_metadata(doc_metadata | {"page": i}),
+                        metadata=_validate_metadata(doc_metadata | page_metadata),
                     )
                 else:
-                    if all_text.endswith("\f"):
-                        all_text = all_text[:-1]
                     all_content.append(all_text)
             if self.mode == "single":
                 # Add pages_delimiter between pages
@@ -804,8 +928,97 @@ class PDFMinerParser(BaseBlobParser):
                     metadata=_validate_metadata(doc_metadata),
                 )
 
+    def _parse_pages(
+        self, pdf_file_obj: BinaryIO, tempdir: str, start: int, stop: int
+    ) -> Iterator[_Page]:
+        """Parse the pages from `start` to `stop` of an open file.
 
-class PyMuPDFParser(BaseBlobParser):
+        Images are exported to `tempdir` to be parsed.
+        """
+        from pdfminer.converter import PDFLayoutAnalyzer
+        from pdfminer.layout import (
+            LAParams,
+            LTContainer,
+            LTImage,
+            LTItem,
+            LTPage,
+            LTText,
+            LTTextBox,
+        )
+        from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
+        from pdfminer.pdfpage import PDFPage
+
+        pages = PDFPage.get_pages(
+            pdf_file_obj,
+            pagenos=range(start, stop),
+            maxpages=stop,
+            password=self.password or "",
+        )
+        rsrcmgr = PDFResourceManager()
+
+        class Visitor(PDFLayoutAnalyzer):
+            def __init__(
+                self,
+                rsrcmgr: PDFResourceManager,
+                pageno: int = 1,
+                laparams: Optional[LAParams] = None,
+            ) -> None:
+                super().__init__(rsrcmgr, pageno=pageno, laparams=laparams)
+
+            def receive_layout(me, ltpage: LTPage) -> None:
+                def render(item: LTItem) -> None:
+                    if isinstance(item, LTContainer):
+                        for child in item:
+                            render(child)
+                    elif isinstance(item, LTText):
+                        text_io.write(item.get_text())
+                    if isinstance(item, LTTextBox):
+                        text_io.write("\n")
+                    elif isinstance(item, LTImage):
+                        if self.images_parser:
+                            from pdfminer.image import ImageWriter
+
+                            image_writer = ImageWriter(tempdir)
+                            filename = image_writer.export_image(item)
+                            blob = Blob.from_path(Path(tempdir) / filename)
+                            blob.metadata["source"] = "#"
+                            image_text = next(
+                                self.images_parser.lazy_parse(blob)
+                            ).page_content
+
+                            text_io.write(
+                                _format_inner_image(
+                                    blob, image_text, self.images_inner_format
+                                )
+                            )
+                    else:
+                        pass
+
+                render(ltpage)
+
+        text_io = io.StringIO()
+        visitor_for_all = PDFPageInterpreter(
+            rsrcmgr, Visitor(rsrcmgr, laparams=LAParams())
+        )
+        for i, page in enumerate(pages, start):
+            text_io.truncate(0)
+            text_io.seek(0)
+            visitor_for_all.process_page(page)
+
+            all_text = text_io.getvalue()
+            # For legacy compatibility, net strip()
+            all_text = all_text.strip()
+            if self.mode == "single" and all_text.endswith("\f"):
+                all_text = all_text[:-1]
+            yield all_text, {"page": i}
+
+    def _parse_page_range(self, blob: Blob, start: int, stop: int) -> list[_Page]:
+        """Open the document and parse the pages from `start` to `stop`."""
+        with blob.as_bytes_io() as pdf_file_obj, TemporaryDirectory() as tempdir:
+            return list(self._parse_pages(pdf_file_obj, tempdir, start, stop))
+
+
+class PyMuPDFParser(_PageWorkersMixin, BaseBlobParser):
     """Parse a blob from a PDF using `PyMuPDF` library.
 
     This class provides methods to parse a blob from a PDF document, supporting various
@@ -874,6 +1087,9 @@ class PyMuPDFParser(BaseBlobParser):
         images_inner_format: Literal["text", "markdown-img", "html-img"] = "text",
         extract_tables: Union[Literal["csv", "markdown", "html"], None] = None,
         extract_tables_settings: Optional[dict[str, Any]] = None,
+        num_workers: int = 1,
+        pages_per_task: int = 16,
+        executor: Optional[concurrent.futures.Executor] = None,
     ) -> None:
         """Initialize a parser based on PyMuPDF.
 
@@ -895,6 +1111,15 @@ class PyMuPDFParser(BaseBlobParser):
                 "csv", "markdown", or "html".
             extract_tables_settings: Optional dictionary of settings for customizing
                 table extraction.
+            num_workers: Number of worker processes that parse the pages of a
+                document, with their images and tables. With more than one,
+                documents longer than `pages_per_task` are split into ranges of
+                pages parsed in parallel. Pages are still returned in order.
+            pages_per_task: Number of pages parsed by a worker at a time.
+            executor: Pool the pages are parsed in when `num_workers` is more
+                than one. It is left running for the caller to shut down. By default,
+                the parser starts a pool of `num_workers` processes on first use
+                and reuses it for the next documents.
 
         Returns:
             This method does not directly return data. Use the `parse` or `lazy_parse`
@@ -922,6 +1147,9 @@ class PyMuPDFParser(BaseBlobParser):
         self.images_parser = images_parser
         self.extract_tables = extract_tables
         self.extract_tables_settings = extract_tables_settings
+        self.num_workers = num_workers
+        self.pages_per_task = pages_per_task
+        self.executor = executor
 
     def lazy_parse(self, blob: Blob) -> Iterator[Document]:
         return self._lazy_parse(
@@ -951,7 +1179,7 @@ class PyMuPDFParser(BaseBlobParser):
             An iterator over the parsed documents.
         """
         try:
-            import pymupdf
+            import pymupdf  # noqa: F401
 
             text_kwargs = text_kwargs or self.text_kwargs
             if not self.extract_tables_settings:
@@ -995,26 +1223,29 @@ class PyMuPDFParser(BaseBlobParser):
 
         with PyMuPDFParser._lock:
             with blob.as_bytes_io() as file_path:
-                if blob.data is None:
-                    doc = pymupdf.open(file_path)
-                else:
-                    doc = pymupdf.open(stream=file_path, filetype="pdf")
-                if doc.is_encrypted:
-                    doc.authenticate(self.password)
+                doc = self._open(blob, file_path)
                 doc_metadata = {
                     "producer": "PyMuPDF",
                     "creator": "PyMuPDF",
                     "creationdate": "",
                 } | self._extract_metadata(doc, blob)
+                total_pages = len(doc)
+                if _use_workers(self.num_workers, self.pages_per_task, total_pages):
+                    pages = self._parse_pages_in_workers(
+                        functools.partial(
+                            self._parse_page_range, text_kwargs=text_kwargs
+                        ),
+                        blob,
+                        total_pages,
+                    )
+                else:
+                    pages = self._parse_pages(doc, 0, total_pages, text_kwargs)
                 full_content = []
-                for page in doc:
-                    all_text = self._get_page_content(doc, page, text_kwargs).strip()
+                for all_text, page_metadata in pages:
                     if self.mode == "page":
                         yield Document(
                             page_content=all_text,
-                            metadata=_validate_metadata(
-                                doc_metadata | {"page": page.number}
-                            ),
+                            metadata=_validate_metadata(doc_metadata | page_metadata),
                         )
                     else:
                         full_content.append(all_text)
@@ -1025,6 +1256,44 @@ class PyMuPDFParser(BaseBlobParser):
                         metadata=_validate_metadata(doc_metadata),
                     )
 
+    def _open(self, blob: Blob, file_path: BinaryIO) -> pymupdf.Document:
+        """Open the document of a blob and authenticate it if encrypted."""
+        import pymupdf
+
+        if blob.data is None:
+            doc = pymupdf.open(file_path)
+        else:
+            doc = pymupdf.open(stream=file_path, filetype="pdf")
+        if doc.is_encrypted:
+            doc.authenticate(self.password)
+        return doc
+
+    def _parse_pages(
+        self,
+        doc: pymupdf.Document,
+        start: int,
+        stop: int,
+        text_kwargs: dict[str, Any],
+    ) -> Iterator[_Page]:
+        """Parse the pages from `start` to `stop` of an open document."""
+        for page_number in range(start, stop):
+            page = doc[page_number]
+            all_text = self._get_page_content(doc, page, text_kwargs).strip()
+            yield all_text, {"page": page.number}
+
+    def _parse_page_range(
+        self,
+        blob: Blob,
+        start: int,
+        stop: int,
+        text_kwargs: dict[str, Any],
+    ) -> list[_Page]:
+        """Open the document and parse the pages from `start` to `stop`."""
+        with PyMuPDFParser._lock:
+            with blob.as_bytes_io() as file_path:
+                doc = self._open(blob, file_path)
+                return list(self._parse_pages(doc, start, stop, text_kwargs))
+
     def _get_page_content(
         self,
         doc: pymupdf.Document,
@@ -1175,7 +1444,7 @@ class PyMuPDFParser(BaseBlobParser):
         return ""
 
 
-class PyPDFium2Parser(BaseBlobParser):
+class PyPDFium2Parser(_PageWorkersMixin, BaseBlobParser):
     """Parse a blob from a PDF using `PyPDFium2` library.
 
     This class provides methods to parse a blob from a PDF document, supporting various
@@ -1239,6 +1508,9 @@ class PyPDFium2Parser(BaseBlobParser):
         pages_delimiter: str = _DEFAULT_PAGES_DELIMITER,
         images_parser: Optional[BaseImageBlobParser] = None,
         images_inner_format: Literal["text", "markdown-img", "html-img"] = "text",
+        num_workers: int = 1,
+        pages_per_task: int = 16,
+        executor: Optional[concurrent.futures.Executor] = None,
     ) -> None:
         """Initialize a parser based on PyPDFium2.
 
@@ -1260,6 +1532,15 @@ class PyPDFium2Parser(BaseBlobParser):
                 layout mode functionality
             extraction_kwargs: Optional additional parameters for the extraction
                 process.
+            num_workers: Number of worker processes that parse the pages of a
+                document. With more than one, documents longer than
+                `pages_per_task` are split into ranges of pages parsed in
+                parallel. Pages are still returned in order.
+            pages_per_task: Number of pages parsed by a worker at a time.
+            executor: Pool the pages are parsed in when `num_workers` is more
+                than one. It is left running for the caller to shut down. By default,
+                the parser starts a pool of `num_workers` processes on first use
+                and reuses it for the next documents.
 
         Returns:
             This method does not directly return data. Use the `parse` or `lazy_parse`
@@ -1279,6 +1560,9 @@ class PyPDFium2Parser(BaseBlobParser):
         self.password = password
         self.mode = mode
         self.pages_delimiter = pages_delimiter
+        self.num_workers = num_workers
+        self.pages_per_task = pages_per_task
+        self.executor = executor
 
     def lazy_parse(self, blob: Blob) -> Iterator[Document]:
         """
@@ -1322,28 +1606,23 @@ class PyPDFium2Parser(BaseBlobParser):
                     doc_metadata["source"] = blob.source
                     doc_metadata["total_pages"] = len(pdf_reader)
 
-                    for page_number, page in enumerate(pdf_reader):
-                        text_page = page.get_textpage()
-                        text_from_page = "\n".join(
-                            text_page.get_text_range().splitlines()
-                        )  # Replace \r\n
-                        text_page.close()
-                        image_from_page = self._extract_images_from_page(page)
-                        all_text = _merge_text_and_extras(
-                            [image_from_page], text_from_page
-                        ).strip()
-                        page.close()
-
+                    total_pages = doc_metadata["total_pages"]
+                    if _use_workers(self.num_workers, self.pages_per_task, total_pages):
+                        pages = self._parse_pages_in_workers(
+                            self._parse_page_range,
+                            blob,
+                            total_pages,
+                        )
+                    else:
+                        pages = self._parse_pages(pdf_reader, 0, total_pages)
+                    for all_text, page_metadata in pages:
                         if self.mode == "page":
-                            # For legacy compatibility, add the last '\n'
-                            if not all_text.endswith("\n"):
-                                all_text += "\n"
                             yield Document(
                                 page_content=all_text,
                                 metadata=_validate_metadata(
                                     {
                                         **doc_metadata,
-                                        "page": page_number,
+                                        **page_metadata,
                                     }
                                 ),
                             )
@@ -1359,6 +1638,41 @@ class PyPDFium2Parser(BaseBlobParser):
                     if pdf_reader:
                         pdf_reader.close()
 
+    def _parse_pages(
+        self, pdf_reader: pypdfium2.PdfDocument, start: int, stop: int
+    ) -> Iterator[_Page]:
+        """Parse the pages from `start` to `stop` of an open document."""
+        for page_number in range(start, stop):
+            page = pdf_reader[page_number]
+            text_page = page.get_textpage()
+            text_from_page = "\n".join(
+                text_page.get_text_range().splitlines()
+            )  # Replace \r\n
+            text_page.close()
+            image_from_page = self._extract_images_from_page(page)
+            all_text = _merge_text_and_extras([image_from_page], text_from_page).strip()
+            page.close()
+            # For legacy compatibility, add the last '\n'
+            if self.mode == "page" and not all_text.endswith("\n"):
+                all_text += "\n"
+            yield all_text, {"page": page_number}
+
+    def _parse_page_range(self, blob: Blob, start: int, stop: int) -> list[_Page]:
+        """Open the document and parse the pages from `start` to `stop`."""
+        import pypdfium2
+
+        with PyPDFium2Parser._lock:
+            with blob.as_bytes_io() as file_path:
+                pdf_reader = None
+                try:
+                    pdf_reader = pypdfium2.PdfDocument(
+                        file_path, password=self.password, autoclose=True
+                    )
+                    return list(self._parse_pages(pdf_reader, start, stop))
+                finally:
+                    if pdf_reader:
+                        pdf_reader.close()
+
     def _extract_images_from_page(self, page: pypdfium2._helpers.page.PdfPage) -> str:
         """Extract images from a PDF page and get the text using images_to_text.
 
@@ -1392,7 +1706,7 @@ class PyPDFium2Parser(BaseBlobParser):
         return _FORMAT_IMAGE_STR.format(image_text=_JOIN_IMAGES.join(str_images))
 
 
-class PDFPlumberParser(BaseBlobParser):
+class PDFPlumberParser(_PageWorkersMixin, BaseBlobParser):
     """Parse `PDF` with `PDFPlumber`."""
 
     def __init__(
@@ -1400,12 +1714,25 @@ class PDFPlumberParser(BaseBlobParser):
         text_kwargs: Optional[Mapping[str, Any]] = None,
         dedupe: bool = False,
         extract_images: bool = False,
+        *,
+        num_workers: int = 1,
+        pages_per_task: int = 16,
+        executor: Optional[concurrent.futures.Executor] = None,
     ) -> None:
         """Initialize the parser.
 
         Args:
             text_kwargs: Keyword arguments to pass to ``pdfplumber.Page.extract_text()``
             dedupe: Avoiding the error of duplicate characters if `dedupe=True`.
+            num_workers: Number of worker processes that parse the pages of a
+                document. With more than one, documents longer than
+                `pages_per_task` are split into ranges of pages parsed in
+                parallel. Pages are still returned in order.
+            pages_per_task: Number of pages parsed by a worker at a time.
+            executor: Pool the pages are parsed in when `num_workers` is more
+                than one. It is left running for the caller to shut down. By default,
+                the parser starts a pool of `num_workers` processes on first use
+                and reuses it for the next documents.
         """
         try:
             import PIL  # noqa:F401
@@ -1416,6 +1743,9 @@ class PDFPlumberParser(BaseBlobParser):
         self.text_kwargs = text_kwargs or {}
         self.dedupe = dedupe
         self.extract_images = extract_images
+        self.num_workers = num_workers
+        self.pages_per_task = pages_per_task
+        self.executor = executor
 
     def lazy_parse(self, blob: Blob) -> Iterator[Document]:
         """Lazily parse the blob."""
@@ -1423,18 +1753,25 @@ class PDFPlumberParser(BaseBlobParser):
 
         with blob.as_bytes_io() as file_path:
             doc = pdfplumber.open(file_path)  # open document
+            total_pages = len(doc.pages)
+            if _use_workers(self.num_workers, self.pages_per_task, total_pages):
+                pages = self._parse_pages_in_workers(
+                    self._parse_page_range,
+                    blob,
+                    total_pages,
+                )
+            else:
+                pages = self._parse_pages(doc, 0, total_pages)
 
             yield from [
                 Document(
-                    page_content=self._process_page_content(page)
-                    + "\n"
-                    + self._extract_images_from_page(page),
+                    page_content=page_content,
                     metadata=dict(
                         {
                             "source": blob.source,
                             "file_path": blob.source,
-                            "page": page.page_number - 1,
-                            "total_pages": len(doc.pages),
+                            **page_metadata,
+                            "total_pages": total_pages,
                         },
                         **{
                             k: doc.metadata[k]
@@ -1443,9 +1780,29 @@ class PDFPlumberParser(BaseBlobParser):
                         },
                     ),
                 )
-                for page in doc.pages
+                for page_content, page_metadata in pages
             ]
 
+    def _parse_pages(
+        self, doc: pdfplumber.PDF, start: int, stop: int
+    ) -> Iterator[_Page]:
+        """Parse the pages from `start` to `stop` of an open document."""
+        for page in doc.pages[start:stop]:
+            page_content = (
+                self._process_page_content(page)
+                + "\n"
+                + self._extract_images_from_page(page)
+            )
+            yield page_content, {"page": page.page_number - 1}
+
+    def _parse_page_range(self, blob: Blob, start: int, stop: int) -> list[_Page]:
+        """Open the document and parse the pages from `start` to `stop`."""
+        import pdfplumber
+
+        with blob.as_bytes_io() as file_path:
+            with pdfplumber.open(file_path) as doc:
+                return list(self._parse_pages(doc, start, stop))
+
     def _process_page_content(self, page: pdfplumber.page.Page) -> str:
         """Process the page content based on dedupe."""
         if self.dedupe:
@@ -7,7 +7,7 @@ from langchain_core.documents import BaseDocumentTransformer, Document
 from langchain_core.embeddings import Embeddings
 from pydantic import BaseModel, ConfigDict, Field
 
-from langchain_community.utils.math import cosine_similarity
+from langchain_community.utils.math import NormalizedMatrix, cosine_similarity
 
 
 class _DocumentWithState(Document):
@@ -50,7 +50,14 @@ def _filter_similar_embeddings(
     embedded_documents: List[List[float]], similarity_fn: Callable, threshold: float
 ) -> List[int]:
     """Filter redundant documents based on the similarity of their embeddings."""
-    similarity = np.tril(similarity_fn(embedded_documents, embedded_documents), k=-1)
+    if similarity_fn is cosine_similarity and len(embedded_documents):
+        # Normalize once and reuse the same rows on both sides of the product.
+        normalized = NormalizedMatrix(embedded_documents)
+        similarity = np.tril(normalized.similarity(normalized), k=-1)
+    else:
+        similarity = np.tril(
+            similarity_fn(embedded_documents, embedded_documents), k=-1
+        )
     redundant = np.where(similarity > threshold)
     redundant_stacked = np.column_stack(redundant)
     redundant_sorted = np.argsort(similarity[redundant])[::-1]
@@ -1,10 +1,16 @@
+import asyncio
+import queue
+import threading
+import time
 import warnings
-from typing import Any, Dict, List, Optional
+import weakref
+from concurrent.futures import Future
+from typing import Any, Dict, List, Optional, Tuple
 
 import requests
 from langchain_core._api import deprecated, warn_deprecated
 from langchain_core.embeddings import Embeddings
-from pydantic import BaseModel, ConfigDict, Field, SecretStr
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, SecretStr
 
 DEFAULT_MODEL_NAME = "sentence-transformers/all-mpnet-base-v2"
 DEFAULT_INSTRUCT_MODEL = "hkunlp/instructor-large"
@@ -19,6 +25,126 @@ DEFAULT_QUERY_BGE_INSTRUCTION_EN = (
 DEFAULT_QUERY_BGE_INSTRUCTION_ZH = "为这个句子生成表示以用于检索相关文章："
 
 
+class _MultiProcessEncoder:
+    """Long-lived ``sentence_transformers`` multi-process pool.
+
+    The worker processes are started on the first request and stopped by
+    ``close``, when the encoder is garbage collected, or at interpreter exit.
+    Requests from concurrent callers are gathered by a dispatcher thread into
+    batches of up to ``max_batch_size`` texts, waiting at most ``max_wait``
+    seconds for more requests, and each batch is encoded with a single
+    ``encode_multi_process`` call.
+
+    Copies and unpickled encoders start their own pool on first use.
+    """
+
+    def __init__(self, client: Any, max_batch_size: int, max_wait: float) -> None:
+        self._client = client
+        self._max_batch_size = max_batch_size
+        self._max_wait = max_wait
+        self._requests: queue.Queue[Optional[Tuple[List[str], Future]]] = queue.Queue()
+        self._lock = threading.Lock()
+        self._finalizer: Optional[weakref.finalize] = None
+        self._closed = False
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return type(self), (self._client, self._max_batch_size, self._max_wait)
+
+    def submit(self, texts: List[str]) -> Future:
+        """Queue texts to encode; the future resolves to their embeddings."""
+        future: Future = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("The multi-process pool has been closed.")
+            if self._finalizer is None:
+                pool = self._client.start_multi_process_pool()
+                # Neither the thread nor the finalizer refer to the encoder, so
+                # that dropping it stops the pool.
+                thread = threading.Thread(
+                    target=self._dispatch,
+                    args=(
+                        self._client,
+                        pool,
+                        self._requests,
+                        self._max_batch_size,
+                        self._max_wait,
+                    ),
+                    name="multi-process-encoder",
+                    daemon=True,
+                )
+                thread.start()
+                self._finalizer = weakref.finalize(
+                    self, self._stop, self._client, pool, self._requests, thread
+                )
+            self._requests.put((texts, future))
+        return future
+
+    @staticmethod
+    def _dispatch(
+        client: Any,
+        pool: Any,
+        requests: "queue.Queue[Optional[Tuple[List[str], Future]]]",
+        max_batch_size: int,
+        max_wait: float,
+    ) -> None:
+        stop = False
+        while not stop:
+            request = requests.get()
+            if request is None:
+                return
+            batch = [request]
+            n_texts = len(request[0])
+            deadline = time.monotonic() + max_wait
+            while n_texts < max_batch_size:
+                try:
+                    request = requests.get(
+                        timeout=max(0.0, deadline - time.monotonic())
+                    )
+                except queue.Empty:
+                    break
+                if request is None:
+                    stop = True
+                    break
+                batch.append(request)
+                n_texts += len(request[0])
+            texts = [text for batch_texts, _ in batch for text in batch_texts]
+            try:
+                embeddings = client.encode_multi_process(texts, pool)
+            except BaseException as e:
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+            offset = 0
+            for batch_texts, future in batch:
+                future.set_result(embeddings[offset : offset + len(batch_texts)])
+                offset += len(batch_texts)
+
+    @staticmethod
+    def _stop(
+        client: Any,
+        pool: Any,
+        requests: "queue.Queue[Optional[Tuple[List[str], Future]]]",
+        thread: threading.Thread,
+    ) -> None:
+        requests.put(None)
+        thread.join()
+        client.stop_multi_process_pool(pool)
+
+    def close(self) -> None:
+        """Encode the pending requests, then stop the worker processes."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        if self._finalizer is not None:
+            self._finalizer()
+
+
+# Serializes creating the encoders of models shared between threads. A lock
+# per model would make the models unpicklable.
+_encoder_lock = threading.Lock()
+
+
 @deprecated(
     since="0.2.2",
     removal="1.0",
@@ -60,10 +186,22 @@ class HuggingFaceEmbeddings(BaseModel, Embeddings):
     `normalize_embeddings`, and more.
     See also the Sentence Transformer documentation: https://sbert.net/docs/package_reference/SentenceTransformer.html#sentence_transformers.SentenceTransformer.encode"""
     multi_process: bool = False
-    """Run encode() on multiple GPUs."""
+    """Run encode() on multiple GPUs.
+
+    The worker processes are started on first use and reused by later calls
+    until `close` is called, the model is garbage collected, or the interpreter
+    exits."""
+    multi_process_batch_size: int = 1024
+    """Maximum number of texts from concurrent calls encoded together when
+    `multi_process` is set."""
+    multi_process_max_wait: float = 0.005
+    """Seconds to wait for concurrent calls to join a batch when
+    `multi_process` is set."""
     show_progress: bool = False
     """Whether to show a progress bar."""
 
+    _encoder: Optional[_MultiProcessEncoder] = PrivateAttr(default=None)
+
     def __init__(self, **kwargs: Any):
         """Initialize the sentence_transformer."""
         super().__init__(**kwargs)
@@ -104,13 +242,9 @@ class HuggingFaceEmbeddings(BaseModel, Embeddings):
         Returns:
             List of embeddings, one for each text.
         """
-        import sentence_transformers
-
         texts = list(map(lambda x: x.replace("\n", " "), texts))
         if self.multi_process:
-            pool = self.client.start_multi_process_pool()
-            embeddings = self.client.encode_multi_process(texts, pool)
-            sentence_transformers.SentenceTransformer.stop_multi_process_pool(pool)
+            embeddings = self._get_encoder().submit(texts).result()
         else:
             embeddings = self.client.encode(
                 texts, show_progress_bar=self.show_progress, **self.encode_kwargs
@@ -118,6 +252,57 @@ class HuggingFaceEmbeddings(BaseModel, Embeddings):
 
         return embeddings.tolist()
 
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        """Asynchronous compute doc embeddings using a HuggingFace transformer model.
+
+        With `multi_process`, the texts are queued to the multi-process pool and
+        awaited without holding a thread.
+
+        Args:
+            texts: The list of texts to embed.
+
+        Returns:
+            List of embeddings, one for each text.
+        """
+        if not self.multi_process:
+            return await super().aembed_documents(texts)
+        texts = list(map(lambda x: x.replace("\n", " "), texts))
+        embeddings = await asyncio.wrap_future(self._get_encoder().submit(texts))
+        return embeddings.tolist()
+
+    async def aembed_query(self, text: str) -> List[float]:
+        """Asynchronous compute query embeddings using a HuggingFace transformer model.
+
+        With `multi_process`, the text is queued to the multi-process pool like
+        in `aembed_documents`.
+
+        Args:
+            text: The text to embed.
+
+        Returns:
+            Embeddings for the text.
+        """
+        if not self.multi_process:
+            return await super().aembed_query(text)
+        return (await self.aembed_documents([text]))[0]
+
+    def _get_encoder(self) -> _MultiProcessEncoder:
+        with _encoder_lock:
+            if self._encoder is None:
+                self._encoder = _MultiProcessEncoder(
+                    self.client,
+                    self.multi_process_batch_size,
+                    self.multi_process_max_wait,
+                )
+            return self._encoder
+
+    def close(self) -> None:
+        """Stop the worker processes of the multi-process pool, if started."""
+        with _encoder_lock:
+            encoder, self._encoder = self._encoder, None
+        if encoder is not None:
+            encoder.close()
+
     def embed_query(self, text: str) -> List[float]:
         """Compute query embeddings using a HuggingFace transformer model.
 
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
-from typing import Any, Callable, Dict, Iterable, List, Optional
+import json
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Literal, Optional, Tuple, Union
 
+import numpy as np
 from langchain_core.callbacks import CallbackManagerForRetrieverRun
 from langchain_core.documents import Document
 from langchain_core.retrievers import BaseRetriever
@@ -12,8 +15,341 @@ def default_preprocessing_func(text: str) -> List[str]:
     return text.split()
 
 
+def _import_scipy_sparse() -> Any:
+    try:
+        import scipy.sparse
+    except ImportError:
+        raise ImportError(
+            "Could not import scipy, please install with `pip install scipy`."
+        )
+    return scipy.sparse
+
+
+class SparseBM25:
+    """BM25 engine over a compressed inverted index.
+
+    Term frequencies are kept in ``scipy.sparse`` CSR matrices with one row per
+    term, so a row is that term's posting list. A query only touches the
+    posting lists of its terms, and top-k selection uses ``np.argpartition``.
+    Scores follow ``rank_bm25.BM25Okapi``, including its epsilon floor for
+    negative idf values.
+
+    Documents are identified by their insertion position. Added documents go
+    into a new segment that is merged with the others once there are more than
+    ``max_segments``. Deleted documents are masked out of results immediately
+    and physically dropped by `compact`, which renumbers the survivors.
+
+    Example:
+        .. code-block:: python
+
+            from langchain_community.retrievers.bm25 import SparseBM25
+
+            engine = SparseBM25([text.split() for text in texts])
+            positions, scores = engine.top_k("what is bm25".split(), k=4)
+    """
+
+    def __init__(
+        self,
+        corpus: Iterable[List[str]] = (),
+        *,
+        k1: float = 1.5,
+        b: float = 0.75,
+        epsilon: float = 0.25,
+        max_segments: int = 8,
+    ) -> None:
+        """
+        Args:
+            corpus: Tokenized documents to index.
+            k1: BM25 term frequency saturation.
+            b: BM25 document length normalization.
+            epsilon: Floor for negative idf values, as a fraction of the
+                average idf.
+            max_segments: Number of segments above which they are merged.
+        """
+        self.k1 = k1
+        self.b = b
+        self.epsilon = epsilon
+        self.max_segments = max_segments
+        self.vocabulary: Dict[str, int] = {}
+        self.segments: List[Any] = []
+        self.doc_len = np.zeros(0, dtype=np.int32)
+        self.alive = np.zeros(0, dtype=bool)
+        self.doc_freq = np.zeros(0, dtype=np.int64)
+        self._stats: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        self.add(corpus)
+
+    def __len__(self) -> int:
+        """Number of live documents."""
+        return int(self.alive.sum())
+
+    @property
+    def size(self) -> int:
+        """Number of indexed positions, including deleted documents."""
+        return len(self.doc_len)
+
+    def add(self, corpus: Iterable[List[str]]) -> None:
+        """Index tokenized documents after the existing ones."""
+        sparse = _import_scipy_sparse()
+        indptr = [0]
+        indices: List[int] = []
+        counts: List[int] = []
+        lengths: List[int] = []
+        for tokens in corpus:
+            term_counts: Dict[int, int] = {}
+            for token in tokens:
+                term = self.vocabulary.setdefault(token, len(self.vocabulary))
+                term_counts[term] = term_counts.get(term, 0) + 1
+            indices.extend(term_counts)
+            counts.extend(term_counts.values())
+            indptr.append(len(indices))
+            lengths.append(len(tokens))
+        if not lengths:
+            return
+        n_terms = len(self.vocabulary)
+        # Built document-major, then transposed so rows are posting lists.
+        segment = sparse.csr_matrix(
+            (
+                np.array(counts, dtype=np.float32),
+                np.array(indices, dtype=np.int32),
+                np.array(indptr, dtype=np.int64),
+            ),
+            shape=(len(lengths), n_terms),
+        ).T.tocsr()
+        self.segments.append(segment)
+        self.doc_len = np.concatenate([self.doc_len, np.array(lengths, dtype=np.int32)])
+        self.alive = np.concatenate([self.alive, np.ones(len(lengths), dtype=bool)])
+        doc_freq = np.bincount(np.array(indices, dtype=np.int64), minlength=n_terms)
+        doc_freq[: len(self.doc_freq)] += self.doc_freq
+        self.doc_freq = doc_freq
+        if len(self.segments) > self.max_segments:
+            self._merge_segments()
+        self._invalidate()
+
+    def delete(self, positions: Iterable[int]) -> None:
+        """Mark documents as deleted; they stop matching immediately."""
+        positions = np.unique(np.fromiter(positions, dtype=np.int64))
+        positions = positions[self.alive[positions]]
+        if not len(positions):
+            return
+        self.alive[positions] = False
+        offset = 0
+        for segment in self.segments:
+            n_docs = segment.shape[1]
+            local = positions[(positions >= offset) & (positions < offset + n_docs)]
+            if len(local):
+                # Column sums over the deleted documents give their doc freqs.
+                removed = np.asarray(
+                    (segment[:, local - offset] > 0).sum(axis=1)
+                ).ravel()
+                self.doc_freq[: len(removed)] -= removed
+            offset += n_docs
+        self._invalidate()
+
+    def compact(self) -> np.ndarray:
+        """Drop deleted documents and merge all segments into one.
+
+        Returns:
+            The old positions of the surviving documents, in their new order.
+        """
+        keep = np.flatnonzero(self.alive)
+        if self.segments:
+            merged = self._merged()
+            self.segments = [merged[:, keep].tocsr()]
+        self.doc_len = self.doc_len[keep]
+        self.alive = np.ones(len(keep), dtype=bool)
+        self._invalidate()
+        return keep
+
+    def _merged(self) -> Any:
+        sparse = _import_scipy_sparse()
+        n_terms = len(self.vocabulary)
+        segments = []
+        for segment in self.segments:
+            if segment.shape[0] < n_terms:
+                # Terms added after this segment have empty posting lists.
+                padding = np.full(
+                    n_terms - segment.shape[0], segment.indptr[-1], dtype=np.int64
+                )
+                segment = sparse.csr_matrix(
+                    (
+                        segment.data,
+                        segment.indices,
+                        np.concatenate([segment.indptr, padding]),
+                    ),
+                    shape=(n_terms, segment.shape[1]),
+                )
+            segments.append(segment)
+        if len(segments) == 1:
+            return segments[0]
+        return sparse.hstack(segments, format="csr")
+
+    def _merge_segments(self) -> None:
+        if self.segments:
+            self.segments = [self._merged()]
+
+    def _invalidate(self) -> None:
+        self._stats = None
+
+    def _get_stats(self) -> Tuple[np.ndarray, np.ndarray]:
+        """The idf of every term and the length norm of every position."""
+        if self._stats is None:
+            n_docs = len(self)
+            present = self.doc_freq > 0
+            idf = np.log(n_docs - self.doc_freq + 0.5) - np.log(self.doc_freq + 0.5)
+            idf[~present] = 0.0
+            if present.any():
+                eps = self.epsilon * idf[present].mean()
+                idf[present & (idf < 0)] = eps
+            avgdl = self.doc_len[self.alive].mean() if n_docs else 1.0
+            norm = self.k1 * (1 - self.b + self.b * self.doc_len / avgdl)
+            self._stats = idf, norm
+        return self._stats
+
+    def _score(self, query: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """Scores of the live documents that contain at least one query term."""
+        # Repeated query terms count once per occurrence, as in rank_bm25.
+        terms = np.array(
+            [self.vocabulary[t] for t in query if t in self.vocabulary],
+            dtype=np.int64,
+        )
+        if not len(terms):
+            return np.zeros(0, dtype=np.int64), np.zeros(0)
+        idf, norm = self._get_stats()
+        positions = []
+        contributions = []
+        offset = 0
+        for segment in self.segments:
+            segment_terms = terms[terms < segment.shape[0]]
+            if len(segment_terms):
+                postings = segment[segment_terms]
+                tf = postings.data
+                docs = postings.indices.astype(np.int64) + offset
+                weights = np.repeat(idf[segment_terms], np.diff(postings.indptr))
+                positions.append(docs)
+                contributions.append(weights * tf * (self.k1 + 1) / (tf + norm[docs]))
+            offset += segment.shape[1]
+        if not positions:
+            return np.zeros(0, dtype=np.int64), np.zeros(0)
+        candidates, inverse = np.unique(np.concatenate(positions), return_inverse=True)
+        scores = np.bincount(inverse, weights=np.concatenate(contributions))
+        mask = self.alive[candidates]
+        return candidates[mask], scores[mask]
+
+    def get_scores(self, query: List[str]) -> np.ndarray:
+        """BM25 score of every indexed position; deleted positions score -inf."""
+        scores = np.zeros(self.size)
+        candidates, candidate_scores = self._score(query)
+        scores[candidates] = candidate_scores
+        scores[~self.alive] = -np.inf
+        return scores
+
+    def top_k(self, query: List[str], k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Positions and scores of the ``k`` best live documents for a query."""
+        positions, scores = self.batch_top_k([query], k)
+        return positions[0], scores[0]
+
+    def batch_top_k(
+        self, queries: List[List[str]], k: int
+    ) -> Tuple[List[np.ndarray], List[np.ndarray]]:
+        """Top-k positions and scores for several queries at once.
+
+        Only documents containing a query term are ranked. If there are fewer
+        than ``k`` of them, the remaining slots are filled with other live
+        documents at score 0, as ``rank_bm25`` would return them.
+        """
+        all_positions: List[np.ndarray] = []
+        all_scores: List[np.ndarray] = []
+        for query in queries:
+            candidates, scores = self._score(query)
+            if len(candidates) > k:
+                part = np.argpartition(-scores, k)[:k]
+                candidates, scores = candidates[part], scores[part]
+            order = np.argsort(-scores, kind="stable")
+            positions, scores = candidates[order], scores[order]
+            if len(positions) < k:
+                fill = np.flatnonzero(self.alive)
+                fill = fill[~np.isin(fill, positions)][: k - len(positions)]
+                positions = np.concatenate([positions, fill])
+                scores = np.concatenate([scores, np.zeros(len(fill))])
+            all_positions.append(positions)
+            all_scores.append(scores)
+        return all_positions, all_scores
+
+    def get_top_n(
+        self, query: List[str], documents: List[Document], n: int = 5
+    ) -> List[Document]:
+        """Same as ``rank_bm25.BM25.get_top_n``, for drop-in use."""
+        positions, _ = self.top_k(query, n)
+        return [documents[i] for i in positions]
+
+    def save(self, folder_path: Union[str, Path]) -> None:
+        """Write the index to a folder as ``.npy`` and JSON files."""
+        self._merge_segments()
+        path = Path(folder_path)
+        path.mkdir(exist_ok=True, parents=True)
+        if self.segments:
+            segment = self.segments[0]
+            np.save(path / "tf_data.npy", segment.data)
+            np.save(path / "tf_indices.npy", segment.indices)
+            np.save(path / "tf_indptr.npy", segment.indptr)
+        np.save(path / "doc_len.npy", self.doc_len)
+        np.save(path / "alive.npy", self.alive)
+        np.save(path / "doc_freq.npy", self.doc_freq)
+        with open(path / "bm25.json", "w") as f:
+            json.dump(
+                {
+                    "k1": self.k1,
+                    "b": self.b,
+                    "epsilon": self.epsilon,
+                    "max_segments": self.max_segments,
+                    "vocabulary": list(self.vocabulary),
+                },
+                f,
+            )
+
+    @classmethod
+    def load(cls, folder_path: Union[str, Path], *, mmap: bool = True) -> SparseBM25:
+        """Load an index written by `save`.
+
+        Args:
+            folder_path: Folder to load from.
+            mmap: Whether to memory-map the posting lists instead of reading
+                them into memory.
+        """
+        sparse = _import_scipy_sparse()
+        path = Path(folder_path)
+        with open(path / "bm25.json") as f:
+            config = json.load(f)
+        vocabulary = config.pop("vocabulary")
+        engine = cls(**config)
+        engine.vocabulary = {term: i for i, term in enumerate(vocabulary)}
+        engine.doc_len = np.load(path / "doc_len.npy")
+        engine.alive = np.load(path / "alive.npy")
+        engine.doc_freq = np.load(path / "doc_freq.npy")
+        if (path / "tf_data.npy").exists():
+            mmap_mode: Optional[Literal["r"]] = "r" if mmap else None
+            engine.segments = [
+                sparse.csr_matrix(
+                    (
+                        np.load(path / "tf_data.npy", mmap_mode=mmap_mode),
+                        np.load(path / "tf_indices.npy", mmap_mode=mmap_mode),
+                        np.load(path / "tf_indptr.npy", mmap_mode=mmap_mode),
+                    ),
+                    shape=(len(vocabulary), len(engine.doc_len)),
+                    copy=False,
+                )
+            ]
+        return engine
+
+
 class BM25Retriever(BaseRetriever):
-    """`BM25` retriever without Elasticsearch."""
+    """`BM25` retriever without Elasticsearch.
+
+    By default documents are scored with ``rank_bm25``. Pass
+    ``backend="sparse"`` to use `SparseBM25` instead, which scales to large
+    corpora and supports `add_documents`, `delete` and
+    ``save_local``/``load_local``.
+    """
 
     vectorizer: Any = None
     """ BM25 vectorizer."""
@@ -36,6 +372,7 @@ class BM25Retriever(BaseRetriever):
         ids: Optional[Iterable[str]] = None,
         bm25_params: Optional[Dict[str, Any]] = None,
         preprocess_func: Callable[[str], List[str]] = default_preprocessing_func,
+        backend: Literal["rank_bm25", "sparse"] = "rank_bm25",
         **kwargs: Any,
     ) -> BM25Retriever:
         """
@@ -46,22 +383,29 @@ class BM25Retriever(BaseRetriever):
             ids: A list of ids to associate with each text.
             bm25_params: Parameters to pass to the BM25 vectorizer.
             preprocess_func: A function to preprocess each text before vectorization.
+            backend: ``"rank_bm25"`` to use ``rank_bm25.BM25Okapi``, or ``"sparse"``
+                to use `SparseBM25`.
             **kwargs: Any other arguments to pass to the retriever.
 
         Returns:
             A BM25Retriever instance.
         """
-        try:
-            from rank_bm25 import BM25Okapi
-        except ImportError:
-            raise ImportError(
-                "Could not import rank_bm25, please install with `pip install "
-                "rank_bm25`."
-            )
-
+        texts = list(texts)
         texts_processed = [preprocess_func(t) for t in texts]
         bm25_params = bm25_params or {}
-        vectorizer = BM25Okapi(texts_processed, **bm25_params)
+        vectorizer: Any
+        if backend == "sparse":
+            vectorizer = SparseBM25(texts_processed, **bm25_params)
+        else:
+            try:
+                from rank_bm25 import BM25Okapi
+            except ImportError:
+                raise ImportError(
+                    "Could not import rank_bm25, please install with `pip install "
+                    "rank_bm25`."
+                )
+
+            vectorizer = BM25Okapi(texts_processed, **bm25_params)
         metadatas = metadatas or ({} for _ in texts)
         if ids:
             docs = [
@@ -83,6 +427,7 @@ class BM25Retriever(BaseRetriever):
         *,
         bm25_params: Optional[Dict[str, Any]] = None,
         preprocess_func: Callable[[str], List[str]] = default_preprocessing_func,
+        backend: Literal["rank_bm25", "sparse"] = "rank_bm25",
         **kwargs: Any,
     ) -> BM25Retriever:
         """
@@ -91,6 +436,8 @@ class BM25Retriever(BaseRetriever):
             documents: A list of Documents to vectorize.
             bm25_params: Parameters to pass to the BM25 vectorizer.
             preprocess_func: A function to preprocess each text before vectorization.
+            backend: ``"rank_bm25"`` to use ``rank_bm25.BM25Okapi``, or ``"sparse"``
+                to use `SparseBM25`.
             **kwargs: Any other arguments to pass to the retriever.
 
         Returns:
@@ -105,6 +452,7 @@ class BM25Retriever(BaseRetriever):
             metadatas=metadatas,
             ids=ids,
             preprocess_func=preprocess_func,
+            backend=backend,
             **kwargs,
         )
 
@@ -114,3 +462,106 @@ class BM25Retriever(BaseRetriever):
         processed_query = self.preprocess_func(query)
         return_docs = self.vectorizer.get_top_n(processed_query, self.docs, n=self.k)
         return return_docs
+
+    def _sparse_vectorizer(self) -> SparseBM25:
+        if not isinstance(self.vectorizer, SparseBM25):
+            raise ValueError(
+                "This operation requires the sparse backend, create the retriever "
+                "with `backend='sparse'`."
+            )
+        return self.vectorizer
+
+    def batch_get_relevant_documents(self, queries: List[str]) -> List[List[Document]]:
+        """Retrieve documents for several queries.
+
+        Args:
+            queries: Queries to search for.
+
+        Returns:
+            One list of documents per query.
+        """
+        processed_queries = [self.preprocess_func(q) for q in queries]
+        if isinstance(self.vectorizer, SparseBM25):
+            positions, _ = self.vectorizer.batch_top_k(processed_queries, self.k)
+            return [[self.docs[i] for i in row] for row in positions]
+        return [
+            self.vectorizer.get_top_n(q, self.docs, n=self.k) for q in processed_queries
+        ]
+
+    def add_documents(self, documents: Iterable[Document]) -> None:
+        """Index more documents. Requires the sparse backend.
+
+        Args:
+            documents: Documents to add.
+        """
+        vectorizer = self._sparse_vectorizer()
+        documents = list(documents)
+        vectorizer.add(self.preprocess_func(d.page_content) for d in documents)
+        self.docs.extend(documents)
+
+    def delete(self, ids: Iterable[str]) -> None:
+        """Delete documents by id. Requires the sparse backend.
+
+        Deleted documents are excluded from results immediately. They are
+        removed from ``docs`` once more than a quarter of the indexed documents
+        are deleted, or when `compact` is called.
+
+        Args:
+            ids: Ids of the documents to delete.
+        """
+        vectorizer = self._sparse_vectorizer()
+        ids = set(ids)
+        vectorizer.delete(
+            i for i, doc in enumerate(self.docs) if doc.id is not None and doc.id in ids
+        )
+        if len(vectorizer) < 0.75 * vectorizer.size:
+            self.compact()
+
+    def compact(self) -> None:
+        """Drop deleted documents from the index and from ``docs``."""
+        keep = self._sparse_vectorizer().compact()
+        self.docs = [self.docs[i] for i in keep]
+
+    def save_local(self, folder_path: Union[str, Path]) -> None:
+        """Save the index and documents to a folder. Requires the sparse backend.
+
+        Args:
+            folder_path: Folder to save to.
+        """
+        vectorizer = self._sparse_vectorizer()
+        vectorizer.save(folder_path)
+        with open(Path(folder_path) / "docs.jsonl", "w") as f:
+            for doc in self.docs:
+                record = {
+                    "page_content": doc.page_content,
+                    "metadata": doc.metadata,
+                    "id": doc.id,
+                }
+                f.write(json.dumps(record) + "\n")
+
+    @classmethod
+    def load_local(
+        cls,
+        folder_path: Union[str, Path],
+        *,
+        preprocess_func: Callable[[str], List[str]] = default_preprocessing_func,
+        mmap: bool = True,
+        **kwargs: Any,
+    ) -> BM25Retriever:
+        """Load a retriever saved with ``save_local``.
+
+        Args:
+            folder_path: Folder to load from.
+            preprocess_func: The preprocessing function used to build the index.
+            mmap: Whether to memory-map the posting lists.
+            **kwargs: Any other arguments to pass to the retriever.
+
+        Returns:
+            A BM25Retriever instance.
+        """
+        vectorizer = SparseBM25.load(folder_path, mmap=mmap)
+        with open(Path(folder_path) / "docs.jsonl") as f:
+            docs = [Document(**json.loads(line)) for line in f]
+        return cls(
+            vectorizer=vectorizer, docs=docs, preprocess_func=preprocess_func, **kwargs
+        )
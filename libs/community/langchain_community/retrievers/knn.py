@@ -4,34 +4,137 @@ https://github.com/karpathy/randomfun/blob/master/knn_vs_svm.ipynb"""
 
 from __future__ import annotations
 
-import concurrent.futures
-from typing import Any, Iterable, List, Optional
+import json
+from pathlib import Path
+from typing import Any, Iterable, List, Literal, Optional, Tuple, Union
 
 import numpy as np
 from langchain_core.callbacks import CallbackManagerForRetrieverRun
 from langchain_core.documents import Document
 from langchain_core.embeddings import Embeddings
 from langchain_core.retrievers import BaseRetriever
-from pydantic import ConfigDict
+from pydantic import ConfigDict, PrivateAttr
 
+from langchain_community.utils.embeddings import embed_texts
 
-def create_index(contexts: List[str], embeddings: Embeddings) -> np.ndarray:
+
+def create_index(
+    contexts: Iterable[str],
+    embeddings: Embeddings,
+    *,
+    batch_size: int = 64,
+    max_concurrency: int = 4,
+    show_progress: bool = False,
+) -> np.ndarray:
     """
     Create an index of embeddings for a list of contexts.
 
     Args:
-        contexts: List of contexts to embed.
+        contexts: Contexts to embed.
         embeddings: Embeddings model to use.
+        batch_size: Number of contexts per ``embed_documents`` call.
+        max_concurrency: Maximum number of concurrent ``embed_documents`` calls.
+        show_progress: Whether to show a progress bar.
 
     Returns:
         Index of embeddings.
     """
-    with concurrent.futures.ThreadPoolExecutor() as executor:
-        return np.array(list(executor.map(embeddings.embed_query, contexts)))
+    return embed_texts(
+        contexts,
+        embeddings,
+        batch_size=batch_size,
+        max_concurrency=max_concurrency,
+        show_progress=show_progress,
+    )
+
+
+class _PreparedIndex:
+    """Unit-normalized, optionally quantized copy of a KNN embedding index.
+
+    Rows are normalized once so that cosine similarity is a dot product. With
+    ``int8`` quantization each row stores int8 codes and a float32 scale.
+    """
+
+    def __init__(self, vectors: np.ndarray, scales: Optional[np.ndarray] = None):
+        self.vectors = vectors
+        self.scales = scales
+
+    @classmethod
+    def build(cls, index: Any, quantization: Optional[str] = None) -> _PreparedIndex:
+        matrix = np.array(index, dtype=np.float32)
+        if matrix.ndim == 1:
+            matrix = matrix.reshape(len(matrix), -1)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        matrix /= norms
+        if quantization is None:
+            return cls(matrix)
+        if quantization == "float16":
+            return cls(matrix.astype(np.float16))
+        if quantization == "int8":
+            scales = np.abs(matrix).max(axis=1) / 127.0
+            scales[scales == 0] = 1.0
+            codes = np.rint(matrix / scales[:, None]).astype(np.int8)
+            return cls(codes, scales.astype(np.float32))
+        raise ValueError(
+            f"Unsupported quantization {quantization!r}, "
+            "expected None, 'float16' or 'int8'."
+        )
+
+    def __len__(self) -> int:
+        return len(self.vectors)
+
+    def search(
+        self, queries: np.ndarray, k: int, block_size: int
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Blocked top-k search for unit-normalized queries.
+
+        Returns:
+            Row indices and scores of shape ``(len(queries), k)`` sorted by
+            decreasing similarity, and the minimum score of each query.
+        """
+        n_queries = len(queries)
+        k = min(k, len(self.vectors))
+        best_scores = np.full((n_queries, k), -np.inf, dtype=np.float32)
+        best_idxs = np.zeros((n_queries, k), dtype=np.int64)
+        min_scores = np.full(n_queries, np.inf, dtype=np.float32)
+        if k <= 0:
+            return best_idxs, best_scores, min_scores
+        for start in range(0, len(self.vectors), block_size):
+            block = self.vectors[start : start + block_size]
+            scores = queries @ block.astype(np.float32, copy=False).T
+            if self.scales is not None:
+                scores *= self.scales[start : start + block_size]
+            np.minimum(min_scores, scores.min(axis=1), out=min_scores)
+            idxs = np.broadcast_to(
+                np.arange(start, start + scores.shape[1]), scores.shape
+            )
+            if scores.shape[1] > k:
+                part = np.argpartition(scores, -k, axis=1)[:, -k:]
+                scores = np.take_along_axis(scores, part, axis=1)
+                idxs = part + start
+            merged_scores = np.concatenate([best_scores, scores], axis=1)
+            merged_idxs = np.concatenate([best_idxs, idxs], axis=1)
+            keep = np.argpartition(merged_scores, -k, axis=1)[:, -k:]
+            best_scores = np.take_along_axis(merged_scores, keep, axis=1)
+            best_idxs = np.take_along_axis(merged_idxs, keep, axis=1)
+        order = np.argsort(-best_scores, axis=1, kind="stable")
+        return (
+            np.take_along_axis(best_idxs, order, axis=1),
+            np.take_along_axis(best_scores, order, axis=1),
+            min_scores,
+        )
 
 
 class KNNRetriever(BaseRetriever):
-    """`KNN` retriever."""
+    """`KNN` retriever.
+
+    The index is normalized once, when the retriever is built or first
+    queried, and searched in blocks with an argpartition top-k. Set
+    ``quantization`` to ``"float16"`` or ``"int8"`` to shrink the searched
+    matrix, and use ``save_local``/``load_local`` to persist it as ``.npy``
+    files that are memory-mapped on load.
+    """
 
     embeddings: Embeddings
     """Embeddings model to use."""
@@ -45,27 +148,46 @@ class KNNRetriever(BaseRetriever):
     """Number of results to return."""
     relevancy_threshold: Optional[float] = None
     """Threshold for relevancy."""
+    quantization: Optional[Literal["float16", "int8"]] = None
+    """Storage format of the prepared index. None keeps float32."""
+    block_size: int = 16384
+    """Number of index rows scored at once."""
 
     model_config = ConfigDict(
         arbitrary_types_allowed=True,
     )
 
+    _prepared: Optional[_PreparedIndex] = PrivateAttr(default=None)
+    _prepared_from: Any = PrivateAttr(default=None)
+
     @classmethod
     def from_texts(
         cls,
         texts: List[str],
         embeddings: Embeddings,
         metadatas: Optional[List[dict]] = None,
+        *,
+        batch_size: int = 64,
+        max_concurrency: int = 4,
+        show_progress: bool = False,
         **kwargs: Any,
     ) -> KNNRetriever:
-        index = create_index(texts, embeddings)
-        return cls(
+        index = create_index(
+            texts,
+            embeddings,
+            batch_size=batch_size,
+            max_concurrency=max_concurrency,
+            show_progress=show_progress,
+        )
+        retriever = cls(
             embeddings=embeddings,
             index=index,
             texts=texts,
             metadatas=metadatas,
             **kwargs,
         )
+        retriever.prepare_index()
+        return retriever
 
     @classmethod
     def from_documents(
@@ -79,29 +201,164 @@ class KNNRetriever(BaseRetriever):
             texts=texts, embeddings=embeddings, metadatas=metadatas, **kwargs
         )
 
+    @classmethod
+    def from_embeddings(
+        cls,
+        text_embeddings: Iterable[Tuple[str, List[float]]],
+        embeddings: Embeddings,
+        metadatas: Optional[List[dict]] = None,
+        **kwargs: Any,
+    ) -> KNNRetriever:
+        """Create the retriever from precomputed embeddings.
+
+        Args:
+            text_embeddings: Pairs of text and its embedding.
+            embeddings: Embeddings model to use for queries.
+            metadatas: List of metadatas corresponding with each text.
+        """
+        texts, vectors = zip(*text_embeddings)
+        retriever = cls(
+            embeddings=embeddings,
+            index=np.array(vectors),
+            texts=list(texts),
+            metadatas=metadatas,
+            **kwargs,
+        )
+        retriever.prepare_index()
+        return retriever
+
+    def prepare_index(self) -> None:
+        """Normalize (and quantize) ``index`` for searching.
+
+        Called automatically on the first query and again whenever ``index``
+        is replaced.
+        """
+        self._prepared = _PreparedIndex.build(self.index, self.quantization)
+        self._prepared_from = self.index
+
+    def _get_prepared(self) -> _PreparedIndex:
+        if self._prepared is None or (
+            self.index is not None and self._prepared_from is not self.index
+        ):
+            self.prepare_index()
+        return self._prepared  # type: ignore[return-value]
+
+    def _search(
+        self, query_embeddings: Union[List[List[float]], np.ndarray]
+    ) -> List[List[Document]]:
+        queries = np.array(query_embeddings, dtype=np.float32).reshape(
+            len(query_embeddings), -1
+        )
+        norms = np.linalg.norm(queries, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        queries /= norms
+
+        idxs, scores, min_scores = self._get_prepared().search(
+            queries, self.k, self.block_size
+        )
+        results = []
+        for row_idxs, row_scores, min_score in zip(idxs, scores, min_scores):
+            if self.relevancy_threshold is not None and len(row_scores):
+                # Min-max normalize over the whole index, as before.
+                denominator = row_scores[0] - min_score + 1e-6
+                keep = (row_scores - min_score) / denominator >= (
+                    self.relevancy_threshold
+                )
+                row_idxs = row_idxs[keep]
+            results.append(
+                [
+                    Document(
+                        page_content=self.texts[row],
+                        metadata=self.metadatas[row] if self.metadatas else {},
+                    )
+                    for row in row_idxs.tolist()
+                ]
+            )
+        return results
+
     def _get_relevant_documents(
         self, query: str, *, run_manager: CallbackManagerForRetrieverRun
     ) -> List[Document]:
-        query_embeds = np.array(self.embeddings.embed_query(query))
-        # calc L2 norm
-        index_embeds = self.index / np.sqrt((self.index**2).sum(1, keepdims=True))
-        query_embeds = query_embeds / np.sqrt((query_embeds**2).sum())
+        return self._search([self.embeddings.embed_query(query)])[0]
 
-        similarities = index_embeds.dot(query_embeds)
-        sorted_ix = np.argsort(-similarities)
+    def batch_get_relevant_documents(self, queries: List[str]) -> List[List[Document]]:
+        """Retrieve documents for several queries with one pass over the index.
 
-        denominator = np.max(similarities) - np.min(similarities) + 1e-6
-        normalized_similarities = (similarities - np.min(similarities)) / denominator
+        Args:
+            queries: Queries to search for.
 
-        top_k_results = [
-            Document(
-                page_content=self.texts[row],
-                metadata=self.metadatas[row] if self.metadatas else {},
-            )
-            for row in sorted_ix[0 : self.k]
-            if (
-                self.relevancy_threshold is None
-                or normalized_similarities[row] >= self.relevancy_threshold
+        Returns:
+            One list of documents per query.
+        """
+        if not queries:
+            return []
+        return self._search([self.embeddings.embed_query(q) for q in queries])
+
+    def save_local(self, folder_path: Union[str, Path]) -> None:
+        """Save the prepared index, texts and metadatas to a folder.
+
+        The index is written as ``.npy`` files so that ``load_local`` can
+        memory-map it instead of reading it into memory.
+
+        Args:
+            folder_path: Folder to save to.
+        """
+        prepared = self._get_prepared()
+        path = Path(folder_path)
+        path.mkdir(exist_ok=True, parents=True)
+        np.save(path / "index.npy", prepared.vectors)
+        if prepared.scales is not None:
+            np.save(path / "scales.npy", prepared.scales)
+        with open(path / "docstore.json", "w") as f:
+            json.dump({"texts": list(self.texts), "metadatas": self.metadatas}, f)
+        with open(path / "config.json", "w") as f:
+            json.dump(
+                {
+                    "k": self.k,
+                    "relevancy_threshold": self.relevancy_threshold,
+                    "quantization": self.quantization,
+                    "block_size": self.block_size,
+                },
+                f,
             )
-        ]
-        return top_k_results
+
+    @classmethod
+    def load_local(
+        cls,
+        folder_path: Union[str, Path],
+        embeddings: Embeddings,
+        *,
+        mmap: bool = True,
+        **kwargs: Any,
+    ) -> KNNRetriever:
+        """Load a retriever saved with ``save_local``.
+
+        Args:
+            folder_path: Folder to load from.
+            embeddings: Embeddings model to use for queries.
+            mmap: Whether to memory-map the index instead of reading it.
+            kwargs: Overrides for the saved retriever settings.
+
+        Returns:
+            KNNRetriever: Loaded retriever. Its ``index`` is None; searches use
+            the prepared index directly.
+        """
+        path = Path(folder_path)
+        mmap_mode: Optional[Literal["r"]] = "r" if mmap else None
+        vectors = np.load(path / "index.npy", mmap_mode=mmap_mode)
+        scales = None
+        if (path / "scales.npy").exists():
+            scales = np.load(path / "scales.npy")
+        with open(path / "docstore.json") as f:
+            docstore = json.load(f)
+        with open(path / "config.json") as f:
+            config = json.load(f)
+        config.update(kwargs)
+        retriever = cls(
+            embeddings=embeddings,
+            texts=docstore["texts"],
+            metadatas=docstore["metadatas"],
+            **config,
+        )
+        retriever._prepared = _PreparedIndex(vectors, scales)
+        return retriever
@@ -1,33 +1,70 @@
 from __future__ import annotations
 
-import concurrent.futures
-from typing import Any, Iterable, List, Optional
+import json
+import threading
+from pathlib import Path
+from typing import Any, Iterable, List, Literal, Optional, Tuple, Union
 
 import numpy as np
 from langchain_core.callbacks import CallbackManagerForRetrieverRun
 from langchain_core.documents import Document
 from langchain_core.embeddings import Embeddings
 from langchain_core.retrievers import BaseRetriever
-from pydantic import ConfigDict
+from pydantic import ConfigDict, PrivateAttr
 
+from langchain_community.utils.embeddings import embed_texts
 
-def create_index(contexts: List[str], embeddings: Embeddings) -> np.ndarray:
+
+def create_index(
+    contexts: Iterable[str],
+    embeddings: Embeddings,
+    *,
+    batch_size: int = 64,
+    max_concurrency: int = 4,
+    show_progress: bool = False,
+) -> np.ndarray:
     """
     Create an index of embeddings for a list of contexts.
 
     Args:
-        contexts: List of contexts to embed.
+        contexts: Contexts to embed.
         embeddings: Embeddings model to use.
+        batch_size: Number of contexts per ``embed_documents`` call.
+        max_concurrency: Maximum number of concurrent ``embed_documents`` calls.
+        show_progress: Whether to show a progress bar.
 
     Returns:
         Index of embeddings.
     """
-    with concurrent.futures.ThreadPoolExecutor() as executor:
-        return np.array(list(executor.map(embeddings.embed_query, contexts)))
+    return embed_texts(
+        contexts,
+        embeddings,
+        batch_size=batch_size,
+        max_concurrency=max_concurrency,
+        show_progress=show_progress,
+    )
+
+
+def _import_pq() -> Any:
+    try:
+        from nanopq import PQ
+    except ImportError:
+        raise ImportError(
+            "Could not import nanopq, please install with `pip install nanopq`."
+        )
+    return PQ
 
 
 class NanoPQRetriever(BaseRetriever):
-    """`NanoPQ retriever."""
+    """`NanoPQ retriever.
+
+    The product quantizer is trained and the index encoded once, by `fit` or
+    lazily on the first query, and trained again if ``index`` is replaced.
+    Queries then only build an asymmetric distance table per query and look
+    the codes up in it. Texts added with `add_texts` are encoded with the
+    existing codebook, and ``save_local``/``load_local`` persist the codebook
+    and codes, memory-mapping the codes on load.
+    """
 
     embeddings: Embeddings
     """Embeddings model to use."""
@@ -45,20 +82,39 @@ class NanoPQRetriever(BaseRetriever):
     """No of subspaces to be created, should be a multiple of embedding shape"""
     clusters: int = 128
     """No of clusters to be created"""
+    block_size: int = 65536
+    """Number of codes scored at once."""
 
     model_config = ConfigDict(
         arbitrary_types_allowed=True,
     )
 
+    _codewords: Optional[np.ndarray] = PrivateAttr(default=None)
+    _codes: Optional[np.ndarray] = PrivateAttr(default=None)
+    # The index the codes were computed from.
+    _fitted_index: Any = PrivateAttr(default=None)
+    # Serializes training, so concurrent first queries train only once.
+    _fit_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+
     @classmethod
     def from_texts(
         cls,
         texts: List[str],
         embeddings: Embeddings,
         metadatas: Optional[List[dict]] = None,
+        *,
+        batch_size: int = 64,
+        max_concurrency: int = 4,
+        show_progress: bool = False,
         **kwargs: Any,
     ) -> NanoPQRetriever:
-        index = create_index(texts, embeddings)
+        index = create_index(
+            texts,
+            embeddings,
+            batch_size=batch_size,
+            max_concurrency=max_concurrency,
+            show_progress=show_progress,
+        )
         return cls(
             embeddings=embeddings,
             index=index,
@@ -79,20 +135,65 @@ class NanoPQRetriever(BaseRetriever):
             texts=texts, embeddings=embeddings, metadatas=metadatas, **kwargs
         )
 
-    def _get_relevant_documents(
-        self, query: str, *, run_manager: CallbackManagerForRetrieverRun
-    ) -> List[Document]:
-        try:
-            from nanopq import PQ
-        except ImportError:
-            raise ImportError(
-                "Could not import nanopq, please install with `pip install nanopq`."
-            )
+    @classmethod
+    def from_embeddings(
+        cls,
+        text_embeddings: Iterable[Tuple[str, List[float]]],
+        embeddings: Embeddings,
+        metadatas: Optional[List[dict]] = None,
+        **kwargs: Any,
+    ) -> NanoPQRetriever:
+        """Create the retriever from precomputed embeddings.
+
+        Args:
+            text_embeddings: Pairs of text and its embedding.
+            embeddings: Embeddings model to use for queries.
+            metadatas: List of metadatas corresponding with each text.
+        """
+        texts, vectors = zip(*text_embeddings)
+        return cls(
+            embeddings=embeddings,
+            index=np.array(vectors),
+            texts=list(texts),
+            metadatas=metadatas,
+            **kwargs,
+        )
+
+    @property
+    def codes(self) -> Optional[np.ndarray]:
+        """PQ codes of the index, one row of ``subspace`` codes per text."""
+        return self._codes
 
-        query_embeds = np.array(self.embeddings.embed_query(query))
+    def fit(
+        self, training_sample: Optional[int] = None, *, seed: int = 123
+    ) -> NanoPQRetriever:
+        """Train the product quantizer and encode the whole index.
+
+        Args:
+            training_sample: Train on this many randomly chosen vectors instead
+                of the whole index.
+            seed: Seed for sampling and k-means.
+
+        Returns:
+            The retriever itself.
+        """
+        with self._fit_lock:
+            self._fit(training_sample, seed=seed)
+        return self
+
+    def _fit(self, training_sample: Optional[int] = None, *, seed: int = 123) -> None:
+        PQ = _import_pq()
+        index = self.index
+        vectors = np.asarray(index, dtype=np.float32)
+        training = vectors
+        if training_sample is not None and training_sample < len(vectors):
+            rng = np.random.default_rng(seed)
+            training = vectors[
+                rng.choice(len(vectors), size=training_sample, replace=False)
+            ]
         try:
-            pq = PQ(M=self.subspace, Ks=self.clusters, verbose=True).fit(
-                self.index.astype("float32")
+            pq = PQ(M=self.subspace, Ks=self.clusters, verbose=False).fit(
+                training, seed=seed
             )
         except AssertionError:
             error_message = (
@@ -101,25 +202,183 @@ class NanoPQRetriever(BaseRetriever):
                 "embedding_shape={embedding_shape}. Issue with the combination. "
                 "Please retrace back to find the exact error"
             ).format(
-                training_sample=self.index.shape[0],
+                training_sample=training.shape[0],
                 n_clusters=self.clusters,
                 subspace=self.subspace,
-                embedding_shape=self.index.shape[1],
+                embedding_shape=vectors.shape[1],
             )
             raise RuntimeError(error_message)
+        self._codewords = pq.codewords
+        self._codes = pq.encode(vecs=vectors)
+        self._fitted_index = index
+
+    def _needs_fit(self) -> bool:
+        if self._codewords is None or self._codes is None:
+            return True
+        # A loaded retriever has codes but no index, which is not a change.
+        return self.index is not None and self.index is not self._fitted_index
 
-        index_code = pq.encode(vecs=self.index.astype("float32"))
-        dt = pq.dtable(query=query_embeds.astype("float32"))
-        dists = dt.adist(codes=index_code)
+    def _get_codebook(self) -> Tuple[np.ndarray, np.ndarray]:
+        if self._needs_fit():
+            with self._fit_lock:
+                if self._needs_fit():
+                    self._fit()
+        return self._codewords, self._codes  # type: ignore[return-value]
 
-        sorted_ix = np.argsort(dists)
+    def _encode(self, vectors: np.ndarray) -> np.ndarray:
+        PQ = _import_pq()
+        pq = PQ(M=self.subspace, Ks=self.clusters, verbose=False)
+        pq.codewords = self._codewords
+        pq.Ds = vectors.shape[1] // self.subspace
+        return pq.encode(vecs=vectors)
 
-        top_k_results = [
-            Document(
-                page_content=self.texts[row],
-                metadata=self.metadatas[row] if self.metadatas else {},
+    def add_texts(
+        self, texts: List[str], metadatas: Optional[List[dict]] = None
+    ) -> None:
+        """Embed and index more texts without retraining the quantizer.
+
+        Args:
+            texts: Texts to add.
+            metadatas: Metadatas corresponding with each text.
+        """
+        if not texts:
+            return
+        vectors = create_index(texts, self.embeddings).astype(np.float32)
+        if self._codes is not None:
+            self._codes = np.concatenate([self._codes, self._encode(vectors)])
+        if self.index is not None:
+            in_sync = self.index is self._fitted_index
+            self.index = np.concatenate([np.asarray(self.index), vectors])
+            if in_sync:
+                # The new codes were encoded above, no need to retrain.
+                self._fitted_index = self.index
+        if self.metadatas is not None or metadatas is not None:
+            self.metadatas = (self.metadatas or [{} for _ in self.texts]) + (
+                metadatas or [{} for _ in texts]
             )
-            for row in sorted_ix[0 : self.k]
+        self.texts = list(self.texts) + list(texts)
+
+    def _search(self, query_embeddings: List[List[float]]) -> List[List[Document]]:
+        codewords, codes = self._get_codebook()
+        queries = np.asarray(query_embeddings, dtype=np.float32)
+        n_queries = len(queries)
+        # Squared L2 distance from every query sub-vector to every codeword:
+        # dtables[q, m, c] for query q, subspace m and codeword c.
+        sub_queries = queries.reshape(n_queries, self.subspace, 1, -1)
+        dtables = ((sub_queries - codewords[None]) ** 2).sum(axis=-1)
+
+        k = min(self.k, len(codes))
+        if k <= 0:
+            return [[] for _ in range(n_queries)]
+        best_dists = np.full((n_queries, k), np.inf, dtype=np.float32)
+        best_idxs = np.zeros((n_queries, k), dtype=np.int64)
+        for start in range(0, len(codes), self.block_size):
+            block = np.asarray(codes[start : start + self.block_size])
+            dists = np.zeros((n_queries, len(block)), dtype=np.float32)
+            for m in range(self.subspace):
+                dists += dtables[:, m, block[:, m]]
+            idxs = np.broadcast_to(np.arange(start, start + len(block)), dists.shape)
+            if dists.shape[1] > k:
+                part = np.argpartition(dists, k, axis=1)[:, :k]
+                dists = np.take_along_axis(dists, part, axis=1)
+                idxs = part + start
+            merged_dists = np.concatenate([best_dists, dists], axis=1)
+            merged_idxs = np.concatenate([best_idxs, idxs], axis=1)
+            keep = np.argpartition(merged_dists, k - 1, axis=1)[:, :k]
+            best_dists = np.take_along_axis(merged_dists, keep, axis=1)
+            best_idxs = np.take_along_axis(merged_idxs, keep, axis=1)
+        order = np.argsort(best_dists, axis=1, kind="stable")
+        best_idxs = np.take_along_axis(best_idxs, order, axis=1)
+        return [
+            [
+                Document(
+                    page_content=self.texts[row],
+                    metadata=self.metadatas[row] if self.metadatas else {},
+                )
+                for row in row_idxs.tolist()
+            ]
+            for row_idxs in best_idxs
         ]
 
-        return top_k_results
+    def _get_relevant_documents(
+        self, query: str, *, run_manager: CallbackManagerForRetrieverRun
+    ) -> List[Document]:
+        return self._search([self.embeddings.embed_query(query)])[0]
+
+    def batch_get_relevant_documents(self, queries: List[str]) -> List[List[Document]]:
+        """Retrieve documents for several queries with one pass over the codes.
+
+        Args:
+            queries: Queries to search for.
+
+        Returns:
+            One list of documents per query.
+        """
+        if not queries:
+            return []
+        return self._search([self.embeddings.embed_query(q) for q in queries])
+
+    def save_local(self, folder_path: Union[str, Path]) -> None:
+        """Save the codebook, codes, texts and metadatas to a folder.
+
+        The raw embeddings are not saved; the loaded retriever searches and
+        encodes new texts with the saved codebook.
+
+        Args:
+            folder_path: Folder to save to.
+        """
+        codewords, codes = self._get_codebook()
+        path = Path(folder_path)
+        path.mkdir(exist_ok=True, parents=True)
+        np.save(path / "codewords.npy", codewords)
+        np.save(path / "codes.npy", codes)
+        with open(path / "docstore.json", "w") as f:
+            json.dump({"texts": list(self.texts), "metadatas": self.metadatas}, f)
+        with open(path / "config.json", "w") as f:
+            json.dump(
+                {
+                    "k": self.k,
+                    "relevancy_threshold": self.relevancy_threshold,
+                    "subspace": self.subspace,
+                    "clusters": self.clusters,
+                    "block_size": self.block_size,
+                },
+                f,
+            )
+
+    @classmethod
+    def load_local(
+        cls,
+        folder_path: Union[str, Path],
+        embeddings: Embeddings,
+        *,
+        mmap: bool = True,
+        **kwargs: Any,
+    ) -> NanoPQRetriever:
+        """Load a retriever saved with ``save_local``.
+
+        Args:
+            folder_path: Folder to load from.
+            embeddings: Embeddings model to use for queries.
+            mmap: Whether to memory-map the codes instead of reading them.
+            kwargs: Overrides for the saved retriever settings.
+
+        Returns:
+            NanoPQRetriever: Loaded retriever, with ``index`` set to None.
+        """
+        path = Path(folder_path)
+        mmap_mode: Optional[Literal["r"]] = "r" if mmap else None
+        with open(path / "docstore.json") as f:
+            docstore = json.load(f)
+        with open(path / "config.json") as f:
+            config = json.load(f)
+        config.update(kwargs)
+        retriever = cls(
+            embeddings=embeddings,
+            texts=docstore["texts"],
+            metadatas=docstore["metadatas"],
+            **config,
+        )
+        retriever._codewords = np.load(path / "codewords.npy")
+        retriever._codes = np.load(path / "codes.npy", mmap_mode=mmap_mode)
+        return retriever
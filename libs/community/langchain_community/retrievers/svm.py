@@ -1,29 +1,49 @@
 from __future__ import annotations
 
 import concurrent.futures
-from typing import Any, Iterable, List, Optional
+import threading
+import weakref
+from typing import Any, Iterable, List, Optional, Tuple
 
 import numpy as np
 from langchain_core.callbacks import CallbackManagerForRetrieverRun
 from langchain_core.documents import Document
 from langchain_core.embeddings import Embeddings
 from langchain_core.retrievers import BaseRetriever
-from pydantic import ConfigDict
+from pydantic import ConfigDict, PrivateAttr
 
+from langchain_community.utils.embeddings import embed_texts
+from langchain_community.utils.math import NormalizedMatrix
 
-def create_index(contexts: List[str], embeddings: Embeddings) -> np.ndarray:
+
+def create_index(
+    contexts: Iterable[str],
+    embeddings: Embeddings,
+    *,
+    batch_size: int = 64,
+    max_concurrency: int = 4,
+    show_progress: bool = False,
+) -> np.ndarray:
     """
     Create an index of embeddings for a list of contexts.
 
     Args:
-        contexts: List of contexts to embed.
+        contexts: Contexts to embed.
         embeddings: Embeddings model to use.
+        batch_size: Number of contexts per ``embed_documents`` call.
+        max_concurrency: Maximum number of concurrent ``embed_documents`` calls.
+        show_progress: Whether to show a progress bar.
 
     Returns:
         Index of embeddings.
     """
-    with concurrent.futures.ThreadPoolExecutor() as executor:
-        return np.array(list(executor.map(embeddings.embed_query, contexts)))
+    return embed_texts(
+        contexts,
+        embeddings,
+        batch_size=batch_size,
+        max_concurrency=max_concurrency,
+        show_progress=show_progress,
+    )
 
 
 class SVMRetriever(BaseRetriever):
@@ -31,6 +51,10 @@ class SVMRetriever(BaseRetriever):
 
     Largely based on
     https://github.com/karpathy/randomfun/blob/master/knn_vs_svm.ipynb
+
+    Set ``candidate_k`` to train each query's SVM on a cosine-prefiltered
+    candidate set rather than the whole index, which keeps latency low on
+    large indexes.
     """
 
     embeddings: Embeddings
@@ -45,20 +69,43 @@ class SVMRetriever(BaseRetriever):
     """Number of results to return."""
     relevancy_threshold: Optional[float] = None
     """Threshold for relevancy."""
+    candidate_k: Optional[int] = None
+    """If set, train each query's SVM only on the query and its ``candidate_k``
+    nearest texts by cosine similarity, instead of on the whole index."""
 
     model_config = ConfigDict(
         arbitrary_types_allowed=True,
     )
 
+    _normalized: Optional[NormalizedMatrix] = PrivateAttr(default=None)
+    _normalized_from: Any = PrivateAttr(default=None)
+    # Training matrices not in use: free rows for the queries, then the index.
+    _buffers: List[np.ndarray] = PrivateAttr(default_factory=list)
+    _buffers_from: Any = PrivateAttr(default=None)
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _executor: Optional[concurrent.futures.ThreadPoolExecutor] = PrivateAttr(
+        default=None
+    )
+
     @classmethod
     def from_texts(
         cls,
         texts: List[str],
         embeddings: Embeddings,
         metadatas: Optional[List[dict]] = None,
+        *,
+        batch_size: int = 64,
+        max_concurrency: int = 4,
+        show_progress: bool = False,
         **kwargs: Any,
     ) -> SVMRetriever:
-        index = create_index(texts, embeddings)
+        index = create_index(
+            texts,
+            embeddings,
+            batch_size=batch_size,
+            max_concurrency=max_concurrency,
+            show_progress=show_progress,
+        )
         return cls(
             embeddings=embeddings,
             index=index,
@@ -79,9 +126,135 @@ class SVMRetriever(BaseRetriever):
             texts=texts, embeddings=embeddings, metadatas=metadatas, **kwargs
         )
 
-    def _get_relevant_documents(
-        self, query: str, *, run_manager: CallbackManagerForRetrieverRun
+    @classmethod
+    def from_embeddings(
+        cls,
+        text_embeddings: Iterable[Tuple[str, List[float]]],
+        embeddings: Embeddings,
+        metadatas: Optional[List[dict]] = None,
+        **kwargs: Any,
+    ) -> SVMRetriever:
+        """Create the retriever from precomputed embeddings.
+
+        Args:
+            text_embeddings: Pairs of text and its embedding.
+            embeddings: Embeddings model to use for queries.
+            metadatas: List of metadatas corresponding with each text.
+        """
+        texts, vectors = zip(*text_embeddings)
+        return cls(
+            embeddings=embeddings,
+            index=np.array(vectors),
+            texts=list(texts),
+            metadatas=metadatas,
+            **kwargs,
+        )
+
+    def _get_normalized_index(self) -> NormalizedMatrix:
+        if self._normalized is None or self._normalized_from is not self.index:
+            self._normalized = NormalizedMatrix(self.index)
+            self._normalized_from = self.index
+        return self._normalized
+
+    def _acquire_buffer(self, n_queries: int) -> np.ndarray:
+        """Take a training matrix with room for ``n_queries`` queries.
+
+        The index is copied into a matrix once and the matrix is reused by
+        later searches, which only write their query rows. Concurrent searches
+        each get a matrix of their own.
+        """
+        with self._lock:
+            if self._buffers_from is not self.index:
+                self._buffers = []
+                self._buffers_from = self.index
+            for i, buffer in enumerate(self._buffers):
+                if len(buffer) - len(self.index) >= n_queries:
+                    return self._buffers.pop(i)
+            if self._buffers:
+                # Replaced by the larger matrix allocated below.
+                self._buffers.pop()
+        index = np.asarray(self.index)
+        # LinearSVC trains on float64, and would otherwise convert it per fit.
+        buffer = np.empty((n_queries + len(index), index.shape[1]), dtype=np.float64)
+        buffer[n_queries:] = index
+        return buffer
+
+    def _release_buffer(self, buffer: np.ndarray, index: Any) -> None:
+        with self._lock:
+            if self._buffers_from is index:
+                self._buffers.append(buffer)
+
+    def _get_executor(self) -> concurrent.futures.ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    thread_name_prefix="svm-retriever"
+                )
+                weakref.finalize(self, self._executor.shutdown, wait=False)
+            return self._executor
+
+    def _search(
+        self, query_embeds: np.ndarray, max_concurrency: Optional[int] = None
+    ) -> List[List[Document]]:
+        """Rank the index for each row of ``query_embeds``."""
+        if self.candidate_k is not None and self.candidate_k < len(self.index):
+            all_candidates = self._get_normalized_index().top_k(
+                query_embeds, k=self.candidate_k
+            )[0]
+            index = np.asarray(self.index)
+            jobs = [
+                (
+                    np.concatenate([query[None, ...], index[candidates]]),
+                    0,
+                    1,
+                    candidates,
+                )
+                for query, candidates in zip(query_embeds, all_candidates)
+            ]
+            return self._run(jobs, max_concurrency)
+
+        # One training matrix holds every query followed by the index, and is
+        # shared read-only by all the fits. Each fit gives zero weight to the
+        # other query rows, so only its labels and weights are per query.
+        index = self.index
+        buffer = self._acquire_buffer(len(query_embeds))
+        n_slots = len(buffer) - len(index)
+        buffer[: len(query_embeds)] = query_embeds
+        try:
+            jobs = [(buffer, row, n_slots, None) for row in range(len(query_embeds))]
+            return self._run(jobs, max_concurrency)
+        finally:
+            self._release_buffer(buffer, index)
+
+    def _run(
+        self,
+        jobs: List[Tuple[np.ndarray, int, int, Optional[np.ndarray]]],
+        max_concurrency: Optional[int],
+    ) -> List[List[Document]]:
+        if len(jobs) == 1:
+            return [self._rank(*jobs[0])]
+        executor = self._get_executor()
+        limit = threading.BoundedSemaphore(max_concurrency or len(jobs))
+        futures = []
+        for job in jobs:
+            limit.acquire()
+            future = executor.submit(self._rank, *job)
+            future.add_done_callback(lambda _: limit.release())
+            futures.append(future)
+        return [future.result() for future in futures]
+
+    def _rank(
+        self,
+        x: np.ndarray,
+        query_row: int,
+        n_queries: int,
+        candidates: Optional[np.ndarray],
     ) -> List[Document]:
+        """Fit the SVM of one query and rank the indexed rows ``x[n_queries:]``.
+
+        The first ``n_queries`` rows hold queries; all but ``query_row`` are
+        left out of the fit.
+        """
         try:
             from sklearn import svm
         except ImportError:
@@ -90,38 +263,66 @@ class SVMRetriever(BaseRetriever):
                 "scikit-learn`."
             )
 
-        query_embeds = np.array(self.embeddings.embed_query(query))
-        x = np.concatenate([query_embeds[None, ...], self.index])
         y = np.zeros(x.shape[0])
-        y[0] = 1
+        y[query_row] = 1
+        sample_weight = None
+        class_weight: Any = "balanced"
+        if n_queries > 1:
+            sample_weight = np.zeros(x.shape[0])
+            sample_weight[query_row] = 1
+            sample_weight[n_queries:] = 1
+            # "balanced" would count the zero-weighted queries as negatives.
+            n_samples = x.shape[0] - n_queries + 1
+            class_weight = {0: n_samples / (2 * (n_samples - 1)), 1: n_samples / 2}
 
         clf = svm.LinearSVC(
-            class_weight="balanced", verbose=False, max_iter=10000, tol=1e-6, C=0.1
+            class_weight=class_weight, verbose=False, max_iter=10000, tol=1e-6, C=0.1
         )
-        clf.fit(x, y)
-
-        similarities = clf.decision_function(x)
-        sorted_ix = np.argsort(-similarities)
+        clf.fit(x, y, sample_weight=sample_weight)
 
-        # svm.LinearSVC in scikit-learn is non-deterministic.
-        # if a text is the same as a query, there is no guarantee
-        # the query will be in the first index.
-        # this performs a simple swap, this works because anything
-        # left of the 0 should be equivalent.
-        zero_index = np.where(sorted_ix == 0)[0][0]
-        if zero_index != 0:
-            sorted_ix[0], sorted_ix[zero_index] = sorted_ix[zero_index], sorted_ix[0]
+        scores = clf.decision_function(x[n_queries:])
+        query_score = clf.decision_function(x[query_row : query_row + 1])[0]
+        k = min(self.k, len(scores))
+        top_k = np.argpartition(-scores, k - 1)[:k] if k else np.zeros(0, int)
+        top_k = top_k[np.argsort(-scores[top_k], kind="stable")]
 
-        denominator = np.max(similarities) - np.min(similarities) + 1e-6
-        normalized_similarities = (similarities - np.min(similarities)) / denominator
+        lowest = min(np.min(scores), query_score)
+        denominator = max(np.max(scores), query_score) - lowest + 1e-6
+        normalized_similarities = (scores - lowest) / denominator
 
         top_k_results = []
-        for row in sorted_ix[1 : self.k + 1]:
+        for row in top_k:
             if (
                 self.relevancy_threshold is None
                 or normalized_similarities[row] >= self.relevancy_threshold
             ):
-                metadata = self.metadatas[row - 1] if self.metadatas else {}
-                doc = Document(page_content=self.texts[row - 1], metadata=metadata)
+                i = int(candidates[row]) if candidates is not None else int(row)
+                metadata = self.metadatas[i] if self.metadatas else {}
+                doc = Document(page_content=self.texts[i], metadata=metadata)
                 top_k_results.append(doc)
         return top_k_results
+
+    def _get_relevant_documents(
+        self, query: str, *, run_manager: CallbackManagerForRetrieverRun
+    ) -> List[Document]:
+        return self._search(np.array([self.embeddings.embed_query(query)]))[0]
+
+    def batch_get_relevant_documents(
+        self, queries: List[str], *, max_concurrency: Optional[int] = None
+    ) -> List[List[Document]]:
+        """Retrieve documents for several queries concurrently.
+
+        Without ``candidate_k``, all the queries share one training matrix,
+        into which the index was copied by an earlier search.
+
+        Args:
+            queries: Queries to search for.
+            max_concurrency: Maximum number of queries ranked at once.
+
+        Returns:
+            One list of documents per query.
+        """
+        if not queries:
+            return []
+        query_embeds = np.array([self.embeddings.embed_query(q) for q in queries])
+        return self._search(query_embeds, max_concurrency)
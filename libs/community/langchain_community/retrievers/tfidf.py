@@ -1,13 +1,53 @@
 from __future__ import annotations
 
+import json
 import pickle
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, List, Literal, Optional, Tuple
 
+import numpy as np
 from langchain_core.callbacks import CallbackManagerForRetrieverRun
 from langchain_core.documents import Document
 from langchain_core.retrievers import BaseRetriever
-from pydantic import ConfigDict
+from pydantic import ConfigDict, PrivateAttr
+
+
+def _save_csr(path: Path, matrix: Any) -> None:
+    """Save a CSR matrix as separate ``.npy`` files that can be memory-mapped."""
+    path.mkdir(exist_ok=True, parents=True)
+    np.save(path / "data.npy", matrix.data)
+    np.save(path / "indices.npy", matrix.indices)
+    np.save(path / "indptr.npy", matrix.indptr)
+    np.save(path / "shape.npy", np.array(matrix.shape))
+
+
+def _load_csr(path: Path, mmap: bool) -> Any:
+    from scipy.sparse import csr_matrix
+
+    mmap_mode: Optional[Literal["r"]] = "r" if mmap else None
+    return csr_matrix(
+        (
+            np.load(path / "data.npy", mmap_mode=mmap_mode),
+            np.load(path / "indices.npy", mmap_mode=mmap_mode),
+            np.load(path / "indptr.npy", mmap_mode=mmap_mode),
+        ),
+        shape=tuple(np.load(path / "shape.npy")),
+        copy=False,
+    )
+
+
+def _rescale_columns(matrix: Any, scale: np.ndarray, norm: Optional[str]) -> Any:
+    """Multiply each column of a CSR matrix by ``scale`` and renormalize rows."""
+    from scipy.sparse import csr_matrix
+    from sklearn.preprocessing import normalize
+
+    rescaled = csr_matrix(
+        (matrix.data * scale[matrix.indices], matrix.indices, matrix.indptr),
+        shape=matrix.shape,
+    )
+    if norm is not None:
+        rescaled = normalize(rescaled, norm=norm, copy=False)
+    return rescaled
 
 
 class TFIDFRetriever(BaseRetriever):
@@ -15,6 +55,12 @@ class TFIDFRetriever(BaseRetriever):
 
     Largely based on
     https://github.com/asvskartheek/Text-Retrieval/blob/master/TF-IDF%20Search%20Engine%20(SKLEARN).ipynb
+
+    Queries are scored through an inverted view of ``tfidf_array``, so only
+    documents sharing a term with the query are touched. Create the retriever
+    with ``append_mode=True`` to use a ``HashingVectorizer`` and
+    ``TfidfTransformer`` pipeline, which lets `add_texts` index new texts
+    without refitting the vectorizer on the whole corpus.
     """
 
     vectorizer: Any = None
@@ -25,33 +71,82 @@ class TFIDFRetriever(BaseRetriever):
     """TF-IDF array."""
     k: int = 4
     """Number of documents to return."""
+    term_counts: Any = None
+    """Raw term counts of the documents, only kept in append mode."""
 
     model_config = ConfigDict(
         arbitrary_types_allowed=True,
     )
 
+    _postings: Any = PrivateAttr(default=None)
+    _postings_from: Any = PrivateAttr(default=None)
+    _doc_norms: Optional[np.ndarray] = PrivateAttr(default=None)
+    _document_frequencies: Optional[np.ndarray] = PrivateAttr(default=None)
+
     @classmethod
     def from_texts(
         cls,
         texts: Iterable[str],
         metadatas: Optional[Iterable[dict]] = None,
         tfidf_params: Optional[Dict[str, Any]] = None,
+        *,
+        append_mode: bool = False,
         **kwargs: Any,
     ) -> TFIDFRetriever:
+        """Create a TFIDFRetriever from a list of texts.
+
+        Args:
+            texts: Texts to index.
+            metadatas: Metadata dicts to associate with each text.
+            tfidf_params: Parameters for ``TfidfVectorizer``, or in append mode
+                for ``HashingVectorizer``, except for the ``TfidfTransformer``
+                parameters ``norm``, ``use_idf``, ``smooth_idf`` and
+                ``sublinear_tf``.
+            append_mode: Whether to use a ``HashingVectorizer`` and
+                ``TfidfTransformer`` pipeline that supports `add_texts`.
+            **kwargs: Any other arguments to pass to the retriever.
+        """
         try:
-            from sklearn.feature_extraction.text import TfidfVectorizer
+            from sklearn.feature_extraction.text import (
+                HashingVectorizer,
+                TfidfTransformer,
+                TfidfVectorizer,
+            )
+            from sklearn.pipeline import Pipeline
         except ImportError:
             raise ImportError(
                 "Could not import scikit-learn, please install with `pip install "
                 "scikit-learn`."
             )
 
+        texts = list(texts)
         tfidf_params = tfidf_params or {}
-        vectorizer = TfidfVectorizer(**tfidf_params)
-        tfidf_array = vectorizer.fit_transform(texts)
+        term_counts = None
+        if append_mode:
+            transformer_params = {
+                key: tfidf_params.pop(key)
+                for key in ("norm", "use_idf", "smooth_idf", "sublinear_tf")
+                if key in tfidf_params
+            }
+            hasher = HashingVectorizer(
+                **{"alternate_sign": False, **tfidf_params, "norm": None}
+            )
+            transformer = TfidfTransformer(**transformer_params)
+            vectorizer = Pipeline([("hasher", hasher), ("transformer", transformer)])
+            term_counts = hasher.transform(texts).tocsr()
+            tfidf_array = transformer.fit_transform(term_counts)
+        else:
+            vectorizer = TfidfVectorizer(**tfidf_params)
+            tfidf_array = vectorizer.fit_transform(texts)
         metadatas = metadatas or ({} for _ in texts)
         docs = [Document(page_content=t, metadata=m) for t, m in zip(texts, metadatas)]
-        return cls(vectorizer=vectorizer, docs=docs, tfidf_array=tfidf_array, **kwargs)
+        return cls(
+            vectorizer=vectorizer,
+            docs=docs,
+            tfidf_array=tfidf_array,
+            term_counts=term_counts,
+            **kwargs,
+        )
 
     @classmethod
     def from_documents(
@@ -59,38 +154,182 @@ class TFIDFRetriever(BaseRetriever):
         documents: Iterable[Document],
         *,
         tfidf_params: Optional[Dict[str, Any]] = None,
+        append_mode: bool = False,
         **kwargs: Any,
     ) -> TFIDFRetriever:
         texts, metadatas = zip(*((d.page_content, d.metadata) for d in documents))
         return cls.from_texts(
-            texts=texts, tfidf_params=tfidf_params, metadatas=metadatas, **kwargs
+            texts=texts,
+            tfidf_params=tfidf_params,
+            metadatas=metadatas,
+            append_mode=append_mode,
+            **kwargs,
         )
 
+    def add_texts(
+        self, texts: Iterable[str], metadatas: Optional[Iterable[dict]] = None
+    ) -> None:
+        """Index more texts. Requires ``append_mode=True``.
+
+        Only the new texts are tokenized and transformed, and the document
+        frequencies are updated from their counts alone. The IDF is global,
+        so the weights of the existing documents still change: they are
+        rescaled by the ratio of new to old IDF and renormalized, which is a
+        linear pass over the stored TF-IDF values. Prefer adding texts in
+        large batches to adding them one at a time.
+
+        Args:
+            texts: Texts to add.
+            metadatas: Metadata dicts to associate with each text.
+        """
+        if self.term_counts is None:
+            raise ValueError(
+                "add_texts requires a retriever created with `append_mode=True`."
+            )
+        from scipy.sparse import csr_matrix, vstack
+
+        texts = list(texts)
+        if not texts:
+            return
+        hasher = self.vectorizer.named_steps["hasher"]
+        transformer = self.vectorizer.named_steps["transformer"]
+        new_counts = hasher.transform(texts).tocsr()
+        tfidf_array = csr_matrix(self.tfidf_array)
+        if transformer.use_idf:
+            document_frequencies = self._get_document_frequencies() + np.bincount(
+                new_counts.indices, minlength=new_counts.shape[1]
+            )
+            # Same smoothing as TfidfTransformer.fit.
+            n_samples = self.term_counts.shape[0] + new_counts.shape[0]
+            smooth = int(transformer.smooth_idf)
+            old_idf = transformer.idf_
+            # Without smoothing, terms in no document get an infinite idf, and
+            # their ratio is undefined; they have no entries to rescale.
+            with np.errstate(divide="ignore", invalid="ignore"):
+                transformer.idf_ = (
+                    np.log((n_samples + smooth) / (document_frequencies + smooth)) + 1.0
+                )
+                ratio = transformer.idf_ / old_idf
+            ratio = np.where(np.isfinite(ratio), ratio, transformer.idf_)
+            tfidf_array = _rescale_columns(tfidf_array, ratio, transformer.norm)
+            self._document_frequencies = document_frequencies
+        self.term_counts = vstack([self.term_counts, new_counts], format="csr")
+        self.tfidf_array = vstack(
+            [tfidf_array, transformer.transform(new_counts)], format="csr"
+        )
+        metadatas = metadatas or ({} for _ in texts)
+        self.docs.extend(
+            Document(page_content=t, metadata=m) for t, m in zip(texts, metadatas)
+        )
+
+    def add_documents(self, documents: Iterable[Document]) -> None:
+        """Index more documents. Requires ``append_mode=True``."""
+        documents = list(documents)
+        self.add_texts(
+            [d.page_content for d in documents], [d.metadata for d in documents]
+        )
+
+    def _get_document_frequencies(self) -> np.ndarray:
+        """Number of documents containing each hashed term."""
+        if self._document_frequencies is None:
+            self._document_frequencies = np.bincount(
+                self.term_counts.indices, minlength=self.term_counts.shape[1]
+            )
+        return self._document_frequencies
+
+    def _get_postings(self) -> Tuple[Any, np.ndarray]:
+        """Term-major view of ``tfidf_array`` and the L2 norm of each document."""
+        if self._postings is None or self._postings_from is not self.tfidf_array:
+            from scipy.sparse import csr_matrix
+
+            tfidf_array = csr_matrix(self.tfidf_array)
+            self._postings = tfidf_array.T.tocsr()
+            self._doc_norms = np.sqrt(
+                np.asarray(tfidf_array.multiply(tfidf_array).sum(axis=1)).ravel()
+            )
+            self._postings_from = self.tfidf_array
+        return self._postings, self._doc_norms  # type: ignore[return-value]
+
+    def _top_k(self, query_vecs: Any) -> List[List[int]]:
+        from scipy.sparse import csr_matrix
+
+        postings, doc_norms = self._get_postings()
+        query_vecs = csr_matrix(query_vecs)
+        query_norms = np.sqrt(
+            np.asarray(query_vecs.multiply(query_vecs).sum(axis=1)).ravel()
+        )
+        # Only the posting lists of the query terms are visited.
+        dots = (query_vecs @ postings).tocsr()
+        n_docs = len(self.docs)
+        k = min(self.k, n_docs)
+        results = []
+        for i in range(dots.shape[0]):
+            start, end = dots.indptr[i], dots.indptr[i + 1]
+            candidates = dots.indices[start:end]
+            denominator = doc_norms[candidates] * query_norms[i]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                scores = np.where(
+                    denominator > 0, dots.data[start:end] / denominator, 0.0
+                )
+            if len(candidates) > k:
+                part = np.argpartition(-scores, k - 1)[:k]
+                candidates, scores = candidates[part], scores[part]
+            order = np.lexsort((-candidates, -scores))
+            top = candidates[order].tolist()
+            if len(top) < k:
+                # Fill with non-matching documents, last ones first, as a full
+                # argsort of the scores would.
+                matched = set(top)
+                for row in range(n_docs - 1, -1, -1):
+                    if len(top) == k:
+                        break
+                    if row not in matched:
+                        top.append(row)
+            results.append(top)
+        return results
+
     def _get_relevant_documents(
         self, query: str, *, run_manager: CallbackManagerForRetrieverRun
     ) -> List[Document]:
-        from sklearn.metrics.pairwise import cosine_similarity
+        query_vec = self.vectorizer.transform([query])
+        return [self.docs[i] for i in self._top_k(query_vec)[0]]
 
-        query_vec = self.vectorizer.transform(
-            [query]
-        )  # Ip -- (n_docs,x), Op -- (n_docs,n_Feats)
-        results = cosine_similarity(self.tfidf_array, query_vec).reshape(
-            (-1,)
-        )  # Op -- (n_docs,1) -- Cosine Sim with each doc
-        return_docs = [self.docs[i] for i in results.argsort()[-self.k :][::-1]]
-        return return_docs
+    def batch_get_relevant_documents(self, queries: List[str]) -> List[List[Document]]:
+        """Retrieve documents for several queries with one sparse product.
+
+        Args:
+            queries: Queries to search for.
+
+        Returns:
+            One list of documents per query.
+        """
+        if not queries:
+            return []
+        query_vecs = self.vectorizer.transform(queries)
+        return [[self.docs[i] for i in top] for top in self._top_k(query_vecs)]
 
     def save_local(
         self,
         folder_path: str,
         file_name: str = "tfidf_vectorizer",
     ) -> None:
+        """Save the retriever to local storage.
+
+        The vectorizer is saved with joblib. The TF-IDF matrix (and the term
+        counts in append mode) are saved as ``.npy`` files that `load_local`
+        can memory-map, and the documents as JSON lines.
+
+        Args:
+            folder_path: Folder path to save to.
+            file_name: File name to save to. Defaults to "tfidf_vectorizer".
+        """
         try:
             import joblib
         except ImportError:
             raise ImportError(
                 "Could not import joblib, please install with `pip install joblib`."
             )
+        from scipy.sparse import csr_matrix
 
         path = Path(folder_path)
         path.mkdir(exist_ok=True, parents=True)
@@ -98,9 +337,19 @@ class TFIDFRetriever(BaseRetriever):
         # Save vectorizer with joblib dump.
         joblib.dump(self.vectorizer, path / f"{file_name}.joblib")
 
-        # Save docs and tfidf array as pickle.
-        with open(path / f"{file_name}.pkl", "wb") as f:
-            pickle.dump((self.docs, self.tfidf_array), f)
+        # Save the sparse matrices as memory-mappable arrays.
+        _save_csr(path / f"{file_name}.tfidf", csr_matrix(self.tfidf_array))
+        if self.term_counts is not None:
+            _save_csr(path / f"{file_name}.counts", csr_matrix(self.term_counts))
+
+        with open(path / f"{file_name}.docs.jsonl", "w") as f:
+            for doc in self.docs:
+                record = {
+                    "page_content": doc.page_content,
+                    "metadata": doc.metadata,
+                    "id": doc.id,
+                }
+                f.write(json.dumps(record) + "\n")
 
     @classmethod
     def load_local(
@@ -109,6 +358,7 @@ class TFIDFRetriever(BaseRetriever):
         *,
         allow_dangerous_deserialization: bool = False,
         file_name: str = "tfidf_vectorizer",
+        mmap: bool = True,
     ) -> TFIDFRetriever:
         """Load the retriever from local storage.
 
@@ -122,6 +372,8 @@ class TFIDFRetriever(BaseRetriever):
                 use deserialization. If you do this, make sure you trust the source of
                 the file.
             file_name: File name to load from. Defaults to "tfidf_vectorizer".
+            mmap: Whether to memory-map the TF-IDF matrix instead of reading it.
+                Ignored for folders saved in the older ``.pkl`` format.
 
         Returns:
             TFIDFRetriever: Loaded retriever.
@@ -150,10 +402,24 @@ class TFIDFRetriever(BaseRetriever):
         # Load vectorizer with joblib load.
         vectorizer = joblib.load(path / f"{file_name}.joblib")
 
-        # Load docs and tfidf array as pickle.
-        with open(path / f"{file_name}.pkl", "rb") as f:
-            # This code path can only be triggered if the user
-            # passed allow_dangerous_deserialization=True
-            docs, tfidf_array = pickle.load(f)  # ignore[pickle]: explicit-opt-in
+        if not (path / f"{file_name}.tfidf").exists():
+            # Load docs and tfidf array as pickle.
+            with open(path / f"{file_name}.pkl", "rb") as f:
+                # This code path can only be triggered if the user
+                # passed allow_dangerous_deserialization=True
+                docs, tfidf_array = pickle.load(f)  # ignore[pickle]: explicit-opt-in
+            return cls(vectorizer=vectorizer, docs=docs, tfidf_array=tfidf_array)
 
-        return cls(vectorizer=vectorizer, docs=docs, tfidf_array=tfidf_array)
+        tfidf_array = _load_csr(path / f"{file_name}.tfidf", mmap)
+        term_counts = None
+        if (path / f"{file_name}.counts").exists():
+            # Counts are rewritten on append, so they are read into memory.
+            term_counts = _load_csr(path / f"{file_name}.counts", mmap=False)
+        with open(path / f"{file_name}.docs.jsonl") as f:
+            docs = [Document(**json.loads(line)) for line in f]
+        return cls(
+            vectorizer=vectorizer,
+            docs=docs,
+            tfidf_array=tfidf_array,
+            term_counts=term_counts,
+        )
@@ -0,0 +1,96 @@
+"""Batched embedding of large text collections."""
+
+from __future__ import annotations
+
+import concurrent.futures
+import itertools
+import logging
+import time
+from typing import Any, Iterable, Iterator, List, Optional, Sequence
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+logger = logging.getLogger(__name__)
+
+
+def _batches(texts: Iterable[str], batch_size: int) -> Iterator[List[str]]:
+    iterator = iter(texts)
+    while batch := list(itertools.islice(iterator, batch_size)):
+        yield batch
+
+
+def embed_texts(
+    texts: Iterable[str],
+    embeddings: Embeddings,
+    *,
+    batch_size: int = 64,
+    max_concurrency: int = 4,
+    show_progress: bool = False,
+    total: Optional[int] = None,
+) -> np.ndarray:
+    """Embed texts with batched ``embed_documents`` calls.
+
+    Texts are consumed lazily in chunks of ``batch_size``. At most
+    ``max_concurrency`` batches are in flight at once, so only that many
+    batches are held in memory beyond the results. Results keep the input
+    order. Throughput is logged at INFO level when done.
+
+    Args:
+        texts: Texts to embed. May be a generator.
+        embeddings: Embeddings model to use.
+        batch_size: Number of texts per ``embed_documents`` call.
+        max_concurrency: Maximum number of concurrent ``embed_documents`` calls.
+        show_progress: Whether to show a progress bar. Requires ``tqdm``.
+        total: Number of texts, for the progress bar, when ``texts`` has no
+            length.
+
+    Returns:
+        Array with one embedding per row.
+    """
+    if batch_size < 1 or max_concurrency < 1:
+        raise ValueError("batch_size and max_concurrency must be at least 1.")
+    if total is None and isinstance(texts, Sequence):
+        total = len(texts)
+
+    progress: Any = None
+    if show_progress:
+        try:
+            from tqdm.auto import tqdm
+
+            progress = tqdm(total=total, unit="text")
+        except ImportError:
+            logger.warning(
+                "Could not import tqdm, please install with `pip install tqdm` to "
+                "show progress."
+            )
+
+    results: List[List[List[float]]] = []
+    n_texts = 0
+    start = time.perf_counter()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_concurrency) as pool:
+        pending: List[concurrent.futures.Future] = []
+        for batch in _batches(texts, batch_size):
+            if len(pending) >= max_concurrency:
+                results.append(pending.pop(0).result())
+                if progress is not None:
+                    progress.update(len(results[-1]))
+            pending.append(pool.submit(embeddings.embed_documents, batch))
+            n_texts += len(batch)
+        for future in pending:
+            results.append(future.result())
+            if progress is not None:
+                progress.update(len(results[-1]))
+    if progress is not None:
+        progress.close()
+
+    elapsed = time.perf_counter() - start
+    logger.info(
+        "Embedded %d texts in %.2fs (%.1f texts/s)",
+        n_texts,
+        elapsed,
+        n_texts / elapsed if elapsed else 0.0,
+    )
+    if not n_texts:
+        return np.zeros((0, 0))
+    return np.array(list(itertools.chain.from_iterable(results)))
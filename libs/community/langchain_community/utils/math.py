@@ -1,7 +1,10 @@
 """Math utils."""
 
+from __future__ import annotations
+
+import heapq
 import logging
-from typing import List, Optional, Tuple, Union
+from typing import Iterator, List, Optional, Tuple, Union
 
 import numpy as np
 
@@ -9,14 +12,178 @@ logger = logging.getLogger(__name__)
 
 Matrix = Union[List[List[float]], List[np.ndarray], np.ndarray]
 
+# Default number of rows scored at once by blocked top-k searches.
+DEFAULT_BLOCK_SIZE = 16384
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """Scale rows to unit L2 norm in place; all-zero rows are left untouched."""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    matrix /= norms
+    return matrix
+
+
+class NormalizedMatrix:
+    """A matrix whose rows are stored unit-normalized, ready for cosine search.
+
+    Normalizing once means that repeated cosine similarity computations
+    reduce to dot products, and that no per-call copies of the matrix are
+    made. Rows can be stored as float16 to halve memory; they are upcast to
+    float32 one block at a time when searched.
+
+    Example:
+        .. code-block:: python
+
+            from langchain_community.utils.math import NormalizedMatrix
+
+            index = NormalizedMatrix(embeddings.embed_documents(texts))
+            idxs, scores = index.top_k(embeddings.embed_query(query), k=4)
+    """
+
+    def __init__(self, X: Matrix, *, dtype: type = np.float32) -> None:
+        """Normalize and store the rows of X.
+
+        Args:
+            X: Matrix with one vector per row.
+            dtype: Storage dtype, ``np.float32`` or ``np.float16``.
+        """
+        if np.dtype(dtype) not in (np.dtype(np.float32), np.dtype(np.float16)):
+            raise ValueError(f"dtype must be float32 or float16, got {dtype}.")
+        matrix = np.array(X, dtype=np.float32)
+        if matrix.ndim == 1:
+            matrix = matrix.reshape(1, -1) if len(matrix) else matrix.reshape(0, 0)
+        self.data: np.ndarray = _normalize_rows(matrix).astype(dtype, copy=False)
+
+    @classmethod
+    def from_normalized(cls, data: np.ndarray) -> NormalizedMatrix:
+        """Wrap an array whose rows are already unit-normalized, without copying.
+
+        Useful for arrays loaded with ``np.load(..., mmap_mode="r")``.
+        """
+        matrix = cls.__new__(cls)
+        matrix.data = data
+        return matrix
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        return self.data.shape
 
-def cosine_similarity(X: Matrix, Y: Matrix) -> np.ndarray:
-    """Row-wise cosine similarity between two equal-width matrices."""
+    def append(self, X: Matrix) -> None:
+        """Normalize and append rows."""
+        rows = NormalizedMatrix(X, dtype=self.data.dtype.type).data
+        if len(self.data) == 0:
+            self.data = rows
+        else:
+            self.data = np.concatenate([self.data, rows])
+
+    def blocks(
+        self, block_size: int = DEFAULT_BLOCK_SIZE
+    ) -> Iterator[Tuple[int, np.ndarray]]:
+        """Yield ``(offset, rows)`` blocks of the matrix as float32."""
+        for start in range(0, len(self.data), block_size):
+            yield (
+                start,
+                self.data[start : start + block_size].astype(np.float32, copy=False),
+            )
+
+    def similarity(self, Y: Union[Matrix, NormalizedMatrix]) -> np.ndarray:
+        """Cosine similarity between every row of Y and every row of this matrix.
+
+        Returns:
+            Array of shape ``(len(Y), len(self))``.
+        """
+        queries = _as_normalized(Y).data.astype(np.float32, copy=False)
+        return queries @ self.data.astype(np.float32, copy=False).T
+
+    def top_k(
+        self,
+        Y: Union[Matrix, NormalizedMatrix],
+        k: int = 4,
+        *,
+        score_threshold: Optional[float] = None,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Find the ``k`` rows most similar to each row of Y.
+
+        Rows are scored one block at a time and merged into a running top-k,
+        so memory is O(len(Y) * (k + block_size)) instead of
+        O(len(Y) * len(self)).
+
+        Args:
+            Y: One query vector, or a matrix with one query per row.
+            k: Number of results per query.
+            score_threshold: Minimum cosine similarity of results.
+            block_size: Number of rows scored at once.
+
+        Returns:
+            Tuple of two ``(len(Y), k')`` arrays, ``k' = min(k, len(self))``:
+            row indices sorted by decreasing similarity, and the similarities.
+            Results below ``score_threshold`` have index -1 and score -inf.
+        """
+        queries = _as_normalized(Y).data.astype(np.float32, copy=False)
+        k = min(k, len(self.data))
+        best_scores = np.full((len(queries), k), -np.inf, dtype=np.float32)
+        best_idxs = np.full((len(queries), k), -1, dtype=np.int64)
+        if k <= 0:
+            return best_idxs, best_scores
+        for start, block in self.blocks(block_size):
+            scores = queries @ block.T
+            if scores.shape[1] > k:
+                part = np.argpartition(scores, -k, axis=1)[:, -k:]
+                scores = np.take_along_axis(scores, part, axis=1)
+                idxs = part + start
+            else:
+                idxs = np.broadcast_to(
+                    np.arange(start, start + scores.shape[1]), scores.shape
+                )
+            merged_scores = np.concatenate([best_scores, scores], axis=1)
+            merged_idxs = np.concatenate([best_idxs, idxs], axis=1)
+            keep = np.argpartition(merged_scores, -k, axis=1)[:, -k:]
+            best_scores = np.take_along_axis(merged_scores, keep, axis=1)
+            best_idxs = np.take_along_axis(merged_idxs, keep, axis=1)
+        order = np.argsort(-best_scores, axis=1, kind="stable")
+        best_scores = np.take_along_axis(best_scores, order, axis=1)
+        best_idxs = np.take_along_axis(best_idxs, order, axis=1)
+        if score_threshold is not None:
+            below = best_scores < score_threshold
+            best_scores[below] = -np.inf
+            best_idxs[below] = -1
+        return best_idxs, best_scores
+
+
+def _as_normalized(X: Union[Matrix, NormalizedMatrix]) -> NormalizedMatrix:
+    if isinstance(X, NormalizedMatrix):
+        return X
+    return NormalizedMatrix(X)
+
+
+def cosine_similarity(
+    X: Union[Matrix, NormalizedMatrix], Y: Union[Matrix, NormalizedMatrix]
+) -> np.ndarray:
+    """Row-wise cosine similarity between two equal-width matrices.
+
+    Either side may be a `NormalizedMatrix`, in which case its stored
+    normalized rows are reused instead of being converted and normalized again.
+    """
     if len(X) == 0 or len(Y) == 0:
         return np.array([])
 
-    X = np.array(X)
-    Y = np.array(Y)
+    if isinstance(X, NormalizedMatrix) or isinstance(Y, NormalizedMatrix):
+        X_normalized = _as_normalized(X)
+        Y_normalized = _as_normalized(Y)
+        if X_normalized.shape[1] != Y_normalized.shape[1]:
+            raise ValueError(
+                "Number of columns in X and Y must be the same. X has shape "
+                f"{X_normalized.shape} and Y has shape {Y_normalized.shape}."
+            )
+        return Y_normalized.similarity(X_normalized)
+
+    X = np.asarray(X)
+    Y = np.asarray(Y)
     if X.shape[1] != Y.shape[1]:
         raise ValueError(
             f"Number of columns in X and Y must be the same. X has shape {X.shape} "
@@ -25,8 +192,8 @@ def cosine_similarity(X: Matrix, Y: Matrix) -> np.ndarray:
     try:
         import simsimd as simd
 
-        X = np.array(X, dtype=np.float32)
-        Y = np.array(Y, dtype=np.float32)
+        X = np.asarray(X, dtype=np.float32)
+        Y = np.asarray(Y, dtype=np.float32)
         Z = 1 - np.array(simd.cdist(X, Y, metric="cosine"))
         return Z
     except ImportError:
@@ -44,18 +211,25 @@ def cosine_similarity(X: Matrix, Y: Matrix) -> np.ndarray:
 
 
 def cosine_similarity_top_k(
-    X: Matrix,
-    Y: Matrix,
+    X: Union[Matrix, NormalizedMatrix],
+    Y: Union[Matrix, NormalizedMatrix],
     top_k: Optional[int] = 5,
     score_threshold: Optional[float] = None,
+    *,
+    block_size: int = DEFAULT_BLOCK_SIZE,
 ) -> Tuple[List[Tuple[int, int]], List[float]]:
     """Row-wise cosine similarity with optional top-k and score threshold filtering.
 
+    X is scored against Y a block of rows at a time and only the best
+    ``top_k`` pairs are kept, so the full score matrix is never materialized.
+
     Args:
         X: Matrix.
         Y: Matrix, same width as X.
-        top_k: Max number of results to return.
+        top_k: Max number of results to return. None or a value <= 0 returns
+            at most ``len(X)`` results.
         score_threshold: Minimum cosine similarity of results.
+        block_size: Number of rows of X scored at once.
 
     Returns:
         Tuple of two lists. First contains two-tuples of indices (X_idx, Y_idx),
@@ -63,12 +237,29 @@ def cosine_similarity_top_k(
     """
     if len(X) == 0 or len(Y) == 0:
         return [], []
-    score_array = cosine_similarity(X, Y)
     score_threshold = score_threshold or -1.0
-    score_array[score_array < score_threshold] = 0
-    top_k = min(top_k or len(score_array), np.count_nonzero(score_array))
-    top_k_idxs = np.argpartition(score_array, -top_k, axis=None)[-top_k:]
-    top_k_idxs = top_k_idxs[np.argsort(score_array.ravel()[top_k_idxs])][::-1]
-    ret_idxs = np.unravel_index(top_k_idxs, score_array.shape)
-    scores = score_array.ravel()[top_k_idxs].tolist()
-    return list(zip(*ret_idxs)), scores  # type: ignore[return-value,unused-ignore]
+    if top_k is None or top_k <= 0:
+        top_k = len(X)
+
+    X_normalized = _as_normalized(X)
+    Y_normalized = _as_normalized(Y)
+    # Min-heap of the best (score, x_idx, y_idx) triples seen so far.
+    heap: List[Tuple[float, int, int]] = []
+    for start, block in X_normalized.blocks(block_size):
+        scores = Y_normalized.similarity(block)
+        # Zero scores are excluded, as when thresholding the full matrix.
+        scores[(scores < score_threshold) | (scores == 0)] = -np.inf
+        n_candidates = min(top_k, scores.size)
+        flat = np.argpartition(scores, -n_candidates, axis=None)[-n_candidates:]
+        for idx in flat:
+            score = float(scores.flat[idx])
+            if score == -np.inf:
+                continue
+            x_idx, y_idx = divmod(int(idx), scores.shape[1])
+            item = (score, start + x_idx, y_idx)
+            if len(heap) < top_k:
+                heapq.heappush(heap, item)
+            elif item[0] > heap[0][0]:
+                heapq.heapreplace(heap, item)
+    best = sorted(heap, key=lambda item: item[0], reverse=True)
+    return [(x_idx, y_idx) for _, x_idx, y_idx in best], [score for score, _, _ in best]
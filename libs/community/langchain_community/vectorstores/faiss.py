@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import operator
 import os
 import pickle
+import shutil
+import threading
 import uuid
 import warnings
 from pathlib import Path
@@ -12,12 +15,16 @@ from typing import (
     Callable,
     Dict,
     Iterable,
+    Iterator,
     List,
+    MutableMapping,
     Optional,
     Sequence,
+    Set,
     Sized,
     Tuple,
     Union,
+    cast,
 )
 
 import numpy as np
@@ -28,9 +35,11 @@ from langchain_core.vectorstores import VectorStore
 
 from langchain_community.docstore.base import AddableMixin, Docstore
 from langchain_community.docstore.in_memory import InMemoryDocstore
+from langchain_community.docstore.jsonl import JSONLinesDocstore
 from langchain_community.vectorstores.utils import (
     DistanceStrategy,
     maximal_marginal_relevance,
+    maximal_marginal_relevance_batch,
 )
 
 logger = logging.getLogger(__name__)
@@ -72,6 +81,271 @@ def _len_check_if_sized(x: Any, y: Any, x_name: str, y_name: str) -> None:
     return
 
 
+def _search_parameters(
+    index: Any, selector: Any = None, search_params: Optional[Dict[str, Any]] = None
+) -> Any:
+    """Build faiss search-time parameters for ``index``, or None if not needed.
+
+    ``search_params`` holds per-query overrides such as ``nprobe`` for IVF
+    indexes or ``efSearch`` for HNSW indexes. Id maps and pre-transforms (such
+    as OPQ) pass parameters through to the index they wrap, so the parameter
+    type is picked from the innermost index.
+    """
+    if selector is None and not search_params:
+        return None
+    faiss = dependable_faiss_import()
+    base = index
+    while isinstance(base, (faiss.IndexIDMap, faiss.IndexPreTransform)):
+        base = faiss.downcast_index(base.index)
+    if isinstance(base, faiss.IndexIVF):
+        params = faiss.SearchParametersIVF()
+    elif isinstance(base, faiss.IndexHNSW):
+        params = faiss.SearchParametersHNSW()
+    else:
+        params = faiss.SearchParameters()
+    for name, value in (search_params or {}).items():
+        if not hasattr(params, name):
+            raise ValueError(
+                f"Search parameter {name!r} is not supported by {type(base).__name__}."
+            )
+        setattr(params, name, value)
+    if selector is not None:
+        params.sel = selector
+    return params
+
+
+def _has_stable_ids(index: Any) -> bool:
+    """Whether ``index`` stores explicit ids that survive ``remove_ids``.
+
+    Flat indexes number vectors by position and shift them on removal; IVF
+    indexes and id maps keep the id each vector was added with.
+    """
+    faiss = dependable_faiss_import()
+    if isinstance(index, faiss.IndexIDMap):
+        return True
+    try:
+        faiss.extract_index_ivf(index)
+    except RuntimeError:
+        return False
+    return True
+
+
+def _stored_ids(index: Any) -> np.ndarray:
+    """Ids of the vectors stored in an index with stable ids."""
+    faiss = dependable_faiss_import()
+    if isinstance(index, faiss.IndexIDMap):
+        return faiss.vector_to_array(index.id_map)
+    invlists = faiss.extract_index_ivf(index).invlists
+    ids = [np.zeros(0, dtype=np.int64)]
+    for list_no in range(invlists.nlist):
+        list_size = invlists.list_size(list_no)
+        if list_size:
+            list_ids = invlists.get_ids(list_no)
+            ids.append(faiss.rev_swig_ptr(list_ids, list_size).copy())
+            invlists.release_ids(list_no, list_ids)
+    return np.concatenate(ids)
+
+
+def _on_disk_invlists(index: Any) -> Any:
+    """Return the on-disk inverted lists of an IVF index, if it has any."""
+    faiss = dependable_faiss_import()
+    try:
+        ivf = faiss.extract_index_ivf(index)
+    except RuntimeError:
+        return None
+    invlists = faiss.downcast_InvertedLists(ivf.invlists)
+    return invlists if isinstance(invlists, faiss.OnDiskInvertedLists) else None
+
+
+class _MetadataIndex:
+    """Inverted index from metadata ``(field, value)`` pairs to faiss ids.
+
+    Used to turn dict filters into an explicit set of matching ids before
+    searching. Only hashable metadata values are indexed; a field holding any
+    unhashable value is marked as unindexable and filters on it fall back to
+    evaluating the filter function on candidates.
+    """
+
+    def __init__(self) -> None:
+        self.postings: Dict[str, Dict[Any, List[int]]] = {}
+        self.unindexable: set = set()
+        self.ids: Set[int] = set()
+        self._sorted_ids: Optional[np.ndarray] = None
+
+    def add(self, faiss_id: int, metadata: Dict[str, Any]) -> None:
+        self.ids.add(faiss_id)
+        self._sorted_ids = None
+        for field, value in metadata.items():
+            if field in self.unindexable:
+                continue
+            try:
+                self.postings.setdefault(field, {}).setdefault(value, []).append(
+                    faiss_id
+                )
+            except TypeError:
+                self.unindexable.add(field)
+                self.postings.pop(field, None)
+
+    def remove(self, faiss_id: int, metadata: Dict[str, Any]) -> None:
+        self.ids.discard(faiss_id)
+        self._sorted_ids = None
+        for field, value in metadata.items():
+            try:
+                ids = self.postings[field][value]
+                ids.remove(faiss_id)
+            except (KeyError, TypeError, ValueError):
+                continue
+            if not ids:
+                del self.postings[field][value]
+
+    def _all(self) -> np.ndarray:
+        if self._sorted_ids is None:
+            self._sorted_ids = np.sort(
+                np.fromiter(self.ids, dtype=np.int64, count=len(self.ids))
+            )
+        return self._sorted_ids
+
+    def _equal(self, field: str, value: Any) -> Optional[np.ndarray]:
+        # Documents missing the field compare equal to None, so None is not
+        # answered from the postings.
+        if value is None or field in self.unindexable:
+            return None
+        try:
+            return np.array(self.postings.get(field, {}).get(value, []), np.int64)
+        except TypeError:
+            return None
+
+    def _member(self, field: str, values: Any) -> Optional[np.ndarray]:
+        if not isinstance(values, (list, tuple, set, frozenset)):
+            return None
+        matches = []
+        for value in values:
+            ids = self._equal(field, value)
+            if ids is None:
+                return None
+            matches.append(ids)
+        if not matches:
+            return np.array([], dtype=np.int64)
+        return np.unique(np.concatenate(matches))
+
+    def _condition(self, field: str, condition: Any) -> Optional[np.ndarray]:
+        if isinstance(condition, list):
+            return self._member(field, condition)
+        if not isinstance(condition, dict):
+            return self._equal(field, condition)
+        result: Optional[np.ndarray] = None
+        for op, value in condition.items():
+            if op == "$eq":
+                ids = self._equal(field, value)
+            elif op == "$in":
+                ids = self._member(field, value)
+            elif op == "$neq":
+                ids = self._equal(field, value)
+                ids = None if ids is None else np.setdiff1d(self._all(), ids)
+            elif op == "$nin":
+                ids = self._member(field, value)
+                ids = None if ids is None else np.setdiff1d(self._all(), ids)
+            else:
+                return None
+            if ids is None:
+                return None
+            result = ids if result is None else np.intersect1d(result, ids)
+        return result
+
+    def match(self, filter: Dict[str, Any]) -> Optional[np.ndarray]:
+        """Sorted ids of documents matching ``filter``.
+
+        Mirrors the semantics of ``FAISS._create_filter_func``. Returns None
+        when the filter uses an operator or value that cannot be answered from
+        the index, such as range comparisons.
+        """
+        if "$and" in filter:
+            result = self._all()
+            for sub_filter in filter["$and"]:
+                part = self.match(sub_filter)
+                if part is None:
+                    return None
+                result = np.intersect1d(result, part)
+            return result
+        if "$or" in filter:
+            parts = [self.match(sub_filter) for sub_filter in filter["$or"]]
+            if any(part is None for part in parts):
+                return None
+            return np.unique(np.concatenate([np.array([], np.int64), *parts]))
+        if "$not" in filter:
+            part = self.match(filter["$not"])
+            return None if part is None else np.setdiff1d(self._all(), part)
+        result = self._all()
+        for field, condition in filter.items():
+            ids = self._condition(field, condition)
+            if ids is None:
+                return None
+            result = np.intersect1d(result, ids)
+        return result
+
+
+class _IdMap(MutableMapping[int, str]):
+    """Bidirectional map between faiss ids and docstore ids.
+
+    Used as ``index_to_docstore_id`` by stores with stable ids. Faiss ids are
+    handed out sequentially and never reused, so the forward direction is a
+    list indexed by faiss id, with None for deleted entries, and lookups in
+    both directions take constant time.
+    """
+
+    def __init__(self, items: Iterable[Tuple[int, str]] = ()) -> None:
+        self._docstore_ids: List[Optional[str]] = []
+        self._faiss_ids: Dict[str, int] = {}
+        self.update(items)
+
+    def __getitem__(self, faiss_id: int) -> str:
+        if 0 <= faiss_id < len(self._docstore_ids):
+            docstore_id = self._docstore_ids[faiss_id]
+            if docstore_id is not None:
+                return docstore_id
+        raise KeyError(faiss_id)
+
+    def __setitem__(self, faiss_id: int, docstore_id: str) -> None:
+        faiss_id = int(faiss_id)
+        if faiss_id < 0:
+            raise KeyError(faiss_id)
+        if faiss_id >= len(self._docstore_ids):
+            self._docstore_ids.extend([None] * (faiss_id + 1 - len(self._docstore_ids)))
+        previous = self._docstore_ids[faiss_id]
+        if previous is not None:
+            del self._faiss_ids[previous]
+        self._docstore_ids[faiss_id] = docstore_id
+        self._faiss_ids[docstore_id] = faiss_id
+
+    def __delitem__(self, faiss_id: int) -> None:
+        docstore_id = self[faiss_id]
+        self._docstore_ids[faiss_id] = None
+        del self._faiss_ids[docstore_id]
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._faiss_ids.values())
+
+    def __len__(self) -> int:
+        return len(self._faiss_ids)
+
+    def __contains__(self, faiss_id: object) -> bool:
+        if not isinstance(faiss_id, (int, np.integer)):
+            return False
+        faiss_id = int(faiss_id)
+        return (
+            0 <= faiss_id < len(self._docstore_ids)
+            and self._docstore_ids[faiss_id] is not None
+        )
+
+    def faiss_id(self, docstore_id: str) -> Optional[int]:
+        """Faiss id of a docstore id, or None if it is not mapped."""
+        return self._faiss_ids.get(docstore_id)
+
+    def next_id(self) -> int:
+        """Faiss id to give to the next added vector."""
+        return len(self._docstore_ids)
+
+
 class FAISS(VectorStore):
     """FAISS vector store integration.
 
@@ -212,8 +486,17 @@ class FAISS(VectorStore):
         relevance_score_fn: Optional[Callable[[float], float]] = None,
         normalize_L2: bool = False,
         distance_strategy: DistanceStrategy = DistanceStrategy.EUCLIDEAN_DISTANCE,
+        compaction_threshold: Optional[float] = None,
     ):
-        """Initialize with necessary components."""
+        """Initialize with necessary components.
+
+        Args:
+            compaction_threshold: If set, deleted vectors are only marked as
+                deleted and excluded from searches. They are removed from the
+                index in a background thread once they make up more than this
+                fraction of it. Requires an index with stable ids, such as an
+                ``IndexIDMap2``.
+        """
         if not isinstance(embedding_function, Embeddings):
             logger.warning(
                 "`embedding_function` is expected to be an Embeddings object, support "
@@ -226,6 +509,34 @@ class FAISS(VectorStore):
         self.distance_strategy = distance_strategy
         self.override_relevance_score_fn = relevance_score_fn
         self._normalize_L2 = normalize_L2
+        # Built lazily by the first dict-filtered search.
+        self._metadata_index: Optional[_MetadataIndex] = None
+        if compaction_threshold is not None and not _has_stable_ids(index):
+            raise ValueError(
+                "compaction_threshold requires an index with stable ids, such as "
+                "an IndexIDMap2."
+            )
+        self.compaction_threshold = compaction_threshold
+        # Faiss ids deleted but not yet removed from the index.
+        self._tombstones: Set[int] = set()
+        if _has_stable_ids(index) and index.ntotal > len(index_to_docstore_id):
+            # Saved with deleted vectors the index could not remove: they are
+            # the stored ids without a document.
+            self._tombstones = set(
+                np.setdiff1d(
+                    _stored_ids(index),
+                    np.fromiter(index_to_docstore_id, dtype=np.int64),
+                ).tolist()
+            )
+        self._tombstone_selector: Optional[Tuple[Any, Any]] = None
+        self._compaction: Optional[threading.Thread] = None
+        self._compaction_failed = False
+        # Serializes changes to the index. Searches only take the state lock,
+        # to read the index and the tombstones consistently.
+        self._write_lock = threading.RLock()
+        self._state_lock = threading.Lock()
+        # Set by load_columnar when the index data is memory-mapped read-only.
+        self._index_mapped = False
         if (
             self.distance_strategy != DistanceStrategy.EUCLIDEAN_DISTANCE
             and self._normalize_L2
@@ -277,6 +588,22 @@ class FAISS(VectorStore):
                 "for passing in a function will soon be removed."
             )
 
+    def _next_index_id(self) -> int:
+        if isinstance(self.index_to_docstore_id, _IdMap):
+            # Tombstoned ids may still be in the index, so ids are not reused.
+            return self.index_to_docstore_id.next_id()
+        if _has_stable_ids(self.index):
+            # Ids may have gaps left by deletes, so continue after the largest,
+            # including the deleted ones still in the index.
+            return (
+                max(
+                    max(self.index_to_docstore_id, default=-1),
+                    max(self._tombstones, default=-1),
+                )
+                + 1
+            )
+        return len(self.index_to_docstore_id)
+
     def __add(
         self,
         texts: Iterable[str],
@@ -310,13 +637,23 @@ class FAISS(VectorStore):
         vector = np.array(embeddings, dtype=np.float32)
         if self._normalize_L2:
             faiss.normalize_L2(vector)
-        self.index.add(vector)
-
-        # Add information to docstore and index.
-        self.docstore.add({id_: doc for id_, doc in zip(ids, documents)})
-        starting_len = len(self.index_to_docstore_id)
-        index_to_id = {starting_len + j: id_ for j, id_ in enumerate(ids)}
-        self.index_to_docstore_id.update(index_to_id)
+        with self._write_lock:
+            self._own_index()
+            starting_len = self._next_index_id()
+            if _has_stable_ids(self.index):
+                self.index.add_with_ids(
+                    vector, np.arange(starting_len, starting_len + len(vector))
+                )
+            else:
+                self.index.add(vector)
+
+            # Add information to docstore and index.
+            self.docstore.add({id_: doc for id_, doc in zip(ids, documents)})
+            index_to_id = {starting_len + j: id_ for j, id_ in enumerate(ids)}
+            self.index_to_docstore_id.update(index_to_id)
+            if self._metadata_index is not None:
+                for j, doc in enumerate(documents):
+                    self._metadata_index.add(starting_len + j, doc.metadata)
         return ids
 
     def add_texts(
@@ -384,6 +721,180 @@ class FAISS(VectorStore):
         texts, embeddings = zip(*text_embeddings)
         return self.__add(texts, embeddings, metadatas=metadatas, ids=ids)
 
+    def _get_metadata_index(self) -> _MetadataIndex:
+        if self._metadata_index is None:
+            metadata_index = _MetadataIndex()
+            for i, _id in self.index_to_docstore_id.items():
+                metadata_index.add(i, self._get_document(_id).metadata)
+            self._metadata_index = metadata_index
+        return self._metadata_index
+
+    def _get_document(self, _id: str) -> Document:
+        doc = self.docstore.search(_id)
+        if not isinstance(doc, Document):
+            raise ValueError(f"Could not find document for id {_id}, got {doc}")
+        return doc
+
+    def _resolve(
+        self, indices: np.ndarray, scores: np.ndarray
+    ) -> List[List[Tuple[int, Document, float]]]:
+        """Turn faiss search results into documents with one docstore lookup.
+
+        Returns:
+            For every row of ``indices``, ``(faiss_id, document, score)``
+            triples, skipping the -1 padding faiss uses for missing results.
+        """
+        hits = [int(i) for i in np.unique(indices) if i != -1]
+        ids = [self.index_to_docstore_id[i] for i in hits]
+        docs: Dict[int, Document] = {}
+        for i, _id, doc in zip(hits, ids, self.docstore.mget(ids)):
+            if not isinstance(doc, Document):
+                raise ValueError(f"Could not find document for id {_id}, got {doc}")
+            docs[i] = doc
+        return [
+            [
+                (i, docs[i], score)
+                for i, score in zip(row_indices.tolist(), row_scores)
+                if i != -1
+            ]
+            for row_indices, row_scores in zip(indices, scores)
+        ]
+
+    def _index_search(
+        self,
+        vectors: np.ndarray,
+        k: int,
+        selector: Any = None,
+        search_params: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        with self._state_lock:
+            index = self.index
+            if self._tombstones and self._tombstone_selector is None:
+                faiss = dependable_faiss_import()
+                deleted = faiss.IDSelectorBatch(
+                    np.fromiter(self._tombstones, dtype=np.int64)
+                )
+                self._tombstone_selector = (deleted, faiss.IDSelectorNot(deleted))
+            tombstone_selector = self._tombstone_selector
+        # Selectors only hold pointers to the selectors they combine, so all
+        # of them stay referenced until the search is done.
+        combined = selector
+        if tombstone_selector is not None:
+            faiss = dependable_faiss_import()
+            combined = (
+                tombstone_selector[1]
+                if selector is None
+                else faiss.IDSelectorAnd(selector, tombstone_selector[1])
+            )
+        params = _search_parameters(index, combined, search_params)
+        if params is None:
+            return index.search(vectors, k)
+        return index.search(vectors, k, params=params)
+
+    def _search_filtered(
+        self,
+        vectors: np.ndarray,
+        k: int,
+        filter: Optional[Union[Callable, Dict[str, Any]]],
+        fetch_k: int,
+        search_params: Optional[Dict[str, Any]] = None,
+    ) -> List[List[Tuple[int, Document, float]]]:
+        """Search for the k nearest documents that pass ``filter``, per query.
+
+        Dict filters that the metadata index can answer are turned into an id
+        selector, so faiss only ever considers matching vectors. Otherwise the
+        number of fetched candidates starts at ``fetch_k`` and doubles until k
+        of them pass the filter or the index is exhausted. Only queries that
+        are still short of k results are searched again.
+
+        Args:
+            vectors: Query vectors, one per row.
+            search_params: Per-query index parameters, such as ``nprobe``.
+
+        Returns:
+            For every query, ``(faiss_id, document, score)`` triples, most
+            similar first. More than k may be returned when filtering
+            candidates.
+        """
+        if filter is None:
+            scores, indices = self._index_search(vectors, k, None, search_params)
+            return self._resolve(indices, scores)
+
+        results: List[List[Tuple[int, Document, float]]] = [
+            [] for _ in range(len(vectors))
+        ]
+        pending = list(range(len(vectors)))
+        filter_func = self._create_filter_func(filter)
+        if isinstance(filter, dict):
+            ids = self._get_metadata_index().match(filter)
+            if ids is not None:
+                if len(ids) == 0:
+                    return results
+                faiss = dependable_faiss_import()
+                n_expected = min(k, len(ids))
+                try:
+                    scores, indices = self._index_search(
+                        vectors,
+                        n_expected,
+                        faiss.IDSelectorBatch(ids),
+                        search_params,
+                    )
+                except (RuntimeError, TypeError) as e:
+                    # Not every index type supports search-time id selectors.
+                    logger.debug("Falling back to post-filtering: %s", e)
+                else:
+                    pending = []
+                    hits_per_query = self._resolve(indices, scores)
+                    for q, hits in enumerate(hits_per_query):
+                        results[q] = [
+                            hit for hit in hits if filter_func(hit[1].metadata)
+                        ]
+                        # Graph indexes can miss selected ids when few of
+                        # them are reachable; post-filter those queries.
+                        if len(hits) < n_expected:
+                            results[q] = []
+                            pending.append(q)
+
+        n_total = self.index.ntotal
+        n_seen = 0
+        n_fetch = max(k, fetch_k, 1)
+        while pending and n_seen < n_total:
+            n_fetch = min(n_fetch, n_total)
+            scores, indices = self._index_search(
+                vectors[pending], n_fetch, None, search_params
+            )
+            new_hits = self._resolve(indices[:, n_seen:], scores[:, n_seen:])
+            still_pending = []
+            for q, hits, row_indices in zip(pending, new_hits, indices):
+                results[q].extend(hit for hit in hits if filter_func(hit[1].metadata))
+                # Approximate indexes may return fewer than requested, which
+                # means there is nothing more to find.
+                if len(results[q]) < k and row_indices[-1] != -1:
+                    still_pending.append(q)
+            pending = still_pending
+            n_seen = n_fetch
+            n_fetch *= 2
+        return results
+
+    def _apply_score_threshold(
+        self,
+        docs: List[Tuple[Document, float]],
+        score_threshold: Optional[float],
+    ) -> List[Tuple[Document, float]]:
+        if score_threshold is None:
+            return docs
+        cmp = (
+            operator.ge
+            if self.distance_strategy
+            in (DistanceStrategy.MAX_INNER_PRODUCT, DistanceStrategy.JACCARD)
+            else operator.le
+        )
+        return [
+            (doc, similarity)
+            for doc, similarity in docs
+            if cmp(similarity, score_threshold)
+        ]
+
     def similarity_search_with_score_by_vector(
         self,
         embedding: List[float],
@@ -401,10 +912,14 @@ class FAISS(VectorStore):
                 Defaults to None. If a callable, it must take as input the
                 metadata dict of Document and return a bool.
             fetch_k: (Optional[int]) Number of Documents to fetch before filtering.
-                      Defaults to 20.
+                      Defaults to 20. If fewer than k of them pass the filter,
+                      the number fetched is doubled until k pass or the index
+                      is exhausted.
             **kwargs: kwargs to be passed to similarity search. Can include:
                 score_threshold: Optional, a floating point value between 0 to 1 to
                     filter the resulting set of retrieved docs
+                search_params: Optional, a dict of index parameters for this
+                    search, such as ``nprobe`` or ``efSearch``
 
         Returns:
             List of documents most similar to the query text and L2 distance
@@ -414,39 +929,13 @@ class FAISS(VectorStore):
         vector = np.array([embedding], dtype=np.float32)
         if self._normalize_L2:
             faiss.normalize_L2(vector)
-        scores, indices = self.index.search(vector, k if filter is None else fetch_k)
-        docs = []
-
-        if filter is not None:
-            filter_func = self._create_filter_func(filter)
-
-        for j, i in enumerate(indices[0]):
-            if i == -1:
-                # This happens when not enough docs are returned.
-                continue
-            _id = self.index_to_docstore_id[i]
-            doc = self.docstore.search(_id)
-            if not isinstance(doc, Document):
-                raise ValueError(f"Could not find document for id {_id}, got {doc}")
-            if filter is not None:
-                if filter_func(doc.metadata):
-                    docs.append((doc, scores[0][j]))
-            else:
-                docs.append((doc, scores[0][j]))
-
-        score_threshold = kwargs.get("score_threshold")
-        if score_threshold is not None:
-            cmp = (
-                operator.ge
-                if self.distance_strategy
-                in (DistanceStrategy.MAX_INNER_PRODUCT, DistanceStrategy.JACCARD)
-                else operator.le
-            )
-            docs = [
-                (doc, similarity)
-                for doc, similarity in docs
-                if cmp(similarity, score_threshold)
-            ]
+        docs = [
+            (doc, score)
+            for _, doc, score in self._search_filtered(
+                vector, k, filter, fetch_k, kwargs.get("search_params")
+            )[0]
+        ]
+        docs = self._apply_score_threshold(docs, kwargs.get("score_threshold"))
         return docs[:k]
 
     async def asimilarity_search_with_score_by_vector(
@@ -471,6 +960,8 @@ class FAISS(VectorStore):
             **kwargs: kwargs to be passed to similarity search. Can include:
                 score_threshold: Optional, a floating point value between 0 to 1 to
                     filter the resulting set of retrieved docs
+                search_params: Optional, a dict of index parameters for this
+                    search, such as ``nprobe`` or ``efSearch``
 
         Returns:
             List of documents most similar to the query text and L2 distance
@@ -556,6 +1047,148 @@ class FAISS(VectorStore):
         )
         return docs
 
+    def _query_matrix(self, embeddings: Sequence[List[float]]) -> np.ndarray:
+        vectors = np.array(embeddings, dtype=np.float32)
+        if vectors.ndim == 1:
+            vectors = vectors.reshape(1, -1) if len(vectors) else vectors.reshape(0, 0)
+        if self._normalize_L2 and len(vectors):
+            faiss = dependable_faiss_import()
+            faiss.normalize_L2(vectors)
+        return vectors
+
+    def batch_similarity_search_with_score_by_vector(
+        self,
+        embeddings: Sequence[List[float]],
+        k: int = 4,
+        filter: Optional[Union[Callable, Dict[str, Any]]] = None,
+        fetch_k: int = 20,
+        **kwargs: Any,
+    ) -> List[List[Tuple[Document, float]]]:
+        """Return docs most similar to each of many query vectors.
+
+        All queries are searched with a single faiss call, which parallelizes
+        across queries, and the hits of all queries are resolved with one
+        docstore lookup.
+
+        Args:
+            embeddings: Embedding vectors to look up documents similar to.
+            k: Number of Documents to return per query. Defaults to 4.
+            filter (Optional[Union[Callable, Dict[str, Any]]]): Filter by metadata,
+                applied to every query. Defaults to None. If a callable, it must
+                take as input the metadata dict of Document and return a bool.
+            fetch_k: (Optional[int]) Number of Documents to fetch before filtering.
+                      Defaults to 20.
+            **kwargs: kwargs to be passed to similarity search. Can include:
+                score_threshold: Optional, a floating point value between 0 to 1 to
+                    filter the resulting set of retrieved docs
+                search_params: Optional, a dict of index parameters for this
+                    search, such as ``nprobe`` or ``efSearch``
+
+        Returns:
+            For every query, the documents most similar to it and the L2
+            distance in float for each, as `similarity_search_with_score_by_vector`
+            would return them.
+        """
+        if len(embeddings) == 0:
+            return []
+        vectors = self._query_matrix(embeddings)
+        score_threshold = kwargs.get("score_threshold")
+        return [
+            self._apply_score_threshold(
+                [(doc, score) for _, doc, score in hits], score_threshold
+            )[:k]
+            for hits in self._search_filtered(
+                vectors, k, filter, fetch_k, kwargs.get("search_params")
+            )
+        ]
+
+    def batch_similarity_search_with_score(
+        self,
+        queries: Sequence[str],
+        k: int = 4,
+        filter: Optional[Union[Callable, Dict[str, Any]]] = None,
+        fetch_k: int = 20,
+        *,
+        batch_size: int = 256,
+        **kwargs: Any,
+    ) -> List[List[Tuple[Document, float]]]:
+        """Return docs most similar to each of many queries.
+
+        Queries are embedded and searched ``batch_size`` at a time.
+
+        Args:
+            queries: Texts to look up documents similar to.
+            k: Number of Documents to return per query. Defaults to 4.
+            filter (Optional[Union[Callable, Dict[str, Any]]]): Filter by metadata,
+                applied to every query. Defaults to None.
+            fetch_k: (Optional[int]) Number of Documents to fetch before filtering.
+                      Defaults to 20.
+            batch_size: Number of queries embedded and searched at once.
+
+        Returns:
+            For every query, the documents most similar to it with L2 distance
+            in float. Lower score represents more similarity.
+        """
+        results: List[List[Tuple[Document, float]]] = []
+        for start in range(0, len(queries), batch_size):
+            batch = queries[start : start + batch_size]
+            results.extend(
+                self.batch_similarity_search_with_score_by_vector(
+                    [self._embed_query(query) for query in batch],
+                    k,
+                    filter=filter,
+                    fetch_k=fetch_k,
+                    **kwargs,
+                )
+            )
+        return results
+
+    async def abatch_similarity_search_with_score(
+        self,
+        queries: Sequence[str],
+        k: int = 4,
+        filter: Optional[Union[Callable, Dict[str, Any]]] = None,
+        fetch_k: int = 20,
+        *,
+        batch_size: int = 256,
+        **kwargs: Any,
+    ) -> List[List[Tuple[Document, float]]]:
+        """Return docs most similar to each of many queries asynchronously.
+
+        The queries of a batch are embedded concurrently.
+
+        Args:
+            queries: Texts to look up documents similar to.
+            k: Number of Documents to return per query. Defaults to 4.
+            filter (Optional[Union[Callable, Dict[str, Any]]]): Filter by metadata,
+                applied to every query. Defaults to None.
+            fetch_k: (Optional[int]) Number of Documents to fetch before filtering.
+                      Defaults to 20.
+            batch_size: Number of queries embedded and searched at once.
+
+        Returns:
+            For every query, the documents most similar to it with L2 distance
+            in float. Lower score represents more similarity.
+        """
+        results: List[List[Tuple[Document, float]]] = []
+        for start in range(0, len(queries), batch_size):
+            batch = queries[start : start + batch_size]
+            embeddings = await asyncio.gather(
+                *(self._aembed_query(query) for query in batch)
+            )
+            results.extend(
+                await run_in_executor(
+                    None,
+                    self.batch_similarity_search_with_score_by_vector,
+                    embeddings,
+                    k,
+                    filter=filter,
+                    fetch_k=fetch_k,
+                    **kwargs,
+                )
+            )
+        return results
+
     def similarity_search_by_vector(
         self,
         embedding: List[float],
@@ -678,6 +1311,7 @@ class FAISS(VectorStore):
         fetch_k: int = 20,
         lambda_mult: float = 0.5,
         filter: Optional[Union[Callable, Dict[str, Any]]] = None,
+        search_params: Optional[Dict[str, Any]] = None,
     ) -> List[Tuple[Document, float]]:
         """Return docs and their similarity scores selected using the maximal marginal
             relevance.
@@ -694,30 +1328,20 @@ class FAISS(VectorStore):
                         of diversity among the results with 0 corresponding
                         to maximum diversity and 1 to minimum diversity.
                         Defaults to 0.5.
+            search_params: Index parameters for this search, such as
+                ``nprobe`` or ``efSearch``.
         Returns:
             List of Documents and similarity scores selected by maximal marginal
                 relevance and score for each.
         """
-        scores, indices = self.index.search(
+        candidates = self._search_filtered(
             np.array([embedding], dtype=np.float32),
-            fetch_k if filter is None else fetch_k * 2,
-        )
-        if filter is not None:
-            filter_func = self._create_filter_func(filter)
-            filtered_indices = []
-            for i in indices[0]:
-                if i == -1:
-                    # This happens when not enough docs are returned.
-                    continue
-                _id = self.index_to_docstore_id[i]
-                doc = self.docstore.search(_id)
-                if not isinstance(doc, Document):
-                    raise ValueError(f"Could not find document for id {_id}, got {doc}")
-                if filter_func(doc.metadata):
-                    filtered_indices.append(i)
-            indices = np.array([filtered_indices])
-        # -1 happens when not enough docs are returned.
-        embeddings = [self.index.reconstruct(int(i)) for i in indices[0] if i != -1]
+            fetch_k,
+            filter,
+            fetch_k * 2,
+            search_params,
+        )[0]
+        embeddings = [self.index.reconstruct(i) for i, _, _ in candidates]
         mmr_selected = maximal_marginal_relevance(
             np.array([embedding], dtype=np.float32),
             embeddings,
@@ -727,14 +1351,8 @@ class FAISS(VectorStore):
 
         docs_and_scores = []
         for i in mmr_selected:
-            if indices[0][i] == -1:
-                # This happens when not enough docs are returned.
-                continue
-            _id = self.index_to_docstore_id[indices[0][i]]
-            doc = self.docstore.search(_id)
-            if not isinstance(doc, Document):
-                raise ValueError(f"Could not find document for id {_id}, got {doc}")
-            docs_and_scores.append((doc, scores[0][i]))
+            _, doc, score = candidates[i]
+            docs_and_scores.append((doc, score))
 
         return docs_and_scores
 
@@ -746,6 +1364,7 @@ class FAISS(VectorStore):
         fetch_k: int = 20,
         lambda_mult: float = 0.5,
         filter: Optional[Union[Callable, Dict[str, Any]]] = None,
+        search_params: Optional[Dict[str, Any]] = None,
     ) -> List[Tuple[Document, float]]:
         """Return docs and their similarity scores selected using the maximal marginal
             relevance asynchronously.
@@ -762,6 +1381,8 @@ class FAISS(VectorStore):
                         of diversity among the results with 0 corresponding
                         to maximum diversity and 1 to minimum diversity.
                         Defaults to 0.5.
+            search_params: Index parameters for this search, such as
+                ``nprobe`` or ``efSearch``.
         Returns:
             List of Documents and similarity scores selected by maximal marginal
                 relevance and score for each.
@@ -775,8 +1396,116 @@ class FAISS(VectorStore):
             fetch_k=fetch_k,
             lambda_mult=lambda_mult,
             filter=filter,
+            search_params=search_params,
         )
 
+    def batch_max_marginal_relevance_search_with_score_by_vector(
+        self,
+        embeddings: Sequence[List[float]],
+        *,
+        k: int = 4,
+        fetch_k: int = 20,
+        lambda_mult: float = 0.5,
+        filter: Optional[Union[Callable, Dict[str, Any]]] = None,
+        search_params: Optional[Dict[str, Any]] = None,
+    ) -> List[List[Tuple[Document, float]]]:
+        """Return docs and their similarity scores selected using the maximal marginal
+            relevance, for each of many query vectors.
+
+        Candidates of all queries are fetched with one faiss search, their
+        vectors are reconstructed once, and the selection runs for all queries
+        together.
+
+        Args:
+            embeddings: Embeddings to look up documents similar to.
+            k: Number of Documents to return per query. Defaults to 4.
+            fetch_k: Number of Documents to fetch before filtering to
+                     pass to MMR algorithm.
+            lambda_mult: Number between 0 and 1 that determines the degree
+                        of diversity among the results with 0 corresponding
+                        to maximum diversity and 1 to minimum diversity.
+                        Defaults to 0.5.
+            filter: Filter by metadata, applied to every query.
+            search_params: Index parameters for this search, such as
+                ``nprobe`` or ``efSearch``.
+        Returns:
+            For every query, the Documents and similarity scores selected by
+                maximal marginal relevance, as
+                `max_marginal_relevance_search_with_score_by_vector` would
+                return them.
+        """
+        if len(embeddings) == 0:
+            return []
+        vectors = np.array(embeddings, dtype=np.float32)
+        candidates = self._search_filtered(
+            vectors, fetch_k, filter, fetch_k * 2, search_params
+        )
+        ids = np.unique(
+            np.array([i for hits in candidates for i, _, _ in hits], dtype=np.int64)
+        )
+        rows = {int(i): row for row, i in enumerate(ids)}
+        reconstructed = (
+            self.index.reconstruct_batch(ids)
+            if len(ids)
+            else np.zeros((0, vectors.shape[1]), dtype=np.float32)
+        )
+        selections = maximal_marginal_relevance_batch(
+            vectors,
+            [reconstructed[[rows[i] for i, _, _ in hits]] for hits in candidates],
+            lambda_mult=lambda_mult,
+            k=k,
+        )
+        return [
+            [(hits[j][1], hits[j][2]) for j in selected]
+            for hits, selected in zip(candidates, selections)
+        ]
+
+    def batch_max_marginal_relevance_search(
+        self,
+        queries: Sequence[str],
+        k: int = 4,
+        fetch_k: int = 20,
+        lambda_mult: float = 0.5,
+        filter: Optional[Union[Callable, Dict[str, Any]]] = None,
+        *,
+        batch_size: int = 256,
+        **kwargs: Any,
+    ) -> List[List[Document]]:
+        """Return docs selected using the maximal marginal relevance, for each of
+            many queries.
+
+        Queries are embedded and searched ``batch_size`` at a time.
+
+        Args:
+            queries: Texts to look up documents similar to.
+            k: Number of Documents to return per query. Defaults to 4.
+            fetch_k: Number of Documents to fetch before filtering (if needed) to
+                     pass to MMR algorithm.
+            lambda_mult: Number between 0 and 1 that determines the degree
+                        of diversity among the results with 0 corresponding
+                        to maximum diversity and 1 to minimum diversity.
+                        Defaults to 0.5.
+            filter: Filter by metadata, applied to every query.
+            batch_size: Number of queries embedded and searched at once.
+        Returns:
+            For every query, the Documents selected by maximal marginal relevance.
+        """
+        results: List[List[Document]] = []
+        for start in range(0, len(queries), batch_size):
+            batch = queries[start : start + batch_size]
+            docs_and_scores = (
+                self.batch_max_marginal_relevance_search_with_score_by_vector(
+                    [self._embed_query(query) for query in batch],
+                    k=k,
+                    fetch_k=fetch_k,
+                    lambda_mult=lambda_mult,
+                    filter=filter,
+                    search_params=kwargs.get("search_params"),
+                )
+            )
+            results.extend([doc for doc, _ in hits] for hits in docs_and_scores)
+        return results
+
     def max_marginal_relevance_search_by_vector(
         self,
         embedding: List[float],
@@ -804,7 +1533,12 @@ class FAISS(VectorStore):
             List of Documents selected by maximal marginal relevance.
         """
         docs_and_scores = self.max_marginal_relevance_search_with_score_by_vector(
-            embedding, k=k, fetch_k=fetch_k, lambda_mult=lambda_mult, filter=filter
+            embedding,
+            k=k,
+            fetch_k=fetch_k,
+            lambda_mult=lambda_mult,
+            filter=filter,
+            search_params=kwargs.get("search_params"),
         )
         return [doc for doc, _ in docs_and_scores]
 
@@ -836,7 +1570,12 @@ class FAISS(VectorStore):
         """
         docs_and_scores = (
             await self.amax_marginal_relevance_search_with_score_by_vector(
-                embedding, k=k, fetch_k=fetch_k, lambda_mult=lambda_mult, filter=filter
+                embedding,
+                k=k,
+                fetch_k=fetch_k,
+                lambda_mult=lambda_mult,
+                filter=filter,
+                search_params=kwargs.get("search_params"),
             )
         )
         return [doc for doc, _ in docs_and_scores]
@@ -915,6 +1654,85 @@ class FAISS(VectorStore):
         )
         return docs
 
+    def _faiss_ids(self, ids: List[str]) -> Set[int]:
+        """Faiss ids of docstore ids, raising if any of them is not stored."""
+        if isinstance(self.index_to_docstore_id, _IdMap):
+            faiss_ids = {_id: self.index_to_docstore_id.faiss_id(_id) for _id in ids}
+            missing_ids = {_id for _id, i in faiss_ids.items() if i is None}
+        else:
+            reversed_index = {
+                id_: idx for idx, id_ in self.index_to_docstore_id.items()
+            }
+            faiss_ids = {_id: reversed_index.get(_id) for _id in ids}
+            missing_ids = {_id for _id, i in faiss_ids.items() if i is None}
+        if missing_ids:
+            raise ValueError(
+                f"Some specified ids do not exist in the current store. Ids not found: "
+                f"{missing_ids}"
+            )
+        return {i for i in faiss_ids.values() if i is not None}
+
+    def compact(self, *, background: bool = False) -> None:
+        """Remove deleted vectors from the index.
+
+        Only needed with ``compaction_threshold``, where deletes just mark
+        vectors as deleted. The tombstoned vectors are removed from a copy of
+        the index, which then replaces it, so searches are not paused while
+        compacting; adds and deletes wait for it to finish. The copy
+        temporarily doubles the memory used by the index.
+
+        Args:
+            background: Compact in a daemon thread and return immediately. Does
+                nothing if a background compaction is already running.
+        """
+        if background:
+            with self._state_lock:
+                if self._compaction is not None and self._compaction.is_alive():
+                    return
+                self._compaction = threading.Thread(
+                    target=self.compact, name="faiss-compaction", daemon=True
+                )
+                self._compaction.start()
+            return
+
+        faiss = dependable_faiss_import()
+        with self._write_lock:
+            if not self._tombstones or self._compaction_failed:
+                return
+            deleted = np.fromiter(self._tombstones, dtype=np.int64)
+            self._own_index()
+            try:
+                index = faiss.clone_index(self.index)
+            except RuntimeError:
+                # Not every index can be copied, e.g. on-disk inverted lists.
+                index = self.index
+            try:
+                index.remove_ids(deleted)
+            except RuntimeError as e:
+                # E.g. HNSW indexes; deleted vectors then stay excluded from
+                # searches by the tombstones.
+                logger.warning("Could not remove deleted vectors: %s", e)
+                self._compaction_failed = True
+                return
+            with self._state_lock:
+                self.index = index
+                self._tombstones.clear()
+                self._tombstone_selector = None
+            logger.debug("Removed %d deleted vectors from the index", len(deleted))
+
+    def _own_index(self) -> None:
+        """Copy a memory-mapped index into memory before it is modified.
+
+        faiss aborts the process when a read-only mapped index is resized.
+        """
+        if not self._index_mapped:
+            return
+        faiss = dependable_faiss_import()
+        index = faiss.deserialize_index(faiss.serialize_index(self.index))
+        with self._state_lock:
+            self.index = index
+            self._index_mapped = False
+
     def delete(self, ids: Optional[List[str]] = None, **kwargs: Any) -> Optional[bool]:
         """Delete by ID. These are the IDs in the vectorstore.
 
@@ -927,25 +1745,44 @@ class FAISS(VectorStore):
         """
         if ids is None:
             raise ValueError("No ids provided to delete.")
-        missing_ids = set(ids).difference(self.index_to_docstore_id.values())
-        if missing_ids:
-            raise ValueError(
-                f"Some specified ids do not exist in the current store. Ids not found: "
-                f"{missing_ids}"
-            )
-
-        reversed_index = {id_: idx for idx, id_ in self.index_to_docstore_id.items()}
-        index_to_delete = {reversed_index[id_] for id_ in ids}
-
-        self.index.remove_ids(np.fromiter(index_to_delete, dtype=np.int64))
-        self.docstore.delete(ids)
-
-        remaining_ids = [
-            id_
-            for i, id_ in sorted(self.index_to_docstore_id.items())
-            if i not in index_to_delete
-        ]
-        self.index_to_docstore_id = {i: id_ for i, id_ in enumerate(remaining_ids)}
+        with self._write_lock:
+            index_to_delete = self._faiss_ids(ids)
+            if self.compaction_threshold is not None:
+                with self._state_lock:
+                    self._tombstones.update(index_to_delete)
+                    self._tombstone_selector = None
+                for i in index_to_delete:
+                    if self._metadata_index is not None:
+                        self._metadata_index.remove(
+                            i, self._get_document(self.index_to_docstore_id[i]).metadata
+                        )
+                    del self.index_to_docstore_id[i]
+                self.docstore.delete(ids)
+                if len(self._tombstones) > self.compaction_threshold * max(
+                    1, self.index.ntotal
+                ):
+                    self.compact(background=True)
+                return True
+
+            self._own_index()
+            # Removed from the index first, so that an index which cannot
+            # remove vectors leaves the docstore untouched.
+            self.index.remove_ids(np.fromiter(index_to_delete, dtype=np.int64))
+            self.docstore.delete(ids)
+            if _has_stable_ids(self.index):
+                for i in index_to_delete:
+                    del self.index_to_docstore_id[i]
+            else:
+                remaining_ids = [
+                    id_
+                    for i, id_ in sorted(self.index_to_docstore_id.items())
+                    if i not in index_to_delete
+                ]
+                self.index_to_docstore_id = {
+                    i: id_ for i, id_ in enumerate(remaining_ids)
+                }
+            # Rebuilt on demand, as positions may have shifted.
+            self._metadata_index = None
 
         return True
 
@@ -962,24 +1799,135 @@ class FAISS(VectorStore):
         """
         if not isinstance(self.docstore, AddableMixin):
             raise ValueError("Cannot merge with this type of docstore")
-        # Numerical index for target docs are incremental on existing ones
-        starting_len = len(self.index_to_docstore_id)
+        # Tombstoned vectors of the target must not be carried over.
+        target.compact()
+        # Merging empties the target index.
+        with target._write_lock:
+            target._own_index()
+        with self._write_lock:
+            self._own_index()
+            # Numerical index for target docs are incremental on existing ones
+            starting_len = self._next_index_id()
+
+            if _has_stable_ids(self.index):
+                self._merge_index_with_ids(
+                    target.index, target.index_to_docstore_id, starting_len
+                )
+            else:
+                # Merge two IndexFlatL2
+                self.index.merge_from(target.index)
 
-        # Merge two IndexFlatL2
-        self.index.merge_from(target.index)
+            # Get id and docs from target FAISS object
+            full_info = []
+            for i, target_id in target.index_to_docstore_id.items():
+                doc = target.docstore.search(target_id)
+                if not isinstance(doc, Document):
+                    raise ValueError("Document should be returned")
+                full_info.append((starting_len + i, target_id, doc))
+
+            # Add information to docstore and index_to_docstore_id.
+            self.docstore.add({_id: doc for _, _id, doc in full_info})
+            index_to_id = {index: _id for index, _id, _ in full_info}
+            self.index_to_docstore_id.update(index_to_id)
+            if self._metadata_index is not None:
+                for index, _, doc in full_info:
+                    self._metadata_index.add(index, doc.metadata)
+
+    def _merge_index_with_ids(
+        self, other: Any, other_ids: Iterable[int], add_id: int
+    ) -> None:
+        """Merge ``other`` into an index with stable ids, offsetting its ids.
+
+        Indexes that faiss cannot merge directly, such as IVF indexes trained
+        separately, are merged by re-adding the reconstructed vectors.
+        """
+        faiss = dependable_faiss_import()
+        try:
+            ivfs = [faiss.extract_index_ivf(self.index), faiss.extract_index_ivf(other)]
+        except RuntimeError:
+            ivfs = []
+        # faiss cannot merge IVF indexes that keep a direct map.
+        map_types = [ivf.direct_map.type for ivf in ivfs]
+        for ivf in ivfs:
+            ivf.set_direct_map_type(faiss.DirectMap.NoMap)
+        try:
+            self.index.merge_from(other, add_id)
+            merged = True
+        except RuntimeError:
+            merged = False
+        finally:
+            for ivf, map_type in zip(ivfs, map_types):
+                ivf.set_direct_map_type(map_type)
+        if not merged:
+            ids = np.fromiter(other_ids, dtype=np.int64)
+            self.index.add_with_ids(other.reconstruct_batch(ids), ids + add_id)
 
-        # Get id and docs from target FAISS object
-        full_info = []
-        for i, target_id in target.index_to_docstore_id.items():
-            doc = target.docstore.search(target_id)
-            if not isinstance(doc, Document):
-                raise ValueError("Document should be returned")
-            full_info.append((starting_len + i, target_id, doc))
+    @staticmethod
+    def _build_index(
+        index_factory: str,
+        embeddings: List[List[float]],
+        *,
+        normalize_L2: bool = False,
+        distance_strategy: DistanceStrategy = DistanceStrategy.EUCLIDEAN_DISTANCE,
+        training_sample_size: Optional[int] = None,
+        search_params: Optional[Dict[str, Any]] = None,
+        on_disk_invlists: Optional[str] = None,
+        seed: int = 123,
+    ) -> Any:
+        """Build and train an empty index from a faiss index factory string.
 
-        # Add information to docstore and index_to_docstore_id.
-        self.docstore.add({_id: doc for _, _id, doc in full_info})
-        index_to_id = {index: _id for index, _id, _ in full_info}
-        self.index_to_docstore_id.update(index_to_id)
+        Args:
+            index_factory: faiss index factory string, e.g. ``"IVF4096,PQ32"``,
+                ``"HNSW32"`` or ``"OPQ32,IVF4096,PQ32"``.
+            embeddings: Embeddings the index will hold. A sample of them is
+                used for training.
+            training_sample_size: Number of embeddings to train on. Defaults
+                to all of them.
+            search_params: Default search parameters, such as ``nprobe`` or
+                ``efSearch``. They are stored in the index, so they are saved
+                along with it.
+            on_disk_invlists: Path of a file to hold the inverted lists of an
+                IVF index, which are then memory-mapped instead of kept in RAM.
+        """
+        faiss = dependable_faiss_import()
+        metric = (
+            faiss.METRIC_INNER_PRODUCT
+            if distance_strategy == DistanceStrategy.MAX_INNER_PRODUCT
+            else faiss.METRIC_L2
+        )
+        index = faiss.index_factory(len(embeddings[0]), index_factory, metric)
+        if not index.is_trained:
+            sample = np.array(embeddings, dtype=np.float32)
+            if training_sample_size is not None and training_sample_size < len(sample):
+                rng = np.random.default_rng(seed)
+                rows = rng.choice(len(sample), training_sample_size, replace=False)
+                sample = sample[np.sort(rows)]
+            if normalize_L2:
+                faiss.normalize_L2(sample)
+            index.train(sample)
+        try:
+            ivf = faiss.extract_index_ivf(index)
+        except RuntimeError:
+            ivf = None
+        if on_disk_invlists is not None:
+            if ivf is None:
+                raise ValueError(
+                    f"on_disk_invlists requires an IVF index, got {index_factory!r}."
+                )
+            Path(on_disk_invlists).parent.mkdir(parents=True, exist_ok=True)
+            invlists = faiss.OnDiskInvertedLists(
+                ivf.nlist, ivf.code_size, str(on_disk_invlists)
+            )
+            ivf.replace_invlists(invlists, True)
+            invlists.this.disown()
+        if ivf is not None:
+            # Needed to reconstruct vectors for MMR and to remove ids.
+            ivf.set_direct_map_type(faiss.DirectMap.Hashtable)
+        if search_params:
+            parameter_space = faiss.ParameterSpace()
+            for name, value in search_params.items():
+                parameter_space.set_index_parameter(index, name, value)
+        return index
 
     @classmethod
     def __from(
@@ -994,13 +1942,31 @@ class FAISS(VectorStore):
         **kwargs: Any,
     ) -> FAISS:
         faiss = dependable_faiss_import()
-        if distance_strategy == DistanceStrategy.MAX_INNER_PRODUCT:
+        index_factory = kwargs.pop("index_factory", None)
+        if index_factory is not None:
+            index = cls._build_index(
+                index_factory,
+                embeddings,
+                normalize_L2=normalize_L2,
+                distance_strategy=distance_strategy,
+                training_sample_size=kwargs.pop("training_sample_size", None),
+                search_params=kwargs.pop("search_params", None),
+                on_disk_invlists=kwargs.pop("on_disk_invlists", None),
+            )
+        elif distance_strategy == DistanceStrategy.MAX_INNER_PRODUCT:
             index = faiss.IndexFlatIP(len(embeddings[0]))
         else:
             # Default to L2, currently other metric types not initialized.
             index = faiss.IndexFlatL2(len(embeddings[0]))
+        stable_ids = kwargs.pop("stable_ids", False)
+        if stable_ids:
+            if not _has_stable_ids(index):
+                index = faiss.IndexIDMap2(index)
+            kwargs.setdefault("compaction_threshold", 0.1)
         docstore = kwargs.pop("docstore", InMemoryDocstore())
-        index_to_docstore_id = kwargs.pop("index_to_docstore_id", {})
+        index_to_docstore_id = kwargs.pop(
+            "index_to_docstore_id", _IdMap() if stable_ids else {}
+        )
         vecstore = cls(
             embedding,
             index,
@@ -1039,6 +2005,29 @@ class FAISS(VectorStore):
 
                 embeddings = OpenAIEmbeddings()
                 faiss = FAISS.from_texts(texts, embeddings)
+
+        An approximate index can be built instead of an exhaustive one by
+        passing ``index_factory``, a faiss index factory string. Optional
+        arguments are ``training_sample_size`` (number of embeddings to train
+        on, default all), ``search_params`` (default ``nprobe``/``efSearch``,
+        saved with the index) and ``on_disk_invlists`` (file that holds the
+        memory-mapped inverted lists of an IVF index):
+
+        .. code-block:: python
+
+                faiss = FAISS.from_texts(
+                    texts,
+                    embeddings,
+                    index_factory="OPQ32,IVF4096,PQ32",
+                    training_sample_size=200_000,
+                    search_params={"nprobe": 32},
+                )
+                faiss.similarity_search(query, search_params={"nprobe": 128})
+
+        With ``stable_ids=True`` the index is wrapped in an ``IndexIDMap2``
+        (unless it already keeps ids, like IVF indexes) so every vector keeps
+        its faiss id for its lifetime. Deletes are then tombstoned and
+        compacted in the background, see ``compaction_threshold``.
         """
         embeddings = embedding.embed_documents(texts)
         return cls.__from(
@@ -1144,24 +2133,60 @@ class FAISS(VectorStore):
             **kwargs,
         )
 
-    def save_local(self, folder_path: str, index_name: str = "index") -> None:
+    def save_local(
+        self, folder_path: str, index_name: str = "index", *, columnar: bool = False
+    ) -> None:
         """Save FAISS index, docstore, and index_to_docstore_id to disk.
 
         Args:
             folder_path: folder path to save index, docstore,
                 and index_to_docstore_id to.
             index_name: for saving with a specific index file name
+            columnar: Save the documents with a ``JSONLinesDocstore`` instead of
+                pickling the docstore, see ``load_columnar``. Metadata must be
+                JSON serializable. The files of the other format are removed.
         """
         path = Path(folder_path)
         path.mkdir(exist_ok=True, parents=True)
+        # Deleted vectors that the index cannot remove are saved with it, and
+        # found again on load as the ids missing from index_to_docstore_id.
+        self.compact()
 
         # save index separately since it is not picklable
         faiss = dependable_faiss_import()
-        faiss.write_index(self.index, str(path / f"{index_name}.faiss"))
+        # Written aside and renamed, as other stores may have the file mapped.
+        faiss.write_index(self.index, str(path / f"{index_name}.faiss.tmp"))
+        os.replace(path / f"{index_name}.faiss.tmp", path / f"{index_name}.faiss")
+        # The index refers to its on-disk inverted lists by file name; keep a
+        # copy next to it so the folder can be moved.
+        invlists = _on_disk_invlists(self.index)
+        if invlists is not None:
+            source = Path(invlists.filename)
+            target = path / source.name
+            if source.resolve() != target.resolve():
+                shutil.copyfile(source, target)
+
+        if columnar:
+            items = list(self.index_to_docstore_id.items())
+            JSONLinesDocstore.write(
+                path / index_name,
+                ((_id, self._get_document(_id)) for _, _id in items),
+            )
+            faiss_ids = np.array([i for i, _ in items], dtype=np.int64)
+            np.save(path / f"{index_name}.faiss_ids.tmp.npy", faiss_ids)
+            os.replace(
+                path / f"{index_name}.faiss_ids.tmp.npy",
+                path / f"{index_name}.faiss_ids.npy",
+            )
+            (path / f"{index_name}.pkl").unlink(missing_ok=True)
+            return
 
         # save docstore and index_to_docstore_id
         with open(path / f"{index_name}.pkl", "wb") as f:
             pickle.dump((self.docstore, self.index_to_docstore_id), f)
+        # load_local would pick files left by an earlier columnar save.
+        JSONLinesDocstore.remove(path / index_name)
+        (path / f"{index_name}.faiss_ids.npy").unlink(missing_ok=True)
 
     @classmethod
     def load_local(
@@ -1184,8 +2209,12 @@ class FAISS(VectorStore):
                 of the data which involves loading a pickle file.
                 Pickle files can be modified by malicious actors to deliver a
                 malicious payload that results in execution of
-                arbitrary code on your machine.
+                arbitrary code on your machine. Not needed for stores saved with
+                ``columnar=True``, which are loaded with ``load_columnar``.
         """
+        path = Path(folder_path)
+        if (path / f"{index_name}.jsonl").exists():
+            return cls.load_columnar(folder_path, embeddings, index_name, **kwargs)
         if not allow_dangerous_deserialization:
             raise ValueError(
                 "The de-serialization relies loading a pickle file. "
@@ -1199,10 +2228,11 @@ class FAISS(VectorStore):
                 "loading a file from an untrusted source (e.g., some random site on "
                 "the internet.)."
             )
-        path = Path(folder_path)
         # load index separately since it is not picklable
         faiss = dependable_faiss_import()
-        index = faiss.read_index(str(path / f"{index_name}.faiss"))
+        index = faiss.read_index(
+            str(path / f"{index_name}.faiss"), faiss.IO_FLAG_ONDISK_SAME_DIR
+        )
 
         # load docstore and index_to_docstore_id
         with open(path / f"{index_name}.pkl", "rb") as f:
@@ -1215,8 +2245,68 @@ class FAISS(VectorStore):
 
         return cls(embeddings, index, docstore, index_to_docstore_id, **kwargs)
 
+    @classmethod
+    def load_columnar(
+        cls,
+        folder_path: str,
+        embeddings: Embeddings,
+        index_name: str = "index",
+        *,
+        mmap: bool = True,
+        **kwargs: Any,
+    ) -> FAISS:
+        """Load a store saved with ``save_local(..., columnar=True)``.
+
+        Nothing is unpickled, and only the ids are read up front: the index
+        data and the documents are memory-mapped, so loading takes seconds
+        even for large stores, and processes loading the same folder share
+        the pages. Documents are parsed when they are returned by a search.
+
+        A memory-mapped index is read-only; it is copied into memory the first
+        time the store is modified.
+
+        Args:
+            folder_path: folder path to load the store from.
+            embeddings: Embeddings to use when generating queries
+            index_name: for loading with a specific index file name
+            mmap: Memory-map the index data instead of reading it into memory.
+                Indexes with on-disk inverted lists are always read that way.
+        """
+        path = Path(folder_path)
+        faiss = dependable_faiss_import()
+        index_path = str(path / f"{index_name}.faiss")
+        mapped = False
+        if mmap:
+            try:
+                index = faiss.read_index(
+                    index_path,
+                    faiss.IO_FLAG_MMAP_IFC | faiss.IO_FLAG_ONDISK_SAME_DIR,
+                )
+                mapped = True
+            except RuntimeError:
+                # On-disk inverted lists can only be opened from a plain file.
+                pass
+        if not mapped:
+            index = faiss.read_index(index_path, faiss.IO_FLAG_ONDISK_SAME_DIR)
+
+        docstore = JSONLinesDocstore(path / index_name)
+        faiss_ids = np.load(path / f"{index_name}.faiss_ids.npy").tolist()
+        index_to_docstore_id: Dict[int, str]
+        if _has_stable_ids(index):
+            # Same lookups as a dict, plus constant time reverse lookups.
+            index_to_docstore_id = cast(
+                Dict[int, str], _IdMap(zip(faiss_ids, docstore))
+            )
+        else:
+            index_to_docstore_id = dict(zip(faiss_ids, docstore))
+        store = cls(embeddings, index, docstore, index_to_docstore_id, **kwargs)
+        store._index_mapped = mapped
+        return store
+
     def serialize_to_bytes(self) -> bytes:
         """Serialize FAISS index, docstore, and index_to_docstore_id to bytes."""
+        # Deleted vectors are handled as in `save_local`.
+        self.compact()
         return pickle.dumps((self.index, self.docstore, self.index_to_docstore_id))
 
     @classmethod
@@ -1,13 +1,11 @@
 """Utility functions for working with vectors and vectorstores."""
 
 from enum import Enum
-from typing import List, Tuple, Type
+from typing import Any, List, Sequence, Tuple, Type
 
 import numpy as np
 from langchain_core.documents import Document
 
-from langchain_community.utils.math import cosine_similarity
-
 
 class DistanceStrategy(str, Enum):
     """Enumerator of the Distance strategies for calculating distances
@@ -20,40 +18,152 @@ class DistanceStrategy(str, Enum):
     COSINE = "COSINE"
 
 
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """Scale the rows of ``matrix`` to unit norm, leaving all-zero rows as is."""
+    norms = np.linalg.norm(matrix, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def _as_float_array(matrix: Any) -> np.ndarray:
+    array = np.asarray(matrix)
+    if not np.issubdtype(array.dtype, np.floating):
+        array = array.astype(np.float64)
+    return array
+
+
 def maximal_marginal_relevance(
     query_embedding: np.ndarray,
     embedding_list: list,
     lambda_mult: float = 0.5,
     k: int = 4,
 ) -> List[int]:
-    """Calculate maximal marginal relevance."""
-    if min(k, len(embedding_list)) <= 0:
+    """Calculate maximal marginal relevance.
+
+    Embeddings are normalized once and, for every candidate, the highest
+    similarity to any selected item is tracked incrementally, so each
+    selection step costs a single matrix-vector product.
+    """
+    k = min(k, len(embedding_list))
+    if k <= 0:
         return []
-    if query_embedding.ndim == 1:
-        query_embedding = np.expand_dims(query_embedding, axis=0)
-    similarity_to_query = cosine_similarity(query_embedding, embedding_list)[0]
+    embeddings = _normalize_rows(_as_float_array(embedding_list))
+    query = _normalize_rows(_as_float_array(query_embedding).reshape(1, -1))[0]
+    similarity_to_query = embeddings @ query
     most_similar = int(np.argmax(similarity_to_query))
     idxs = [most_similar]
-    selected = np.array([embedding_list[most_similar]])
-    while len(idxs) < min(k, len(embedding_list)):
-        best_score = -np.inf
-        idx_to_add = -1
-        similarity_to_selected = cosine_similarity(embedding_list, selected)
-        for i, query_score in enumerate(similarity_to_query):
-            if i in idxs:
-                continue
-            redundant_score = max(similarity_to_selected[i])
-            equation_score = (
-                lambda_mult * query_score - (1 - lambda_mult) * redundant_score
-            )
-            if equation_score > best_score:
-                best_score = equation_score
-                idx_to_add = i
+    taken = np.zeros(len(embeddings), dtype=bool)
+    taken[most_similar] = True
+    max_similarity_to_selected = embeddings @ embeddings[most_similar]
+    query_term = lambda_mult * similarity_to_query
+    while len(idxs) < k:
+        scores = query_term - (1 - lambda_mult) * max_similarity_to_selected
+        scores[taken] = -np.inf
+        idx_to_add = int(np.argmax(scores))
         idxs.append(idx_to_add)
-        selected = np.append(selected, [embedding_list[idx_to_add]], axis=0)
+        taken[idx_to_add] = True
+        np.maximum(
+            max_similarity_to_selected,
+            embeddings @ embeddings[idx_to_add],
+            out=max_similarity_to_selected,
+        )
     return idxs
 
 
+_MMR_BATCH_CHUNK_BYTES = 4 * 1024 * 1024
+
+
+def maximal_marginal_relevance_batch(
+    query_embeddings: Any,
+    embedding_lists: Sequence[Any],
+    lambda_mult: float = 0.5,
+    k: int = 4,
+) -> List[List[int]]:
+    """Calculate maximal marginal relevance for many queries at once.
+
+    Args:
+        query_embeddings: Matrix with one query embedding per row.
+        embedding_lists: One matrix of candidate embeddings per query. The
+            candidate sets may have different sizes.
+        lambda_mult: Number between 0 and 1 that determines the degree
+            of diversity among the results, 0 being maximum diversity.
+        k: Number of indices to select per query.
+
+    Returns:
+        For every query, the selected indices into its candidate list, in the
+        order `maximal_marginal_relevance` would return them.
+    """
+    queries = _as_float_array(query_embeddings)
+    if queries.ndim == 1:
+        queries = queries.reshape(1, -1)
+    if len(queries) != len(embedding_lists):
+        raise ValueError(
+            f"Got {len(queries)} query embeddings but {len(embedding_lists)} "
+            "embedding lists."
+        )
+    if len(queries) == 0:
+        return []
+    # Queries are processed in chunks whose candidate tensor fits in the CPU
+    # cache; beyond that every selection step would be memory bound.
+    n_max = max(len(candidates) for candidates in embedding_lists)
+    chunk_size = max(1, _MMR_BATCH_CHUNK_BYTES // max(1, n_max * queries.shape[1] * 8))
+    results: List[List[int]] = []
+    for start in range(0, len(queries), chunk_size):
+        results.extend(
+            _maximal_marginal_relevance_chunk(
+                queries[start : start + chunk_size],
+                embedding_lists[start : start + chunk_size],
+                lambda_mult,
+                k,
+            )
+        )
+    return results
+
+
+def _maximal_marginal_relevance_chunk(
+    queries: np.ndarray,
+    embedding_lists: Sequence[Any],
+    lambda_mult: float,
+    k: int,
+) -> List[List[int]]:
+    sizes = np.array([len(candidates) for candidates in embedding_lists])
+    n_max = int(sizes.max())
+    n_select = np.minimum(sizes, k)
+    if n_max == 0 or k <= 0:
+        return [[] for _ in embedding_lists]
+    # Pad the candidate sets into a (queries, candidates, dim) tensor; padding
+    # rows are marked as taken so they are never selected.
+    embeddings = np.zeros((len(queries), n_max, queries.shape[1]), dtype=queries.dtype)
+    for i, candidates in enumerate(embedding_lists):
+        if len(candidates):
+            embeddings[i, : len(candidates)] = _as_float_array(candidates)
+    embeddings = _normalize_rows(embeddings)
+    queries = _normalize_rows(queries)
+    taken = np.arange(n_max)[None, :] >= sizes[:, None]
+    rows = np.arange(len(queries))
+
+    query_term = lambda_mult * np.matmul(embeddings, queries[:, :, None])[:, :, 0]
+    max_similarity_to_selected = np.full((len(queries), n_max), -np.inf)
+    selected = np.empty((len(queries), int(n_select.max())), dtype=np.int64)
+    for step in range(selected.shape[1]):
+        if step == 0:
+            scores = query_term.copy()
+        else:
+            scores = query_term - (1 - lambda_mult) * max_similarity_to_selected
+        scores[taken] = -np.inf
+        # Queries whose candidates are exhausted pick an arbitrary index, which
+        # is dropped below.
+        idx_to_add = np.argmax(scores, axis=1)
+        selected[:, step] = idx_to_add
+        taken[rows, idx_to_add] = True
+        np.maximum(
+            max_similarity_to_selected,
+            np.matmul(embeddings, embeddings[rows, idx_to_add][:, :, None])[:, :, 0],
+            out=max_similarity_to_selected,
+        )
+    return [selected[i, : n_select[i]].tolist() for i in range(len(queries))]
+
+
 def filter_complex_metadata(
     documents: List[Document],
     *,
@@ -0,0 +1,82 @@
+"""Benchmark of `SparseBM25` against ``rank_bm25.BM25Okapi``.
+
+Builds both indexes over a synthetic Zipf-distributed corpus and reports
+build time, per-query latency and batched query throughput.
+
+Run with:
+
+.. code-block:: bash
+
+    python -m tests.benchmarks.bench_bm25 --docs 10000 100000
+"""
+
+import argparse
+import time
+from typing import List
+
+import numpy as np
+
+from langchain_community.retrievers.bm25 import SparseBM25
+
+
+def _corpus(
+    rng: np.random.Generator, n_docs: int, vocab_size: int, doc_len: int
+) -> List[List[str]]:
+    tokens = rng.zipf(1.3, size=n_docs * doc_len) % vocab_size
+    return [
+        [f"w{t}" for t in tokens[i * doc_len : (i + 1) * doc_len]]
+        for i in range(n_docs)
+    ]
+
+
+def main(n_docs_list: List[int], n_queries: int, k: int, vocab_size: int) -> None:
+    from rank_bm25 import BM25Okapi
+
+    rng = np.random.default_rng(0)
+    print(  # noqa: T201
+        f"{'docs':>8} {'build rank_bm25 (s)':>20} {'build sparse (s)':>17} "
+        f"{'query rank_bm25 (ms)':>21} {'query sparse (ms)':>18} "
+        f"{'batched sparse (ms)':>20}"
+    )
+    for n_docs in n_docs_list:
+        corpus = _corpus(rng, n_docs, vocab_size, doc_len=50)
+        queries = _corpus(rng, n_queries, vocab_size, doc_len=4)
+
+        start = time.perf_counter()
+        reference = BM25Okapi(corpus)
+        reference_build = time.perf_counter() - start
+        start = time.perf_counter()
+        engine = SparseBM25(corpus)
+        sparse_build = time.perf_counter() - start
+
+        assert np.allclose(
+            reference.get_scores(queries[0]), engine.get_scores(queries[0])
+        )
+
+        start = time.perf_counter()
+        for query in queries:
+            reference.get_top_n(query, corpus, n=k)
+        reference_query = (time.perf_counter() - start) / n_queries
+        start = time.perf_counter()
+        for query in queries:
+            engine.top_k(query, k)
+        sparse_query = (time.perf_counter() - start) / n_queries
+        start = time.perf_counter()
+        engine.batch_top_k(queries, k)
+        sparse_batched = (time.perf_counter() - start) / n_queries
+
+        print(  # noqa: T201
+            f"{n_docs:>8} {reference_build:>20.2f} {sparse_build:>17.2f} "
+            f"{reference_query * 1e3:>21.2f} {sparse_query * 1e3:>18.3f} "
+            f"{sparse_batched * 1e3:>20.3f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--docs", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--queries", type=int, default=20)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--vocab", type=int, default=50000)
+    args = parser.parse_args()
+    main(args.docs, args.queries, args.k, args.vocab)
@@ -0,0 +1,119 @@
+"""Benchmark of in memory docstore add throughput against store size.
+
+Adds documents in small batches, as ``FAISS.add_texts`` does when called
+repeatedly, and reports the add throughput at increasing store sizes for the
+previous copy-on-add dict, `InMemoryDocstore` and `ColumnarInMemoryDocstore`,
+plus the memory used per document.
+
+Run with:
+
+.. code-block:: bash
+
+    python -m tests.benchmarks.bench_docstore --docs 200000 --batch 100
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+from typing import Callable, Dict, List
+
+from langchain_core.documents import Document
+
+from langchain_community.docstore.in_memory import (
+    ColumnarInMemoryDocstore,
+    InMemoryDocstore,
+)
+
+
+class _CopyOnAddDocstore(InMemoryDocstore):
+    """The previous implementation, kept as a baseline."""
+
+    def add(self, texts: Dict[str, Document]) -> None:
+        overlapping = set(texts).intersection(self._dict)
+        if overlapping:
+            raise ValueError(f"Tried to add ids that already exist: {overlapping}")
+        self._dict = {**self._dict, **texts}
+
+
+def _batches(n_docs: int, batch_size: int) -> List[Dict[str, Document]]:
+    return [
+        {
+            str(i): Document(
+                page_content=f"chunk {i} " + "lorem ipsum " * 20,
+                metadata={"source": f"file_{i // 1000}.pdf"},
+            )
+            for i in range(start, min(start + batch_size, n_docs))
+        }
+        for start in range(0, n_docs, batch_size)
+    ]
+
+
+def _run(
+    name: str,
+    factory: Callable[[], InMemoryDocstore | ColumnarInMemoryDocstore],
+    batches: List[Dict[str, Document]],
+    checkpoints: int,
+) -> None:
+    docstore = factory()
+    every = max(1, len(batches) // checkpoints)
+    # Keep cyclic GC passes over the pre-built batches out of the timings.
+    gc.collect()
+    gc.disable()
+    added = 0
+    start = time.perf_counter()
+    for i, batch in enumerate(batches, 1):
+        docstore.add(batch)
+        added += len(batch)
+        if i % every == 0:
+            elapsed = time.perf_counter() - start
+            print(f"{name:>10} {added:>10} {every * len(batch) / elapsed:>14.0f}")  # noqa: T201
+            start = time.perf_counter()
+    gc.enable()
+
+
+def _memory_per_doc(
+    factory: Callable[[], InMemoryDocstore | ColumnarInMemoryDocstore],
+    n_docs: int,
+) -> float:
+    batches = _batches(n_docs, n_docs)
+    tracemalloc.start()
+    docstore = factory()
+    # Documents are rebuilt from raw fields so the inputs are not counted.
+    for batch in batches:
+        docstore.add(
+            {
+                key: Document(page_content=doc.page_content, metadata=doc.metadata)
+                for key, doc in batch.items()
+            }
+        )
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current / n_docs
+
+
+def main(n_docs: int, batch_size: int, checkpoints: int, skip_baseline: bool) -> None:
+    batches = _batches(n_docs, batch_size)
+    factories = {
+        "columnar": ColumnarInMemoryDocstore,
+        "dict": InMemoryDocstore,
+    }
+    if not skip_baseline:
+        factories["copy"] = _CopyOnAddDocstore
+    print(f"{'docstore':>10} {'size':>10} {'adds/s':>14}")  # noqa: T201
+    for name, factory in factories.items():
+        _run(name, factory, batches, checkpoints)
+    print()  # noqa: T201
+    for name in ("dict", "columnar"):
+        per_doc = _memory_per_doc(factories[name], min(n_docs, 50_000))
+        print(f"{name:>10} {per_doc:>10.0f} bytes/doc")  # noqa: T201
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--docs", type=int, default=100_000)
+    parser.add_argument("--batch", type=int, default=100)
+    parser.add_argument("--checkpoints", type=int, default=5)
+    parser.add_argument("--skip-baseline", action="store_true")
+    args = parser.parse_args()
+    main(args.docs, args.batch, args.checkpoints, args.skip_baseline)
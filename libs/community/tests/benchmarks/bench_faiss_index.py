@@ -0,0 +1,89 @@
+"""Recall-vs-latency benchmark of FAISS index factory configurations.
+
+Builds a FAISS vectorstore over clustered random vectors with several index
+factory strings, then sweeps ``nprobe`` (IVF) or ``efSearch`` (HNSW) per query
+and reports recall@k against exhaustive search, next to the batched search
+latency per query.
+
+Run with:
+
+.. code-block:: bash
+
+    python -m tests.benchmarks.bench_faiss_index --n 200000 --dim 64
+"""
+
+import argparse
+import time
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from langchain_community.vectorstores.faiss import FAISS
+from tests.integration_tests.vectorstores.fake_embeddings import FakeEmbeddings
+
+# Index factory string -> (search parameter name, values to sweep).
+CONFIGS: Dict[str, Tuple[str, List[int]]] = {
+    "Flat": ("", [0]),
+    "IVF1024,Flat": ("nprobe", [1, 4, 16, 64]),
+    "IVF1024,PQ16": ("nprobe", [1, 4, 16, 64]),
+    "OPQ16,IVF1024,PQ16": ("nprobe", [1, 4, 16, 64]),
+    "HNSW32": ("efSearch", [16, 32, 64, 128]),
+}
+
+
+def _clustered(n: int, dim: int, rng: np.random.Generator) -> np.ndarray:
+    centers = rng.normal(size=(max(1, n // 100), dim))
+    points = centers[rng.integers(len(centers), size=n)]
+    return (points + 0.3 * rng.normal(size=(n, dim))).astype(np.float32)
+
+
+def _recall(found: List[List[str]], truth: List[List[str]]) -> float:
+    hits = sum(len(set(f) & set(t)) for f, t in zip(found, truth))
+    return hits / sum(len(t) for t in truth)
+
+
+def main(n: int, dim: int, n_queries: int, k: int, training_sample_size: int) -> None:
+    rng = np.random.default_rng(0)
+    vectors = _clustered(n + n_queries, dim, rng)
+    corpus, queries = vectors[:n], vectors[n:].tolist()
+    text_embeddings = [(str(i), row) for i, row in enumerate(corpus.tolist())]
+
+    truth: List[List[str]] = []
+    print(  # noqa: T201
+        f"{'index':>20} {'param':>12} {'build (s)':>10} {'recall@k':>9} {'ms/query':>9}"
+    )
+    for index_factory, (param, values) in CONFIGS.items():
+        start = time.perf_counter()
+        store = FAISS.from_embeddings(
+            text_embeddings,
+            FakeEmbeddings(),
+            index_factory=index_factory,
+            training_sample_size=training_sample_size,
+        )
+        build = time.perf_counter() - start
+        for value in values:
+            search_params = {param: value} if param else None
+            start = time.perf_counter()
+            results = store.batch_similarity_search_with_score_by_vector(
+                queries, k=k, search_params=search_params
+            )
+            elapsed = time.perf_counter() - start
+            found = [[doc.page_content for doc, _ in hits] for hits in results]
+            if not truth:
+                truth = found
+            label = f"{param}={value}" if param else "-"
+            print(  # noqa: T201
+                f"{index_factory:>20} {label:>12} {build:>10.2f} "
+                f"{_recall(found, truth):>9.3f} {elapsed / n_queries * 1e3:>9.3f}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--n", type=int, default=100_000)
+    parser.add_argument("--dim", type=int, default=64)
+    parser.add_argument("--queries", type=int, default=1000)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--training-sample-size", type=int, default=50_000)
+    args = parser.parse_args()
+    main(args.n, args.dim, args.queries, args.k, args.training_sample_size)
@@ -0,0 +1,103 @@
+"""Microbenchmark of `maximal_marginal_relevance`.
+
+Compares the vectorized implementation against the previous per-candidate
+Python loop for several ``fetch_k`` sizes, and times the batched variant.
+
+Run with:
+
+.. code-block:: bash
+
+    python -m tests.benchmarks.bench_mmr
+"""
+
+import argparse
+import timeit
+from typing import List
+
+import numpy as np
+
+from langchain_community.utils.math import cosine_similarity
+from langchain_community.vectorstores.utils import (
+    maximal_marginal_relevance,
+    maximal_marginal_relevance_batch,
+)
+
+
+def _reference_mmr(
+    query_embedding: np.ndarray,
+    embedding_list: list,
+    lambda_mult: float = 0.5,
+    k: int = 4,
+) -> List[int]:
+    """The previous implementation, kept as a baseline."""
+    if min(k, len(embedding_list)) <= 0:
+        return []
+    if query_embedding.ndim == 1:
+        query_embedding = np.expand_dims(query_embedding, axis=0)
+    similarity_to_query = cosine_similarity(query_embedding, embedding_list)[0]
+    most_similar = int(np.argmax(similarity_to_query))
+    idxs = [most_similar]
+    selected = np.array([embedding_list[most_similar]])
+    while len(idxs) < min(k, len(embedding_list)):
+        best_score = -np.inf
+        idx_to_add = -1
+        similarity_to_selected = cosine_similarity(embedding_list, selected)
+        for i, query_score in enumerate(similarity_to_query):
+            if i in idxs:
+                continue
+            redundant_score = max(similarity_to_selected[i])
+            equation_score = (
+                lambda_mult * query_score - (1 - lambda_mult) * redundant_score
+            )
+            if equation_score > best_score:
+                best_score = equation_score
+                idx_to_add = i
+        idxs.append(idx_to_add)
+        selected = np.append(selected, [embedding_list[idx_to_add]], axis=0)
+    return idxs
+
+
+def main(fetch_ks: List[int], k: int, dim: int, n_queries: int) -> None:
+    rng = np.random.default_rng(0)
+    print(  # noqa: T201
+        f"{'fetch_k':>8} {'reference (ms)':>15} {'vectorized (ms)':>16} "
+        f"{'batched/query (ms)':>19}"
+    )
+    for fetch_k in fetch_ks:
+        query = rng.normal(size=dim)
+        candidates = rng.normal(size=(fetch_k, dim))
+        assert _reference_mmr(query, candidates, k=k) == maximal_marginal_relevance(
+            query, candidates, k=k
+        )
+        number = max(1, 2000 // fetch_k)
+        reference = timeit.timeit(
+            lambda: _reference_mmr(query, candidates, k=k), number=number
+        )
+        vectorized = timeit.timeit(
+            lambda: maximal_marginal_relevance(query, candidates, k=k),
+            number=number,
+        )
+        queries = rng.normal(size=(n_queries, dim))
+        candidate_sets = [rng.normal(size=(fetch_k, dim)) for _ in range(n_queries)]
+        batch_number = max(1, number // n_queries)
+        batched = (
+            timeit.timeit(
+                lambda: maximal_marginal_relevance_batch(queries, candidate_sets, k=k),
+                number=batch_number,
+            )
+            / batch_number
+        )
+        print(  # noqa: T201
+            f"{fetch_k:>8} {reference / number * 1e3:>15.3f} "
+            f"{vectorized / number * 1e3:>16.3f} {batched / n_queries * 1e3:>19.3f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--fetch-k", type=int, nargs="+", default=[20, 200, 2000])
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--queries", type=int, default=32)
+    args = parser.parse_args()
+    main(args.fetch_k, args.k, args.dim, args.queries)
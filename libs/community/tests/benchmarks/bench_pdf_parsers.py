@@ -0,0 +1,124 @@
+"""Throughput benchmark of the PDF parsers, sequential vs. page-parallel.
+
+Parses every PDF of a corpus with each installed parser, once in a single
+process and once split between worker processes, and reports the pages parsed
+per second. Without ``--corpus``, a corpus of synthetic text-only PDFs is
+generated in a temporary directory.
+
+Run with:
+
+.. code-block:: bash
+
+    python -m tests.benchmarks.bench_pdf_parsers --pages 400 --workers 1 4 8
+"""
+
+import argparse
+import importlib
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from langchain_community.document_loaders.blob_loaders import Blob
+from langchain_community.document_loaders.parsers import pdf
+
+# Parser class -> module it requires.
+PARSERS: Dict[str, str] = {
+    "PDFMinerParser": "pdfminer",
+    "PDFPlumberParser": "pdfplumber",
+    "PyMuPDFParser": "pymupdf",
+    "PyPDFParser": "pypdf",
+    "PyPDFium2Parser": "pypdfium2",
+}
+
+_WORDS = "lorem ipsum dolor sit amet consectetur adipiscing elit sed do".split()
+
+
+def _synthetic_pdf(n_pages: int, lines_per_page: int = 45) -> bytes:
+    """Build a PDF of ``n_pages`` pages of Helvetica text."""
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"",  # Page tree, filled in once the page objects are numbered.
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    kids = []
+    for page in range(n_pages):
+        lines = [
+            " ".join(_WORDS[(page + line + i) % len(_WORDS)] for i in range(12))
+            for line in range(lines_per_page)
+        ]
+        text = b"".join(b"(%s) Tj T* " % line.encode() for line in lines)
+        stream = b"BT /F1 10 Tf 14 TL 50 780 Td %s ET" % text
+        objects.append(
+            b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream)
+        )
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % len(objects)
+        )
+        kids.append(b"%d 0 R" % len(objects))
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (b" ".join(kids), n_pages)
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1,
+        xref,
+    )
+    return bytes(out)
+
+
+def main(
+    corpus: Optional[Path],
+    n_files: int,
+    n_pages: int,
+    workers: List[int],
+    pages_per_task: int,
+) -> None:
+    with tempfile.TemporaryDirectory() as tempdir:
+        if corpus is None:
+            corpus = Path(tempdir)
+            for i in range(n_files):
+                (corpus / f"doc-{i}.pdf").write_bytes(_synthetic_pdf(n_pages))
+        paths = sorted(corpus.glob("**/*.pdf"))
+
+        print(  # noqa: T201
+            f"{'parser':>18} {'workers':>8} {'pages':>7} {'time (s)':>9} {'pages/s':>8}"
+        )
+        for name, module in PARSERS.items():
+            try:
+                importlib.import_module(module)
+            except ImportError:
+                print(f"{name:>18} skipped, `{module}` is not installed")  # noqa: T201
+                continue
+            for num_workers in workers:
+                parser = getattr(pdf, name)(
+                    num_workers=num_workers, pages_per_task=pages_per_task
+                )
+                start = time.perf_counter()
+                total = sum(
+                    parser.parse(Blob.from_path(path))[0].metadata["total_pages"]
+                    for path in paths
+                )
+                elapsed = time.perf_counter() - start
+                print(  # noqa: T201
+                    f"{name:>18} {num_workers:>8} {total:>7} {elapsed:>9.2f} "
+                    f"{total / elapsed:>8.1f}"
+                )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--corpus", type=Path, help="Directory of PDFs to parse.")
+    parser.add_argument("--files", type=int, default=4)
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4])
+    parser.add_argument("--pages-per-task", type=int, default=16)
+    args = parser.parse_args()
+    main(args.corpus, args.files, args.pages, args.workers, args.pages_per_task)
@@ -0,0 +1,91 @@
+"""Benchmark lookup latency of the SQL-backed LLM caches against cache size.
+
+Compares `SQLiteCache` (raw prompt and llm string as primary key) with
+`SQLiteHashedCache` (fixed-width digest key) using realistic, multi-kilobyte
+prompts and llm strings.
+
+Run with:
+
+.. code-block:: bash
+
+    python -m tests.benchmarks.bench_sql_cache --sizes 1000 10000 50000
+"""
+
+import argparse
+import random
+import tempfile
+import time
+from pathlib import Path
+from typing import List, Union
+
+from langchain_core.load import dumps
+from langchain_core.outputs import Generation
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from langchain_community.cache import (
+    SQLiteCache,
+    SQLiteHashedCache,
+)
+
+LLM_STRING = "llm-config:" + "x" * 2048
+
+
+def _prompt(i: int) -> str:
+    return f"prompt {i}: " + "lorem ipsum " * 300
+
+
+def _fill(cache: Union[SQLiteCache, SQLiteHashedCache], size: int) -> None:
+    """Bulk load ``size`` single-generation entries."""
+    payload = dumps(Generation(text="cached response"))
+    if isinstance(cache, SQLiteHashedCache):
+        rows = [
+            {
+                "key": cache._key(_prompt(i), LLM_STRING),
+                "idx": 0,
+                "prompt": _prompt(i),
+                "response": payload,
+            }
+            for i in range(size)
+        ]
+    else:
+        rows = [
+            {"prompt": _prompt(i), "llm": LLM_STRING, "idx": 0, "response": payload}
+            for i in range(size)
+        ]
+    with Session(cache.engine) as session, session.begin():
+        session.execute(insert(cache.cache_schema), rows)
+
+
+def _time_lookups(
+    cache: Union[SQLiteCache, SQLiteHashedCache], size: int, n_lookups: int
+) -> float:
+    """Return the mean lookup latency in microseconds."""
+    keys = [random.randrange(size) for _ in range(n_lookups)]
+    start = time.perf_counter()
+    for i in keys:
+        assert cache.lookup(_prompt(i), LLM_STRING) is not None
+    return (time.perf_counter() - start) / n_lookups * 1e6
+
+
+def main(sizes: List[int], n_lookups: int) -> None:
+    print(f"{'size':>8} {'SQLiteCache (us)':>18} {'SQLiteHashedCache (us)':>24}")  # noqa: T201
+    for size in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            legacy = SQLiteCache(str(Path(tmp) / "legacy.db"))
+            hashed = SQLiteHashedCache(str(Path(tmp) / "hashed.db"))
+            _fill(legacy, size)
+            _fill(hashed, size)
+            legacy_us = _time_lookups(legacy, size, n_lookups)
+            hashed_us = _time_lookups(hashed, size, n_lookups)
+            legacy.engine.dispose()
+            hashed.engine.dispose()
+        print(f"{size:>8} {legacy_us:>18.1f} {hashed_us:>24.1f}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--lookups", type=int, default=2000)
+    args = parser.parse_args()
+    main(args.sizes, args.lookups)
@@ -96,6 +96,57 @@ def test_sync_redis_cache() -> None:
         assert output == expected_output
 
 
+@pytest.mark.parametrize("value_encoding", ["hash", "binary"])
+def test_sync_redis_cache_batch(value_encoding: str) -> None:
+    cache = RedisCache.from_url(
+        REDIS_TEST_URL,
+        ttl=1,
+        value_encoding=value_encoding,  # type: ignore[arg-type]
+        max_connections=4,
+    )
+    try:
+        cache.batch_update(
+            ["foo", "bar"],
+            "llm",
+            [
+                [Generation(text="fizz")],
+                [ChatGeneration(message=AIMessage(content="buzz"))],
+            ],
+        )
+        assert cache.batch_lookup(["foo", "missing", "bar"], "llm") == [
+            [Generation(text="fizz")],
+            None,
+            [ChatGeneration(message=AIMessage(content="buzz"))],
+        ]
+        assert cache.lookup("foo", "llm") == [Generation(text="fizz")]
+        assert cache.redis.connection_pool.max_connections == 4
+    finally:
+        cache.clear()
+
+
+@pytest.mark.parametrize("value_encoding", ["hash", "binary"])
+async def test_async_redis_cache_batch(value_encoding: str) -> None:
+    cache = AsyncRedisCache.from_url(
+        REDIS_TEST_URL,
+        ttl=1,
+        value_encoding=value_encoding,  # type: ignore[arg-type]
+    )
+    try:
+        await cache.abatch_update(
+            ["foo", "bar"],
+            "llm",
+            [[Generation(text="fizz")], [Generation(text="buzz")]],
+        )
+        assert await cache.abatch_lookup(["foo", "missing", "bar"], "llm") == [
+            [Generation(text="fizz")],
+            None,
+            [Generation(text="buzz")],
+        ]
+        assert await cache.alookup("bar", "llm") == [Generation(text="buzz")]
+    finally:
+        await cache.aclear()
+
+
 async def test_sync_in_async_redis_cache() -> None:
     """Test the sync RedisCache invoked with async methods"""
     with get_sync_redis() as llm_cache:
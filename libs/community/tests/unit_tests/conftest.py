@@ -16,6 +16,12 @@ def blockbuster() -> Iterator[None]:
             bb.functions["os.stat"]
             .can_block_in("langchain_community/utils/openai.py", "is_openai_v1")
             .can_block_in("httpx/_client.py", "_init_transport")
+            .can_block_in("redis/utils.py", "get_lib_version")
+        )
+        (
+            bb.functions["io.TextIOWrapper.read"]
+            .can_block_in("redis/utils.py", "get_lib_version")
+            .can_block_in("fakeredis/model/_command_info.py", "_load_command_info")
         )
         bb.functions["os.path.abspath"].can_block_in(
             "sqlalchemy/dialects/sqlite/pysqlite.py", "create_connect_args"
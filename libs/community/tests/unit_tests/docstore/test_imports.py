@@ -1,6 +1,12 @@
 from langchain_community.docstore import __all__, _module_lookup
 
-EXPECTED_ALL = ["DocstoreFn", "InMemoryDocstore", "Wikipedia"]
+EXPECTED_ALL = [
+    "ColumnarInMemoryDocstore",
+    "DocstoreFn",
+    "InMemoryDocstore",
+    "JSONLinesDocstore",
+    "Wikipedia",
+]
 
 
 def test_all_imports() -> None:
@@ -1,9 +1,15 @@
 """Test in memory docstore."""
 
+from typing import Type, Union
+
 import pytest
 from langchain_core.documents import Document
 
-from langchain_community.docstore.in_memory import InMemoryDocstore
+from langchain_community.docstore.base import AddableMixin
+from langchain_community.docstore.in_memory import (
+    ColumnarInMemoryDocstore,
+    InMemoryDocstore,
+)
 
 
 def test_document_found() -> None:
@@ -64,3 +70,85 @@ def test_default_dict_value_in_constructor() -> None:
     output = docstore.search("foo")
     assert isinstance(output, Document)
     assert output.page_content == "bar"
+
+
+def test_adding_document_in_place() -> None:
+    """Test that adding keeps the same dict instead of rebuilding it."""
+    docstore = InMemoryDocstore()
+    _dict = docstore._dict
+    docstore.add({"foo": Document(page_content="bar")})
+    assert docstore._dict is _dict
+
+
+def test_adding_document_keeps_constructor_dict() -> None:
+    """Test that adding does not mutate the dict passed to the constructor."""
+    _dict = {"foo": Document(page_content="bar")}
+    docstore = InMemoryDocstore(_dict)
+    docstore.add({"bar": Document(page_content="foo")})
+    assert list(_dict) == ["foo"]
+
+
+@pytest.mark.parametrize("docstore_cls", [InMemoryDocstore, ColumnarInMemoryDocstore])
+def test_docstore_add_search_delete(
+    docstore_cls: Type[Union[InMemoryDocstore, ColumnarInMemoryDocstore]],
+) -> None:
+    """Test that both in memory docstores behave the same."""
+    docstore = docstore_cls({"foo": Document(page_content="bar", metadata={"a": 1})})
+    assert isinstance(docstore, AddableMixin)
+    docstore.add(
+        {
+            "bar": Document(page_content="foo", metadata={"a": 1}, id="doc-id"),
+            "baz": Document(page_content="qux"),
+        }
+    )
+    with pytest.raises(ValueError):
+        docstore.add({"foo": Document(page_content="foo")})
+
+    output = docstore.search("bar")
+    assert output == Document(page_content="foo", metadata={"a": 1}, id="doc-id")
+
+    docstore.delete(["foo"])
+    assert docstore.search("foo") == "ID foo not found."
+    with pytest.raises(ValueError):
+        docstore.delete(["foo"])
+    assert docstore.search("baz") == Document(page_content="qux")
+    assert docstore.mget(["baz", "foo", "bar"]) == [
+        Document(page_content="qux"),
+        "ID foo not found.",
+        output,
+    ]
+
+
+def test_columnar_docstore_interns_metadata() -> None:
+    """Test that identical metadata is stored once."""
+    docstore = ColumnarInMemoryDocstore(
+        {
+            str(i): Document(page_content=f"text {i}", metadata={"source": "a.pdf"})
+            for i in range(100)
+        }
+    )
+    assert len(docstore._metadatas) == 1
+    # Lookups get their own copy of the metadata.
+    output = docstore.search("3")
+    assert isinstance(output, Document)
+    output.metadata["page"] = 3
+    assert docstore.search("4") == Document(
+        page_content="text 4", metadata={"source": "a.pdf"}
+    )
+
+
+def test_columnar_docstore_compacts_after_deletes() -> None:
+    """Test that deleted rows are dropped once most rows are deleted."""
+    docstore = ColumnarInMemoryDocstore(
+        {
+            str(i): Document(page_content=f"text {i}", metadata={"i": i})
+            for i in range(10)
+        }
+    )
+    docstore.delete([str(i) for i in range(8)])
+    assert len(docstore._texts) == 2
+    assert len(docstore._metadatas) == 2
+    assert docstore.search("9") == Document(page_content="text 9", metadata={"i": 9})
+    docstore.add({"10": Document(page_content="text 10")})
+    assert docstore.search("10") == Document(page_content="text 10")
+    assert "8" in docstore
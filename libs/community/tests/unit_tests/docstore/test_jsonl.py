@@ -0,0 +1,79 @@
+"""Test the memory-mapped JSON Lines docstore."""
+
+from pathlib import Path
+
+import pytest
+from langchain_core.documents import Document
+
+from langchain_community.docstore.jsonl import JSONLinesDocstore
+
+
+def test_write_and_search(tmp_path: Path) -> None:
+    """Test that written documents are read back lazily."""
+    docstore = JSONLinesDocstore.write(
+        tmp_path / "docs",
+        [
+            ("foo", Document(page_content="bar", metadata={"page": 1})),
+            ("baz", Document(page_content="qüx\nquux", id="doc-id")),
+        ],
+    )
+    assert list(docstore) == ["foo", "baz"]
+    assert docstore.search("foo") == Document(page_content="bar", metadata={"page": 1})
+    output = docstore.search("baz")
+    assert isinstance(output, Document)
+    assert output.page_content == "qüx\nquux"
+    assert output.id == "doc-id"
+    assert docstore.search("bar") == "ID bar not found."
+    assert JSONLinesDocstore(tmp_path / "docs").mget(["baz", "foo"]) == [
+        output,
+        docstore.search("foo"),
+    ]
+
+
+def test_add_and_delete(tmp_path: Path) -> None:
+    """Test that changes are kept in memory until the store is written again."""
+    docstore = JSONLinesDocstore.write(
+        tmp_path / "docs",
+        [("foo", Document(page_content="bar")), ("baz", Document(page_content="qux"))],
+    )
+    docstore.add({"new": Document(page_content="doc")})
+    with pytest.raises(ValueError):
+        docstore.add({"foo": Document(page_content="bar")})
+    docstore.delete(["foo", "new"])
+    assert list(docstore) == ["baz"]
+    assert docstore.search("foo") == "ID foo not found."
+    with pytest.raises(ValueError):
+        docstore.delete(["foo"])
+
+    docstore.add({"foo": Document(page_content="again")})
+    assert list(docstore) == ["baz", "foo"]
+    rewritten = JSONLinesDocstore.write(
+        tmp_path / "docs",
+        [("foo", Document(page_content="again")), ("new", Document(page_content=""))],
+    )
+    # The old store still reads the files it opened.
+    assert docstore.search("baz") == Document(page_content="qux")
+    assert docstore.search("foo") == Document(page_content="again")
+    assert list(rewritten) == ["foo", "new"]
+    assert rewritten.search("baz") == "ID baz not found."
+
+
+def test_empty_and_not_serializable(tmp_path: Path) -> None:
+    """Test empty stores and metadata that cannot be written."""
+    assert list(JSONLinesDocstore.write(tmp_path / "empty", [])) == []
+    with pytest.raises(ValueError):
+        JSONLinesDocstore.write(
+            tmp_path / "docs", [("foo", Document(page_content="", metadata={1j: 1}))]
+        )
+
+
+def test_remove(tmp_path: Path) -> None:
+    """Test that removing a store deletes its files but not open readers."""
+    docstore = JSONLinesDocstore.write(
+        tmp_path / "docs", [("foo", Document(page_content="bar"))]
+    )
+    JSONLinesDocstore.remove(tmp_path / "docs")
+    assert list(tmp_path.iterdir()) == []
+    assert docstore.search("foo") == Document(page_content="bar")
+    # Removing a missing store is a no-op.
+    JSONLinesDocstore.remove(tmp_path / "docs")
@@ -1,6 +1,9 @@
 """Tests for the various PDF parsers."""
 
+import concurrent.futures
 import importlib
+import pickle
+import time
 from pathlib import Path
 from typing import Any, Iterator
 
@@ -9,7 +12,11 @@ import pytest
 import langchain_community.document_loaders.parsers as pdf_parsers
 from langchain_community.document_loaders.base import BaseBlobParser
 from langchain_community.document_loaders.blob_loaders import Blob
-from langchain_community.document_loaders.parsers.pdf import _merge_text_and_extras
+from langchain_community.document_loaders.parsers.pdf import (
+    _merge_text_and_extras,
+    _PageWorkersMixin,
+    _parse_pages_in_workers,
+)
 
 _THIS_DIR = Path(__file__).parents[3]
 
@@ -93,3 +100,82 @@ def test_parsers(
         _assert_with_parser(parser, **params)
     except ModuleNotFoundError:
         pytest.skip(f"{parser_factory} skiped. Require '{require}'")
+
+
+def _parse_fake_range(blob: Blob, start: int, stop: int) -> list:
+    # Later ranges finish first, to exercise the reordering.
+    time.sleep(0.05 / (start + 1))
+    assert blob.path is not None and blob.data is None
+    return [(f"page {i}", {"page": i}) for i in range(start, stop)]
+
+
+def test_parse_pages_in_workers_keeps_order() -> None:
+    blob = Blob.from_data(b"%PDF-1.4", path="in-memory.pdf")
+    pages = list(
+        _parse_pages_in_workers(
+            _parse_fake_range, blob, total_pages=23, num_workers=2, pages_per_task=3
+        )
+    )
+    assert [metadata["page"] for _, metadata in pages] == list(range(23))
+    assert pages[7] == ("page 7", {"page": 7})
+
+
+class _FakePageWorkersParser(_PageWorkersMixin):
+    def __init__(self, **kwargs: Any) -> None:
+        self.num_workers = 2
+        self.pages_per_task = 3
+        self.executor = kwargs.get("executor")
+
+    def parse(self, blob: Blob) -> list:
+        return list(self._parse_pages_in_workers(_parse_fake_range, blob, 10))
+
+
+def test_parse_pages_in_workers_reuses_executor() -> None:
+    blob = Blob.from_data(b"%PDF-1.4", path="in-memory.pdf")
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        parser = _FakePageWorkersParser(executor=executor)
+        for _ in range(2):
+            pages = parser.parse(blob)
+            assert [metadata["page"] for _, metadata in pages] == list(range(10))
+        # The pool belongs to the caller and is still usable.
+        assert executor.submit(int, "1").result() == 1
+    assert parser._page_pool is None
+
+
+def test_parse_pages_in_workers_keeps_own_pool() -> None:
+    blob = Blob.from_data(b"%PDF-1.4", path="in-memory.pdf")
+    parser = _FakePageWorkersParser()
+    assert len(parser.parse(blob)) == 10
+    pool = parser._page_pool
+    assert pool is not None
+    assert len(parser.parse(blob)) == 10
+    assert parser._page_pool is pool
+
+    clone = pickle.loads(pickle.dumps(parser))
+    assert clone.executor is None and clone._page_pool is None
+
+
+@pytest.mark.parametrize(
+    "parser_factory,require,params",
+    [
+        ("PDFMinerParser", "pdfminer", {"mode": "page"}),
+        ("PDFPlumberParser", "pdfplumber", {}),
+        ("PyMuPDFParser", "pymupdf", {}),
+        ("PyPDFParser", "pypdf", {}),
+        ("PyPDFium2Parser", "pypdfium2", {}),
+    ],
+)
+def test_parsers_in_workers(
+    parser_factory: str,
+    require: str,
+    params: dict[str, Any],
+) -> None:
+    try:
+        importlib.import_module(require, package=None)
+    except ModuleNotFoundError:
+        pytest.skip(f"{parser_factory} skiped. Require '{require}'")
+    parser_class = getattr(pdf_parsers, parser_factory)
+    blob = Blob.from_path(LAYOUT_PARSER_PAPER_PDF)
+    expected = parser_class(**params).parse(blob)
+    docs = parser_class(num_workers=2, pages_per_task=3, **params).parse(blob)
+    assert docs == expected
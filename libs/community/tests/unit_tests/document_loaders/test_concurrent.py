@@ -0,0 +1,140 @@
+"""Test concurrent loader."""
+
+import time
+from pathlib import Path
+from typing import Iterable, Iterator, List
+
+import pytest
+from langchain_core.documents import Document
+
+from langchain_community.document_loaders.base import BaseBlobParser
+from langchain_community.document_loaders.blob_loaders import Blob, BlobLoader
+from langchain_community.document_loaders.concurrent import ConcurrentLoader
+
+
+class ListBlobLoader(BlobLoader):
+    """Yield blobs from a list and count how many were taken."""
+
+    def __init__(self, contents: Iterable[str]) -> None:
+        self.contents = list(contents)
+        self.n_yielded = 0
+
+    def yield_blobs(self) -> Iterator[Blob]:
+        for i, content in enumerate(self.contents):
+            self.n_yielded += 1
+            yield Blob.from_data(content, path=f"blob-{i}")
+
+
+class SleepyParser(BaseBlobParser):
+    """Sleep for as many hundredths of a second as the blob says, fail on 'fail'."""
+
+    def lazy_parse(self, blob: Blob) -> Iterator[Document]:
+        content = blob.as_string()
+        if content == "fail":
+            raise ValueError("Cannot parse")
+        time.sleep(int(content) / 100)
+        yield Document(page_content=content, metadata={"source": blob.source})
+
+
+class LoggingParser(SleepyParser):
+    """Sleepy parser that logs every blob it starts on to a file."""
+
+    def __init__(self, log: Path) -> None:
+        self.log = log
+
+    def lazy_parse(self, blob: Blob) -> Iterator[Document]:
+        with self.log.open("a") as f:
+            f.write(f"{blob.source}\n")
+        return super().lazy_parse(blob)
+
+
+def _contents(loader: ConcurrentLoader) -> List[str]:
+    return [doc.page_content for doc in loader.lazy_load()]
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_concurrent_loader_preserve_order(executor: str) -> None:
+    contents = ["20", "0", "10", "0", "5", "0"]
+    loader = ConcurrentLoader(
+        ListBlobLoader(contents),
+        SleepyParser(),
+        num_workers=3,
+        executor=executor,  # type: ignore[arg-type]
+        preserve_order=True,
+    )
+    assert _contents(loader) == contents
+
+    loader.preserve_order = False
+    assert sorted(_contents(loader)) == sorted(contents)
+
+
+def test_concurrent_loader_back_pressure() -> None:
+    blob_loader = ListBlobLoader(["0"] * 20)
+    loader = ConcurrentLoader(blob_loader, SleepyParser(), num_workers=2)
+    assert loader.max_in_flight == 4
+    documents = loader.lazy_load()
+    next(documents)
+    assert blob_loader.n_yielded <= 4
+    assert len(list(documents)) == 19
+
+
+def test_concurrent_loader_errors() -> None:
+    blob_loader = ListBlobLoader(["0", "fail", "0"])
+    with pytest.raises(ValueError):
+        list(ConcurrentLoader(blob_loader, SleepyParser()).lazy_load())
+
+    loader = ConcurrentLoader(blob_loader, SleepyParser(), silent_errors=True)
+    assert _contents(loader) == ["0", "0"]
+
+
+def test_concurrent_loader_timeout() -> None:
+    blob_loader = ListBlobLoader(["0", "100", "0"])
+    loader = ConcurrentLoader(blob_loader, SleepyParser(), timeout=0.2)
+    with pytest.raises(TimeoutError):
+        list(loader.lazy_load())
+
+    loader = ConcurrentLoader(
+        blob_loader, SleepyParser(), timeout=0.2, silent_errors=True
+    )
+    start = time.monotonic()
+    assert sorted(_contents(loader)) == ["0", "0"]
+    assert time.monotonic() - start < 0.9
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_concurrent_loader_timeout_replaces_stuck_worker(executor: str) -> None:
+    # The hung blob would take 2s with threads, which cannot be interrupted,
+    # and 30s with processes.
+    hang = "200" if executor == "thread" else "3000"
+    blob_loader = ListBlobLoader([hang, "0", "0", "0", "0"])
+    loader = ConcurrentLoader(
+        blob_loader,
+        SleepyParser(),
+        num_workers=1,
+        executor=executor,  # type: ignore[arg-type]
+        timeout=0.5,
+        silent_errors=True,
+    )
+    start = time.monotonic()
+    # Blobs queued behind the hung one are not timed out before they start.
+    assert _contents(loader) == ["0", "0", "0", "0"]
+    assert time.monotonic() - start < 1.5
+
+
+def test_concurrent_loader_timeout_keeps_healthy_workers(tmp_path: Path) -> None:
+    log = tmp_path / "parsed.log"
+    # The second worker is parsing blob-2 when blob-0 times out.
+    blob_loader = ListBlobLoader(["3000", "60", "80"])
+    loader = ConcurrentLoader(
+        blob_loader,
+        LoggingParser(log),
+        num_workers=2,
+        executor="process",
+        timeout=1.0,
+        silent_errors=True,
+    )
+    start = time.monotonic()
+    assert sorted(_contents(loader)) == ["60", "80"]
+    assert time.monotonic() - start < 2.0
+    # Only the worker of the hung blob was terminated.
+    assert sorted(log.read_text().split()) == ["blob-0", "blob-1", "blob-2"]
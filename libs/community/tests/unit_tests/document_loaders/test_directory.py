@@ -98,3 +98,112 @@ def test_directory_loader_glob_multiple() -> None:
 
     for ext in list_extensions:
         assert is_file_type_loaded.get(ext, False)
+
+
+def _make_tree(root: Path) -> None:
+    (root / "sub" / "deeper").mkdir(parents=True)
+    (root / ".hidden").mkdir()
+    for name in ["a.txt", "b.md", "sub/c.txt", "sub/deeper/d.txt", ".hidden/e.txt"]:
+        (root / name).write_text(name)
+
+
+def _sources(loader: DirectoryLoader) -> List[str]:
+    return sorted(
+        str(Path(doc.metadata["source"]).relative_to(loader.path))
+        for doc in loader.load()
+    )
+
+
+def test_directory_loader_walk(tmp_path: Path) -> None:
+    _make_tree(tmp_path)
+    path = str(tmp_path)
+    assert _sources(DirectoryLoader(path, glob="*.txt", loader_cls=TextLoader)) == [
+        "a.txt"
+    ]
+    assert _sources(
+        DirectoryLoader(path, glob="*.txt", recursive=True, loader_cls=TextLoader)
+    ) == ["a.txt", "sub/c.txt", "sub/deeper/d.txt"]
+    assert _sources(
+        DirectoryLoader(path, glob=["**/*.txt", "*.md"], loader_cls=TextLoader)
+    ) == ["a.txt", "b.md", "sub/c.txt", "sub/deeper/d.txt"]
+    assert _sources(
+        DirectoryLoader(path, glob="**/*.txt", load_hidden=True, loader_cls=TextLoader)
+    ) == [".hidden/e.txt", "a.txt", "sub/c.txt", "sub/deeper/d.txt"]
+    # Patterns on directory names fall back to globbing.
+    assert _sources(DirectoryLoader(path, glob="sub/*", loader_cls=TextLoader)) == [
+        "sub/c.txt"
+    ]
+
+
+@pytest.mark.parametrize(
+    "options", [{"use_multithreading": True}, {"use_multiprocessing": True}]
+)
+def test_directory_loader_concurrent(tmp_path: Path, options: dict) -> None:
+    _make_tree(tmp_path)
+    loader = DirectoryLoader(
+        str(tmp_path), loader_cls=TextLoader, max_concurrency=2, **options
+    )
+    assert _sources(loader) == ["a.txt", "b.md", "sub/c.txt", "sub/deeper/d.txt"]
+
+
+class CountingLoader(TextLoader):
+    """Text loader that counts the files it loads."""
+
+    loaded: List[str] = []
+
+    def lazy_load(self) -> Iterator[Document]:
+        CountingLoader.loaded.append(str(self.file_path))
+        return super().lazy_load()
+
+
+def test_directory_loader_file_cache(tmp_path: Path) -> None:
+    from langchain_core.stores import InMemoryByteStore
+
+    _make_tree(tmp_path)
+    loader = DirectoryLoader(
+        str(tmp_path),
+        glob="**/*.txt",
+        loader_cls=CountingLoader,
+        file_cache=InMemoryByteStore(),
+    )
+    CountingLoader.loaded = []
+    expected = sorted(loader.load(), key=lambda doc: doc.page_content)
+    assert len(CountingLoader.loaded) == 3
+
+    CountingLoader.loaded = []
+    assert sorted(loader.load(), key=lambda doc: doc.page_content) == expected
+    assert CountingLoader.loaded == []
+
+    (tmp_path / "a.txt").write_text("changed")
+    loader.use_multithreading = True
+    assert sorted(doc.page_content for doc in loader.load()) == [
+        "changed",
+        "sub/c.txt",
+        "sub/deeper/d.txt",
+    ]
+    assert CountingLoader.loaded == [str(tmp_path / "a.txt")]
+
+    CountingLoader.loaded = []
+    loader.loader_kwargs = {"encoding": "utf-8"}
+    assert len(loader.load()) == 3
+    assert len(CountingLoader.loaded) == 3
+
+
+@pytest.mark.parametrize("options", [{}, {"use_multithreading": True}])
+def test_directory_loader_skips_vanished_files(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, options: dict
+) -> None:
+    _make_tree(tmp_path)
+
+    def iter_paths(self: DirectoryLoader, p: Path) -> Iterator[Path]:
+        yield tmp_path / "a.txt"
+        yield tmp_path / "deleted.txt"
+
+    monkeypatch.setattr(DirectoryLoader, "_iter_paths", iter_paths)
+    loader = DirectoryLoader(
+        str(tmp_path), loader_cls=TextLoader, silent_errors=True, **options
+    )
+    assert _sources(loader) == ["a.txt"]
+    loader.silent_errors = False
+    with pytest.raises(FileNotFoundError):
+        loader.load()
@@ -471,3 +471,116 @@ def test_load_json_with_utf8_bom() -> None:
         assert result == expected_docs
     finally:
         Path(temp_file_path).unlink()
+
+
+def test_load_jsonlines_in_chunks(tmp_path: Path, mocker: MockerFixture) -> None:
+    mocker.patch(
+        "langchain_community.document_loaders.json_loader._JSON_LINES_CHUNK_SIZE", 64
+    )
+    file_path = tmp_path / "test.jsonl"
+    file_path.write_text(
+        "\n".join(f'{{"text": "value{i}"}}' for i in range(100)) + "\n\n",
+        encoding="utf-8",
+    )
+
+    loader = JSONLoader(
+        file_path=file_path, jq_schema=".", content_key="text", json_lines=True
+    )
+    result = loader.load()
+
+    assert [doc.page_content for doc in result] == [f"value{i}" for i in range(100)]
+    assert [doc.metadata["seq_num"] for doc in result] == list(range(1, 101))
+
+
+@pytest.mark.requires("ijson")
+@pytest.mark.parametrize(
+    "params",
+    (
+        {"jq_schema": ".data[].text"},
+        {"jq_schema": ".data[]", "content_key": "text"},
+        {
+            "jq_schema": ".data[]",
+            "content_key": ".text",
+            "is_content_key_jq_parsable": True,
+        },
+    ),
+)
+def test_load_json_streaming(params: Dict, tmp_path: Path) -> None:
+    file_path = tmp_path / "test.json"
+    file_path.write_text(
+        '{"meta": {"n": 2.5}, "data": [{"text": "value1"}, {"text": "value2"}]}',
+        encoding="utf-8-sig",
+    )
+    expected_docs = [
+        Document(
+            page_content="value1",
+            metadata={"source": str(file_path), "seq_num": 1},
+        ),
+        Document(
+            page_content="value2",
+            metadata={"source": str(file_path), "seq_num": 2},
+        ),
+    ]
+
+    loader = JSONLoader(file_path=file_path, streaming=True, **params)
+
+    assert loader.load() == expected_docs
+
+
+def test_load_json_streaming_unsupported_schema() -> None:
+    with raises(ValueError):
+        JSONLoader(file_path="file_path", jq_schema=".data | .[0]", streaming=True)
+
+
+@pytest.mark.requires("jq", "ijson")
+@pytest.mark.parametrize(
+    "content,jq_schema",
+    (
+        ('{"a": {"text": "x"}, "b": {"text": "y"}}', ".[]"),
+        ('{"a": {"text": "x"}, "b": {"text": "y"}}', ".[].text"),
+        ('[{"text": "x"}, {"text": ["y", "z"]}]', ".[].text"),
+        ('{"item": ["x"], "data": {"item": "y", "n": [1, {"item": 2}]}}', ".item[]"),
+        ('{"data": {"item": "y", "n": [1, {"item": 2}]}}', ".data[]"),
+        ('{"data": [{"item": "x"}, {"k": 1}, null]}', ".data[].item"),
+        ('{"data": [{"a": {"b": "x"}}, {"a": {}}, {"b": 1}]}', ".data[].a.b"),
+        ('{"data": [[1, 2], {"k": [3]}]}', ".data[][]"),
+        ('{"text": "x"}', "."),
+    ),
+)
+def test_load_json_streaming_matches_jq(
+    content: str, jq_schema: str, tmp_path: Path
+) -> None:
+    file_path = tmp_path / "test.json"
+    file_path.write_text(content, encoding="utf-8")
+
+    expected = JSONLoader(
+        file_path=file_path, jq_schema=jq_schema, text_content=False
+    ).load()
+    streamed = JSONLoader(
+        file_path=file_path, jq_schema=jq_schema, text_content=False, streaming=True
+    ).load()
+
+    assert expected
+    assert streamed == expected
+
+
+@pytest.mark.requires("jq", "ijson")
+@pytest.mark.parametrize(
+    "content,jq_schema",
+    (
+        ('{"data": [{"item": "x"}, ["y"]]}', ".data[].item"),
+        ('{"data": 1}', ".data[]"),
+        ('{"data": null}', ".data[]"),
+        ('{"meta": [1]}', ".data[]"),
+    ),
+)
+def test_load_json_streaming_raises_like_jq(
+    content: str, jq_schema: str, tmp_path: Path
+) -> None:
+    file_path = tmp_path / "test.json"
+    file_path.write_text(content, encoding="utf-8")
+
+    with raises(ValueError):
+        JSONLoader(file_path=file_path, jq_schema=jq_schema).load()
+    with raises(ValueError):
+        JSONLoader(file_path=file_path, jq_schema=jq_schema, streaming=True).load()
@@ -1,7 +1,108 @@
-from langchain_community.embeddings.huggingface import HuggingFaceInferenceAPIEmbeddings
+import asyncio
+import copy
+import gc
+import pickle
+from typing import Any, List
+
+import numpy as np
+import pytest
+
+from langchain_community.embeddings.huggingface import (
+    HuggingFaceEmbeddings,
+    HuggingFaceInferenceAPIEmbeddings,
+    _MultiProcessEncoder,
+)
 
 
 def test_hugginggface_inferenceapi_embedding_documents_init() -> None:
     """Test huggingface embeddings."""
     embedding = HuggingFaceInferenceAPIEmbeddings(api_key="abcd123")  # type: ignore[arg-type]
     assert "abcd123" not in repr(embedding)
+
+
+class _FakeSentenceTransformer:
+    def __init__(self) -> None:
+        self.pools_started = 0
+        self.pools_stopped = 0
+        self.batches: List[List[str]] = []
+
+    def start_multi_process_pool(self) -> str:
+        self.pools_started += 1
+        return "pool"
+
+    def encode_multi_process(self, texts: List[str], pool: str) -> np.ndarray:
+        self.batches.append(texts)
+        return np.array([[float(len(text))] for text in texts])
+
+    def stop_multi_process_pool(self, pool: str) -> None:
+        self.pools_stopped += 1
+
+
+def test_huggingface_multi_process_pool_batches_requests() -> None:
+    client = _FakeSentenceTransformer()
+    encoder = _MultiProcessEncoder(client, max_batch_size=4, max_wait=0.5)
+    futures = [encoder.submit(["a", "bb"]) for _ in range(3)]
+    results = [future.result(timeout=5).tolist() for future in futures]
+    encoder.close()
+
+    assert results == [[[1.0], [2.0]]] * 3
+    assert client.pools_started == 1
+    assert [len(batch) for batch in client.batches] == [4, 2]
+    with pytest.raises(RuntimeError):
+        encoder.submit(["a"])
+
+
+def test_huggingface_multi_process_pool_is_reused() -> None:
+    client = _FakeSentenceTransformer()
+    embedding = HuggingFaceEmbeddings.model_construct(
+        client=client, multi_process=True, multi_process_max_wait=0.0
+    )
+    assert embedding.embed_documents(["a", "bb"]) == [[1.0], [2.0]]
+    assert embedding.embed_query("ccc") == [3.0]
+    assert asyncio.run(embedding.aembed_documents(["dddd"])) == [[4.0]]
+    embedding.close()
+
+    assert client.pools_started == 1
+    assert client.pools_stopped == 1
+
+
+def test_huggingface_aembed_query_without_multi_process_uses_embed_query() -> None:
+    class _QueryEmbeddings(HuggingFaceEmbeddings):
+        def embed_query(self, text: str) -> List[float]:
+            return [-1.0]
+
+    embedding = _QueryEmbeddings.model_construct(client=_FakeSentenceTransformer())
+    assert asyncio.run(embedding.aembed_query("ccc")) == [-1.0]
+
+
+def test_huggingface_multi_process_pool_stops_when_collected() -> None:
+    client = _FakeSentenceTransformer()
+    encoder = _MultiProcessEncoder(client, max_batch_size=4, max_wait=0.0)
+    assert encoder.submit(["a"]).result(timeout=5).tolist() == [[1.0]]
+    del encoder
+    gc.collect()
+
+    assert client.pools_stopped == 1
+
+
+@pytest.mark.parametrize(
+    "copier", [copy.deepcopy, lambda x: pickle.loads(pickle.dumps(x))]
+)
+def test_huggingface_multi_process_copies(copier: Any) -> None:
+    embedding = HuggingFaceEmbeddings.model_construct(
+        client=_FakeSentenceTransformer(),
+        multi_process=True,
+        multi_process_max_wait=0.0,
+    )
+    assert copier(embedding).model_name == embedding.model_name
+    assert embedding.embed_documents(["a"]) == [[1.0]]
+
+    clone = copier(embedding)
+    assert clone.embed_documents(["bb"]) == [[2.0]]
+    # The copied client starts a pool of its own.
+    assert clone.client.pools_started == embedding.client.pools_started + 1
+    assert clone._encoder is not embedding._encoder
+    clone.close()
+    embedding.close()
+
+    assert embedding.client.pools_stopped == 1
@@ -1,7 +1,10 @@
+from pathlib import Path
+
+import numpy as np
 import pytest
 from langchain_core.documents import Document
 
-from langchain_community.retrievers.bm25 import BM25Retriever
+from langchain_community.retrievers.bm25 import BM25Retriever, SparseBM25
 
 
 @pytest.mark.requires("rank_bm25")
@@ -82,3 +85,91 @@ def test_doc_id() -> None:
             assert doc.id == "3"
         else:
             raise ValueError("Unexpected document")
+
+
+@pytest.mark.requires("rank_bm25", "scipy")
+def test_sparse_bm25_matches_rank_bm25() -> None:
+    from rank_bm25 import BM25Okapi
+
+    corpus = [
+        "the cat sat on the mat".split(),
+        "the dog sat on the log".split(),
+        "cats and dogs".split(),
+        "a bird in the hand".split(),
+        "the the the".split(),
+    ]
+    expected = BM25Okapi(corpus)
+    engine = SparseBM25(corpus[:2])
+    engine.add(corpus[2:4])
+    engine.add(corpus[4:])
+    for query in (["the", "cat"], ["sat", "sat", "log"], ["unknown"]):
+        assert np.allclose(engine.get_scores(query), expected.get_scores(query))
+
+
+@pytest.mark.requires("rank_bm25", "scipy")
+def test_sparse_bm25_delete_and_compact() -> None:
+    from rank_bm25 import BM25Okapi
+
+    corpus = [
+        "the cat sat on the mat".split(),
+        "the dog sat on the log".split(),
+        "cats and dogs".split(),
+        "a bird in the hand".split(),
+    ]
+    engine = SparseBM25(corpus)
+    engine.delete([1])
+    assert len(engine) == 3
+    positions, _ = engine.top_k(["dog", "log"], k=4)
+    assert 1 not in positions.tolist()
+    assert engine.compact().tolist() == [0, 2, 3]
+    expected = BM25Okapi([corpus[0], corpus[2], corpus[3]])
+    assert np.allclose(
+        engine.get_scores(["the", "cat"]), expected.get_scores(["the", "cat"])
+    )
+
+
+@pytest.mark.requires("scipy")
+def test_sparse_backend_retriever() -> None:
+    input_docs = [
+        Document(page_content="I have a pen.", id="1"),
+        Document(page_content="Do you have a pen?", id="2"),
+        Document(page_content="I have a bag.", id="3"),
+    ]
+    bm25_retriever = BM25Retriever.from_documents(
+        documents=input_docs, backend="sparse", k=1
+    )
+    assert isinstance(bm25_retriever.vectorizer, SparseBM25)
+    assert bm25_retriever.invoke("bag.") == [input_docs[2]]
+    assert bm25_retriever.batch_get_relevant_documents(["bag.", "you"]) == [
+        [input_docs[2]],
+        [input_docs[1]],
+    ]
+
+    new_doc = Document(page_content="A new notebook.", id="4")
+    bm25_retriever.add_documents([new_doc])
+    assert bm25_retriever.invoke("notebook.") == [new_doc]
+
+    bm25_retriever.delete(["3"])
+    assert bm25_retriever.invoke("bag.") != [input_docs[2]]
+    bm25_retriever.compact()
+    assert [doc.id for doc in bm25_retriever.docs] == ["1", "2", "4"]
+    bm25_retriever.delete(["1", "2"])
+    assert [doc.id for doc in bm25_retriever.docs] == ["4"]
+
+
+@pytest.mark.requires("scipy")
+def test_sparse_backend_save_and_load(tmp_path: Path) -> None:
+    input_docs = [
+        Document(page_content="I have a pen.", metadata={"page": 1}),
+        Document(page_content="Do you have a pen?", metadata={"page": 2}),
+        Document(page_content="I have a bag.", metadata={"page": 3}),
+    ]
+    bm25_retriever = BM25Retriever.from_documents(
+        documents=input_docs, backend="sparse", k=2
+    )
+    bm25_retriever.save_local(tmp_path)
+    loaded = BM25Retriever.load_local(tmp_path, k=2)
+    assert loaded.docs == input_docs
+    assert loaded.invoke("bag.") == bm25_retriever.invoke("bag.")
+    loaded.add_documents([Document(page_content="A new bag.")])
+    assert loaded.invoke("new")[0].page_content == "A new bag."
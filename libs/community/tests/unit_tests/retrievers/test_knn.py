@@ -1,6 +1,11 @@
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import pytest
 from langchain_core.documents import Document
 
-from langchain_community.embeddings import FakeEmbeddings
+from langchain_community.embeddings import DeterministicFakeEmbedding, FakeEmbeddings
 from langchain_community.retrievers.knn import KNNRetriever
 
 
@@ -27,3 +32,75 @@ class TestKNNRetriever:
             "I have a bag.",
         ]
         assert knn_retriever.metadatas == [{"page": 1}, {"page": 2}, {"page": 3}]
+
+    def test_query_returns_nearest(self) -> None:
+        texts = ["foo", "bar", "baz", "qux"]
+        knn_retriever = KNNRetriever.from_texts(
+            texts=texts, embeddings=DeterministicFakeEmbedding(size=16), k=2
+        )
+        docs = knn_retriever.invoke("baz")
+        assert len(docs) == 2
+        assert docs[0].page_content == "baz"
+
+    @pytest.mark.parametrize("quantization", [None, "float16", "int8"])
+    def test_prepared_index_matches_brute_force(
+        self, quantization: Optional[str]
+    ) -> None:
+        embeddings = DeterministicFakeEmbedding(size=32)
+        texts = [f"text {i}" for i in range(50)]
+        knn_retriever = KNNRetriever.from_texts(
+            texts=texts,
+            embeddings=embeddings,
+            k=5,
+            quantization=quantization,
+            block_size=7,
+        )
+        queries = ["text 3", "text 41", "something else"]
+        index = np.array(knn_retriever.index)
+        index = index / np.linalg.norm(index, axis=1, keepdims=True)
+        for query, docs in zip(
+            queries, knn_retriever.batch_get_relevant_documents(queries)
+        ):
+            similarities = index @ np.array(embeddings.embed_query(query))
+            expected = [texts[i] for i in np.argsort(-similarities)[:5]]
+            actual = [doc.page_content for doc in docs]
+            if quantization is None:
+                assert actual == expected
+            else:
+                assert actual[0] == expected[0]
+                assert len(set(actual) & set(expected)) >= 4
+
+    def test_relevancy_threshold(self) -> None:
+        knn_retriever = KNNRetriever.from_texts(
+            texts=["foo", "bar", "baz"],
+            embeddings=DeterministicFakeEmbedding(size=16),
+            k=3,
+            relevancy_threshold=0.99,
+        )
+        docs = knn_retriever.invoke("bar")
+        assert [doc.page_content for doc in docs] == ["bar"]
+
+    def test_save_and_load_local(self, tmp_path: Path) -> None:
+        embeddings = DeterministicFakeEmbedding(size=16)
+        knn_retriever = KNNRetriever.from_texts(
+            texts=["foo", "bar", "baz"],
+            embeddings=embeddings,
+            metadatas=[{"i": 0}, {"i": 1}, {"i": 2}],
+            k=2,
+            quantization="int8",
+        )
+        knn_retriever.save_local(tmp_path)
+        loaded = KNNRetriever.load_local(tmp_path, embeddings)
+        assert loaded.k == 2
+        assert loaded.quantization == "int8"
+        assert loaded.invoke("baz") == knn_retriever.invoke("baz")
+
+    def test_from_embeddings(self) -> None:
+        embeddings = DeterministicFakeEmbedding(size=16)
+        texts = ["foo", "bar", "baz"]
+        vectors = embeddings.embed_documents(texts)
+        knn_retriever = KNNRetriever.from_embeddings(
+            list(zip(texts, vectors)), embeddings, k=1
+        )
+        assert knn_retriever.texts == texts
+        assert knn_retriever.invoke("bar")[0].page_content == "bar"
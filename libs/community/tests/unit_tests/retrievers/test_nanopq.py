@@ -1,7 +1,14 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import numpy as np
 import pytest
 from langchain_core.documents import Document
 
-from langchain_community.embeddings import FakeEmbeddings
+from langchain_community.embeddings import DeterministicFakeEmbedding, FakeEmbeddings
 from langchain_community.retrievers import NanoPQRetriever
 
 
@@ -39,3 +46,108 @@ class TestNanoPQRetriever:
         )
         with pytest.raises(RuntimeError):
             pq_retriever.invoke("I have")
+
+    @pytest.mark.requires("nanopq")
+    def test_fit_once_and_search(self) -> None:
+        embeddings = DeterministicFakeEmbedding(size=16)
+        texts = [f"text {i}" for i in range(300)]
+        pq_retriever = NanoPQRetriever.from_texts(
+            texts=texts, embeddings=embeddings, k=3, clusters=16, block_size=64
+        )
+        pq_retriever.fit()
+        codes = pq_retriever.codes
+        assert codes is not None
+        assert codes.shape == (300, 4)
+        assert codes.dtype == np.uint8
+
+        docs = pq_retriever.invoke("text 42")
+        assert len(docs) == 3
+        assert docs[0].page_content == "text 42"
+        assert pq_retriever.codes is codes
+
+        batched = pq_retriever.batch_get_relevant_documents(["text 42", "text 7"])
+        assert batched[0] == docs
+        assert batched[1][0].page_content == "text 7"
+
+    @pytest.mark.requires("nanopq")
+    def test_add_texts_and_save_load(self, tmp_path: Path) -> None:
+        embeddings = DeterministicFakeEmbedding(size=16)
+        texts = [f"text {i}" for i in range(100)]
+        pq_retriever = NanoPQRetriever.from_texts(
+            texts=texts, embeddings=embeddings, k=2, clusters=16
+        ).fit()
+        pq_retriever.add_texts(["a new text"], metadatas=[{"new": True}])
+        assert pq_retriever.codes is not None
+        assert len(pq_retriever.codes) == 101
+        assert pq_retriever.invoke("a new text")[0].metadata == {"new": True}
+
+        pq_retriever.save_local(tmp_path)
+        loaded = NanoPQRetriever.load_local(tmp_path, embeddings)
+        assert loaded.index is None
+        assert loaded.clusters == 16
+        assert loaded.invoke("text 5") == pq_retriever.invoke("text 5")
+
+    @pytest.mark.requires("nanopq")
+    def test_concurrent_first_queries_fit_once(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        embeddings = DeterministicFakeEmbedding(size=16)
+        texts = [f"text {i}" for i in range(100)]
+        pq_retriever = NanoPQRetriever.from_texts(
+            texts=texts, embeddings=embeddings, k=2, clusters=16
+        )
+        calls = []
+        fit = NanoPQRetriever._fit
+
+        def counting_fit(self: NanoPQRetriever, *args: Any, **kwargs: Any) -> None:
+            calls.append(1)
+            time.sleep(0.05)
+            fit(self, *args, **kwargs)
+
+        monkeypatch.setattr(NanoPQRetriever, "_fit", counting_fit)
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(pq_retriever.invoke, ["text 3"] * 8))
+        assert len(calls) == 1
+        assert all(docs == results[0] for docs in results)
+
+    @pytest.mark.requires("nanopq")
+    def test_retrievers_fit_concurrently(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        embeddings = DeterministicFakeEmbedding(size=16)
+        texts = [f"text {i}" for i in range(100)]
+        retrievers = [
+            NanoPQRetriever.from_texts(
+                texts=texts, embeddings=embeddings, k=2, clusters=16
+            )
+            for _ in range(2)
+        ]
+        # Both fits must be running at once to pass the barrier.
+        barrier = threading.Barrier(2, timeout=5)
+        fit = NanoPQRetriever._fit
+
+        def waiting_fit(self: NanoPQRetriever, *args: Any, **kwargs: Any) -> None:
+            barrier.wait()
+            fit(self, *args, **kwargs)
+
+        monkeypatch.setattr(NanoPQRetriever, "_fit", waiting_fit)
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            list(pool.map(lambda retriever: retriever.fit(), retrievers))
+
+    @pytest.mark.requires("nanopq")
+    def test_refits_when_index_is_replaced(self) -> None:
+        embeddings = DeterministicFakeEmbedding(size=16)
+        texts = [f"text {i}" for i in range(100)]
+        pq_retriever = NanoPQRetriever.from_texts(
+            texts=texts, embeddings=embeddings, k=2, clusters=16
+        ).fit()
+        # add_texts encodes with the existing codebook, it does not retrain.
+        pq_retriever.add_texts(["a new text"])
+        codes = pq_retriever.codes
+        pq_retriever.invoke("text 3")
+        assert pq_retriever.codes is codes
+
+        new_texts = [f"other {i}" for i in range(50)]
+        pq_retriever.texts = new_texts
+        pq_retriever.index = np.array(embeddings.embed_documents(new_texts))
+        assert pq_retriever.invoke("other 7")[0].page_content == "other 7"
+        assert pq_retriever.codes is not None
+        assert len(pq_retriever.codes) == 50
@@ -1,7 +1,9 @@
+from typing import Optional
+
 import pytest
 from langchain_core.documents import Document
 
-from langchain_community.embeddings import FakeEmbeddings
+from langchain_community.embeddings import DeterministicFakeEmbedding, FakeEmbeddings
 from langchain_community.retrievers.svm import SVMRetriever
 
 
@@ -40,3 +42,67 @@ class TestSVMRetriever:
         output_docs = svm_retriever.invoke(query)
         for doc in output_docs:
             assert "foo" in doc.metadata
+
+    @pytest.mark.requires("sklearn")
+    @pytest.mark.parametrize("candidate_k", [None, 10])
+    def test_exact_match_ranks_first(self, candidate_k: Optional[int]) -> None:
+        texts = [f"text {i}" for i in range(50)]
+        svm_retriever = SVMRetriever.from_texts(
+            texts=texts,
+            embeddings=DeterministicFakeEmbedding(size=32),
+            k=3,
+            candidate_k=candidate_k,
+        )
+        docs = svm_retriever.invoke("text 17")
+        assert len(docs) == 3
+        assert docs[0].page_content == "text 17"
+        assert svm_retriever.invoke("text 3")[0].page_content == "text 3"
+
+    @pytest.mark.requires("sklearn")
+    def test_batch_get_relevant_documents(self) -> None:
+        texts = [f"text {i}" for i in range(30)]
+        svm_retriever = SVMRetriever.from_texts(
+            texts=texts, embeddings=DeterministicFakeEmbedding(size=32), k=2
+        )
+        queries = ["text 1", "text 2", "text 3", "text 4"]
+        results = svm_retriever.batch_get_relevant_documents(queries, max_concurrency=2)
+        assert [docs[0].page_content for docs in results] == queries
+        assert svm_retriever.batch_get_relevant_documents([]) == []
+
+    @pytest.mark.requires("sklearn")
+    def test_batch_matches_single_queries(self) -> None:
+        texts = [f"text {i}" for i in range(30)]
+        svm_retriever = SVMRetriever.from_texts(
+            texts=texts, embeddings=DeterministicFakeEmbedding(size=32), k=1
+        )
+        # The queries of a batch share one training matrix, but each SVM only
+        # trains on its own query and the index.
+        queries = ["text 5", "text 6", "something else"]
+        results = svm_retriever.batch_get_relevant_documents(queries)
+        assert results == [svm_retriever.invoke(query) for query in queries]
+
+    @pytest.mark.requires("sklearn")
+    def test_reuses_training_matrix_and_executor(self) -> None:
+        texts = [f"text {i}" for i in range(30)]
+        svm_retriever = SVMRetriever.from_texts(
+            texts=texts, embeddings=DeterministicFakeEmbedding(size=32), k=1
+        )
+        assert svm_retriever.invoke("text 5")[0].page_content == "text 5"
+        buffers = list(svm_retriever._buffers)
+        assert len(buffers) == 1
+        assert svm_retriever.invoke("text 6")[0].page_content == "text 6"
+        assert svm_retriever._buffers[0] is buffers[0]
+
+        queries = ["text 1", "text 2"]
+        results = svm_retriever.batch_get_relevant_documents(queries)
+        assert [docs[0].page_content for docs in results] == queries
+        executor = svm_retriever._executor
+        assert executor is not None
+        svm_retriever.batch_get_relevant_documents(queries)
+        assert svm_retriever._executor is executor
+
+        # A new index is copied into a new training matrix.
+        svm_retriever.index = svm_retriever.index[:10]
+        assert svm_retriever.invoke("text 5")[0].page_content == "text 5"
+        assert len(svm_retriever._buffers) == 1
+        assert len(svm_retriever._buffers[0]) == 11
@@ -1,7 +1,12 @@
 import os
+import pickle
+import warnings
 from datetime import datetime
+from pathlib import Path
 from tempfile import TemporaryDirectory
+from typing import Any, Dict
 
+import numpy as np
 import pytest
 from langchain_core.documents import Document
 
@@ -51,7 +56,8 @@ def test_save_local_load_local() -> None:
             file_name=file_name,
         )
         assert os.path.exists(os.path.join(temp_folder, f"{file_name}.joblib"))
-        assert os.path.exists(os.path.join(temp_folder, f"{file_name}.pkl"))
+        assert os.path.exists(os.path.join(temp_folder, f"{file_name}.tfidf"))
+        assert os.path.exists(os.path.join(temp_folder, f"{file_name}.docs.jsonl"))
 
         loaded_tfidf_retriever = TFIDFRetriever.load_local(
             folder_path=temp_folder,
@@ -64,3 +70,88 @@ def test_save_local_load_local() -> None:
         )
     assert len(loaded_tfidf_retriever.docs) == 3
     assert loaded_tfidf_retriever.tfidf_array.toarray().shape == (3, 5)
+
+
+@pytest.mark.requires("sklearn")
+def test_sparse_top_k_matches_dense_cosine() -> None:
+    from sklearn.metrics.pairwise import cosine_similarity
+
+    input_texts = [
+        "the cat sat on the mat",
+        "the dog sat on the log",
+        "cats and dogs",
+        "a bird in the hand",
+        "nothing in common",
+    ]
+    tfidf_retriever = TFIDFRetriever.from_texts(texts=input_texts, k=3)
+    for query in ("the cat", "dog log", "bird"):
+        query_vec = tfidf_retriever.vectorizer.transform([query])
+        scores = cosine_similarity(tfidf_retriever.tfidf_array, query_vec).ravel()
+        expected = [input_texts[i] for i in np.argsort(-scores, kind="stable")[:1]]
+        docs = tfidf_retriever.invoke(query)
+        assert len(docs) == 3
+        assert [docs[0].page_content] == expected
+    assert [
+        docs[0].page_content
+        for docs in tfidf_retriever.batch_get_relevant_documents(["cat", "hand"])
+    ] == ["the cat sat on the mat", "a bird in the hand"]
+
+
+@pytest.mark.requires("sklearn")
+@pytest.mark.parametrize(
+    "tfidf_params",
+    [{}, {"sublinear_tf": True, "smooth_idf": False}, {"norm": "l1"}, {"norm": None}],
+)
+def test_append_mode_matches_refit(tfidf_params: Dict[str, Any]) -> None:
+    first = ["I have a pen.", "Do you have a pen?"]
+    second = ["I have a bag.", "A bag of pens."]
+    tfidf_retriever = TFIDFRetriever.from_texts(
+        texts=first, append_mode=True, tfidf_params=dict(tfidf_params)
+    )
+    with warnings.catch_warnings():
+        # Terms in no document have an infinite idf without smoothing.
+        warnings.simplefilter("error", RuntimeWarning)
+        tfidf_retriever.add_texts(second[:1], metadatas=[{"i": 2}])
+        tfidf_retriever.add_texts(second[1:], metadatas=[{"i": 3}])
+    refit = TFIDFRetriever.from_texts(
+        texts=first + second, append_mode=True, tfidf_params=dict(tfidf_params)
+    )
+    assert np.allclose(
+        tfidf_retriever.tfidf_array.toarray(), refit.tfidf_array.toarray()
+    )
+    assert len(tfidf_retriever.docs) == 4
+    assert tfidf_retriever.invoke("bag")[0].metadata in ({"i": 2}, {"i": 3})
+
+
+@pytest.mark.requires("sklearn")
+def test_add_texts_requires_append_mode() -> None:
+    tfidf_retriever = TFIDFRetriever.from_texts(texts=["I have a pen."])
+    with pytest.raises(ValueError):
+        tfidf_retriever.add_texts(["I have a bag."])
+
+
+@pytest.mark.requires("sklearn")
+def test_save_local_load_local_append_mode(tmp_path: Path) -> None:
+    tfidf_retriever = TFIDFRetriever.from_texts(
+        texts=["I have a pen.", "Do you have a pen?"], append_mode=True, k=1
+    )
+    tfidf_retriever.save_local(folder_path=str(tmp_path))
+    loaded = TFIDFRetriever.load_local(
+        folder_path=str(tmp_path), allow_dangerous_deserialization=True
+    )
+    loaded.add_texts(["I have a bag."])
+    assert loaded.invoke("bag")[0].page_content == "I have a bag."
+
+
+@pytest.mark.requires("sklearn")
+def test_load_local_legacy_pickle(tmp_path: Path) -> None:
+    import joblib
+
+    tfidf_retriever = TFIDFRetriever.from_texts(texts=["I have a pen.", "A bag."])
+    joblib.dump(tfidf_retriever.vectorizer, tmp_path / "tfidf_vectorizer.joblib")
+    with open(tmp_path / "tfidf_vectorizer.pkl", "wb") as f:
+        pickle.dump((tfidf_retriever.docs, tfidf_retriever.tfidf_array), f)
+    loaded = TFIDFRetriever.load_local(
+        folder_path=str(tmp_path), allow_dangerous_deserialization=True
+    )
+    assert loaded.docs == tfidf_retriever.docs
@@ -1,11 +1,15 @@
 """Test caching for LLMs and ChatModels."""
 
+import asyncio
 import sqlite3
-from typing import Dict, Generator, List, Union
+import threading
+from pathlib import Path
+from typing import Any, Dict, Generator, List, Optional, Union
 
 import pytest
 from _pytest.fixtures import FixtureRequest
-from langchain_core.caches import InMemoryCache
+from langchain_core.caches import RETURN_VAL_TYPE, BaseCache, InMemoryCache
+from langchain_core.embeddings import Embeddings
 from langchain_core.language_models import FakeListChatModel, FakeListLLM
 from langchain_core.language_models.chat_models import BaseChatModel
 from langchain_core.language_models.llms import BaseLLM
@@ -23,7 +27,17 @@ except ImportError:
 from langchain.globals import get_llm_cache, set_llm_cache
 from langchain_core.outputs import Generation, LLMResult
 
-from langchain_community.cache import SQLAlchemyCache
+from langchain_community.cache import (
+    BinaryGenerationCodec,
+    JSONGenerationCodec,
+    LocalSemanticCache,
+    SQLAlchemyCache,
+    SQLAlchemyHashedCache,
+    SQLiteCache,
+    SQLiteHashedCache,
+    TieredCache,
+)
+from langchain_community.cache import InMemoryCache as CommunityInMemoryCache
 from tests.unit_tests.llms.fake_llm import FakeLLM
 
 
@@ -36,9 +50,34 @@ def get_sqlite_cache() -> SQLAlchemyCache:
     )
 
 
+def get_sqlite_hashed_cache() -> SQLAlchemyHashedCache:
+    return SQLAlchemyHashedCache(
+        engine=create_engine(
+            "sqlite://",
+            creator=lambda: sqlite3.connect("file::memory:?cache=shared", uri=True),
+        )
+    )
+
+
+def get_tiered_cache() -> TieredCache:
+    # The shared in-memory SQLite database raises "table is locked" instead of
+    # waiting when the background writer races a read, so use a thread-safe
+    # backend here; write-behind against SQL is exercised separately.
+    return TieredCache(
+        CommunityInMemoryCache(), front=CommunityInMemoryCache(maxsize=10)
+    )
+
+
+def get_bounded_in_memory_cache() -> CommunityInMemoryCache:
+    return CommunityInMemoryCache(maxsize=100, max_bytes=100_000, ttl=60)
+
+
 CACHE_OPTIONS = [
     InMemoryCache,
+    get_bounded_in_memory_cache,
     get_sqlite_cache,
+    get_sqlite_hashed_cache,
+    get_tiered_cache,
 ]
 
 
@@ -302,3 +341,550 @@ def test_sql_alchemy_cache() -> None:
         llm_output=None,
     )
     assert output == expected_output
+
+
+def test_in_memory_cache_lru_eviction() -> None:
+    cache = CommunityInMemoryCache(maxsize=2)
+    cache.update("a", "llm", [Generation(text="A")])
+    cache.update("b", "llm", [Generation(text="B")])
+    # Touch "a" so that "b" becomes the least recently used entry.
+    assert cache.lookup("a", "llm") == [Generation(text="A")]
+    cache.update("c", "llm", [Generation(text="C")])
+    assert cache.lookup("b", "llm") is None
+    assert cache.lookup("a", "llm") == [Generation(text="A")]
+    assert cache.lookup("c", "llm") == [Generation(text="C")]
+    assert cache.currsize == 2
+    assert cache.stats.evictions == 1
+    assert cache.stats.hits == 3
+    assert cache.stats.misses == 1
+
+
+def test_in_memory_cache_max_bytes() -> None:
+    cache = CommunityInMemoryCache(
+        max_bytes=10, size_fn=lambda prompt, llm_string, val: len(val[0].text)
+    )
+    cache.update("a", "llm", [Generation(text="xxxx")])
+    cache.update("b", "llm", [Generation(text="yyyy")])
+    assert cache.current_bytes == 8
+    cache.update("c", "llm", [Generation(text="zzzz")])
+    assert cache.current_bytes == 8
+    assert cache.lookup("a", "llm") is None
+    # Entries larger than the whole budget are never admitted.
+    cache.update("d", "llm", [Generation(text="w" * 11)])
+    assert cache.lookup("d", "llm") is None
+    assert cache.stats.rejections == 1
+
+
+def test_in_memory_cache_ttl(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = [1000.0]
+    monkeypatch.setattr("langchain_community.cache.time.monotonic", lambda: now[0])
+    cache = CommunityInMemoryCache(ttl=10)
+    cache.update("a", "llm", [Generation(text="A")])
+    now[0] += 5
+    assert cache.lookup("a", "llm") == [Generation(text="A")]
+    now[0] += 6
+    assert cache.lookup("a", "llm") is None
+    assert cache.stats.expirations == 1
+    assert cache.currsize == 0
+
+
+def test_in_memory_cache_tinylfu_keeps_hot_entries() -> None:
+    cache = CommunityInMemoryCache(maxsize=1, admission_policy="tinylfu")
+    for _ in range(3):
+        cache.lookup("hot", "llm")
+    cache.update("hot", "llm", [Generation(text="hot")])
+    # A one-off prompt is not popular enough to displace the hot entry.
+    cache.lookup("cold", "llm")
+    cache.update("cold", "llm", [Generation(text="cold")])
+    assert cache.lookup("hot", "llm") == [Generation(text="hot")]
+    assert cache.lookup("cold", "llm") is None
+    assert cache.stats.rejections == 1
+
+
+def test_in_memory_cache_invalid_arguments() -> None:
+    with pytest.raises(ValueError):
+        CommunityInMemoryCache(maxsize=0)
+    with pytest.raises(ValueError):
+        CommunityInMemoryCache(max_bytes=-1)
+    with pytest.raises(ValueError):
+        CommunityInMemoryCache(ttl=0)
+    with pytest.raises(ValueError):
+        CommunityInMemoryCache(admission_policy="fifo")  # type: ignore[arg-type]
+
+
+def test_in_memory_cache_concurrent_access() -> None:
+    cache = CommunityInMemoryCache(maxsize=50)
+
+    def worker(offset: int) -> None:
+        for i in range(200):
+            prompt = str((offset + i) % 80)
+            cache.update(prompt, "llm", [Generation(text=prompt)])
+            cache.lookup(prompt, "llm")
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert cache.currsize == 50
+    assert cache.stats.hits + cache.stats.misses == 8 * 200
+
+
+async def test_in_memory_cache_async_paths() -> None:
+    cache = CommunityInMemoryCache(maxsize=10)
+    await asyncio.gather(
+        *(cache.aupdate(str(i), "llm", [Generation(text=str(i))]) for i in range(20))
+    )
+    assert cache.currsize == 10
+    assert await cache.alookup("19", "llm") == [Generation(text="19")]
+    await cache.aclear()
+    assert cache.currsize == 0
+
+
+def test_sql_alchemy_hashed_cache_update_replaces_generations() -> None:
+    cache = SQLAlchemyHashedCache(create_engine("sqlite://"))
+    cache.update("foo", "llm", [Generation(text="a"), Generation(text="b")])
+    assert cache.lookup("foo", "llm") == [Generation(text="a"), Generation(text="b")]
+    cache.update("foo", "llm", [Generation(text="c")])
+    assert cache.lookup("foo", "llm") == [Generation(text="c")]
+    assert cache.lookup("foo", "other-llm") is None
+    assert cache.lookup("fo", "ollm") is None
+
+
+def test_sql_alchemy_hashed_cache_verifies_prompt() -> None:
+    cache = SQLAlchemyHashedCache(create_engine("sqlite://"))
+    cache.update("foo", "llm", [Generation(text="a")])
+    # Simulate a digest collision by rewriting the stored prompt.
+    with Session(cache.engine) as session, session.begin():
+        session.query(cache.cache_schema).update({"prompt": "bar"})
+    assert cache.lookup("foo", "llm") is None
+
+
+def test_sql_alchemy_hashed_cache_migrate_from_legacy_table() -> None:
+    engine = create_engine("sqlite://")
+    legacy = SQLAlchemyCache(engine)
+    legacy.update("foo", "llm", [Generation(text="a"), Generation(text="b")])
+    legacy.update("bar", "llm", [Generation(text="c")])
+
+    cache = SQLAlchemyHashedCache(engine)
+    assert cache.migrate_from(batch_size=2, drop_legacy=True) == 3
+    assert cache.lookup("foo", "llm") == [Generation(text="a"), Generation(text="b")]
+    assert cache.lookup("bar", "llm") == [Generation(text="c")]
+    assert cache.migrate_from() == 0
+
+
+def test_sqlite_cache_pragmas(tmp_path: Path) -> None:
+    hashed = SQLiteHashedCache(str(tmp_path / "hashed.db"))
+    with hashed.engine.connect() as connection:
+        journal_mode = connection.exec_driver_sql("PRAGMA journal_mode").scalar()
+    assert journal_mode == "wal"
+
+    plain = SQLiteCache(str(tmp_path / "plain.db"))
+    with plain.engine.connect() as connection:
+        journal_mode = connection.exec_driver_sql("PRAGMA journal_mode").scalar()
+    assert journal_mode != "wal"
+
+
+def test_sqlite_hashed_cache_migrate_legacy(tmp_path: Path) -> None:
+    database_path = str(tmp_path / "cache.db")
+    SQLiteCache(database_path).update("foo", "llm", [Generation(text="a")])
+    cache = SQLiteHashedCache(database_path, migrate_legacy=True)
+    assert cache.lookup("foo", "llm") == [Generation(text="a")]
+
+    # Restarting must neither rescan the legacy table nor copy its entries
+    # over newer ones.
+    cache.update("foo", "llm", [Generation(text="b")])
+    SQLiteCache(database_path).update("bar", "llm", [Generation(text="c")])
+    cache = SQLiteHashedCache(database_path, migrate_legacy=True)
+    assert cache.lookup("foo", "llm") == [Generation(text="b")]
+    assert cache.lookup("bar", "llm") is None
+
+
+def test_sql_alchemy_hashed_cache_migrate_from_pages_by_primary_key() -> None:
+    engine = create_engine("sqlite://")
+    legacy = SQLAlchemyCache(engine)
+    for i in range(7):
+        legacy.update(f"p{i}", "llm", [Generation(text=f"{i}-{j}") for j in range(3)])
+
+    cache = SQLAlchemyHashedCache(engine)
+    cache.update("p1", "llm", [Generation(text="kept")])
+    # Pages of 2 rows split the generations of most keys across pages.
+    assert cache.migrate_from(batch_size=2, overwrite=False) == 18
+    assert cache.lookup("p1", "llm") == [Generation(text="kept")]
+    for i in (0, 2, 6):
+        expected = [Generation(text=f"{i}-{j}") for j in range(3)]
+        assert cache.lookup(f"p{i}", "llm") == expected
+
+    assert cache.migrate_from(batch_size=4) == 21
+    assert cache.lookup("p1", "llm") == [Generation(text=f"1-{j}") for j in range(3)]
+
+
+class _CountingCache(BaseCache):
+    """Backend cache recording how often it is hit."""
+
+    def __init__(self, lookup_delay: Optional[threading.Event] = None) -> None:
+        self._store: Dict[Any, RETURN_VAL_TYPE] = {}
+        self.lookups = 0
+        self.updates = 0
+        self._lookup_delay = lookup_delay
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        self.lookups += 1
+        # Read first, so that a delayed lookup returns what it saw at the start.
+        value = self._store.get((prompt, llm_string))
+        if self._lookup_delay is not None:
+            self._lookup_delay.wait(timeout=5)
+        return value
+
+    def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        self.updates += 1
+        self._store[(prompt, llm_string)] = return_val
+
+    def clear(self, **kwargs: Any) -> None:
+        self._store = {}
+
+
+def test_tiered_cache_read_through_and_write_behind() -> None:
+    backend = _CountingCache()
+    backend.update("foo", "llm", [Generation(text="from backend")])
+    cache = TieredCache(backend)
+    for _ in range(3):
+        assert cache.lookup("foo", "llm") == [Generation(text="from backend")]
+    assert backend.lookups == 1
+
+    cache.update("bar", "llm", [Generation(text="bar")])
+    assert cache.lookup("bar", "llm") == [Generation(text="bar")]
+    cache.flush()
+    assert backend.lookup("bar", "llm") == [Generation(text="bar")]
+    cache.close()
+
+
+def test_tiered_cache_negative_caching() -> None:
+    backend = _CountingCache()
+    cache = TieredCache(backend, negative_ttl=60, write_behind=False)
+    assert cache.lookup("foo", "llm") is None
+    assert cache.lookup("foo", "llm") is None
+    assert backend.lookups == 1
+    cache.update("foo", "llm", [Generation(text="foo")])
+    assert cache.lookup("foo", "llm") == [Generation(text="foo")]
+    assert backend.updates == 1
+
+
+def test_tiered_cache_collapses_concurrent_lookups() -> None:
+    release = threading.Event()
+    backend = _CountingCache(lookup_delay=release)
+    backend._store[("foo", "llm")] = [Generation(text="foo")]
+    cache = TieredCache(backend)
+    results: List[Optional[RETURN_VAL_TYPE]] = []
+
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.lookup("foo", "llm")))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    while not cache._inflight:
+        release.wait(0.001)
+    release.set()
+    for thread in threads:
+        thread.join()
+    assert results == [[Generation(text="foo")]] * 8
+    assert backend.lookups == 1
+    assert backend.updates == 0
+
+
+def test_tiered_cache_read_through_does_not_overwrite_update() -> None:
+    release = threading.Event()
+    backend = _CountingCache(lookup_delay=release)
+    backend._store[("foo", "llm")] = [Generation(text="old")]
+    cache = TieredCache(backend, write_behind=False)
+    results: List[Optional[RETURN_VAL_TYPE]] = []
+    reader = threading.Thread(target=lambda: results.append(cache.lookup("foo", "llm")))
+    reader.start()
+    while not cache._inflight:
+        release.wait(0.001)
+    cache.update("foo", "llm", [Generation(text="new")])
+    release.set()
+    reader.join()
+
+    assert results == [[Generation(text="old")]]
+    assert cache.lookup("foo", "llm") == [Generation(text="new")]
+    assert backend.lookups == 1
+    assert backend.updates == 1
+
+
+async def test_tiered_cache_async_collapses_lookups() -> None:
+    class _SlowAsyncCache(_CountingCache):
+        async def alookup(
+            self, prompt: str, llm_string: str
+        ) -> Optional[RETURN_VAL_TYPE]:
+            self.lookups += 1
+            await asyncio.sleep(0.01)
+            return self._store.get((prompt, llm_string))
+
+        async def aupdate(
+            self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE
+        ) -> None:
+            self.update(prompt, llm_string, return_val)
+
+    backend = _SlowAsyncCache()
+    backend._store[("foo", "llm")] = [Generation(text="foo")]
+    cache = TieredCache(backend)
+    results = await asyncio.gather(*(cache.alookup("foo", "llm") for _ in range(10)))
+    assert results == [[Generation(text="foo")]] * 10
+    assert backend.lookups == 1
+
+    await cache.aupdate("bar", "llm", [Generation(text="bar")])
+    await cache.aflush()
+    assert backend._store[("bar", "llm")] == [Generation(text="bar")]
+
+
+class _KeywordEmbeddings(Embeddings):
+    """Embeds texts by counting a few keywords, so paraphrases are close."""
+
+    KEYWORDS = ["weather", "paris", "london", "capital", "france"]
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return [self.embed_query(text) for text in texts]
+
+    def embed_query(self, text: str) -> List[float]:
+        self.calls += 1
+        words = text.lower().replace("?", "").split()
+        return [float(words.count(k)) for k in self.KEYWORDS] + [0.1]
+
+
+@pytest.mark.parametrize("index_type", ["flat", "hnsw"])
+def test_local_semantic_cache(index_type: str) -> None:
+    if index_type == "hnsw":
+        pytest.importorskip("faiss")
+    embedding = _KeywordEmbeddings()
+    cache = LocalSemanticCache(
+        embedding,
+        similarity_threshold=0.9,
+        index_type=index_type,  # type: ignore[arg-type]
+    )
+    assert cache.lookup("weather in paris", "llm") is None
+    cache.update("weather in paris", "llm", [Generation(text="sunny")])
+    assert cache.lookup("what is the weather in paris?", "llm") == [
+        Generation(text="sunny")
+    ]
+    assert cache.lookup("weather in london", "llm") is None
+    assert cache.lookup("weather in paris", "other-llm") is None
+    cache.clear(llm_string="llm")
+    assert cache.lookup("weather in paris", "llm") is None
+
+
+@pytest.mark.parametrize("index_type", ["flat", "hnsw"])
+def test_local_semantic_cache_update_replaces_entry(index_type: str) -> None:
+    if index_type == "hnsw":
+        pytest.importorskip("faiss")
+    cache = LocalSemanticCache(
+        _KeywordEmbeddings(),
+        max_entries=2,
+        index_type=index_type,  # type: ignore[arg-type]
+    )
+    cache.update("weather in london", "llm", [Generation(text="rainy")])
+    cache.update("weather in paris", "llm", [Generation(text="old")])
+    cache.update("weather in paris", "llm", [Generation(text="new")])
+    assert cache.lookup("weather in paris", "llm") == [Generation(text="new")]
+    assert cache._partitions["llm"].count == 2
+    assert cache.lookup("weather in london", "llm") == [Generation(text="rainy")]
+
+
+def test_local_semantic_cache_memoizes_embeddings() -> None:
+    embedding = _KeywordEmbeddings()
+    cache = LocalSemanticCache(embedding)
+    cache.update("weather in paris", "llm", [Generation(text="sunny")])
+    cache.lookup("weather in paris", "llm")
+    cache.update("weather in paris", "other-llm", [Generation(text="sunny")])
+    assert embedding.calls == 1
+
+
+@pytest.mark.parametrize("index_type", ["flat", "hnsw"])
+def test_local_semantic_cache_eviction(index_type: str) -> None:
+    if index_type == "hnsw":
+        pytest.importorskip("faiss")
+    cache = LocalSemanticCache(
+        _KeywordEmbeddings(),
+        max_entries=2,
+        index_type=index_type,  # type: ignore[arg-type]
+    )
+    cache.update("weather in paris", "llm", [Generation(text="sunny")])
+    cache.update("weather in london", "llm", [Generation(text="rainy")])
+    assert cache.lookup("weather in paris", "llm") == [Generation(text="sunny")]
+    cache.update("capital of france", "llm", [Generation(text="paris")])
+    assert cache.lookup("weather in london", "llm") is None
+    assert cache.lookup("weather in paris", "llm") == [Generation(text="sunny")]
+    assert cache.lookup("capital of france", "llm") == [Generation(text="paris")]
+
+
+def test_local_semantic_cache_persistence(tmp_path: Path) -> None:
+    path = str(tmp_path / "semantic")
+    cache = LocalSemanticCache(_KeywordEmbeddings(), persist_path=path)
+    cache.update("weather in paris", "llm", [Generation(text="sunny")])
+    cache.update(
+        "capital of france",
+        "chat",
+        [ChatGeneration(message=AIMessage(content="paris"))],
+    )
+    cache.persist()
+
+    restored = LocalSemanticCache(_KeywordEmbeddings(), persist_path=path)
+    assert restored.lookup("weather in paris", "llm") == [Generation(text="sunny")]
+    assert restored.lookup("capital of france", "chat") == [
+        ChatGeneration(message=AIMessage(content="paris"))
+    ]
+
+
+async def test_local_semantic_cache_async() -> None:
+    cache = LocalSemanticCache(_KeywordEmbeddings())
+    await cache.aupdate("weather in paris", "llm", [Generation(text="sunny")])
+    assert await cache.alookup("paris weather", "llm") == [Generation(text="sunny")]
+
+
+def test_tiered_cache_over_sql_backend(tmp_path: Path) -> None:
+    backend = SQLiteHashedCache(str(tmp_path / "cache.db"))
+    cache = TieredCache(backend, front=CommunityInMemoryCache(maxsize=10))
+    cache.update("foo", "llm", [Generation(text="fizz")])
+    cache.flush()
+    assert backend.lookup("foo", "llm") == [Generation(text="fizz")]
+    assert TieredCache(backend).lookup("foo", "llm") == [Generation(text="fizz")]
+    cache.close()
+
+
+CODEC_GENERATIONS = [
+    Generation(text="plain"),
+    Generation(text="with info ✓", generation_info={"finish_reason": "stop"}),
+    ChatGeneration(message=AIMessage(content="chat", id="run-1")),
+]
+
+
+@pytest.mark.parametrize(
+    "codec",
+    [
+        JSONGenerationCodec(),
+        BinaryGenerationCodec(compression=None),
+        BinaryGenerationCodec(compression="zlib", compression_threshold=0),
+        BinaryGenerationCodec(compression="zstd", compression_threshold=0),
+    ],
+)
+def test_generation_codec_round_trip(codec: Any) -> None:
+    assert codec.decode(codec.encode(CODEC_GENERATIONS)) == CODEC_GENERATIONS
+    assert codec.decode(codec.encode([])) in ([], None)
+
+
+def test_binary_generation_codec_compresses_large_payloads() -> None:
+    codec = BinaryGenerationCodec(compression="zlib", compression_threshold=100)
+    generations = [Generation(text="lorem ipsum " * 1000)]
+    encoded = codec.encode(generations)
+    assert len(encoded) < len(generations[0].text) / 10
+    assert codec.decode(encoded) == generations
+    assert len(codec.encode([Generation(text="short")])) < 100
+
+
+def test_binary_generation_codec_reads_legacy_formats() -> None:
+    codec = BinaryGenerationCodec()
+    legacy = JSONGenerationCodec().encode(CODEC_GENERATIONS)
+    assert codec.decode(legacy) == CODEC_GENERATIONS
+    oldest = b'[{"text": "fizz", "generation_info": null}]'
+    assert codec.decode(oldest) == [Generation(text="fizz")]
+    assert codec.decode(b"\x00LCG\x01\x00\x05") is None
+
+
+def test_binary_generation_codec_decodes_text() -> None:
+    codec = BinaryGenerationCodec()
+    legacy = JSONGenerationCodec().encode(CODEC_GENERATIONS).decode("utf-8")
+    assert codec.decode(legacy) == CODEC_GENERATIONS
+    assert JSONGenerationCodec().decode(legacy) == CODEC_GENERATIONS
+    assert codec.decode('[{"text": "fizz", "generation_info": null}]') == [
+        Generation(text="fizz")
+    ]
+
+
+def test_binary_generation_codec_non_json_generation_info() -> None:
+    import datetime
+
+    codec = BinaryGenerationCodec()
+    legacy = JSONGenerationCodec()
+    generations = [
+        Generation(text="a", generation_info={"pair": (1, 2), "keys": {3: "x"}}),
+        Generation(text="b", generation_info={"nested": [{"ok": 1.5}]}),
+    ]
+    assert codec.decode(codec.encode(generations)) == legacy.decode(
+        legacy.encode(generations)
+    )
+    assert codec.decode(codec.encode(generations[1:])) == generations[1:]
+    # Unserializable values are stored as markers that cannot be loaded back.
+    dated = [Generation(text="c", generation_info={"at": datetime.date(2024, 1, 2)})]
+    assert codec.decode(codec.encode(dated)) is None
+
+
+def test_binary_generation_codec_corrupt_entry_is_a_miss() -> None:
+    assert BinaryGenerationCodec().decode(b"\xff\xfe not utf-8") is None
+
+
+@pytest.mark.requires("fakeredis")
+@pytest.mark.parametrize("value_encoding", ["hash", "binary"])
+def test_redis_cache_batch_lookup_and_update(value_encoding: str) -> None:
+    import fakeredis
+
+    from langchain_community.cache import RedisCache
+
+    redis_ = fakeredis.FakeRedis()
+    cache = RedisCache(redis_, value_encoding=value_encoding, ttl=60)  # type: ignore[arg-type]
+    generations = [
+        [Generation(text="foo")],
+        [Generation(text="bar", generation_info={"a": 1})],
+    ]
+    cache.batch_update(["foo", "bar"], "llm", generations)
+    assert cache.batch_lookup(["foo", "baz", "bar"], "llm") == [
+        generations[0],
+        None,
+        generations[1],
+    ]
+    assert cache.lookup("bar", "llm") == generations[1]
+    assert cache.lookup("foo", "other llm") is None
+    assert cache.batch_lookup([], "llm") == []
+    assert all(0 < redis_.ttl(key) <= 60 for key in redis_.keys())
+    expected_type = b"string" if value_encoding == "binary" else b"hash"
+    assert {redis_.type(key) for key in redis_.keys()} == {expected_type}
+    with pytest.raises(ValueError):
+        cache.batch_update(["foo"], "llm", [])
+
+
+@pytest.mark.requires("fakeredis")
+async def test_async_redis_cache_batch_lookup_and_update() -> None:
+    from fakeredis import FakeAsyncRedis
+
+    from langchain_community.cache import AsyncRedisCache
+
+    cache = AsyncRedisCache(FakeAsyncRedis(), value_encoding="binary")
+    generations = [[Generation(text="foo")], [Generation(text="bar")]]
+    await cache.abatch_update(["foo", "bar"], "llm", generations)
+    assert await cache.abatch_lookup(["foo", "baz", "bar"], "llm") == [
+        generations[0],
+        None,
+        generations[1],
+    ]
+    await cache.aupdate("foo", "llm", generations[1])
+    assert await cache.alookup("foo", "llm") == generations[1]
+
+
+@pytest.mark.requires("fakeredis")
+def test_redis_cache_binary_rejects_decoded_responses() -> None:
+    import fakeredis
+
+    from langchain_community.cache import AsyncRedisCache, RedisCache
+
+    with pytest.raises(ValueError, match="decode_responses"):
+        RedisCache(fakeredis.FakeRedis(decode_responses=True), value_encoding="binary")
+    with pytest.raises(ValueError, match="decode_responses"):
+        AsyncRedisCache(
+            fakeredis.FakeAsyncRedis(decode_responses=True), value_encoding="binary"
+        )
+    cache = RedisCache(fakeredis.FakeRedis(decode_responses=True))
+    cache.update("foo", "llm", [Generation(text="foo")])
+    assert cache.lookup("foo", "llm") == [Generation(text="foo")]
@@ -0,0 +1,55 @@
+"""Test batched embedding utilities."""
+
+import threading
+from typing import List
+
+import numpy as np
+import pytest
+from langchain_core.embeddings import Embeddings
+
+from langchain_community.embeddings import DeterministicFakeEmbedding
+from langchain_community.utils.embeddings import embed_texts
+
+
+class _RecordingEmbeddings(Embeddings):
+    def __init__(self) -> None:
+        self.inner = DeterministicFakeEmbedding(size=8)
+        self.batches: List[List[str]] = []
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        with self.lock:
+            self.batches.append(texts)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            return self.inner.embed_documents(texts)
+        finally:
+            with self.lock:
+                self.active -= 1
+
+    def embed_query(self, text: str) -> List[float]:
+        raise AssertionError("embed_texts should only call embed_documents")
+
+
+def test_embed_texts_batches_in_order() -> None:
+    embeddings = _RecordingEmbeddings()
+    texts = [f"text {i}" for i in range(25)]
+    result = embed_texts(
+        (t for t in texts), embeddings, batch_size=10, max_concurrency=2
+    )
+    assert sorted(len(batch) for batch in embeddings.batches) == [5, 10, 10]
+    assert embeddings.max_active <= 2
+    expected = embeddings.inner.embed_documents(texts)
+    assert np.allclose(result, expected)
+
+
+def test_embed_texts_empty() -> None:
+    assert len(embed_texts([], _RecordingEmbeddings())) == 0
+
+
+def test_embed_texts_invalid_arguments() -> None:
+    with pytest.raises(ValueError):
+        embed_texts(["a"], _RecordingEmbeddings(), batch_size=0)
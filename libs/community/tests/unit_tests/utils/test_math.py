@@ -1,12 +1,16 @@
 """Test math utility functions."""
 
 import importlib
-from typing import List
+from typing import List, Optional
 
 import numpy as np
 import pytest
 
-from langchain_community.utils.math import cosine_similarity, cosine_similarity_top_k
+from langchain_community.utils.math import (
+    NormalizedMatrix,
+    cosine_similarity,
+    cosine_similarity_top_k,
+)
 
 
 @pytest.fixture
@@ -58,6 +62,17 @@ def test_cosine_similarity_top_k(X: List[List[float]], Y: List[List[float]]) ->
     assert np.allclose(expected_scores, actual_scores)
 
 
+@pytest.mark.parametrize("top_k", [None, 0, -1])
+def test_cosine_similarity_top_k_defaults_to_len_x(
+    X: List[List[float]], Y: List[List[float]], top_k: Optional[int]
+) -> None:
+    expected_idxs, expected_scores = cosine_similarity_top_k(X, Y, top_k=len(X))
+    actual_idxs, actual_scores = cosine_similarity_top_k(X, Y, top_k=top_k)
+    assert len(actual_idxs) == len(X)
+    assert actual_idxs == expected_idxs
+    assert np.allclose(expected_scores, actual_scores)
+
+
 def test_cosine_similarity_score_threshold(
     X: List[List[float]], Y: List[List[float]]
 ) -> None:
@@ -94,3 +109,44 @@ def test_cosine_similarity_top_k_and_score_threshold_with_simsimd(
 ) -> None:
     # Same test, but ensuring simsimd is available in the project through the import.
     invoke_cosine_similarity_top_k_score_threshold(X, Y)
+
+
+def test_cosine_similarity_top_k_blocked(
+    X: List[List[float]], Y: List[List[float]]
+) -> None:
+    expected_idxs, expected_scores = cosine_similarity_top_k(X, Y)
+    actual_idxs, actual_scores = cosine_similarity_top_k(X, Y, block_size=1)
+    assert actual_idxs == expected_idxs
+    assert np.allclose(expected_scores, actual_scores)
+
+
+def test_cosine_similarity_normalized_matrix(
+    X: List[List[float]], Y: List[List[float]]
+) -> None:
+    expected = cosine_similarity(X, Y)
+    assert np.allclose(cosine_similarity(NormalizedMatrix(X), Y), expected)
+    assert np.allclose(cosine_similarity(X, NormalizedMatrix(Y)), expected)
+
+
+def test_normalized_matrix_top_k() -> None:
+    rng = np.random.default_rng(0)
+    corpus = rng.normal(size=(100, 8))
+    queries = rng.normal(size=(5, 8))
+    expected = np.argsort(-cosine_similarity(queries, corpus), axis=1)[:, :4]
+    for dtype in (np.float32, np.float16):
+        index = NormalizedMatrix(corpus, dtype=dtype)
+        idxs, scores = index.top_k(queries, k=4, block_size=7)
+        assert idxs.shape == scores.shape == (5, 4)
+        assert np.all(np.diff(scores, axis=1) <= 0)
+        if dtype is np.float32:
+            assert (idxs == expected).all()
+
+
+def test_normalized_matrix_top_k_threshold_and_append() -> None:
+    index = NormalizedMatrix([[1.0, 0.0], [0.0, 1.0]])
+    index.append([[1.0, 1.0], [0.0, 0.0]])
+    assert len(index) == 4
+    idxs, scores = index.top_k([1.0, 0.0], k=10, score_threshold=0.5)
+    assert idxs.tolist() == [[0, 2, -1, -1]]
+    assert np.allclose(scores[0, :2], [1.0, np.sqrt(0.5)])
+    assert np.isneginf(scores[0, 2:]).all()
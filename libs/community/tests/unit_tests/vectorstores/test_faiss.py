@@ -3,8 +3,10 @@
 import datetime
 import math
 import tempfile
-from typing import Union
+from pathlib import Path
+from typing import List, Tuple, Union
 
+import numpy as np
 import pytest
 from langchain_core.documents import Document
 
@@ -326,7 +328,7 @@ def test_faiss_mmr_with_metadatas_and_filter() -> None:
     assert output[0][0] == Document(
         id=output[0][0].id, page_content="foo", metadata={"page": 1}
     )
-    assert output[0][1] == 0.0
+    assert output[0][1] == 1.0
     assert output == docsearch.max_marginal_relevance_search_with_score_by_vector(
         query_vec, k=10, lambda_mult=0.1, filter=lambda di: di["page"] == 1
     )
@@ -345,7 +347,7 @@ def test_faiss_mmr_with_metadatas_and_comparison_operators_filter_eq() -> None:
     assert output[0][0] == Document(
         id=output[0][0].id, page_content="foo", metadata={"page": 1}
     )
-    assert output[0][1] == 0.0
+    assert output[0][1] == 1.0
     assert output == docsearch.max_marginal_relevance_search_with_score_by_vector(
         query_vec, k=10, lambda_mult=0.1, filter=lambda di: di["page"] == 1
     )
@@ -389,7 +391,7 @@ def test_faiss_mmr_with_metadatas_and_comparison_operators_filter_gt() -> None:
     assert output[0][0] == Document(
         id=output[0][0].id, page_content="foo", metadata={"page": 1}
     )
-    assert output[0][1] == 0.0
+    assert output[0][1] == 1.0
     assert output[1][0] != Document(
         id=output[1][0].id, page_content="foo", metadata={"page": 1}
     )
@@ -437,7 +439,7 @@ def test_faiss_mmr_with_metadatas_and_comparison_operators_filter_gte() -> None:
     assert output[0][0] == Document(
         id=output[0][0].id, page_content="foo", metadata={"page": 1}
     )
-    assert output[0][1] == 0.0
+    assert output[0][1] == 1.0
     assert output[1][0] != Document(
         id=output[1][0].id, page_content="foo", metadata={"page": 1}
     )
@@ -500,7 +502,7 @@ def test_faiss_mmr_with_metadatas_and_comparison_operators_filter_in_2() -> None
     assert output[0][0] == Document(
         id=output[0][0].id, page_content="foo", metadata={"page": 1}
     )
-    assert output[0][1] == 0.0
+    assert output[0][1] == 1.0
     assert output[1][0] == Document(
         id=output[1][0].id, page_content="fou", metadata={"page": 2}
     )
@@ -522,7 +524,7 @@ def test_faiss_mmr_with_metadatas_and_comparison_operators_filter_nin_1() -> Non
     assert output[0][0] == Document(
         id=output[0][0].id, page_content="fou", metadata={"page": 2}
     )
-    assert output[0][1] == 0.0
+    assert output[0][1] == 4.0
     assert output[1][0] == Document(
         id=output[1][0].id, page_content="foy", metadata={"page": 3}
     )
@@ -544,7 +546,7 @@ def test_faiss_mmr_with_metadatas_and_comparison_operators_filter_nin_2() -> Non
     assert output[0][0] == Document(
         id=output[0][0].id, page_content="foy", metadata={"page": 3}
     )
-    assert output[0][1] == 0.0
+    assert output[0][1] == 9.0
     assert output == docsearch.max_marginal_relevance_search_with_score_by_vector(
         query_vec, k=10, lambda_mult=0.1, filter=lambda di: di["page"] not in [0, 1, 2]
     )
@@ -857,7 +859,7 @@ def test_faiss_mmr_with_metadatas_and_logical_comparsion_operators_filter_2() ->
     assert output[0][0] == Document(
         id=output[0][0].id, page_content="foo", metadata={"page": 1}
     )
-    assert output[0][1] == 0.0
+    assert output[0][1] == 1.0
     assert output[1][0] == Document(
         id=output[1][0].id, page_content="foy", metadata={"page": 3}
     )
@@ -1227,7 +1229,7 @@ async def test_faiss_async_mmr_with_metadatas_and_filter() -> None:
     assert output[0][0] == Document(
         id=output[0][0].id, page_content="foo", metadata={"page": 1}
     )
-    assert output[0][1] == 0.0
+    assert output[0][1] == 1.0
     assert (
         output
         == await docsearch.amax_marginal_relevance_search_with_score_by_vector(
@@ -1797,3 +1799,509 @@ def test_faiss_get_by_ids() -> None:
         res = vstore.get_by_ids([id_])
         assert len(res) == 1
         assert res[0].id == id_
+
+
+def _selective_faiss() -> FAISS:
+    texts = [f"text {i}" for i in range(50)]
+    metadatas = [
+        {"page": i, "group": "rare" if i >= 40 else "common"} for i in range(50)
+    ]
+    return FAISS.from_texts(texts, FakeEmbeddings(), metadatas=metadatas)
+
+
+@pytest.mark.requires("faiss")
+def test_faiss_selective_filter_returns_k() -> None:
+    """Selective filters still return k results when fetch_k is too small."""
+    docsearch = _selective_faiss()
+    query_vec = FakeEmbeddings().embed_query(text="foo")
+    # Answered from the metadata index with an id selector.
+    output = docsearch.similarity_search_by_vector(
+        query_vec, k=4, filter={"group": "rare"}, fetch_k=5
+    )
+    assert [doc.metadata["page"] for doc in output] == [40, 41, 42, 43]
+    # Post-filtered with a growing candidate window.
+    for filter in (
+        lambda md: md["group"] == "rare",
+        {"group": "rare", "page": {"$gte": 40}},
+    ):
+        output = docsearch.similarity_search_by_vector(
+            query_vec, k=4, filter=filter, fetch_k=5
+        )
+        assert [doc.metadata["page"] for doc in output] == [40, 41, 42, 43]
+    # The window stops growing once the index is exhausted.
+    output = docsearch.similarity_search_by_vector(
+        query_vec, k=4, filter=lambda md: md["page"] == 49, fetch_k=5
+    )
+    assert [doc.metadata["page"] for doc in output] == [49]
+
+
+@pytest.mark.requires("faiss")
+def test_faiss_metadata_index_follows_updates() -> None:
+    docsearch = _selective_faiss()
+    query_vec = FakeEmbeddings().embed_query(text="foo")
+    filter = {"$or": [{"group": "new"}, {"page": {"$in": [45, 46]}}]}
+    output = docsearch.similarity_search_by_vector(query_vec, k=4, filter=filter)
+    assert [doc.metadata["page"] for doc in output] == [45, 46]
+    docsearch.add_texts(["new"], metadatas=[{"group": "new", "page": 50}])
+    output = docsearch.similarity_search_by_vector(query_vec, k=4, filter=filter)
+    assert [doc.metadata["page"] for doc in output] == [50, 45, 46]
+    docsearch.delete([docsearch.index_to_docstore_id[45]])
+    output = docsearch.similarity_search_by_vector(query_vec, k=4, filter=filter)
+    assert [doc.metadata["page"] for doc in output] == [50, 46]
+    output = docsearch.similarity_search_by_vector(
+        query_vec,
+        k=4,
+        filter={"$and": [{"$not": {"group": "common"}}, {"page": {"$neq": 41}}]},
+    )
+    assert [doc.metadata["page"] for doc in output] == [50, 40, 42, 43]
+
+
+@pytest.mark.requires("faiss")
+async def test_faiss_async_selective_filter_returns_k() -> None:
+    docsearch = _selective_faiss()
+    query_vec = await FakeEmbeddings().aembed_query(text="foo")
+    output = await docsearch.asimilarity_search_by_vector(
+        query_vec, k=4, filter=lambda md: md["group"] == "rare", fetch_k=5
+    )
+    assert [doc.metadata["page"] for doc in output] == [40, 41, 42, 43]
+    output = await docsearch.amax_marginal_relevance_search_by_vector(
+        query_vec, k=2, fetch_k=3, filter={"group": "rare"}
+    )
+    assert len(output) == 2
+    assert all(doc.metadata["group"] == "rare" for doc in output)
+
+
+@pytest.mark.requires("faiss")
+def test_faiss_batch_similarity_search_matches_single() -> None:
+    docsearch = _selective_faiss()
+    query_vecs = [[1.0] * 9 + [float(i)] for i in (0, 12, 47)]
+    for filter in (None, {"group": "rare"}, lambda md: md["page"] % 7 == 0):
+        expected = [
+            docsearch.similarity_search_with_score_by_vector(
+                vec, k=3, filter=filter, fetch_k=4
+            )
+            for vec in query_vecs
+        ]
+        output = docsearch.batch_similarity_search_with_score_by_vector(
+            query_vecs, k=3, filter=filter, fetch_k=4
+        )
+        assert output == expected
+    output = docsearch.batch_similarity_search_with_score_by_vector(
+        query_vecs, k=3, score_threshold=1.0
+    )
+    assert [len(hits) for hits in output] == [2, 3, 3]
+    assert docsearch.batch_similarity_search_with_score_by_vector([]) == []
+
+
+@pytest.mark.requires("faiss")
+def test_faiss_batch_mmr_matches_single() -> None:
+    docsearch = _selective_faiss()
+    query_vecs = [[1.0] * 9 + [float(i)] for i in (0, 12, 47)]
+    for filter in (None, {"group": "common"}):
+        expected = [
+            docsearch.max_marginal_relevance_search_with_score_by_vector(
+                vec, k=3, fetch_k=6, lambda_mult=0.1, filter=filter
+            )
+            for vec in query_vecs
+        ]
+        output = docsearch.batch_max_marginal_relevance_search_with_score_by_vector(
+            query_vecs, k=3, fetch_k=6, lambda_mult=0.1, filter=filter
+        )
+        assert output == expected
+
+
+@pytest.mark.requires("faiss")
+async def test_faiss_batch_similarity_search_by_text() -> None:
+    texts = ["foo", "bar", "baz"]
+    docsearch = FAISS.from_texts(texts, FakeEmbeddings())
+    queries = ["foo", "bar", "baz", "qux"]
+    expected = [docsearch.similarity_search_with_score(q, k=2) for q in queries]
+    assert docsearch.batch_similarity_search_with_score(queries, k=2, batch_size=3) == (
+        expected
+    )
+    assert (
+        await docsearch.abatch_similarity_search_with_score(queries, k=2, batch_size=3)
+        == expected
+    )
+    assert docsearch.batch_max_marginal_relevance_search(queries, k=2) == [
+        docsearch.max_marginal_relevance_search(q, k=2) for q in queries
+    ]
+
+
+def _random_text_embeddings(n: int, dim: int = 8) -> List[Tuple[str, List[float]]]:
+    rng = np.random.default_rng(0)
+    return [(f"text {i}", rng.normal(size=dim).tolist()) for i in range(n)]
+
+
+@pytest.mark.requires("faiss")
+def test_faiss_index_factory_ivf_on_disk(tmp_path: Path) -> None:
+    text_embeddings = _random_text_embeddings(300)
+    metadatas = [{"page": i} for i in range(300)]
+    flat = FAISS.from_embeddings(text_embeddings, FakeEmbeddings(), metadatas)
+    docsearch = FAISS.from_embeddings(
+        text_embeddings,
+        FakeEmbeddings(),
+        metadatas,
+        index_factory="IVF4,Flat",
+        training_sample_size=100,
+        # Probing every list makes the search exhaustive.
+        search_params={"nprobe": 4},
+        on_disk_invlists=str(tmp_path / "build" / "lists.ivfdata"),
+    )
+    queries = [embedding for _, embedding in text_embeddings[:5]]
+    expected = flat.batch_similarity_search_with_score_by_vector(queries, k=5)
+    output = docsearch.batch_similarity_search_with_score_by_vector(queries, k=5)
+    assert [[doc.page_content for doc, _ in hits] for hits in output] == [
+        [doc.page_content for doc, _ in hits] for hits in expected
+    ]
+    filtered = docsearch.similarity_search_by_vector(
+        queries[0], k=3, filter={"page": {"$in": [7, 8, 9]}}
+    )
+    assert sorted(doc.metadata["page"] for doc in filtered) == [7, 8, 9]
+    assert len(docsearch.max_marginal_relevance_search_by_vector(queries[0], k=3)) == 3
+
+    docsearch.save_local(str(tmp_path / "saved"))
+    (tmp_path / "build" / "lists.ivfdata").unlink()
+    loaded = FAISS.load_local(
+        str(tmp_path / "saved"), FakeEmbeddings(), allow_dangerous_deserialization=True
+    )
+    assert loaded.batch_similarity_search_with_score_by_vector(queries, k=5) == output
+    # Ids of IVF indexes are stable, so deleting does not renumber them.
+    loaded.delete([loaded.index_to_docstore_id[0]])
+    assert loaded.index.ntotal == 299
+    assert 0 not in loaded.index_to_docstore_id
+    assert loaded.similarity_search_by_vector(queries[1], k=1)[0].page_content == (
+        "text 1"
+    )
+    loaded.add_embeddings([("new", queries[0])])
+    assert loaded.similarity_search_by_vector(queries[0], k=1)[0].page_content == (
+        "new"
+    )
+
+
+@pytest.mark.requires("faiss")
+def test_faiss_index_factory_search_params(tmp_path: Path) -> None:
+    text_embeddings = _random_text_embeddings(200)
+    docsearch = FAISS.from_embeddings(
+        text_embeddings,
+        FakeEmbeddings(),
+        index_factory="HNSW8",
+        search_params={"efSearch": 64},
+    )
+    assert docsearch.index.hnsw.efSearch == 64
+    query = text_embeddings[3][1]
+    output = docsearch.similarity_search_by_vector(
+        query, k=1, search_params={"efSearch": 16}
+    )
+    assert output[0].page_content == "text 3"
+    with pytest.raises(ValueError, match="nprobe"):
+        docsearch.similarity_search_by_vector(query, search_params={"nprobe": 4})
+    docsearch.save_local(str(tmp_path))
+    loaded = FAISS.load_local(
+        str(tmp_path), FakeEmbeddings(), allow_dangerous_deserialization=True
+    )
+    assert loaded.index.hnsw.efSearch == 64
+
+    text_embeddings = _random_text_embeddings(1000, dim=16)
+    docsearch = FAISS.from_embeddings(
+        text_embeddings,
+        FakeEmbeddings(),
+        index_factory="OPQ4,IVF4,PQ4x4",
+        distance_strategy=DistanceStrategy.MAX_INNER_PRODUCT,
+    )
+    output = docsearch.similarity_search_by_vector(
+        text_embeddings[0][1], k=4, search_params={"nprobe": 4}
+    )
+    assert len(output) == 4
+
+
+@pytest.mark.requires("faiss")
+def test_faiss_index_factory_merge_from() -> None:
+    text_embeddings = _random_text_embeddings(300)
+    docsearch = FAISS.from_embeddings(
+        text_embeddings[:200],
+        FakeEmbeddings(),
+        index_factory="IVF4,Flat",
+        search_params={"nprobe": 4},
+    )
+    # Trained separately, so the coarse quantizers differ.
+    other = FAISS.from_embeddings(
+        text_embeddings[200:],
+        FakeEmbeddings(),
+        index_factory="IVF4,Flat",
+        search_params={"nprobe": 4},
+    )
+    docsearch.delete([docsearch.index_to_docstore_id[10]])
+    docsearch.merge_from(other)
+    assert docsearch.index.ntotal == 299
+    for i in (5, 250):
+        output = docsearch.similarity_search_by_vector(text_embeddings[i][1], k=1)
+        assert output[0].page_content == f"text {i}"
+
+
+@pytest.mark.requires("faiss")
+def test_faiss_stable_ids_delete() -> None:
+    texts = [f"text {i}" for i in range(10)]
+    ids = [f"id{i}" for i in range(10)]
+    docsearch = FAISS.from_texts(
+        texts,
+        FakeEmbeddings(),
+        metadatas=[{"page": i % 2} for i in range(10)],
+        ids=ids,
+        stable_ids=True,
+        compaction_threshold=1.0,
+    )
+    before = dict(docsearch.index_to_docstore_id)
+    docsearch.delete(["id3", "id4"])
+    # Deleted vectors are tombstoned, the others keep their faiss ids.
+    assert docsearch.index.ntotal == 10
+    assert dict(docsearch.index_to_docstore_id) == {
+        i: _id for i, _id in before.items() if _id not in ("id3", "id4")
+    }
+    output = docsearch.similarity_search("text 3", k=10)
+    assert "text 3" not in [doc.page_content for doc in output]
+    assert len(output) == 8
+    output = docsearch.similarity_search("text 3", k=2, filter={"page": 0})
+    assert [doc.page_content for doc in output] == ["text 0", "text 2"]
+    output = docsearch.max_marginal_relevance_search("text 3", k=3, fetch_k=10)
+    assert "text 4" not in [doc.page_content for doc in output]
+
+    docsearch.compact()
+    assert docsearch.index.ntotal == 8
+    assert dict(docsearch.index_to_docstore_id) == {
+        i: _id for i, _id in before.items() if _id not in ("id3", "id4")
+    }
+    # Ids of deleted vectors are not reused.
+    docsearch.add_texts(["text 10"], ids=["id10"])
+    assert docsearch.index_to_docstore_id[10] == "id10"
+    output = docsearch.similarity_search_by_vector([1.0] * 9 + [0.0], k=2)
+    assert {doc.page_content for doc in output} == {"text 0", "text 10"}
+
+
+@pytest.mark.requires("faiss")
+def test_faiss_stable_ids_background_compaction(tmp_path: Path) -> None:
+    texts = [f"text {i}" for i in range(10)]
+    docsearch = FAISS.from_texts(
+        texts,
+        FakeEmbeddings(),
+        ids=[f"id{i}" for i in range(10)],
+        stable_ids=True,
+        compaction_threshold=0.2,
+    )
+    docsearch.delete(["id0", "id1"])
+    assert docsearch._compaction is None
+    docsearch.delete(["id2"])
+    assert docsearch._compaction is not None
+    docsearch._compaction.join()
+    assert docsearch.index.ntotal == 7
+    assert not docsearch._tombstones
+
+    docsearch.delete(["id9"])
+    docsearch.save_local(str(tmp_path))
+    loaded = FAISS.load_local(
+        str(tmp_path), FakeEmbeddings(), allow_dangerous_deserialization=True
+    )
+    assert loaded.index.ntotal == 6
+    assert loaded.index_to_docstore_id[8] == "id8"
+    output = loaded.similarity_search_by_vector([1.0] * 9 + [8.0], k=1)
+    assert output[0].page_content == "text 8"
+
+
+@pytest.mark.requires("faiss")
+@pytest.mark.parametrize("save", ["pickle", "columnar", "bytes"])
+def test_faiss_stable_ids_persists_unremovable_deletes(
+    tmp_path: Path, save: str
+) -> None:
+    texts = [f"text {i}" for i in range(10)]
+    docsearch = FAISS.from_texts(
+        texts,
+        FakeEmbeddings(),
+        ids=[f"id{i}" for i in range(10)],
+        index_factory="HNSW8",
+        stable_ids=True,
+        compaction_threshold=1.0,
+    )
+    docsearch.delete(["id3", "id4"])
+    # HNSW indexes cannot remove vectors, so they are saved as well.
+    if save == "bytes":
+        loaded = FAISS.deserialize_from_bytes(
+            docsearch.serialize_to_bytes(),
+            FakeEmbeddings(),
+            allow_dangerous_deserialization=True,
+        )
+    else:
+        docsearch.save_local(str(tmp_path), columnar=save == "columnar")
+        loaded = FAISS.load_local(
+            str(tmp_path), FakeEmbeddings(), allow_dangerous_deserialization=True
+        )
+    assert loaded.index.ntotal == 10
+    assert loaded._tombstones == {3, 4}
+    output = loaded.similarity_search_by_vector([1.0] * 9 + [3.0], k=10)
+    assert {doc.page_content for doc in output} == set(texts) - {"text 3", "text 4"}
+
+
+@pytest.mark.requires("faiss")
+def test_faiss_tombstoned_ids_are_not_reused() -> None:
+    import faiss
+
+    docsearch = FAISS(
+        FakeEmbeddings(),
+        faiss.IndexIDMap2(faiss.IndexFlatL2(10)),
+        InMemoryDocstore(),
+        {},
+        compaction_threshold=0.9,
+    )
+    docsearch.add_texts(["a", "b", "c"], ids=["a", "b", "c"])
+    docsearch.delete(["c"])
+    docsearch.add_texts(["ccc"], ids=["c2"])
+    assert docsearch._tombstones == {2}
+    assert docsearch.index_to_docstore_id[3] == "c2"
+    output = docsearch.similarity_search("ccc", k=3)
+    assert {doc.page_content for doc in output} == {"a", "b", "ccc"}
+    docsearch.compact()
+    output = docsearch.similarity_search("ccc", k=3)
+    assert {doc.page_content for doc in output} == {"a", "b", "ccc"}
+
+
+@pytest.mark.requires("faiss")
+def test_faiss_tombstone_deletes_update_metadata_index() -> None:
+    docsearch = FAISS.from_texts(
+        [f"text {i}" for i in range(10)],
+        FakeEmbeddings(),
+        metadatas=[{"group": i % 2} for i in range(10)],
+        ids=[f"id{i}" for i in range(10)],
+        stable_ids=True,
+        compaction_threshold=1.0,
+    )
+    query_vec = [1.0] * 9 + [0.0]
+    docsearch.similarity_search_by_vector(query_vec, k=2, filter={"group": 0})
+    docsearch.delete(["id0", "id2"])
+    docsearch.compact()
+    assert not docsearch._tombstones
+    metadata_index = docsearch._metadata_index
+    assert metadata_index is not None
+    assert metadata_index.postings["group"][0] == [4, 6, 8]
+    output = docsearch.similarity_search_by_vector(query_vec, k=2, filter={"group": 0})
+    assert [doc.page_content for doc in output] == ["text 4", "text 6"]
+
+
+@pytest.mark.requires("faiss")
+def test_faiss_serialize_to_bytes_compacts() -> None:
+    docsearch = FAISS.from_texts(
+        [f"text {i}" for i in range(10)],
+        FakeEmbeddings(),
+        ids=[f"id{i}" for i in range(10)],
+        stable_ids=True,
+        compaction_threshold=1.0,
+    )
+    docsearch.delete(["id3"])
+    loaded = FAISS.deserialize_from_bytes(
+        docsearch.serialize_to_bytes(),
+        FakeEmbeddings(),
+        allow_dangerous_deserialization=True,
+    )
+    assert loaded.index.ntotal == 9
+    assert not loaded._tombstones
+
+
+@pytest.mark.requires("faiss")
+def test_faiss_delete_keeps_docstore_when_index_cannot_remove() -> None:
+    docsearch = FAISS.from_texts(
+        ["foo", "bar"],
+        FakeEmbeddings(),
+        ids=["a", "b"],
+        index_factory="HNSW8",
+        stable_ids=True,
+        compaction_threshold=None,
+    )
+    with pytest.raises(RuntimeError):
+        docsearch.delete(["a"])
+    assert docsearch.get_by_ids(["a"])[0].page_content == "foo"
+    assert docsearch.index.ntotal == 2
+
+
+@pytest.mark.requires("faiss")
+def test_faiss_stable_ids_requires_stable_index() -> None:
+    with pytest.raises(ValueError):
+        FAISS.from_texts(["foo"], FakeEmbeddings(), compaction_threshold=0.1)
+
+
+@pytest.mark.requires("faiss")
+def test_faiss_save_local_replaces_other_format(tmp_path: Path) -> None:
+    old = FAISS.from_texts(["old"], FakeEmbeddings(), ids=["old"])
+    new = FAISS.from_texts(["new"], FakeEmbeddings(), ids=["new"])
+    query = [1.0] * 9 + [0.0]
+
+    old.save_local(str(tmp_path), columnar=True)
+    new.save_local(str(tmp_path))
+    assert not (tmp_path / "index.jsonl").exists()
+    assert not (tmp_path / "index.faiss_ids.npy").exists()
+    loaded = FAISS.load_local(
+        str(tmp_path), FakeEmbeddings(), allow_dangerous_deserialization=True
+    )
+    assert loaded.similarity_search_by_vector(query, k=1)[0].page_content == "new"
+
+    old.save_local(str(tmp_path), columnar=True)
+    assert not (tmp_path / "index.pkl").exists()
+    loaded = FAISS.load_local(str(tmp_path), FakeEmbeddings())
+    assert loaded.similarity_search_by_vector(query, k=1)[0].page_content == "old"
+
+
+@pytest.mark.requires("faiss")
+@pytest.mark.parametrize("stable_ids", [False, True])
+def test_faiss_columnar_save_load(tmp_path: Path, stable_ids: bool) -> None:
+    texts = [f"text {i}" for i in range(10)]
+    docsearch = FAISS.from_texts(
+        texts,
+        FakeEmbeddings(),
+        metadatas=[{"page": i % 2} for i in range(10)],
+        ids=[f"id{i}" for i in range(10)],
+        stable_ids=stable_ids,
+    )
+    docsearch.delete(["id0"])
+    docsearch.save_local(str(tmp_path), columnar=True)
+    assert not (tmp_path / "index.pkl").exists()
+
+    # No pickle is loaded, so no opt-in is needed.
+    loaded = FAISS.load_local(str(tmp_path), FakeEmbeddings())
+    assert loaded._index_mapped
+    assert dict(loaded.index_to_docstore_id) == dict(docsearch.index_to_docstore_id)
+    query = [1.0] * 9 + [4.0]
+    expected = docsearch.similarity_search_with_score_by_vector(query, k=3)
+    assert loaded.similarity_search_with_score_by_vector(query, k=3) == expected
+    expected = docsearch.similarity_search_by_vector(query, k=2, filter={"page": 1})
+    assert loaded.similarity_search_by_vector(query, k=2, filter={"page": 1}) == (
+        expected
+    )
+
+    # The mapped index is copied into memory before it is modified.
+    loaded.add_texts(["new"], ids=["new"])
+    loaded.delete(["id1"])
+    loaded.compact()
+    assert not loaded._index_mapped
+    assert loaded.index.ntotal == 9
+    output = loaded.similarity_search_by_vector([1.0] * 9 + [0.0], k=1)
+    assert output[0].page_content == "new"
+
+    # Saving over the mapped files leaves the open store readable.
+    reloaded = FAISS.load_columnar(str(tmp_path), FakeEmbeddings())
+    loaded.save_local(str(tmp_path), columnar=True)
+    assert reloaded.similarity_search_by_vector(query, k=1)[0].page_content == "text 4"
+    assert FAISS.load_local(str(tmp_path), FakeEmbeddings()).index.ntotal == 9
+
+
+@pytest.mark.requires("faiss")
+def test_faiss_columnar_ivf_on_disk(tmp_path: Path) -> None:
+    text_embeddings = _random_text_embeddings(300)
+    docsearch = FAISS.from_embeddings(
+        text_embeddings,
+        FakeEmbeddings(),
+        index_factory="IVF4,Flat",
+        search_params={"nprobe": 4},
+        on_disk_invlists=str(tmp_path / "build" / "lists.ivfdata"),
+    )
+    docsearch.save_local(str(tmp_path / "store"), columnar=True)
+    loaded = FAISS.load_local(str(tmp_path / "store"), FakeEmbeddings())
+    assert not loaded._index_mapped
+    output = loaded.similarity_search_by_vector(text_embeddings[7][1], k=1)
+    assert output[0].page_content == "text 7"
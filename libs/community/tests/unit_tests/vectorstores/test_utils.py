@@ -8,6 +8,7 @@ from langchain_core.documents import Document
 from langchain_community.vectorstores.utils import (
     filter_complex_metadata,
     maximal_marginal_relevance,
+    maximal_marginal_relevance_batch,
 )
 
 
@@ -61,6 +62,34 @@ def test_maximal_marginal_relevance_query_dim() -> None:
     assert first == second
 
 
+def test_maximal_marginal_relevance_zero_vectors() -> None:
+    query_embedding = np.array([1.0, 0.0])
+    embedding_list = [[0.0, 0.0], [1.0, 0.1], [0.0, 1.0]]
+    # The zero vector has similarity 0 to everything and is therefore preferred
+    # over a vector that is somewhat redundant with the first pick.
+    assert maximal_marginal_relevance(query_embedding, embedding_list, k=3) == [
+        1,
+        0,
+        2,
+    ]
+    assert maximal_marginal_relevance(query_embedding, [], k=3) == []
+
+
+def test_maximal_marginal_relevance_batch() -> None:
+    rng = np.random.default_rng(42)
+    query_embeddings = rng.random(size=(3, 8))
+    embedding_lists = [rng.random(size=(n, 8)) for n in (10, 2, 0)]
+    actual = maximal_marginal_relevance_batch(
+        query_embeddings, embedding_lists, lambda_mult=0.3, k=4
+    )
+    expected = [
+        maximal_marginal_relevance(query, list(embeddings), lambda_mult=0.3, k=4)
+        for query, embeddings in zip(query_embeddings, embedding_lists)
+    ]
+    assert actual == expected
+    assert [len(idxs) for idxs in actual] == [4, 2, 0]
+
+
 def test_filter_list_metadata() -> None:
     documents = [
         Document(